@@ -5,16 +5,20 @@ from fastapi import APIRouter, HTTPException, Depends
 from typing import Dict, List, Any, Optional
 from datetime import datetime, timedelta
 
+from app.api.routes.auth import get_admin_user
 from app.services.blockchain_service import BlockchainService
+from app.services.network_health_service import network_health_service
+from app.core.response_cache import DASHBOARD, response_cache
+from app.core.service_registry import service_registry
 
 router = APIRouter()
 
-async def get_blockchain_service():
-    service = BlockchainService()
-    await service.initialize()
-    return service
+async def get_blockchain_service() -> BlockchainService:
+    """Shared blockchain service, initialized once at startup"""
+    return await service_registry.get("blockchain")
 
 @router.get("/dashboard")
+@response_cache.cached(DASHBOARD, exclude=("blockchain_service",))
 async def get_dashboard_analytics(
     blockchain_service: BlockchainService = Depends(get_blockchain_service)
 ):
@@ -53,7 +57,7 @@ async def get_dashboard_analytics(
                 "total_counterfeits": total_counterfeits,
                 "anomalies_last_24h": recent_anomalies
             },
-            "network_status": await blockchain_service.get_network_stats()
+            "network_status": await network_health_service.get_snapshot()
         }
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
@@ -218,7 +222,7 @@ async def get_performance_metrics(
     """Get system performance metrics"""
     try:
         # Network statistics
-        network_stats = await blockchain_service.get_network_stats()
+        network_stats = await network_health_service.get_snapshot()
         
         # Database performance
         db_stats = {
@@ -239,3 +243,16 @@ async def get_performance_metrics(
         }
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
+
+@router.get("/network-health")
+async def get_network_health():
+    """Latest network health snapshot from the background poller, with its age"""
+    return await network_health_service.get_snapshot()
+
+@router.post("/network-health/refresh")
+async def refresh_network_health(admin_user: dict = Depends(get_admin_user)):
+    """Probe every chain now instead of waiting for the next poll (admin only)"""
+    try:
+        return await network_health_service.get_snapshot(force_refresh=True)
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=str(e))
@@ -370,9 +370,9 @@ async def create_admin_simple():
     """Create admin account directly in database - simplified version"""
     try:
         # Get database connection from blockchain service which has working connection
-        from app.services.blockchain_service import BlockchainService
-        blockchain_service = BlockchainService()
-        await blockchain_service.initialize()
+        from app.core.service_registry import service_registry
+        from app.services.blockchain_service import blockchain_service
+        await service_registry.initialize("blockchain")
         database = blockchain_service.database
         
         # Check if admin already exists
@@ -426,9 +426,9 @@ async def create_admin_simple():
 async def check_admin_exists():
     """Check if admin exists in database"""
     try:
-        from app.services.blockchain_service import BlockchainService
-        blockchain_service = BlockchainService()
-        await blockchain_service.initialize()
+        from app.core.service_registry import service_registry
+        from app.services.blockchain_service import blockchain_service
+        await service_registry.initialize("blockchain")
         database = blockchain_service.database
         
         # Check for admin user
@@ -462,9 +462,9 @@ async def check_admin_exists():
 async def get_pending_users_no_auth():
     """Get pending users without authentication (for debugging)"""
     try:
-        from app.services.blockchain_service import BlockchainService
-        blockchain_service = BlockchainService()
-        await blockchain_service.initialize()
+        from app.core.service_registry import service_registry
+        from app.services.blockchain_service import blockchain_service
+        await service_registry.initialize("blockchain")
         database = blockchain_service.database
         
         # Get all pending users
@@ -495,9 +495,9 @@ async def get_pending_users_no_auth():
 async def get_all_users_no_auth():
     """Get all users without authentication (for debugging)"""
     try:
-        from app.services.blockchain_service import BlockchainService
-        blockchain_service = BlockchainService()
-        await blockchain_service.initialize()
+        from app.core.service_registry import service_registry
+        from app.services.blockchain_service import blockchain_service
+        await service_registry.initialize("blockchain")
         database = blockchain_service.database
         
         # Get all users
@@ -18,6 +18,9 @@ from datetime import datetime
 from web3 import Web3
 
 from app.services.blockchain_service import BlockchainService
+from app.core.response_cache import PRODUCTS, response_cache
+from app.core.service_registry import service_registry
+from app.services.network_health_service import network_health_service
 from app.core.config import get_settings
 from app.core.database import get_database
 
@@ -25,14 +28,14 @@ from app.core.database import get_database
 settings = get_settings()
 
 # Dependency to get blockchain service - MOVED HERE TO FIX NAMEERROR
-async def get_blockchain_service():
-    service = BlockchainService()
-    await service.initialize()
-    return service
+async def get_blockchain_service() -> BlockchainService:
+    """Shared blockchain service, initialized once at startup"""
+    return await service_registry.get("blockchain")
 
 router = APIRouter()
 
 @router.get("/marketplace/products")
+@response_cache.cached(PRODUCTS, exclude=("blockchain_service",))
 async def get_marketplace_products(
     limit: int = 50,
     category: str = None,
@@ -170,6 +173,11 @@ class ProductMintRequest(BaseModel):
     target_chains: List[int] = None  # Optional list of target chain IDs
     manufacturer_private_key: Optional[str] = None  # Optional private key for cross-chain messaging
 
+class ProductBatchMintRequest(BaseModel):
+    manufacturer: str
+    products: List[Dict[str, Any]] = Field(..., min_length=1, max_length=100)  # Raw metadata per product
+    manufacturer_private_key: Optional[str] = None
+
 # Enhanced Product Purchase Models (for new /marketplace/buy endpoint)
 class ProductBuyRequest(BaseModel):
     product_id: str
@@ -211,8 +219,8 @@ class ParticipantRegistration(BaseModel):
 async def get_comprehensive_blockchain_status(
     blockchain_service: BlockchainService = Depends(get_blockchain_service)
 ):
-    """Get comprehensive multi-chain network status with algorithm statistics"""
-    return await blockchain_service.get_network_stats()
+    """Get comprehensive multi-chain network status with algorithm statistics (periodic snapshot)"""
+    return await network_health_service.get_snapshot()
 
 @router.post("/participants/register")
 async def register_participant(
@@ -440,6 +448,121 @@ async def verify_product_authenticity(
 # ENHANCED PRODUCT MANAGEMENT (NFTCore Integration)
 # ==========================================
 
+def _price_to_wei(raw: Dict[str, Any]) -> int:
+    """Convert the metadata's ETH price to Wei (0 if missing or invalid)"""
+    if raw.get("price"):
+        try:
+            price_in_eth = float(raw.get("price", 0))
+            return int(price_in_eth * 10**18)  # Convert ETH to Wei
+        except (ValueError, TypeError):
+            pass
+    return 0
+
+def _build_product_metadata(manufacturer_address: str, raw: Dict[str, Any], image_cid: str, video_cid: str, price_in_wei: int, current_timestamp: int) -> Dict[str, Any]:
+    """Generate comprehensive NFT metadata with enhanced structure"""
+    unique_product_id = raw.get("uniqueProductID") or f"PROD-{current_timestamp}"
+    batch_number = raw.get("batchNumber") or f"BATCH-{current_timestamp}"
+
+    # Format dates properly
+    manufacturing_date = raw.get("manufacturingDate") or time.strftime("%Y-%m-%d")
+    expiration_date = raw.get("expirationDate") or ""
+
+    metadata = {
+        "name": raw.get("name", "ChainFLIP Product"),
+        "description": raw.get("description", "Supply chain tracked product"),
+        "image": f"https://w3s.link/ipfs/{image_cid}" if image_cid else "",
+        "video": f"https://w3s.link/ipfs/{video_cid}" if video_cid else "",
+        "external_url": raw.get("external_url", ""),
+        "attributes": [
+            {"trait_type": "Manufacturer", "value": manufacturer_address},
+            {"trait_type": "Product Type", "value": raw.get("productType", "General")},
+            {"trait_type": "Batch Number", "value": batch_number},
+            {"trait_type": "Manufacturing Date", "value": manufacturing_date},
+            {"trait_type": "Expiration Date", "value": expiration_date},
+            {"trait_type": "Location", "value": raw.get("location", "")},
+            {"trait_type": "Category", "value": raw.get("category", "")},
+            {"trait_type": "Price (ETH)", "value": str(raw.get("price", "0"))},
+            {"trait_type": "Price (Wei)", "value": str(price_in_wei)},
+            {"trait_type": "Unique Product ID", "value": unique_product_id},
+            {"trait_type": "Image CID", "value": image_cid},
+            {"trait_type": "Video CID", "value": video_cid}
+        ],
+        # ChainFLIP specific metadata
+        "uniqueProductID": unique_product_id,
+        "batchNumber": batch_number,
+        "manufacturerID": manufacturer_address,
+        "productType": raw.get("productType", "General"),
+        "manufacturingDate": manufacturing_date,
+        "expirationDate": expiration_date,
+        "location": raw.get("location", ""),
+        "category": raw.get("category", ""),
+        "price_eth": raw.get("price", "0"),
+        "price_wei": price_in_wei,
+        "image_cid": image_cid,
+        "video_cid": video_cid,
+        "chainflip_version": "2.0",
+        "mint_timestamp": current_timestamp,
+        "mint_date_formatted": time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(current_timestamp)),
+        "blockchain": "Base Sepolia"
+    }
+    return metadata
+
+async def _send_cid_to_hub(result: Dict[str, Any], manufacturer_address: str, manufacturer_private_key: Optional[str]) -> Dict[str, Any]:
+    """Send the minted product's CID to the Polygon Amoy hub; returns the cross-chain info for the response"""
+    try:
+        print(f"\n🌐 === SENDING CROSS-CHAIN CID MESSAGE ===")
+        print(f"📦 Token ID: {result['token_id']}")
+        print(f"📄 Metadata CID: {result['metadata_cid']}")
+        print(f"🏭 Manufacturer: {manufacturer_address}")
+        print(f"🎯 Target: Polygon Amoy Central Hub - Admin can check contract for CID")
+
+        # Import the ChainFLIP messaging service for cross-chain CID sync
+        from app.services.chainflip_messaging_service import chainflip_messaging_service
+
+        # Send cross-chain CID sync only to Polygon Amoy (central hub)
+        messaging_result = await chainflip_messaging_service.send_cid_to_chain(
+            source_chain="base_sepolia",
+            target_chain="polygon_amoy",
+            token_id=result['token_id'],
+            metadata_cid=result['metadata_cid'],
+            manufacturer=manufacturer_address,
+            manufacturer_private_key=manufacturer_private_key
+        )
+
+        if messaging_result["success"]:
+            print(f"✅ Cross-chain CID sync sent to Polygon Amoy central hub!")
+            print(f"🔗 ChainFLIP TX: {messaging_result['transaction_hash']}")
+            print(f"💰 LayerZero Fee: {messaging_result['layerzero_fee_paid']} ETH")
+            print(f"🆔 Sync ID: {messaging_result['sync_id']}")
+            print(f"📍 Admin can check: {messaging_result['messenger_contract']}")
+
+            # Add messaging info to the response
+            cross_chain_info = {
+                "cross_chain_message_sent": True,
+                "chainflip_tx_hash": messaging_result["transaction_hash"],
+                "layerzero_fee_paid": messaging_result["layerzero_fee_paid"],
+                "sync_id": messaging_result["sync_id"],
+                "message_method": "chainflip_messenger_single_chain",
+                "target_chain": "polygon_amoy",
+                "admin_address": messaging_result["admin_address"],
+                "messenger_contract": messaging_result["messenger_contract"],
+                "admin_instructions": "Check ChainFLIP Messenger contract on Polygon Amoy for CID data"
+            }
+        else:
+            print(f"⚠️ Cross-chain message failed: {messaging_result.get('error')}")
+            cross_chain_info = {
+                "cross_chain_message_sent": False,
+                "error": messaging_result.get('error')
+            }
+
+    except Exception as cid_error:
+        print(f"⚠️ Cross-chain CID message error: {cid_error}")
+        cross_chain_info = {
+            "cross_chain_message_sent": False,
+            "error": f"Cross-chain messaging failed: {str(cid_error)}"
+        }
+    return cross_chain_info
+
 @router.post("/products/mint")
 async def mint_product(
     product_data: ProductMintRequest,
@@ -459,13 +582,7 @@ async def mint_product(
             print(f"✅ Using provided manufacturer address: {manufacturer_address}")
         
         # Convert price from ETH to Wei if provided
-        price_in_wei = 0
-        if product_data.metadata.get("price"):
-            try:
-                price_in_eth = float(product_data.metadata.get("price", 0))
-                price_in_wei = int(price_in_eth * 10**18)  # Convert ETH to Wei
-            except (ValueError, TypeError):
-                price_in_wei = 0
+        price_in_wei = _price_to_wei(product_data.metadata)
         
         # FIX 2: Use existing IPFS CIDs instead of re-uploading
         # Check if CIDs are already provided from frontend uploads
@@ -508,53 +625,8 @@ async def mint_product(
                 print(f"⚠️ Video upload failed: {e}")
                 # Continue without video CID
 
-        # Generate comprehensive metadata with enhanced structure
         current_timestamp = int(time.time())
-        unique_product_id = product_data.metadata.get("uniqueProductID") or f"PROD-{current_timestamp}"
-        batch_number = product_data.metadata.get("batchNumber") or f"BATCH-{current_timestamp}"
-        
-        # Format dates properly
-        manufacturing_date = product_data.metadata.get("manufacturingDate") or time.strftime("%Y-%m-%d")
-        expiration_date = product_data.metadata.get("expirationDate") or ""
-        
-        metadata = {
-            "name": product_data.metadata.get("name", "ChainFLIP Product"),
-            "description": product_data.metadata.get("description", "Supply chain tracked product"),
-            "image": f"https://w3s.link/ipfs/{image_cid}" if image_cid else "",
-            "video": f"https://w3s.link/ipfs/{video_cid}" if video_cid else "",
-            "external_url": product_data.metadata.get("external_url", ""),
-            "attributes": [
-                {"trait_type": "Manufacturer", "value": manufacturer_address},
-                {"trait_type": "Product Type", "value": product_data.metadata.get("productType", "General")},
-                {"trait_type": "Batch Number", "value": batch_number},
-                {"trait_type": "Manufacturing Date", "value": manufacturing_date},
-                {"trait_type": "Expiration Date", "value": expiration_date},
-                {"trait_type": "Location", "value": product_data.metadata.get("location", "")},
-                {"trait_type": "Category", "value": product_data.metadata.get("category", "")},
-                {"trait_type": "Price (ETH)", "value": str(product_data.metadata.get("price", "0"))},
-                {"trait_type": "Price (Wei)", "value": str(price_in_wei)},
-                {"trait_type": "Unique Product ID", "value": unique_product_id},
-                {"trait_type": "Image CID", "value": image_cid},
-                {"trait_type": "Video CID", "value": video_cid}
-            ],
-            # ChainFLIP specific metadata
-            "uniqueProductID": unique_product_id,
-            "batchNumber": batch_number,
-            "manufacturerID": manufacturer_address,
-            "productType": product_data.metadata.get("productType", "General"),
-            "manufacturingDate": manufacturing_date,
-            "expirationDate": expiration_date,
-            "location": product_data.metadata.get("location", ""),
-            "category": product_data.metadata.get("category", ""),
-            "price_eth": product_data.metadata.get("price", "0"),
-            "price_wei": price_in_wei,
-            "image_cid": image_cid,
-            "video_cid": video_cid,
-            "chainflip_version": "2.0",
-            "mint_timestamp": current_timestamp,
-            "mint_date_formatted": time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(current_timestamp)),
-            "blockchain": "Base Sepolia"
-        }
+        metadata = _build_product_metadata(manufacturer_address, product_data.metadata, image_cid, video_cid, price_in_wei, current_timestamp)
         
         print(f"🏭 Minting enhanced product NFT on Base Sepolia...")
         print(f"📄 Enhanced Metadata with Image/Video CIDs:")
@@ -571,58 +643,7 @@ async def mint_product(
         )
         
         # NEW: Send cross-chain CID message to Polygon Amoy admin after successful minting
-        try:
-            print(f"\n🌐 === SENDING CROSS-CHAIN CID MESSAGE ===")
-            print(f"📦 Token ID: {result['token_id']}")
-            print(f"📄 Metadata CID: {result['metadata_cid']}")
-            print(f"🏭 Manufacturer: {manufacturer_address}")
-            print(f"🎯 Target: Polygon Amoy Central Hub - Admin can check contract for CID")
-            
-            # Import the ChainFLIP messaging service for cross-chain CID sync
-            from app.services.chainflip_messaging_service import chainflip_messaging_service
-            
-            # Send cross-chain CID sync only to Polygon Amoy (central hub)
-            messaging_result = await chainflip_messaging_service.send_cid_to_chain(
-                source_chain="base_sepolia",
-                target_chain="polygon_amoy",
-                token_id=result['token_id'],
-                metadata_cid=result['metadata_cid'],
-                manufacturer=manufacturer_address,
-                manufacturer_private_key=product_data.manufacturer_private_key
-            )
-            
-            if messaging_result["success"]:
-                print(f"✅ Cross-chain CID sync sent to Polygon Amoy central hub!")
-                print(f"🔗 ChainFLIP TX: {messaging_result['transaction_hash']}")
-                print(f"💰 LayerZero Fee: {messaging_result['layerzero_fee_paid']} ETH")
-                print(f"🆔 Sync ID: {messaging_result['sync_id']}")
-                print(f"📍 Admin can check: {messaging_result['messenger_contract']}")
-                
-                # Add messaging info to the response
-                cross_chain_info = {
-                    "cross_chain_message_sent": True,
-                    "chainflip_tx_hash": messaging_result["transaction_hash"],
-                    "layerzero_fee_paid": messaging_result["layerzero_fee_paid"],
-                    "sync_id": messaging_result["sync_id"],
-                    "message_method": "chainflip_messenger_single_chain",
-                    "target_chain": "polygon_amoy",
-                    "admin_address": messaging_result["admin_address"],
-                    "messenger_contract": messaging_result["messenger_contract"],
-                    "admin_instructions": "Check ChainFLIP Messenger contract on Polygon Amoy for CID data"
-                }
-            else:
-                print(f"⚠️ Cross-chain message failed: {messaging_result.get('error')}")
-                cross_chain_info = {
-                    "cross_chain_message_sent": False,
-                    "error": messaging_result.get('error')
-                }
-                
-        except Exception as cid_error:
-            print(f"⚠️ Cross-chain CID message error: {cid_error}")
-            cross_chain_info = {
-                "cross_chain_message_sent": False,
-                "error": f"Cross-chain messaging failed: {str(cid_error)}"
-            }
+        cross_chain_info = await _send_cid_to_hub(result, manufacturer_address, product_data.manufacturer_private_key)
         
         return {
             "success": True,
@@ -650,6 +671,73 @@ async def mint_product(
         print(f"❌ Enhanced product minting error: {e}")
         raise HTTPException(status_code=400, detail=str(e))
 
+@router.post("/products/mint/batch")
+async def mint_products_batch(
+    batch_data: ProductBatchMintRequest,
+    blockchain_service: BlockchainService = Depends(get_blockchain_service)
+):
+    """
+    Bulk product onboarding: all metadata is uploaded to IPFS as one directory,
+    then each product is minted. Media must already be on IPFS (imageCID/videoCID).
+    """
+    try:
+        manufacturer_address = batch_data.manufacturer
+        current_timestamp = int(time.time())
+        metadata_list = [
+            _build_product_metadata(
+                manufacturer_address,
+                # Products in one batch share a timestamp, so default IDs need the index
+                {**raw, "uniqueProductID": raw.get("uniqueProductID") or f"PROD-{current_timestamp}-{index}"},
+                raw.get("imageCID", ""),
+                raw.get("videoCID", ""),
+                _price_to_wei(raw),
+                current_timestamp,
+            )
+            for index, raw in enumerate(batch_data.products)
+        ]
+        
+        print(f"🏭 Batch minting {len(metadata_list)} products for {manufacturer_address}...")
+        batch = await blockchain_service.mint_products_batch(
+            manufacturer=manufacturer_address,
+            metadata_list=metadata_list,
+            manufacturer_private_key=batch_data.manufacturer_private_key
+        )
+        
+        products = []
+        for metadata, result in zip(metadata_list, batch["results"]):
+            if result["success"]:
+                cross_chain_info = await _send_cid_to_hub(result, manufacturer_address, batch_data.manufacturer_private_key)
+                products.append({
+                    "success": True,
+                    "uniqueProductID": metadata["uniqueProductID"],
+                    "token_id": result["token_id"],
+                    "transaction_hash": result["transaction_hash"],
+                    "metadata_cid": result["metadata_cid"],
+                    "qr_hash": result["qr_hash"],
+                    "token_uri": result.get("token_uri"),
+                    **cross_chain_info
+                })
+            else:
+                products.append({
+                    "success": False,
+                    "uniqueProductID": metadata["uniqueProductID"],
+                    "metadata_cid": result["metadata_cid"],
+                    "error": result["error"]
+                })
+        
+        return {
+            "success": batch["failed"] == 0,
+            "message": f"Minted {batch['minted']} of {len(products)} products",
+            "manufacturer_address": manufacturer_address,
+            "directory_cid": batch["directory_cid"],
+            "minted": batch["minted"],
+            "failed": batch["failed"],
+            "products": products
+        }
+    except Exception as e:
+        print(f"❌ Batch product minting error: {e}")
+        raise HTTPException(status_code=400, detail=str(e))
+
 @router.get("/products/{token_id}")
 async def get_product(
     token_id: str,
@@ -3,11 +3,17 @@ Enhanced Product Authenticity Verification API Routes
 Algorithm 4 Enhancement with batch processing and detailed verification status
 """
 from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import StreamingResponse
 from typing import Dict, List, Optional, Any
 from pydantic import BaseModel
 from datetime import datetime
+import json
 
 from app.services.blockchain_service import blockchain_service
+from app.core.config import get_settings
+from app.core.service_registry import service_registry
+
+settings = get_settings()
 
 router = APIRouter()
 
@@ -60,6 +66,24 @@ async def verify_product_authenticity(request: SingleVerificationRequest):
         raise HTTPException(status_code=500, detail=f"Verification failed: {str(e)}")
 
 
+def _prepare_batch_requests(request: BatchVerificationRequest) -> List[Dict]:
+    """Validate the batch size and add the batch context to each request"""
+    if len(request.verification_requests) == 0:
+        raise HTTPException(status_code=400, detail="No verification requests provided")
+    
+    if len(request.verification_requests) > settings.authenticity_batch_max_size:  # Limit batch size
+        raise HTTPException(status_code=400, detail=f"Batch size cannot exceed {settings.authenticity_batch_max_size} products")
+    
+    enhanced_requests = []
+    for req in request.verification_requests:
+        enhanced_req = dict(req)
+        enhanced_req["context"] = dict(enhanced_req.get("context") or {})
+        enhanced_req["context"].update(request.batch_context or {})
+        enhanced_req["context"]["api_batch_request"] = True
+        enhanced_requests.append(enhanced_req)
+    return enhanced_requests
+
+
 @router.post("/authenticity/verify-batch")
 async def verify_batch_authenticity(request: BatchVerificationRequest):
     """
@@ -67,21 +91,7 @@ async def verify_batch_authenticity(request: BatchVerificationRequest):
     Algorithm 4 with batch processing capabilities
     """
     try:
-        if len(request.verification_requests) == 0:
-            raise HTTPException(status_code=400, detail="No verification requests provided")
-        
-        if len(request.verification_requests) > 50:  # Limit batch size
-            raise HTTPException(status_code=400, detail="Batch size cannot exceed 50 products")
-        
-        # Add batch context to each request
-        enhanced_requests = []
-        for req in request.verification_requests:
-            enhanced_req = dict(req)
-            if "context" not in enhanced_req:
-                enhanced_req["context"] = {}
-            enhanced_req["context"].update(request.batch_context or {})
-            enhanced_req["context"]["api_batch_request"] = True
-            enhanced_requests.append(enhanced_req)
+        enhanced_requests = _prepare_batch_requests(request)
         
         # Perform batch verification
         batch_result = await blockchain_service.verify_multiple_products_authenticity(enhanced_requests)
@@ -96,6 +106,27 @@ async def verify_batch_authenticity(request: BatchVerificationRequest):
         raise HTTPException(status_code=500, detail=f"Batch verification failed: {str(e)}")
 
 
+@router.post("/authenticity/verify-batch/stream")
+async def verify_batch_authenticity_stream(request: BatchVerificationRequest):
+    """
+    Streaming batch product authenticity verification
+    Returns newline-delimited JSON: one {"type": "result", ...} line per QR code as soon
+    as it is verified (completion order, "index" refers to the request position),
+    then a final {"type": "summary", ...} line
+    """
+    enhanced_requests = _prepare_batch_requests(request)
+    
+    async def ndjson():
+        try:
+            async for item in blockchain_service.stream_products_authenticity(enhanced_requests):
+                yield json.dumps(item, default=str) + "\n"
+        except Exception as e:
+            # Headers are already sent; report the failure in-band
+            yield json.dumps({"type": "error", "error_message": str(e)}) + "\n"
+    
+    return StreamingResponse(ndjson(), media_type="application/x-ndjson")
+
+
 @router.get("/authenticity/analytics")
 async def get_verification_analytics(
     time_range_days: int = Query(30, ge=1, le=365, description="Number of days to analyze")
@@ -125,8 +156,7 @@ async def get_product_verification_history(product_id: str):
     """
     try:
         # Initialize blockchain service if needed
-        if blockchain_service.database is None:
-            await blockchain_service.initialize()
+        await service_registry.initialize("blockchain")
         
         # Get verification history from database
         verification_cursor = blockchain_service.database.verification_history.find({
@@ -167,8 +197,7 @@ async def get_verifier_summary(verifier_address: str):
     """
     try:
         # Initialize blockchain service if needed
-        if blockchain_service.database is None:
-            await blockchain_service.initialize()
+        await service_registry.initialize("blockchain")
         
         # Get verifier's verification history
         verification_cursor = blockchain_service.database.verification_history.find({
@@ -248,8 +277,7 @@ async def verification_service_health():
     """
     try:
         # Check database connectivity
-        if blockchain_service.database is None:
-            await blockchain_service.initialize()
+        await service_registry.initialize("blockchain")
         
         # Test verification functionality with a simple check
         test_result = await blockchain_service.database.verification_history.find_one({}, {"_id": 1})
@@ -2,10 +2,14 @@
 Federated Learning API Routes
 """
 from fastapi import APIRouter, HTTPException, Depends
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional
 from pydantic import BaseModel
 
-from app.services.fl_service import FederatedLearningService
+from app.api.routes.auth import get_admin_user
+from app.core.config import get_settings
+from app.core.service_registry import service_registry
+from app.services.fl_executor import FLJobQueueFull, fl_executor
+from app.services.fl_service import FederatedLearningService, check_product_filter
 
 router = APIRouter()
 
@@ -15,17 +19,48 @@ class TrainingData(BaseModel):
     training_data: List[Dict[str, Any]]
     model_type: str  # "anomaly_detection" or "counterfeit_detection"
 
+class StoredTrainingRequest(BaseModel):
+    participant_address: str
+    limit: int = 0  # 0 = all of the participant's stored records
+
 class AnomalyDetection(BaseModel):
     product_data: Dict[str, Any]
 
 class CounterfeitDetection(BaseModel):
     product_data: Dict[str, Any]
 
+class BatchDetection(BaseModel):
+    token_ids: List[str]
+    analysis_type: str = "full"  # "anomaly", "counterfeit" or "full"
+    background: bool = False  # run as an FL job and return its job_id
+
+class SweepDetection(BaseModel):
+    filter: Optional[Dict[str, Any]] = None  # allow-listed products query; the whole catalog when omitted
+    analysis_type: str = "full"
+    background: bool = True
+
 # Dependency to get FL service
-async def get_fl_service():
-    service = FederatedLearningService()
-    await service.initialize()
-    return service
+async def get_fl_service() -> FederatedLearningService:
+    """Shared FL service, initialized on first use"""
+    return await service_registry.get("fl_service")
+
+def _model_type(model: str) -> str:
+    model_types = {"anomaly": "anomaly_detection", "counterfeit": "counterfeit_detection"}
+    if model not in model_types:
+        raise HTTPException(status_code=404, detail=f"Unknown model {model}")
+    return model_types[model]
+
+def _submit_job(kind: str, operation, **info) -> Dict[str, Any]:
+    try:
+        job_id = fl_executor.submit(kind, operation, **info)
+    except FLJobQueueFull as e:
+        raise HTTPException(status_code=429, detail=str(e))
+    return {
+        "success": True,
+        "job_id": job_id,
+        "status": "queued",
+        "status_url": f"/api/federated-learning/jobs/{job_id}"
+    }
 
 @router.get("/status")
 async def get_fl_status(
@@ -39,30 +74,43 @@ async def train_anomaly_model(
     training_data: TrainingData,
     fl_service: FederatedLearningService = Depends(get_fl_service)
 ):
-    """Train local anomaly detection model"""
-    try:
-        result = await fl_service.train_local_anomaly_model(
+    """Queue local anomaly detection model training; poll /jobs/{job_id} for the result"""
+    return _submit_job(
+        "train_anomaly",
+        fl_service.train_local_anomaly_model(
             training_data.participant_address,
             training_data.training_data
-        )
-        return result
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=str(e))
+        ),
+        participant_address=training_data.participant_address
+    )
 
 @router.post("/train/counterfeit")
 async def train_counterfeit_model(
     training_data: TrainingData,
     fl_service: FederatedLearningService = Depends(get_fl_service)
 ):
-    """Train local counterfeit detection model"""
-    try:
-        result = await fl_service.train_local_counterfeit_model(
+    """Queue local counterfeit detection model training; poll /jobs/{job_id} for the result"""
+    return _submit_job(
+        "train_counterfeit",
+        fl_service.train_local_counterfeit_model(
             training_data.participant_address,
             training_data.training_data
-        )
-        return result
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=str(e))
+        ),
+        participant_address=training_data.participant_address
+    )
+
+@router.post("/train/{model}/stored")
+async def train_model_from_stored_records(
+    model: str,
+    request: StoredTrainingRequest,
+    fl_service: FederatedLearningService = Depends(get_fl_service)
+):
+    """Queue local model training on the participant's records stored in MongoDB (streamed, not loaded at once)"""
+    return _submit_job(
+        f"train_{model}",
+        fl_service.train_local_model_from_collection(_model_type(model), request.participant_address, request.limit),
+        participant_address=request.participant_address
+    )
 
 @router.post("/aggregate/anomaly")
 async def aggregate_anomaly_models(
@@ -110,6 +158,41 @@ async def detect_counterfeit(
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
 
+async def _run_scoring(fl_service: FederatedLearningService, background: bool, token_ids=None, query=None, analysis_type="full"):
+    operation = fl_service.score_products(token_ids, query, analysis_type)
+    if background:
+        return _submit_job("score_products", operation)
+    result = await operation
+    if "error" in result:
+        raise HTTPException(status_code=400, detail=result["error"])
+    return result
+
+@router.post("/detect/batch")
+async def detect_batch(
+    detection: BatchDetection,
+    fl_service: FederatedLearningService = Depends(get_fl_service)
+):
+    """Score a list of products for anomalies and counterfeits in one call"""
+    max_token_ids = get_settings().fl_batch_max_token_ids
+    if not detection.token_ids:
+        raise HTTPException(status_code=400, detail="token_ids is required; use /detect/sweep to score by filter")
+    if len(detection.token_ids) > max_token_ids:
+        raise HTTPException(status_code=400, detail=f"At most {max_token_ids} token_ids per request")
+    return await _run_scoring(fl_service, detection.background, token_ids=detection.token_ids, analysis_type=detection.analysis_type)
+
+@router.post("/detect/sweep")
+async def detect_sweep(
+    detection: SweepDetection,
+    admin_user: dict = Depends(get_admin_user),
+    fl_service: FederatedLearningService = Depends(get_fl_service)
+):
+    """Score every product matching an allow-listed filter (or the whole catalog); admin only"""
+    try:
+        check_product_filter(detection.filter or {})
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return await _run_scoring(fl_service, detection.background, query=detection.filter, analysis_type=detection.analysis_type)
+
 @router.get("/models/anomaly/global")
 async def get_global_anomaly_model(
     fl_service: FederatedLearningService = Depends(get_fl_service)
@@ -122,7 +205,8 @@ async def get_global_anomaly_model(
             "features": model_info.get('features', []),
             "training_rounds": model_info.get('training_rounds', 0),
             "last_updated": model_info.get('last_updated', '').isoformat() if model_info.get('last_updated') else '',
-            "participants_contributed": len(model_info.get('participants_contributed', []))
+            "participants_contributed": len(model_info.get('participants_contributed', [])),
+            "active_version": model_info.get('version')
         }
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
@@ -139,7 +223,54 @@ async def get_global_counterfeit_model(
             "features": model_info.get('features', []),
             "training_rounds": model_info.get('training_rounds', 0),
             "last_updated": model_info.get('last_updated', '').isoformat() if model_info.get('last_updated') else '',
-            "participants_contributed": len(model_info.get('participants_contributed', []))
+            "participants_contributed": len(model_info.get('participants_contributed', [])),
+            "active_version": model_info.get('version')
         }
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
+
+@router.get("/jobs")
+async def list_fl_jobs(kind: Optional[str] = None):
+    """Queued, running and recently finished FL jobs (without results)"""
+    return {"jobs": fl_executor.list_jobs(kind), "executor": fl_executor.metrics()}
+
+@router.get("/jobs/{job_id}")
+async def get_fl_job(job_id: str):
+    """Status of an FL job; includes the result once it has finished"""
+    job = fl_executor.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Unknown FL job {job_id}")
+    return job
+
+@router.post("/jobs/{job_id}/cancel")
+async def cancel_fl_job(job_id: str):
+    """Cancel a queued or running FL job"""
+    job = fl_executor.cancel(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Unknown FL job {job_id}")
+    return job
+
+@router.get("/models/{model}/versions")
+async def list_global_model_versions(
+    model: str,
+    fl_service: FederatedLearningService = Depends(get_fl_service)
+):
+    """Stored versions of a global model, newest first"""
+    model_type = _model_type(model)
+    return {
+        "model_type": model_type,
+        "active_version": fl_service.global_models[model_type].get('version'),
+        "versions": await fl_service.model_store.versions(model_type)
+    }
+
+@router.post("/models/{model}/versions/{version}/activate")
+async def activate_global_model_version(
+    model: str,
+    version: int,
+    fl_service: FederatedLearningService = Depends(get_fl_service)
+):
+    """Serve a stored version of a global model (e.g. roll back)"""
+    result = await fl_service.activate_global_model(_model_type(model), version)
+    if "error" in result:
+        raise HTTPException(status_code=404, detail=result["error"])
+    return result
@@ -6,13 +6,10 @@ from typing import Dict, Any, Optional
 from pydantic import BaseModel
 import json
 import base64
-import subprocess
-import tempfile
-import os
-from pathlib import Path
 from datetime import datetime
 
 from app.services.ipfs_service import ipfs_service
+from app.services.w3storage_worker import w3storage_worker
 
 router = APIRouter()
 
@@ -116,78 +113,11 @@ async def upload_file_to_ipfs(request: FileUploadRequest):
         raise HTTPException(status_code=500, detail=f"Upload failed: {str(e)}")
 
 async def upload_binary_to_w3storage(file_content: bytes, filename: str, mime_type: str) -> Optional[str]:
-    """Upload binary file directly to W3Storage using file-based credentials"""
+    """Upload binary file directly to W3Storage through the persistent upload worker"""
     try:
-        # Create temporary file for the binary content
-        with tempfile.NamedTemporaryFile(delete=False, suffix=f".{filename.split('.')[-1]}") as temp_file:
-            temp_file.write(file_content)
-            temp_file_path = temp_file.name
-        
-        # Create temporary files for credentials to avoid environment variable corruption
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.token', delete=False) as token_file:
-            token_file.write(ipfs_service.w3storage_token)
-            token_file_path = token_file.name
-        
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.proof', delete=False) as proof_file:
-            proof_file.write(ipfs_service.w3storage_proof)
-            proof_file_path = proof_file.name
-        
-        try:
-            # Find the W3Storage upload script
-            script_path = Path(__file__).parent.parent.parent.parent / "w3storage_upload.mjs"
-            
-            if not script_path.exists():
-                print(f"❌ W3Storage script not found at: {script_path}")
-                return None
-            
-            # Set environment variables with credential file paths
-            env = os.environ.copy()
-            env['W3STORAGE_TOKEN_FILE'] = token_file_path
-            env['W3STORAGE_PROOF_FILE'] = proof_file_path
-            
-            # Run Node.js script
-            result = subprocess.run([
-                'node', str(script_path), temp_file_path, filename
-            ], 
-            capture_output=True, 
-            text=True, 
-            encoding='utf-8',
-            env=env,
-            timeout=60
-            )
-            
-            if result.returncode == 0:
-                try:
-                    stdout_clean = result.stdout.strip()
-                    if stdout_clean:
-                        response = json.loads(stdout_clean)
-                        if response.get('success'):
-                            cid = response.get('cid')
-                            print(f"✅ Binary file uploaded to W3Storage: {cid}")
-                            return cid
-                        else:
-                            print(f"❌ W3Storage upload failed: {response.get('error')}")
-                            return None
-                    else:
-                        print(f"❌ Empty response from W3Storage script")
-                        return None
-                except json.JSONDecodeError as e:
-                    print(f"❌ Failed to parse W3Storage response: {e}")
-                    print(f"Raw output: {result.stdout}")
-                    return None
-            else:
-                print(f"❌ W3Storage script failed: {result.stderr}")
-                return None
-                
-        finally:
-            # Clean up temporary files
-            try:
-                os.unlink(temp_file_path)
-                os.unlink(token_file_path)
-                os.unlink(proof_file_path)
-            except OSError:
-                pass
-                
+        cid = await w3storage_worker.upload(file_content, filename, mime_type)
+        print(f"✅ Binary file uploaded to W3Storage: {cid}")
+        return cid
     except Exception as e:
         print(f"❌ Binary upload error: {e}")
         return None
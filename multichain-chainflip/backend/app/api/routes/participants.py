@@ -6,6 +6,7 @@ from typing import Dict, List, Any, Optional
 from pydantic import BaseModel
 
 from app.services.blockchain_service import BlockchainService
+from app.core.service_registry import service_registry
 
 router = APIRouter()
 
@@ -16,10 +17,9 @@ class ParticipantQuery(BaseModel):
     offset: int = 0
 
 # Dependencies
-async def get_blockchain_service():
-    service = BlockchainService()
-    await service.initialize()
-    return service
+async def get_blockchain_service() -> BlockchainService:
+    """Shared blockchain service, initialized once at startup"""
+    return await service_registry.get("blockchain")
 
 @router.get("/")
 async def get_participants(
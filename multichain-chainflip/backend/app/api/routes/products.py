@@ -6,7 +6,11 @@ from typing import Dict, List, Any, Optional
 from pydantic import BaseModel
 
 from app.services.blockchain_service import BlockchainService
+from app.core.response_cache import PRODUCTS, invalidate_product_views, response_cache
+from app.core.service_registry import service_registry
+from app.core.web3_pool import web3_pool
 from app.services.fl_service import FederatedLearningService
+from app.services.ownership_indexer_service import indexed_contracts
 from app.services.ownership_verification_service import OwnershipVerificationService
 
 router = APIRouter()
@@ -23,33 +27,20 @@ class ProductQuery(BaseModel):
     offset: int = 0
 
 # Dependencies
-async def get_blockchain_service():
-    service = BlockchainService()
-    await service.initialize()
-    return service
+async def get_blockchain_service() -> BlockchainService:
+    """Shared blockchain service, initialized once at startup"""
+    return await service_registry.get("blockchain")
 
-async def get_fl_service():
-    service = FederatedLearningService()
-    await service.initialize()
-    return service
+async def get_fl_service() -> FederatedLearningService:
+    """Shared FL service, initialized on first use"""
+    return await service_registry.get("fl_service")
 
 async def get_ownership_verification_service(blockchain_service: BlockchainService = Depends(get_blockchain_service)):
     """Create ownership verification service with blockchain connections"""
-    # Get available web3 connections from blockchain service
-    web3_connections = {}
-    contract_addresses = {}
+    # Every chain with an indexed NFT contract; used when the ownership index is stale
+    contract_addresses = indexed_contracts()
+    web3_connections = {chain: web3_pool.web3(chain) for chain in contract_addresses}
     
-    # Only add connections that actually exist in the blockchain service
-    if hasattr(blockchain_service, 'pos_web3') and blockchain_service.pos_web3:
-        web3_connections["polygon_amoy"] = blockchain_service.pos_web3
-        contract_addresses["polygon_amoy"] = getattr(blockchain_service, 'polygon_contract_address', None)
-    
-    if hasattr(blockchain_service, 'manufacturer_web3') and blockchain_service.manufacturer_web3:
-        web3_connections["base_sepolia"] = blockchain_service.manufacturer_web3
-        contract_addresses["base_sepolia"] = getattr(blockchain_service, 'base_contract_address', None)
-    
-    # Note: For now, we'll create the service with limited connections
-    # On-chain verification can be enhanced later when all chain connections are available
     return OwnershipVerificationService(
         database=blockchain_service.database,
         web3_connections=web3_connections,
@@ -57,6 +48,7 @@ async def get_ownership_verification_service(blockchain_service: BlockchainServi
     )
 
 @router.get("/")
+@response_cache.cached(PRODUCTS, exclude=("blockchain_service", "ownership_service"))
 async def get_products(
     manufacturer: Optional[str] = None,
     owner: Optional[str] = None,
@@ -282,6 +274,15 @@ async def get_buyer_owned_products(
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
 
+@router.get("/ownership-index/status")
+async def get_ownership_index_status():
+    """Checkpoint and freshness of the Transfer-event ownership index per chain"""
+    try:
+        indexer = await service_registry.get("ownership_indexer")
+        return {"chains": await indexer.get_status(), "max_staleness_seconds": indexer.max_staleness}
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
 @router.get("/{token_id}")
 async def get_product_details(
     token_id: str,
@@ -368,6 +369,7 @@ async def analyze_product(
                 {"token_id": token_id},
                 {"$set": update_data}
             )
+            await invalidate_product_views(token_id)
         
         return results
         
@@ -391,6 +393,7 @@ async def get_product_qr(
     }
 
 @router.get("/statistics/overview")
+@response_cache.cached(PRODUCTS, exclude=("blockchain_service",))
 async def get_product_statistics(
     blockchain_service: BlockchainService = Depends(get_blockchain_service)
 ):
@@ -9,6 +9,7 @@ from typing import Dict, Any, Optional, List
 from pydantic import BaseModel, Field
 from app.services.real_weth_bridge_service import real_weth_bridge_service
 from app.services.layerzero_oft_bridge_service import layerzero_oft_bridge_service
+from app.services.confirmation_tracker import confirmation_tracker
 
 router = APIRouter()
 
@@ -20,6 +21,7 @@ class TokenTransferRequest(BaseModel):
     to_address: str = Field(..., description="Recipient wallet address")
     amount_eth: float = Field(..., gt=0, description="Amount in ETH to transfer")
     escrow_id: Optional[str] = Field(None, description="Associated escrow ID for tracking")
+    background: bool = Field(False, description="Return a tracking_id at once instead of waiting for the transfer")
 
 class BalanceRequest(BaseModel):
     chain_name: str = Field(..., description="Chain name to check balance on")
@@ -124,11 +126,29 @@ async def get_token_bridge_status():
 
 @router.post("/transfer", response_model=Dict[str, Any])
 async def transfer_tokens_cross_chain(request: TokenTransferRequest):
-    """Execute cross-chain ETH transfer using LayerZero OFT or Real WETH bridge"""
+    """
+    Execute cross-chain ETH transfer using LayerZero OFT or Real WETH bridge
+
+    With background=true the transfer runs after the response is sent; the
+    response carries a tracking_id to poll at /api/tracking/{tracking_id}.
+    """
+    # Generate escrow ID if not provided
+    escrow_id = request.escrow_id or f"BRIDGE-{int(time.time())}-{request.from_address[-6:]}"
+    if not request.background:
+        return await _execute_transfer(request, escrow_id)
+    
+    tracking_id = await confirmation_tracker.run("token_transfer", _execute_transfer(request, escrow_id))
+    return {
+        "success": True,
+        "transfer_id": escrow_id,
+        "tracking_id": tracking_id,
+        "status": "running",
+        "status_url": f"/api/tracking/{tracking_id}",
+        "timestamp": time.time()
+    }
+
+async def _execute_transfer(request: TokenTransferRequest, escrow_id: str) -> Dict[str, Any]:
     try:
-        # Generate escrow ID if not provided
-        escrow_id = request.escrow_id or f"BRIDGE-{int(time.time())}-{request.from_address[-6:]}"
-        
         print(f"\n🌉 === CROSS-CHAIN TRANSFER REQUEST ===")
         print(f"From: {request.from_chain} → To: {request.to_chain}")
         print(f"Amount: {request.amount_eth} ETH")
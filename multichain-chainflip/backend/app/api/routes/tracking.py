@@ -0,0 +1,37 @@
+"""
+Transaction tracking API
+Status of transactions and background operations started by endpoints that
+answer with a tracking_id (polling or an NDJSON stream of status changes)
+"""
+from fastapi import APIRouter, HTTPException
+from fastapi.responses import StreamingResponse
+import json
+
+from app.services.confirmation_tracker import confirmation_tracker
+
+router = APIRouter()
+
+
+@router.get("/{tracking_id}")
+async def get_tracking_status(tracking_id: str):
+    """Current status of a tracked transaction or operation"""
+    status = await confirmation_tracker.get(tracking_id)
+    if status is None:
+        raise HTTPException(status_code=404, detail=f"Unknown tracking id {tracking_id}")
+    return status
+
+
+@router.get("/{tracking_id}/events")
+async def stream_tracking_status(tracking_id: str):
+    """
+    Push status changes as NDJSON: the current status first, then one line per
+    change; the stream ends once the status is final
+    """
+    if await confirmation_tracker.get(tracking_id) is None:
+        raise HTTPException(status_code=404, detail=f"Unknown tracking id {tracking_id}")
+
+    async def ndjson():
+        async for status in confirmation_tracker.updates(tracking_id):
+            yield json.dumps(status, default=str) + "\n"
+
+    return StreamingResponse(ndjson(), media_type="application/x-ndjson")
@@ -0,0 +1,182 @@
+"""
+Content-addressed IPFS cache
+CIDs are immutable, so fetched content is kept forever (bounded by size) in
+memory and on disk; failed lookups are remembered briefly so a missing CID
+doesn't hit every gateway on every request
+"""
+import asyncio
+import os
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Optional
+
+from app.core.config import get_settings
+from app.core.log import get_logger
+
+settings = get_settings()
+logger = get_logger(__name__)
+
+
+class CIDCache:
+    """
+    Two-level LRU keyed by CID
+
+    - memory: the most recently used max_memory_bytes of content
+    - disk: one file per CID under directory, evicted least-recently-used
+      first once the directory exceeds max_disk_bytes; survives restarts
+    - negative entries expire after negative_ttl seconds
+    """
+
+    def __init__(
+        self,
+        directory: str = settings.ipfs_cache_dir,
+        max_memory_bytes: int = settings.ipfs_cache_memory_mb * 1024 * 1024,
+        max_disk_bytes: int = settings.ipfs_cache_disk_mb * 1024 * 1024,
+        negative_ttl: float = settings.ipfs_negative_cache_ttl,
+    ):
+        self.directory = Path(directory)
+        self.max_memory_bytes = max_memory_bytes
+        self.max_disk_bytes = max_disk_bytes
+        self.negative_ttl = negative_ttl
+        self._memory: "OrderedDict[str, bytes]" = OrderedDict()
+        self._memory_bytes = 0
+        self._disk: "Optional[OrderedDict[str, int]]" = None
+        self._disk_bytes = 0
+        self._negative: Dict[str, float] = {}
+        self._stats = {"memory_hits": 0, "disk_hits": 0, "negative_hits": 0, "misses": 0, "evictions": 0}
+
+    @staticmethod
+    def _valid_cid(cid: str) -> bool:
+        # "<cid>" or "<directory cid>/<file name>"; anything else must not become a path
+        root, *names = cid.split("/")
+        if not root.isalnum() or len(cid) > 256:
+            return False
+        return all(
+            name not in ("", ".", "..") and all(c.isalnum() or c in "._-" for c in name)
+            for name in names
+        )
+
+    def _path(self, cid: str) -> Path:
+        root = cid.partition("/")[0]
+        return self.directory / root[-2:] / cid.replace("/", "~")
+
+    def _scan_disk(self) -> "OrderedDict[str, int]":
+        """Index existing cache files, oldest access first"""
+        entries = []
+        if self.directory.exists():
+            for path in self.directory.glob("*/*"):
+                if path.is_file() and not path.name.endswith(".tmp"):
+                    stat = path.stat()
+                    entries.append((stat.st_mtime, path.name.replace("~", "/"), stat.st_size))
+        entries.sort()
+        return OrderedDict((name, size) for _, name, size in entries)
+
+    async def _disk_index(self) -> "OrderedDict[str, int]":
+        if self._disk is None:
+            self._disk = await asyncio.to_thread(self._scan_disk)
+            self._disk_bytes = sum(self._disk.values())
+        return self._disk
+
+    def _remember(self, cid: str, content: bytes):
+        if len(content) > self.max_memory_bytes:
+            return
+        previous = self._memory.pop(cid, None)
+        if previous is not None:
+            self._memory_bytes -= len(previous)
+        self._memory[cid] = content
+        self._memory_bytes += len(content)
+        while self._memory_bytes > self.max_memory_bytes:
+            _, evicted = self._memory.popitem(last=False)
+            self._memory_bytes -= len(evicted)
+
+    def is_negative(self, cid: str) -> bool:
+        expires_at = self._negative.get(cid)
+        if expires_at is None:
+            return False
+        if expires_at <= time.monotonic():
+            del self._negative[cid]
+            return False
+        self._stats["negative_hits"] += 1
+        return True
+
+    async def get(self, cid: str) -> Optional[bytes]:
+        """Cached content for a CID, or None"""
+        content = self._memory.get(cid)
+        if content is not None:
+            self._memory.move_to_end(cid)
+            self._stats["memory_hits"] += 1
+            return content
+
+        if self._valid_cid(cid):
+            disk = await self._disk_index()
+            if cid in disk:
+                path = self._path(cid)
+                try:
+                    content = await asyncio.to_thread(path.read_bytes)
+                    await asyncio.to_thread(os.utime, path)
+                except OSError:
+                    self._disk_bytes -= disk.pop(cid)
+                else:
+                    disk.move_to_end(cid)
+                    self._remember(cid, content)
+                    self._stats["disk_hits"] += 1
+                    return content
+
+        self._stats["misses"] += 1
+        return None
+
+    def _write(self, path: Path, content: bytes):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        tmp.write_bytes(content)
+        os.replace(tmp, path)
+
+    def _evict_disk(self, disk: "OrderedDict[str, int]"):
+        while self._disk_bytes > self.max_disk_bytes and disk:
+            cid, size = disk.popitem(last=False)
+            self._disk_bytes -= size
+            self._stats["evictions"] += 1
+            try:
+                self._path(cid).unlink()
+            except OSError:
+                pass
+
+    async def put(self, cid: str, content: bytes):
+        """Store content for a CID (memory and disk) and clear any negative entry"""
+        self._negative.pop(cid, None)
+        self._remember(cid, content)
+        if not self._valid_cid(cid) or len(content) > self.max_disk_bytes:
+            return
+
+        disk = await self._disk_index()
+        if cid in disk:
+            disk.move_to_end(cid)
+            return
+        try:
+            await asyncio.to_thread(self._write, self._path(cid), content)
+        except OSError as e:
+            logger.warning("⚠️ IPFS cache write failed for %s: %s", cid, e)
+            return
+        disk[cid] = len(content)
+        self._disk_bytes += len(content)
+        if self._disk_bytes > self.max_disk_bytes:
+            await asyncio.to_thread(self._evict_disk, disk)
+
+    def put_negative(self, cid: str):
+        """Remember that no gateway could serve this CID"""
+        self._negative[cid] = time.monotonic() + self.negative_ttl
+
+    def metrics(self):
+        return {
+            **self._stats,
+            "memory_entries": len(self._memory),
+            "memory_bytes": self._memory_bytes,
+            "disk_entries": len(self._disk) if self._disk is not None else None,
+            "disk_bytes": self._disk_bytes if self._disk is not None else None,
+            "negative_entries": len(self._negative),
+            "directory": str(self.directory),
+        }
+
+
+cid_cache = CIDCache()
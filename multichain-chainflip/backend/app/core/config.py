@@ -2,6 +2,7 @@
 Configuration settings for ChainFLIP Multi-Chain Backend
 """
 import os
+import tempfile
 from functools import lru_cache
 from typing import Optional
 from pydantic_settings import BaseSettings
@@ -39,6 +40,15 @@ class Settings(BaseSettings):
     # QR Code Encryption Keys
     qr_aes_key: str = os.getenv("QR_AES_KEY", "")
     qr_hmac_key: str = os.getenv("QR_HMAC_KEY", "")
+    qr_write_session_keys_to_env: bool = os.getenv("QR_WRITE_SESSION_KEYS_TO_ENV", "false").lower() == "true"
+    qr_key_cache_size: int = int(os.getenv("QR_KEY_CACHE_SIZE", "1024"))
+    qr_crypto_workers: int = int(os.getenv("QR_CRYPTO_WORKERS", "4"))
+    
+    # Batch authenticity verification (Algorithm 4)
+    authenticity_batch_max_size: int = int(os.getenv("AUTHENTICITY_BATCH_MAX_SIZE", "500"))
+    authenticity_batch_concurrency: int = int(os.getenv("AUTHENTICITY_BATCH_CONCURRENCY", "32"))
+    verification_cache_size: int = int(os.getenv("VERIFICATION_CACHE_SIZE", "10000"))  # 0 disables
+    verification_cache_ttl: float = float(os.getenv("VERIFICATION_CACHE_TTL", "600"))
     
     # Legacy L2 CDK (for backward compatibility)
     l2_cdk_rpc: str = os.getenv("L2_CDK_RPC", "")
@@ -77,6 +87,32 @@ class Settings(BaseSettings):
     dispute_resolution_contract: str = os.getenv("DISPUTE_RESOLUTION_CONTRACT", "")
     marketplace_contract: str = os.getenv("MARKETPLACE_CONTRACT", "")
     
+    # NFT ownership indexer - first block to scan per chain (0 = locate the contract deployment block)
+    nft_index_start_block_base_sepolia: int = int(os.getenv("NFT_INDEX_START_BLOCK_BASE_SEPOLIA", "0"))
+    nft_index_start_block_op_sepolia: int = int(os.getenv("NFT_INDEX_START_BLOCK_OP_SEPOLIA", "0"))
+    nft_index_start_block_arbitrum_sepolia: int = int(os.getenv("NFT_INDEX_START_BLOCK_ARBITRUM_SEPOLIA", "0"))
+    nft_index_start_block_polygon_amoy: int = int(os.getenv("NFT_INDEX_START_BLOCK_POLYGON_AMOY", "0"))
+    nft_index_poll_interval: int = int(os.getenv("NFT_INDEX_POLL_INTERVAL", "30"))
+    nft_index_max_staleness: int = int(os.getenv("NFT_INDEX_MAX_STALENESS", "300"))
+    
+    # Network health snapshot (background poller)
+    network_health_poll_interval: int = int(os.getenv("NETWORK_HEALTH_POLL_INTERVAL", "30"))
+    
+    # Startup - chains whose RPC connection is verified before serving; others connect on first use
+    startup_critical_chains: str = os.getenv("STARTUP_CRITICAL_CHAINS", "polygon_amoy,base_sepolia")
+    startup_service_timeout: float = float(os.getenv("STARTUP_SERVICE_TIMEOUT", "20"))
+    
+    # Transaction pipeline (see app/core/tx_pipeline.py)
+    gas_price_cache_ttl: float = float(os.getenv("GAS_PRICE_CACHE_TTL", "10"))
+    tx_receipt_poll_interval: float = float(os.getenv("TX_RECEIPT_POLL_INTERVAL", "2"))
+    tx_nonce_retries: int = int(os.getenv("TX_NONCE_RETRIES", "3"))
+    tx_nonce_idle_resync: float = float(os.getenv("TX_NONCE_IDLE_RESYNC", "60"))
+    
+    # Confirmation tracker (see app/services/confirmation_tracker.py)
+    tx_tracking_poll_interval: float = float(os.getenv("TX_TRACKING_POLL_INTERVAL", "4"))
+    tx_confirmations: int = int(os.getenv("TX_CONFIRMATIONS", "3"))
+    tx_tracking_timeout: float = float(os.getenv("TX_TRACKING_TIMEOUT", "900"))
+    
     # Bridge and Cross-chain - Updated with real deployed addresses
     bridge_layerzero_hub: str = os.getenv("BRIDGE_LAYERZERO_HUB", "0x72a336eAAC8186906F1Ee85dF00C7d6b91257A43")
     bridge_fxportal_hub: str = os.getenv("BRIDGE_FXPORTAL_HUB", "0xd3c6396D0212Edd8424bd6544E7DF8BA74c16476")
@@ -108,10 +144,28 @@ class Settings(BaseSettings):
     w3storage_token: str = os.getenv("W3STORAGE_TOKEN", "")
     w3storage_proof: str = os.getenv("W3STORAGE_PROOF", "")
     ipfs_gateway: str = os.getenv("IPFS_GATEWAY", "https://w3s.link/ipfs/")
+    ipfs_gateway_timeout: float = float(os.getenv("IPFS_GATEWAY_TIMEOUT", "15"))
+    ipfs_cache_dir: str = os.getenv("IPFS_CACHE_DIR", os.path.join(tempfile.gettempdir(), "chainflip-ipfs-cache"))
+    ipfs_cache_memory_mb: int = int(os.getenv("IPFS_CACHE_MEMORY_MB", "64"))
+    ipfs_cache_disk_mb: int = int(os.getenv("IPFS_CACHE_DISK_MB", "1024"))
+    ipfs_negative_cache_ttl: float = float(os.getenv("IPFS_NEGATIVE_CACHE_TTL", "60"))
+    w3storage_worker_concurrency: int = int(os.getenv("W3STORAGE_WORKER_CONCURRENCY", "8"))
+    w3storage_upload_timeout: float = float(os.getenv("W3STORAGE_UPLOAD_TIMEOUT", "60"))
     
     # Federated Learning
     fl_model_storage: str = os.getenv("FL_MODEL_STORAGE", "./fl_models")
     fl_aggregation_threshold: int = int(os.getenv("FL_AGGREGATION_THRESHOLD", "3"))
+    fl_max_global_estimators: int = int(os.getenv("FL_MAX_GLOBAL_ESTIMATORS", "200"))  # trees kept when merging participants' forests
+    fl_training_workers: int = int(os.getenv("FL_TRAINING_WORKERS", "2"))  # see app/services/fl_executor.py
+    fl_inference_workers: int = int(os.getenv("FL_INFERENCE_WORKERS", "4"))
+    fl_max_queued_jobs: int = int(os.getenv("FL_MAX_QUEUED_JOBS", "16"))
+    fl_job_ttl: int = int(os.getenv("FL_JOB_TTL", "3600"))  # seconds a finished job stays pollable
+    fl_model_refresh_interval: float = float(os.getenv("FL_MODEL_REFRESH_INTERVAL", "30"))  # seconds between active_version checks
+    fl_feature_chunk_size: int = int(os.getenv("FL_FEATURE_CHUNK_SIZE", "8192"))  # records per feature-extraction chunk
+    fl_batch_max_token_ids: int = int(os.getenv("FL_BATCH_MAX_TOKEN_IDS", "1000"))  # per /detect/batch request
+    fl_flagged_report_limit: int = int(os.getenv("FL_FLAGGED_REPORT_LIMIT", "100"))  # flagged token ids listed per batch summary
+    fl_anomaly_training_collection: str = os.getenv("FL_ANOMALY_TRAINING_COLLECTION", "transport_logs")
+    fl_counterfeit_training_collection: str = os.getenv("FL_COUNTERFEIT_TRAINING_COLLECTION", "counterfeit_samples")
     
     # Security
     secret_key: str = os.getenv("SECRET_KEY", "chainflip-multichain-secret-key")
@@ -122,6 +176,15 @@ class Settings(BaseSettings):
     
     # Redis for caching and messaging
     redis_url: str = os.getenv("REDIS_URL", "redis://localhost:6379")
+    response_cache_backend: str = os.getenv("RESPONSE_CACHE_BACKEND", "memory")  # "memory" or "redis"
+    response_cache_ttl: int = int(os.getenv("RESPONSE_CACHE_TTL", "30"))
+    
+    # Logging (see app/core/log.py)
+    log_level: str = os.getenv("LOG_LEVEL", "INFO")
+    log_levels: str = os.getenv("LOG_LEVELS", "")  # per-module overrides, e.g. "app.services.blockchain_service=DEBUG"
+    log_format: str = os.getenv("LOG_FORMAT", "text")  # "text" or "json"
+    log_debug_sample_rate: float = float(os.getenv("LOG_DEBUG_SAMPLE_RATE", "1.0"))
+    log_queue_size: int = int(os.getenv("LOG_QUEUE_SIZE", "10000"))
     
     model_config = {"env_file": ".env", "extra": "allow"}
 
@@ -4,6 +4,7 @@ Database configuration and initialization
 import motor.motor_asyncio
 from pymongo import MongoClient
 from app.core.config import get_settings
+from app.core.index_manifest import index_manifest
 
 settings = get_settings()
 
@@ -70,51 +71,29 @@ async def init_database():
     
     return database
 
+# Core indexes; services register their own collections' indexes in their modules
+for _collection, _fields in {
+    "users": ["role", "approval_status", "registration_date"],
+    "products": ["chain_id", "manufacturer", "created_at"],
+    "transactions": ["tx_hash", "chain_id", "block_number", "timestamp"],
+    "participants": ["participant_type", "chain_id"],
+    "fl_models": ["model_id", "participant_address", "training_round", "created_at"],
+    "qr_codes": ["product_id", "qr_hash", "created_at"],
+    "cross_chain_messages": ["source_chain", "target_chain", "timestamp"],
+}.items():
+    for _field in _fields:
+        index_manifest.register("core", _collection, _field)
+index_manifest.register("core", "users", "email", unique=True)
+index_manifest.register("core", "users", "wallet_address", unique=True)
+index_manifest.register("core", "products", "token_id", unique=True)
+index_manifest.register("core", "participants", "address", unique=True)
+
+
 async def create_indexes():
-    """Create database indexes"""
+    """Create every index declared in the index manifest"""
     
     print("📊 Creating database indexes...")
-    
-    # Users collection
-    await database.users.create_index("email", unique=True)
-    await database.users.create_index("wallet_address", unique=True)
-    await database.users.create_index("role")
-    await database.users.create_index("approval_status")
-    await database.users.create_index("registration_date")
-    
-    # Products collection
-    await database.products.create_index("token_id", unique=True)
-    await database.products.create_index("chain_id")
-    await database.products.create_index("manufacturer")
-    await database.products.create_index("created_at")
-    
-    # Transactions collection
-    await database.transactions.create_index("tx_hash")
-    await database.transactions.create_index("chain_id")
-    await database.transactions.create_index("block_number")
-    await database.transactions.create_index("timestamp")
-    
-    # Participants collection
-    await database.participants.create_index("address", unique=True)
-    await database.participants.create_index("participant_type")
-    await database.participants.create_index("chain_id")
-    
-    # FL Models collection
-    await database.fl_models.create_index("model_id")
-    await database.fl_models.create_index("participant_address")
-    await database.fl_models.create_index("training_round")
-    await database.fl_models.create_index("created_at")
-    
-    # QR Codes collection
-    await database.qr_codes.create_index("product_id")
-    await database.qr_codes.create_index("qr_hash")
-    await database.qr_codes.create_index("created_at")
-    
-    # Cross-chain messages
-    await database.cross_chain_messages.create_index("source_chain")
-    await database.cross_chain_messages.create_index("target_chain")
-    await database.cross_chain_messages.create_index("timestamp")
-    
+    await index_manifest.apply(database)
     print("✅ Database indexes created successfully")
 
 async def get_database():
@@ -0,0 +1,158 @@
+"""
+MongoDB index manifest
+Services declare the indexes they need and the query shapes those indexes
+serve; the manifest creates the indexes idempotently and can explain() every
+query shape to report collection scans
+"""
+import asyncio
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple, Union
+
+from pymongo import IndexModel
+from pymongo.errors import OperationFailure
+
+from app.core.log import get_logger
+
+logger = get_logger(__name__)
+
+IndexKeys = Union[str, Sequence[Tuple[str, int]]]
+
+# createIndex error codes for an index that exists with different options / key spec
+INDEX_CONFLICT_CODES = {85, 86}
+
+
+class IndexSpec(NamedTuple):
+    owner: str
+    collection: str
+    keys: Tuple[Tuple[str, int], ...]
+    options: Tuple[Tuple[str, Any], ...]
+
+    def model(self) -> IndexModel:
+        return IndexModel(list(self.keys), **dict(self.options))
+
+    def describe(self) -> str:
+        fields = ", ".join(f"{field}:{direction}" for field, direction in self.keys)
+        flags = "".join(f" {name}={value}" for name, value in self.options)
+        return f"{self.collection}({fields}){flags}"
+
+
+class QueryShape(NamedTuple):
+    owner: str
+    collection: str
+    filter: Dict[str, Any]
+    sort: Optional[Tuple[Tuple[str, int], ...]]
+    name: str
+
+
+def normalize_keys(keys: IndexKeys) -> Tuple[Tuple[str, int], ...]:
+    if isinstance(keys, str):
+        return ((keys, 1),)
+    return tuple((field, direction) for field, direction in keys)
+
+
+def plan_stages(plan: Any) -> List[str]:
+    """Every stage name in an explain() plan tree (classic and SBE layouts)"""
+    stages = []
+    if isinstance(plan, dict):
+        if "stage" in plan:
+            stages.append(plan["stage"])
+        for value in plan.values():
+            stages.extend(plan_stages(value))
+    elif isinstance(plan, list):
+        for item in plan:
+            stages.extend(plan_stages(item))
+    return stages
+
+
+class IndexManifest:
+    """
+    Declarative registry of MongoDB indexes and the queries they serve
+
+    - register() / register_query() are called at import time by the module
+      that owns the queries; nothing touches the database until apply()
+    - apply() creates every declared index that has not been applied in this
+      process yet; identical existing indexes are no-ops and conflicting ones
+      are reported instead of failing startup
+    - verify() runs explain() on each registered query shape and flags the ones
+      whose winning plan is a collection scan
+    """
+
+    def __init__(self):
+        self._indexes: Dict[Tuple[str, Tuple[Tuple[str, int], ...]], IndexSpec] = {}
+        self._queries: List[QueryShape] = []
+        self._applied: set = set()
+
+    def register(self, owner: str, collection: str, keys: IndexKeys, **options):
+        """Declare an index; the same keys declared twice for a collection keep the first declaration"""
+        spec = IndexSpec(owner, collection, normalize_keys(keys), tuple(sorted(options.items())))
+        self._indexes.setdefault((collection, spec.keys), spec)
+
+    def register_query(
+        self,
+        owner: str,
+        collection: str,
+        filter: Dict[str, Any],
+        sort: Optional[IndexKeys] = None,
+        name: Optional[str] = None,
+    ):
+        """Declare a query shape (representative filter values) that should be index-backed"""
+        sort_keys = normalize_keys(sort) if sort else None
+        self._queries.append(QueryShape(owner, collection, filter, sort_keys, name or f"{collection}:{','.join(filter)}"))
+
+    def indexes(self, owners: Optional[Iterable[str]] = None) -> List[IndexSpec]:
+        owners = set(owners) if owners is not None else None
+        return [spec for spec in self._indexes.values() if owners is None or spec.owner in owners]
+
+    def queries(self, owners: Optional[Iterable[str]] = None) -> List[QueryShape]:
+        owners = set(owners) if owners is not None else None
+        return [query for query in self._queries if owners is None or query.owner in owners]
+
+    async def _create(self, database, spec: IndexSpec) -> Dict[str, Any]:
+        try:
+            name = await database[spec.collection].create_indexes([spec.model()])
+        except OperationFailure as e:
+            if e.code in INDEX_CONFLICT_CODES:
+                logger.warning("⚠️ Index conflict on %s: %s", spec.describe(), e.details.get('errmsg') if e.details else e)
+                return {"index": spec.describe(), "status": "conflict", "error": str(e)}
+            raise
+        self._applied.add((spec.collection, spec.keys))
+        return {"index": spec.describe(), "status": "ok", "name": name[0]}
+
+    async def apply(self, database, owners: Optional[Iterable[str]] = None) -> List[Dict[str, Any]]:
+        """Create declared indexes (collections in parallel, one index at a time per collection)"""
+        pending: Dict[str, List[IndexSpec]] = {}
+        for spec in self.indexes(owners):
+            if (spec.collection, spec.keys) not in self._applied:
+                pending.setdefault(spec.collection, []).append(spec)
+        if not pending:
+            return []
+
+        async def apply_collection(specs: List[IndexSpec]) -> List[Dict[str, Any]]:
+            return [await self._create(database, spec) for spec in specs]
+
+        results = await asyncio.gather(*(apply_collection(specs) for specs in pending.values()))
+        flat = [result for collection_results in results for result in collection_results]
+        created = sum(1 for result in flat if result["status"] == "ok")
+        logger.info("📊 Index manifest applied: %s/%s indexes across %s collections", created, len(flat), len(pending))
+        return flat
+
+    async def verify(self, database, owners: Optional[Iterable[str]] = None) -> List[Dict[str, Any]]:
+        """explain() every registered query shape; status is indexed, collection_scan or missing_collection"""
+        existing = set(await database.list_collection_names())
+        report = []
+        for query in self.queries(owners):
+            entry = {"query": query.name, "owner": query.owner, "collection": query.collection}
+            if query.collection not in existing:
+                report.append({**entry, "status": "missing_collection"})
+                continue
+            cursor = database[query.collection].find(query.filter)
+            if query.sort:
+                cursor = cursor.sort(list(query.sort))
+            explain = await cursor.explain()
+            stages = plan_stages(explain.get("queryPlanner", {}).get("winningPlan", {}))
+            entry["stages"] = stages
+            entry["status"] = "collection_scan" if "COLLSCAN" in stages else "indexed"
+            report.append(entry)
+        return report
+
+
+index_manifest = IndexManifest()
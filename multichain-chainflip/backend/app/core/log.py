@@ -0,0 +1,173 @@
+"""
+Structured logging
+One root configuration for the whole backend: records go through a bounded
+in-memory queue to a background thread that formats and writes them, so a
+log call on a request path never blocks on stdout
+
+- LOG_LEVEL sets the default level, LOG_LEVELS per-module overrides
+  ("app.services.blockchain_service=DEBUG,web3=WARNING")
+- LOG_FORMAT=json emits one JSON object per line (message, level, logger,
+  timestamp and any `extra` fields); "text" is the human-readable default
+- LOG_DEBUG_SAMPLE_RATE keeps only that fraction of DEBUG records per call site
+- messages use logging's lazy %-formatting: arguments are only rendered for
+  records that pass the level check
+"""
+import atexit
+import copy
+import json
+import logging
+import logging.handlers
+import queue
+import sys
+import threading
+from datetime import datetime, timezone
+from typing import Dict, Optional
+
+from app.core.config import get_settings
+
+settings = get_settings()
+
+# Attributes every LogRecord has; anything else came in through `extra`
+_RECORD_ATTRS = set(vars(logging.LogRecord("", 0, "", 0, "", (), None))) | {"message", "asctime", "taskName"}
+
+_exception_formatter = logging.Formatter()
+_listener: Optional[logging.handlers.QueueListener] = None
+_queue_handler: Optional["DroppingQueueHandler"] = None
+
+
+def get_logger(name: str) -> logging.Logger:
+    """Module logger; use as `logger = get_logger(__name__)`"""
+    return logging.getLogger(name)
+
+
+def parse_levels(spec: str) -> Dict[str, int]:
+    """Parse "a.b=DEBUG,c=WARNING" into {"a.b": 10, "c": 30}; malformed entries are ignored"""
+    levels = {}
+    for entry in spec.split(","):
+        name, _, level = entry.partition("=")
+        level = logging.getLevelName(level.strip().upper())
+        if name.strip() and isinstance(level, int):
+            levels[name.strip()] = level
+    return levels
+
+
+class JSONFormatter(logging.Formatter):
+    """One JSON object per record, including `extra` fields"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "timestamp": datetime.fromtimestamp(record.created, timezone.utc).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        for key, value in record.__dict__.items():
+            if key not in _RECORD_ATTRS and not key.startswith("_"):
+                entry[key] = value
+        if record.exc_text:
+            entry["exc_info"] = record.exc_text
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+class DebugSampler(logging.Filter):
+    """
+    Keep 1 in every round(1 / rate) DEBUG records per call site
+
+    The first record from each site always passes, so a rare event is never
+    lost; records at INFO and above are never sampled.
+    """
+
+    def __init__(self, rate: float):
+        super().__init__()
+        self.every = max(1, round(1 / rate)) if rate > 0 else 0
+        self._counts: Dict[tuple, int] = {}
+        self._lock = threading.Lock()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno > logging.DEBUG or self.every == 1:
+            return True
+        if self.every == 0:
+            return False
+        site = (record.pathname, record.lineno)
+        with self._lock:
+            count = self._counts.get(site, 0)
+            self._counts[site] = count + 1
+        return count % self.every == 0
+
+
+class DroppingQueueHandler(logging.handlers.QueueHandler):
+    """
+    Enqueue without blocking; when the writer thread falls behind, records are
+    dropped (and counted) instead of stalling the caller
+    """
+
+    def __init__(self, log_queue: queue.Queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Render the message here so mutable arguments aren't read later from the
+        # writer thread; timestamps and JSON are left to the writer's formatter
+        record = copy.copy(record)
+        record.message = record.getMessage()
+        record.msg, record.args = record.message, None
+        if record.exc_info:
+            record.exc_text = _exception_formatter.formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+def configure_logging(
+    level: str = settings.log_level,
+    levels: str = settings.log_levels,
+    fmt: str = settings.log_format,
+    debug_sample_rate: float = settings.log_debug_sample_rate,
+    queue_size: int = settings.log_queue_size,
+):
+    """Install the queue handler on the root logger (idempotent)"""
+    global _listener, _queue_handler
+    if _listener is not None:
+        return
+
+    output = logging.StreamHandler(sys.stdout)
+    if fmt == "json":
+        output.setFormatter(JSONFormatter())
+    else:
+        output.setFormatter(logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s"))
+
+    _queue_handler = DroppingQueueHandler(queue.Queue(maxsize=queue_size))
+    _queue_handler.addFilter(DebugSampler(debug_sample_rate))
+
+    root = logging.getLogger()
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+    root.addHandler(_queue_handler)
+    root.setLevel(parse_levels(f"root={level}").get("root", logging.INFO))
+    for name, module_level in parse_levels(levels).items():
+        logging.getLogger(name).setLevel(module_level)
+
+    _listener = logging.handlers.QueueListener(_queue_handler.queue, output, respect_handler_level=True)
+    _listener.start()
+    atexit.register(shutdown_logging)
+
+
+def shutdown_logging():
+    """Write out queued records and stop the writer thread"""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+def logging_metrics() -> Dict[str, object]:
+    return {
+        "queued": _queue_handler.queue.qsize() if _queue_handler else 0,
+        "dropped": _queue_handler.dropped if _queue_handler else 0,
+        "level": logging.getLevelName(logging.getLogger().level),
+    }
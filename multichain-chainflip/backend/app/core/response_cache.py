@@ -0,0 +1,226 @@
+"""
+Response cache for hot read endpoints
+TTL + LRU in process by default, Redis (settings.redis_url) when
+RESPONSE_CACHE_BACKEND=redis; writes invalidate whole namespaces
+"""
+import functools
+import hashlib
+import inspect
+import json
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Iterable, Optional, Tuple
+
+from fastapi.encoders import jsonable_encoder
+
+from app.core.config import get_settings
+from app.core.log import get_logger
+from app.core.verification_cache import verification_cache
+
+settings = get_settings()
+logger = get_logger(__name__)
+
+# Namespaces shared by the endpoints and the write paths that invalidate them
+PRODUCTS = "products"
+DASHBOARD = "dashboard"
+
+
+class MemoryCacheBackend:
+    """Bounded LRU with per-entry expiry"""
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._generations: Dict[str, int] = {}
+
+    async def get(self, key: str) -> Tuple[bool, Any]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return False, None
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return False, None
+        self._entries.move_to_end(key)
+        return True, value
+
+    async def set(self, key: str, value: Any, ttl: float):
+        self._entries[key] = (time.monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    async def generation(self, namespace: str) -> int:
+        return self._generations.get(namespace, 0)
+
+    async def bump(self, namespace: str):
+        self._generations[namespace] = self._generations.get(namespace, 0) + 1
+        prefix = f"{namespace}:"
+        for key in [key for key in self._entries if key.startswith(prefix)]:
+            del self._entries[key]
+
+    def size(self) -> int:
+        return len(self._entries)
+
+
+class RedisCacheBackend:
+    """Shared cache across workers; invalidation bumps a per-namespace generation key"""
+
+    def __init__(self, url: str, prefix: str = "chainflip:cache"):
+        import redis.asyncio as redis  # optional dependency, only needed for this backend
+
+        self._redis = redis.from_url(url)
+        self._prefix = prefix
+
+    async def get(self, key: str) -> Tuple[bool, Any]:
+        raw = await self._redis.get(f"{self._prefix}:{key}")
+        if raw is None:
+            return False, None
+        return True, json.loads(raw)
+
+    async def set(self, key: str, value: Any, ttl: float):
+        await self._redis.set(f"{self._prefix}:{key}", json.dumps(jsonable_encoder(value)), ex=max(1, int(ttl)))
+
+    async def generation(self, namespace: str) -> int:
+        value = await self._redis.get(f"{self._prefix}:gen:{namespace}")
+        return int(value) if value else 0
+
+    async def bump(self, namespace: str):
+        # Entries of older generations are never read again and expire by TTL
+        await self._redis.incr(f"{self._prefix}:gen:{namespace}")
+
+    def size(self) -> Optional[int]:
+        return None
+
+
+def normalize_params(params: Dict[str, Any]) -> str:
+    """Stable key material: sorted names, unset parameters dropped"""
+    normalized = {
+        name: value.strip() if isinstance(value, str) else value
+        for name, value in params.items()
+        if value is not None
+    }
+    return json.dumps(normalized, sort_keys=True, default=str)
+
+
+class ResponseCache:
+    """
+    Namespaced response cache with hit/miss metrics
+
+    Keys are namespace, generation, endpoint and normalized parameters;
+    invalidate(namespace) moves the namespace to a new generation so every
+    cached response in it is dropped at once. Backend errors never fail a
+    request - the response is computed as if uncached.
+    """
+
+    def __init__(self, default_ttl: Optional[float] = None, max_entries: int = 1024, backend: Optional[str] = None):
+        self.default_ttl = default_ttl or settings.response_cache_ttl
+        self.max_entries = max_entries
+        self.backend_name = backend or settings.response_cache_backend
+        self._backend = None
+        self._metrics: Dict[str, Dict[str, int]] = {}
+
+    @property
+    def backend(self):
+        if self._backend is None:
+            if self.backend_name == "redis":
+                try:
+                    self._backend = RedisCacheBackend(settings.redis_url)
+                    logger.info("✅ Response cache using Redis at %s", settings.redis_url)
+                except ImportError:
+                    logger.warning("⚠️ redis package not installed, response cache falling back to memory")
+                    self.backend_name = "memory"
+            if self._backend is None:
+                self._backend = MemoryCacheBackend(self.max_entries)
+        return self._backend
+
+    def _count(self, endpoint: str, outcome: str):
+        counters = self._metrics.setdefault(endpoint, {"hits": 0, "misses": 0, "errors": 0})
+        counters[outcome] += 1
+
+    async def get_or_compute(
+        self,
+        namespace: str,
+        endpoint: str,
+        params: Dict[str, Any],
+        compute: Callable[[], Awaitable[Any]],
+        ttl: Optional[float] = None,
+    ) -> Any:
+        key = None
+        try:
+            generation = await self.backend.generation(namespace)
+            digest = hashlib.sha1(normalize_params(params).encode()).hexdigest()
+            key = f"{namespace}:{generation}:{endpoint}:{digest}"
+            found, value = await self.backend.get(key)
+            if found:
+                self._count(endpoint, "hits")
+                return value
+        except Exception as e:
+            self._count(endpoint, "errors")
+            logger.warning("⚠️ Response cache read failed for %s: %s", endpoint, e)
+
+        self._count(endpoint, "misses")
+        value = await compute()
+        if key is not None:
+            try:
+                await self.backend.set(key, value, ttl or self.default_ttl)
+            except Exception as e:
+                self._count(endpoint, "errors")
+                logger.warning("⚠️ Response cache write failed for %s: %s", endpoint, e)
+        return value
+
+    async def invalidate(self, *namespaces: str):
+        for namespace in namespaces:
+            try:
+                await self.backend.bump(namespace)
+            except Exception as e:
+                logger.warning("⚠️ Response cache invalidation failed for %s: %s", namespace, e)
+
+    def cached(self, namespace: str, ttl: Optional[float] = None, exclude: Iterable[str] = ()):
+        """
+        Decorator for route handlers; the key is built from the handler's
+        arguments minus `exclude` (injected dependencies)
+        """
+        excluded = set(exclude)
+
+        def decorator(handler):
+            signature = inspect.signature(handler)
+            endpoint = handler.__name__
+
+            @functools.wraps(handler)
+            async def wrapper(*args, **kwargs):
+                bound = signature.bind(*args, **kwargs)
+                bound.apply_defaults()
+                params = {name: value for name, value in bound.arguments.items() if name not in excluded}
+                return await self.get_or_compute(namespace, endpoint, params, lambda: handler(*args, **kwargs), ttl)
+
+            return wrapper
+
+        return decorator
+
+    def metrics(self) -> Dict[str, Any]:
+        totals = {"hits": 0, "misses": 0, "errors": 0}
+        for counters in self._metrics.values():
+            for outcome, count in counters.items():
+                totals[outcome] += count
+        lookups = totals["hits"] + totals["misses"]
+        return {
+            "backend": self.backend_name,
+            "entries": self.backend.size(),
+            "hit_ratio": round(totals["hits"] / lookups, 3) if lookups else None,
+            "totals": totals,
+            "endpoints": self._metrics,
+        }
+
+
+response_cache = ResponseCache()
+
+
+async def invalidate_product_views(*token_ids: str):
+    """
+    Call after any write to the products collection; pass the token_id of each
+    updated product so its cached authenticity verifications are dropped too
+    """
+    for token_id in token_ids:
+        verification_cache.invalidate(token_id)
+    await response_cache.invalidate(PRODUCTS, DASHBOARD)
@@ -0,0 +1,185 @@
+"""
+Batched contract reads
+Packs many read-only contract calls into Multicall3 aggregate calls, or into
+JSON-RPC batches on chains without Multicall3
+"""
+import asyncio
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence
+
+from eth_abi.exceptions import DecodingError
+from eth_utils import get_abi_output_types
+from web3 import Web3
+from web3._utils.abi import map_abi_data
+from web3._utils.normalizers import BASE_RETURN_NORMALIZERS
+from web3.contract.contract import ContractFunction
+
+from app.core.log import get_logger
+from app.core.web3_pool import web3_pool
+
+logger = get_logger(__name__)
+
+# Multicall3 is deployed at the same address on every supported testnet
+MULTICALL3_ADDRESS = "0xcA11bde05977b3631167028862bE2a173976CA11"
+
+MULTICALL3_ABI = [
+    {
+        "inputs": [
+            {
+                "components": [
+                    {"name": "target", "type": "address"},
+                    {"name": "allowFailure", "type": "bool"},
+                    {"name": "callData", "type": "bytes"}
+                ],
+                "name": "calls",
+                "type": "tuple[]"
+            }
+        ],
+        "name": "aggregate3",
+        "outputs": [
+            {
+                "components": [
+                    {"name": "success", "type": "bool"},
+                    {"name": "returnData", "type": "bytes"}
+                ],
+                "name": "returnData",
+                "type": "tuple[]"
+            }
+        ],
+        "stateMutability": "payable",
+        "type": "function"
+    }
+]
+
+
+class CallResult(NamedTuple):
+    """Outcome of one call in a batch; value is decoded exactly like ContractFunction.call()"""
+    success: bool
+    value: Any = None
+    error: Optional[str] = None
+
+
+def decode_call_result(w3: Web3, fn: ContractFunction, return_data: bytes) -> CallResult:
+    """Decode raw eth_call return data for a bound contract function"""
+    output_types = get_abi_output_types(fn.abi)
+    try:
+        output_data = w3.codec.decode(output_types, return_data)
+    except DecodingError as e:
+        return CallResult(False, error=f"Could not decode {fn.abi['name']} result: {e}")
+    normalized = map_abi_data(BASE_RETURN_NORMALIZERS, output_types, output_data)
+    return CallResult(True, normalized[0] if len(normalized) == 1 else normalized)
+
+
+class BatchReader:
+    """
+    Batched read-only contract calls, one result per call in input order
+
+    - chains with Multicall3 get up to chunk_size calls per aggregate3 eth_call;
+      calls that revert are reported individually (allowFailure)
+    - other chains, or an aggregate call that fails as a whole, use JSON-RPC
+      batches of up to batch_limit eth_calls; a rejected batch falls back to
+      single calls for that chunk
+    - chunks of one request run concurrently within the chain's web3_pool budget
+    """
+
+    def __init__(
+        self,
+        chunk_size: int = 100,
+        batch_limit: int = 20,
+        chunk_sizes: Optional[Dict[str, int]] = None,
+        batch_limits: Optional[Dict[str, int]] = None,
+    ):
+        self.default_chunk_size = chunk_size
+        self.default_batch_limit = batch_limit
+        self.chunk_sizes = chunk_sizes or {}
+        self.batch_limits = batch_limits or {}
+        self._multicall_available: Dict[str, bool] = {}
+
+    def chunk_size(self, chain: str) -> int:
+        return self.chunk_sizes.get(web3_pool.chain_key(chain), self.default_chunk_size)
+
+    def batch_limit(self, chain: str) -> int:
+        return self.batch_limits.get(web3_pool.chain_key(chain), self.default_batch_limit)
+
+    async def has_multicall(self, chain: str) -> bool:
+        key = web3_pool.chain_key(chain)
+        if key not in self._multicall_available:
+            w3 = web3_pool.web3(key)
+            try:
+                code = await web3_pool.run(key, w3.eth.get_code, MULTICALL3_ADDRESS)
+            except Exception as e:
+                logger.warning("⚠️ Multicall3 lookup failed on %s: %s", key, e)
+                return False
+            self._multicall_available[key] = len(code) > 0
+            if not code:
+                logger.info("ℹ️ Multicall3 not deployed on %s, using JSON-RPC batches", key)
+        return self._multicall_available[key]
+
+    async def call(self, chain: str, calls: Sequence[ContractFunction]) -> List[CallResult]:
+        """Execute read-only contract calls on a chain; never raises for individual call failures"""
+        if not calls:
+            return []
+        key = web3_pool.chain_key(chain)
+        use_multicall = await self.has_multicall(key)
+        size = self.chunk_size(key) if use_multicall else self.batch_limit(key)
+        chunks = [list(calls[i:i + size]) for i in range(0, len(calls), size)]
+
+        if use_multicall:
+            results = await asyncio.gather(*(self._multicall_chunk(key, chunk) for chunk in chunks))
+        else:
+            results = await asyncio.gather(*(self._rpc_batch_chunk(key, chunk) for chunk in chunks))
+        return [result for chunk_results in results for result in chunk_results]
+
+    async def _multicall_chunk(self, chain: str, calls: List[ContractFunction]) -> List[CallResult]:
+        w3 = web3_pool.web3(chain)
+        multicall = w3.eth.contract(address=MULTICALL3_ADDRESS, abi=MULTICALL3_ABI)
+        payload = [(fn.address, True, fn._encode_transaction_data()) for fn in calls]
+        try:
+            responses = await web3_pool.run(chain, multicall.functions.aggregate3(payload).call)
+        except Exception as e:
+            logger.warning("⚠️ Multicall3 aggregate failed on %s (%s calls), using JSON-RPC batch: %s", chain, len(calls), e)
+            results = []
+            limit = self.batch_limit(chain)
+            for i in range(0, len(calls), limit):
+                results.extend(await self._rpc_batch_chunk(chain, calls[i:i + limit]))
+            return results
+
+        results = []
+        for fn, (success, return_data) in zip(calls, responses):
+            if not success:
+                results.append(CallResult(False, error=f"{fn.abi['name']} reverted"))
+            else:
+                results.append(decode_call_result(w3, fn, return_data))
+        return results
+
+    async def _rpc_batch_chunk(self, chain: str, calls: List[ContractFunction]) -> List[CallResult]:
+        w3 = web3_pool.web3(chain)
+        requests = [
+            ("eth_call", [{"to": fn.address, "data": fn._encode_transaction_data()}, "latest"])
+            for fn in calls
+        ]
+        try:
+            responses = await web3_pool.run(chain, w3.provider.make_batch_request, requests)
+        except Exception as e:
+            responses = {"error": {"message": str(e)}}
+
+        if not isinstance(responses, list) or len(responses) != len(calls):
+            # Batch rejected as a whole (size limits, provider without batch support)
+            return await asyncio.gather(*(self._single_call(chain, fn) for fn in calls))
+
+        results = []
+        for fn, response in zip(calls, responses):
+            if response.get("error"):
+                error = response["error"]
+                results.append(CallResult(False, error=error.get("message") if isinstance(error, dict) else str(error)))
+            else:
+                results.append(decode_call_result(w3, fn, Web3.to_bytes(hexstr=response.get("result") or "0x")))
+        return results
+
+    async def _single_call(self, chain: str, fn: ContractFunction) -> CallResult:
+        try:
+            return CallResult(True, await web3_pool.run(chain, fn.call))
+        except Exception as e:
+            return CallResult(False, error=str(e))
+
+
+batch_reader = BatchReader()
@@ -0,0 +1,215 @@
+"""
+RPC endpoint router with health scoring
+Tracks latency and error rate per endpoint, prefers the healthiest one and
+fails over to the next when a call fails
+"""
+import statistics
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, Optional
+
+from app.core.config import get_settings
+from app.core.log import get_logger
+
+settings = get_settings()
+logger = get_logger(__name__)
+
+# Public endpoints used as a last resort when the configured ones degrade
+PUBLIC_RPCS = {
+    "polygon_amoy": [
+        "https://rpc-amoy.polygon.technology",
+        "https://polygon-amoy.drpc.org",
+    ],
+}
+
+# JSON-RPC error codes that mean "this endpoint is throttling us", not "the call is invalid"
+RETRYABLE_RPC_ERROR_CODES = {-32005, 429}
+
+
+def default_chain_endpoints() -> Dict[str, List[str]]:
+    """Configured RPC URLs per canonical chain name, primary first"""
+    configured = {
+        "polygon_amoy": [settings.polygon_pos_rpc, settings.polygon_pos_rpc_fallback],
+        "base_sepolia": [settings.base_sepolia_rpc, settings.base_sepolia_rpc_fallback],
+        "arbitrum_sepolia": [settings.arbitrum_sepolia_rpc, settings.arbitrum_sepolia_rpc_fallback],
+        "optimism_sepolia": [settings.optimism_sepolia_rpc, settings.optimism_sepolia_rpc_fallback],
+    }
+    for chain, urls in PUBLIC_RPCS.items():
+        configured.setdefault(chain, []).extend(urls)
+    return configured
+
+
+def normalize_url(url: str) -> str:
+    return url.strip().rstrip("/")
+
+
+class RpcUnavailableError(Exception):
+    """Every endpoint of a chain failed for one call"""
+
+    def __init__(self, chain: str, errors: Dict[str, str]):
+        self.chain = chain
+        self.errors = errors
+        super().__init__(f"All RPC endpoints failed for {chain}: {errors}")
+
+
+class EndpointHealth:
+    """Rolling health statistics for one RPC endpoint"""
+
+    def __init__(self, url: str, window: int):
+        self.url = url
+        self.latencies: Deque[float] = deque(maxlen=window)
+        self.outcomes: Deque[bool] = deque(maxlen=window)
+        self.consecutive_failures = 0
+        self.open_until = 0.0
+        self.last_error: Optional[str] = None
+
+    @property
+    def error_rate(self) -> float:
+        if not self.outcomes:
+            return 0.0
+        return self.outcomes.count(False) / len(self.outcomes)
+
+    @property
+    def latency(self) -> Optional[float]:
+        """Median latency over the window, in seconds"""
+        if not self.latencies:
+            return None
+        return statistics.median(self.latencies)
+
+    def is_open(self, now: float) -> bool:
+        return self.open_until > now
+
+    def to_dict(self, now: float) -> Dict[str, Any]:
+        latency = self.latency
+        return {
+            "url": self.url,
+            "latency_ms": round(latency * 1000, 1) if latency is not None else None,
+            "error_rate": round(self.error_rate, 3),
+            "samples": len(self.outcomes),
+            "circuit_open": self.is_open(now),
+            "consecutive_failures": self.consecutive_failures,
+            "last_error": self.last_error,
+        }
+
+
+class RpcRouter:
+    """
+    Routes RPC calls to the healthiest endpoint of each chain
+
+    - score = median latency scaled up by the recent error rate; endpoints that
+      have not been measured yet rank at untried_latency, in configured order
+    - failure_threshold consecutive failures open an endpoint's circuit for
+      cooldown seconds; after that it is retried (half-open) and one more
+      failure opens it again
+    - when every circuit is open the endpoints are still tried in score order
+      rather than failing the call outright
+    """
+
+    def __init__(
+        self,
+        window: int = 50,
+        failure_threshold: int = 3,
+        cooldown: float = 30.0,
+        untried_latency: float = 1.0,
+        error_penalty: float = 4.0,
+    ):
+        self.window = window
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self.untried_latency = untried_latency
+        self.error_penalty = error_penalty
+        self._endpoints: Dict[str, Dict[str, EndpointHealth]] = {}
+        self._lock = threading.Lock()
+        for chain, urls in default_chain_endpoints().items():
+            self.add_endpoints(chain, urls)
+
+    def add_endpoints(self, chain: str, urls: List[str]):
+        """Register RPC URLs for a chain; already known URLs keep their stats and position"""
+        with self._lock:
+            endpoints = self._endpoints.setdefault(chain, {})
+            for url in urls:
+                if not url:
+                    continue
+                url = normalize_url(url)
+                if url not in endpoints:
+                    endpoints[url] = EndpointHealth(url, self.window)
+
+    def chains(self) -> List[str]:
+        return [chain for chain, endpoints in self._endpoints.items() if endpoints]
+
+    def endpoints(self, chain: str) -> List[str]:
+        """Configured URLs for a chain, in registration order"""
+        return list(self._endpoints.get(chain, {}))
+
+    def _score(self, health: EndpointHealth) -> float:
+        latency = health.latency
+        if latency is None:
+            latency = self.untried_latency
+        return latency * (1 + self.error_penalty * health.error_rate)
+
+    def ranked(self, chain: str) -> List[str]:
+        """Endpoints for a chain, best first; endpoints with an open circuit go last"""
+        now = time.monotonic()
+        with self._lock:
+            endpoints = list(self._endpoints.get(chain, {}).values())
+            order = {health.url: index for index, health in enumerate(endpoints)}
+            endpoints.sort(key=lambda h: (h.is_open(now), self._score(h), order[h.url]))
+        return [health.url for health in endpoints]
+
+    def best(self, chain: str) -> Optional[str]:
+        ranked = self.ranked(chain)
+        return ranked[0] if ranked else None
+
+    def record_success(self, chain: str, url: str, latency: float):
+        with self._lock:
+            health = self._endpoints.get(chain, {}).get(normalize_url(url))
+            if health is None:
+                return
+            health.latencies.append(latency)
+            health.outcomes.append(True)
+            health.consecutive_failures = 0
+            health.open_until = 0.0
+
+    def record_failure(self, chain: str, url: str, error: Any):
+        with self._lock:
+            health = self._endpoints.get(chain, {}).get(normalize_url(url))
+            if health is None:
+                return
+            health.outcomes.append(False)
+            health.consecutive_failures += 1
+            health.last_error = str(error)[:200]
+            if health.consecutive_failures >= self.failure_threshold:
+                health.open_until = time.monotonic() + self.cooldown
+                logger.warning("⚠️ RPC circuit opened for %s endpoint %s (%s)", chain, health.url, health.last_error)
+
+    def dispatch(self, chain: str, call: Callable[[str], Any]) -> Any:
+        """
+        Run call(url) against the endpoints of a chain, best first, until one succeeds
+
+        Blocking; call it from a worker thread (web3_pool.run) rather than the event loop.
+        """
+        errors: Dict[str, str] = {}
+        for url in self.ranked(chain):
+            started = time.perf_counter()
+            try:
+                result = call(url)
+            except Exception as e:
+                self.record_failure(chain, url, e)
+                errors[url] = str(e)
+                continue
+            self.record_success(chain, url, time.perf_counter() - started)
+            return result
+        raise RpcUnavailableError(chain, errors)
+
+    def status(self) -> Dict[str, List[Dict[str, Any]]]:
+        """Health of every endpoint, best first per chain"""
+        now = time.monotonic()
+        result = {}
+        for chain in self.chains():
+            endpoints = self._endpoints[chain]
+            result[chain] = [endpoints[url].to_dict(now) for url in self.ranked(chain)]
+        return result
+
+
+rpc_router = RpcRouter()
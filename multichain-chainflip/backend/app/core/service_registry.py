@@ -0,0 +1,195 @@
+"""
+Process-wide service registry
+Holds the long-lived service singletons and initializes each one exactly once
+"""
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Tuple
+
+
+class ServiceRegistry:
+    """Lifecycle-managed registry of shared service instances"""
+
+    def __init__(self):
+        self._services: Dict[str, Any] = {}
+        self._initialized: Dict[str, float] = {}
+        self._locks: Dict[str, asyncio.Lock] = {}
+        self._dependencies: Dict[str, Tuple[str, ...]] = {}
+        self._timeouts: Dict[str, Optional[float]] = {}
+        self._critical: Dict[str, bool] = {}
+        self._lazy: Dict[str, bool] = {}
+        self._startup_report: Dict[str, Dict[str, Any]] = {}
+
+    def register(
+        self,
+        name: str,
+        service: Any,
+        depends_on: Iterable[str] = (),
+        timeout: Optional[float] = None,
+        critical: bool = False,
+        lazy: bool = False,
+    ) -> Any:
+        """
+        Register a service instance under a name (idempotent for the same instance)
+
+        depends_on, timeout, critical and lazy only matter to initialize_all();
+        registering the same instance again updates them. Lazy services are left
+        out of startup and initialized by get() / dependency() on first use.
+        """
+        existing = self._services.get(name)
+        if existing is not None and existing is not service:
+            raise ValueError(f"Service '{name}' is already registered with a different instance")
+        self._services[name] = service
+        depends_on = tuple(depends_on)
+        if depends_on or name not in self._dependencies:
+            self._dependencies[name] = depends_on
+        if timeout is not None or name not in self._timeouts:
+            self._timeouts[name] = timeout
+        self._critical[name] = critical or self._critical.get(name, False)
+        self._lazy[name] = lazy or self._lazy.get(name, False)
+        return service
+
+    def is_registered(self, name: str) -> bool:
+        return name in self._services
+
+    def is_initialized(self, name: str) -> bool:
+        return name in self._initialized
+
+    def _lock_for(self, name: str) -> asyncio.Lock:
+        lock = self._locks.get(name)
+        if lock is None:
+            lock = self._locks[name] = asyncio.Lock()
+        return lock
+
+    async def initialize(self, name: str) -> Any:
+        """Run the service's initialize() once; concurrent callers wait for the first"""
+        if name not in self._services:
+            raise KeyError(f"Service '{name}' is not registered")
+
+        service = self._services[name]
+        if name in self._initialized:
+            return service
+
+        async with self._lock_for(name):
+            if name not in self._initialized:
+                started = time.perf_counter()
+                initialize = getattr(service, "initialize", None)
+                if initialize is not None:
+                    await initialize()
+                self._initialized[name] = time.perf_counter() - started
+        return service
+
+    def _startup_order(self, names: Iterable[str]) -> List[str]:
+        """Dependencies first; raises on unknown services and cycles"""
+        order: List[str] = []
+        visiting: List[str] = []
+
+        def visit(name: str):
+            if name in order:
+                return
+            if name in visiting:
+                raise ValueError(f"Service dependency cycle: {' -> '.join(visiting + [name])}")
+            if name not in self._services:
+                raise KeyError(f"Service '{name}' is not registered")
+            visiting.append(name)
+            for dependency in self._dependencies.get(name, ()):
+                visit(dependency)
+            visiting.pop()
+            order.append(name)
+
+        for name in names:
+            visit(name)
+        return order
+
+    async def initialize_all(
+        self,
+        names: Optional[Iterable[str]] = None,
+        default_timeout: Optional[float] = None,
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Initialize services concurrently, each as soon as its dependencies are up
+
+        - names defaults to every service not registered as lazy
+        - every initialize() is bounded by the service's timeout (or default_timeout);
+          a service that times out or fails is left uninitialized, so get() retries
+          it on first use, and services depending on it are skipped
+        - returns a per-service report (status, seconds, error); raises RuntimeError
+          afterwards if a critical service did not come up
+        """
+        if names is None:
+            names = [name for name in self._services if not self._lazy.get(name)]
+        order = self._startup_order(names)
+        tasks: Dict[str, asyncio.Task] = {}
+        report: Dict[str, Dict[str, Any]] = {}
+
+        async def start(name: str) -> bool:
+            dependencies = self._dependencies.get(name, ())
+            ready = await asyncio.gather(*(tasks[dependency] for dependency in dependencies))
+            failed = [dependency for dependency, ok in zip(dependencies, ready) if not ok]
+            if failed:
+                report[name] = {"status": "skipped", "seconds": 0.0, "error": f"dependencies not ready: {failed}"}
+                return False
+
+            timeout = self._timeouts.get(name) or default_timeout
+            started = time.perf_counter()
+            try:
+                await asyncio.wait_for(self.initialize(name), timeout)
+                status, error = "ok", None
+            except asyncio.TimeoutError:
+                status, error = "timeout", f"initialize() exceeded {timeout}s"
+            except Exception as e:
+                status, error = "failed", str(e)
+            report[name] = {"status": status, "seconds": round(time.perf_counter() - started, 3), "error": error}
+            return status == "ok"
+
+        for name in order:
+            tasks[name] = asyncio.create_task(start(name))
+        await asyncio.gather(*tasks.values())
+
+        self._startup_report.update(report)
+        critical_failures = [name for name in order if self._critical.get(name) and report[name]["status"] != "ok"]
+        if critical_failures:
+            raise RuntimeError(f"Critical services failed to start: {critical_failures}")
+        return {name: report[name] for name in order}
+
+    async def get(self, name: str) -> Any:
+        """Return the shared, initialized instance of a service"""
+        if name in self._initialized:
+            return self._services[name]
+        return await self.initialize(name)
+
+    def dependency(self, *names: str) -> Callable[[], Awaitable[None]]:
+        """FastAPI dependency that initializes services on first use (router-level Depends)"""
+        async def ensure_initialized():
+            for name in names:
+                if name not in self._initialized:
+                    await self.initialize(name)
+
+        return ensure_initialized
+
+    def get_nowait(self, name: str) -> Optional[Any]:
+        """Return the registered instance without initializing it"""
+        return self._services.get(name)
+
+    def status(self) -> Dict[str, Dict[str, Any]]:
+        """Registration and initialization status for every service"""
+        return {
+            name: {
+                "initialized": name in self._initialized,
+                "init_seconds": self._initialized.get(name),
+                "depends_on": list(self._dependencies.get(name, ())),
+                "lazy": self._lazy.get(name, False),
+                "startup": self._startup_report.get(name),
+            }
+            for name in self._services
+        }
+
+    def reset(self, name: Optional[str] = None):
+        """Forget initialization state so the next get() re-initializes"""
+        if name is None:
+            self._initialized.clear()
+        else:
+            self._initialized.pop(name, None)
+
+
+service_registry = ServiceRegistry()
@@ -0,0 +1,361 @@
+"""
+Transaction pipeline
+Nonces, gas prices and receipts for every signing account, so one account can
+have many transactions in flight: sends are serialized per (chain, account)
+and numbered from a local counter, confirmations are awaited concurrently
+through one receipt poller per chain
+
+    gas_price = await tx_pipeline.gas_price(chain, web3, multiplier=2)
+    pending = await tx_pipeline.submit(chain, web3, account, transaction)
+    receipt = await pending.receipt(timeout=300)
+"""
+import asyncio
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from hexbytes import HexBytes
+from web3 import Web3
+from web3._utils.method_formatters import receipt_formatter
+from web3.datastructures import AttributeDict
+from web3.exceptions import TimeExhausted, TransactionNotFound
+
+from app.core.config import get_settings
+from app.core.log import get_logger
+from app.core.web3_pool import web3_pool
+
+settings = get_settings()
+logger = get_logger(__name__)
+
+# send_raw_transaction errors meaning the nonce we used is already taken
+NONCE_TAKEN_ERRORS = ("nonce too low", "replacement transaction underpriced", "already been used", "invalid nonce")
+# ... or that the node hasn't seen the transactions before it
+NONCE_GAP_ERRORS = ("nonce too high", "nonce gap")
+# ... or that this exact transaction is already in the mempool
+ALREADY_KNOWN_ERRORS = ("already known", "already imported", "known transaction")
+
+RECEIPT_BATCH_SIZE = 50
+
+
+def hash_hex(tx_hash: Any) -> str:
+    """0x-prefixed lowercase hex of a transaction hash (HexBytes, bytes or str)"""
+    if isinstance(tx_hash, str):
+        return tx_hash.lower() if tx_hash.startswith("0x") else f"0x{tx_hash.lower()}"
+    return Web3.to_hex(tx_hash)
+
+
+def _matches(error: Exception, patterns: Tuple[str, ...]) -> bool:
+    message = str(error).lower()
+    return any(pattern in message for pattern in patterns)
+
+
+async def _single_receipt(chain: str, web3: Web3, tx_hash_hex: str) -> Optional[AttributeDict]:
+    try:
+        return await web3_pool.run(chain, web3.eth.get_transaction_receipt, tx_hash_hex)
+    except TransactionNotFound:
+        return None
+
+
+async def fetch_receipts(chain: str, web3: Web3, hashes: List[str]) -> Dict[str, AttributeDict]:
+    """
+    Receipts that exist so far for the given transaction hashes, keyed by hash
+
+    One JSON-RPC batch per RECEIPT_BATCH_SIZE hashes; single
+    eth_getTransactionReceipt calls where the batch is refused.
+    """
+    found = {}
+    for i in range(0, len(hashes), RECEIPT_BATCH_SIZE):
+        chunk = hashes[i:i + RECEIPT_BATCH_SIZE]
+        try:
+            responses = await web3_pool.run(
+                chain, web3.provider.make_batch_request,
+                [("eth_getTransactionReceipt", [tx_hash_hex]) for tx_hash_hex in chunk],
+            )
+        except Exception:
+            responses = None
+        if isinstance(responses, list) and len(responses) == len(chunk):
+            for tx_hash_hex, response in zip(chunk, responses):
+                if isinstance(response, dict) and response.get("result"):
+                    found[tx_hash_hex] = AttributeDict.recursive(receipt_formatter(response["result"]))
+            continue
+        # Batch rejected as a whole (size limits, provider without batch support)
+        receipts = await asyncio.gather(*(_single_receipt(chain, web3, tx_hash_hex) for tx_hash_hex in chunk))
+        found.update((tx_hash_hex, receipt) for tx_hash_hex, receipt in zip(chunk, receipts) if receipt is not None)
+    return found
+
+
+class AccountNonce:
+    """Local nonce counter of one (chain, account); lock serializes its sends"""
+
+    __slots__ = ("lock", "next", "last_used")
+
+    def __init__(self):
+        self.lock = asyncio.Lock()
+        self.next: Optional[int] = None
+        self.last_used = 0.0
+
+
+class NonceManager:
+    """
+    Per-(chain, account) nonce allocation
+
+    - the first send reads the pending transaction count; later sends count up
+      locally without an RPC call
+    - an account idle for idle_resync seconds re-reads the chain, so a dropped
+      transaction or a send from outside this process can't wedge it
+    - resync() after a nonce error moves past the nonce the node rejected
+    """
+
+    def __init__(self, idle_resync: float = settings.tx_nonce_idle_resync):
+        self.idle_resync = idle_resync
+        self._accounts: Dict[Tuple[str, str], AccountNonce] = {}
+        self._stats = {"allocated": 0, "chain_reads": 0, "resyncs": 0}
+
+    def account(self, chain: str, address: str) -> AccountNonce:
+        key = (web3_pool.chain_key(chain), address.lower())
+        state = self._accounts.get(key)
+        if state is None:
+            state = self._accounts[key] = AccountNonce()
+        return state
+
+    async def _pending_count(self, chain: str, web3: Web3, address: str) -> int:
+        self._stats["chain_reads"] += 1
+        return await web3_pool.run(chain, web3.eth.get_transaction_count, address, "pending")
+
+    async def next(self, chain: str, web3: Web3, address: str) -> int:
+        """Nonce for the account's next send; call with the account lock held"""
+        state = self.account(chain, address)
+        if state.next is None or time.monotonic() - state.last_used > self.idle_resync:
+            state.next = await self._pending_count(chain, web3, address)
+        return state.next
+
+    def advance(self, chain: str, address: str, nonce: int):
+        """Record that `nonce` was accepted by the node"""
+        state = self.account(chain, address)
+        state.next = nonce + 1
+        state.last_used = time.monotonic()
+        self._stats["allocated"] += 1
+
+    async def resync(self, chain: str, web3: Web3, address: str, taken: Optional[int] = None):
+        """Re-read the chain's count; `taken` is a nonce the node reported as used"""
+        self._stats["resyncs"] += 1
+        state = self.account(chain, address)
+        pending = await self._pending_count(chain, web3, address)
+        state.next = pending if taken is None else max(pending, taken + 1)
+        state.last_used = time.monotonic()
+
+    def forget(self, chain: str, address: str):
+        """Re-read the chain on the account's next send (e.g. after a receipt timeout)"""
+        self.account(chain, address).next = None
+
+    def metrics(self) -> Dict[str, Any]:
+        return {**self._stats, "accounts": len(self._accounts)}
+
+
+class GasPriceOracle:
+    """
+    Per-chain gas price, cached for ttl seconds
+
+    Concurrent callers on an expired chain share one eth_gasPrice request.
+    """
+
+    def __init__(self, ttl: float = settings.gas_price_cache_ttl):
+        self.ttl = ttl
+        self._prices: Dict[str, Tuple[int, float]] = {}
+        self._refreshing: Dict[str, asyncio.Task] = {}
+        self._stats = {"hits": 0, "refreshes": 0}
+
+    async def get(self, chain: str, web3: Web3) -> int:
+        key = web3_pool.chain_key(chain)
+        cached = self._prices.get(key)
+        if cached is not None and cached[1] > time.monotonic():
+            self._stats["hits"] += 1
+            return cached[0]
+        task = self._refreshing.get(key)
+        if task is None:
+            task = self._refreshing[key] = asyncio.create_task(self._refresh(key, web3))
+        return await asyncio.shield(task)
+
+    async def _refresh(self, chain: str, web3: Web3) -> int:
+        try:
+            self._stats["refreshes"] += 1
+            price = await web3_pool.run(chain, lambda: web3.eth.gas_price)
+            self._prices[chain] = (price, time.monotonic() + self.ttl)
+            return price
+        finally:
+            self._refreshing.pop(chain, None)
+
+    def invalidate(self, chain: str):
+        self._prices.pop(web3_pool.chain_key(chain), None)
+
+    def metrics(self) -> Dict[str, Any]:
+        return {**self._stats, "chains": {chain: price for chain, (price, _) in self._prices.items()}}
+
+
+class _Watch:
+    __slots__ = ("future", "waiters")
+
+    def __init__(self, future: asyncio.Future):
+        self.future = future
+        self.waiters = 0
+
+
+class ReceiptWatcher:
+    """
+    Awaitable transaction receipts
+
+    One poller per chain runs while any of its transactions is awaited and
+    fetches all of their receipts with fetch_receipts() every poll_interval.
+    """
+
+    def __init__(self, poll_interval: float = settings.tx_receipt_poll_interval):
+        self.poll_interval = poll_interval
+        self._pending: Dict[str, Dict[str, _Watch]] = {}
+        self._clients: Dict[str, Web3] = {}
+        self._pollers: Dict[str, asyncio.Task] = {}
+        self._stats = {"watched": 0, "confirmed": 0, "timeouts": 0, "polls": 0}
+
+    async def wait(self, chain: str, web3: Web3, tx_hash: Any, timeout: float = 300.0) -> AttributeDict:
+        """Receipt of a sent transaction; raises web3's TimeExhausted after timeout seconds"""
+        key = web3_pool.chain_key(chain)
+        tx_hash_hex = hash_hex(tx_hash)
+        pending = self._pending.setdefault(key, {})
+        watch = pending.get(tx_hash_hex)
+        if watch is None:
+            watch = pending[tx_hash_hex] = _Watch(asyncio.get_running_loop().create_future())
+            self._stats["watched"] += 1
+        watch.waiters += 1
+        self._clients[key] = web3
+        poller = self._pollers.get(key)
+        if poller is None or poller.done():
+            self._pollers[key] = asyncio.create_task(self._poll(key))
+        try:
+            return await asyncio.wait_for(asyncio.shield(watch.future), timeout)
+        except asyncio.TimeoutError:
+            self._stats["timeouts"] += 1
+            raise TimeExhausted(f"Transaction {tx_hash_hex} is not in the chain after {timeout} seconds")
+        finally:
+            watch.waiters -= 1
+            if watch.waiters == 0 and pending.get(tx_hash_hex) is watch:
+                del pending[tx_hash_hex]
+
+    async def _poll(self, chain: str):
+        while self._pending.get(chain):
+            await asyncio.sleep(self.poll_interval)
+            pending = self._pending.get(chain, {})
+            hashes = list(pending)
+            if not hashes:
+                break
+            self._stats["polls"] += 1
+            try:
+                receipts = await fetch_receipts(chain, self._clients[chain], hashes)
+            except Exception as e:
+                logger.warning("⚠️ Receipt poll failed on %s (%s pending): %s", chain, len(hashes), e)
+                continue
+            for tx_hash_hex, receipt in receipts.items():
+                watch = pending.pop(tx_hash_hex, None)
+                if watch is not None and not watch.future.done():
+                    watch.future.set_result(receipt)
+                    self._stats["confirmed"] += 1
+
+    async def close(self):
+        for task in self._pollers.values():
+            task.cancel()
+        await asyncio.gather(*self._pollers.values(), return_exceptions=True)
+        self._pollers.clear()
+
+    def metrics(self) -> Dict[str, Any]:
+        return {**self._stats, "pending": sum(len(pending) for pending in self._pending.values())}
+
+
+class PendingTransaction:
+    """A transaction accepted by the node; await receipt() for its confirmation"""
+
+    __slots__ = ("chain", "tx_hash", "nonce", "address", "_web3", "_pipeline")
+
+    def __init__(self, pipeline: "TransactionPipeline", chain: str, web3: Web3, tx_hash: HexBytes, nonce: int, address: str):
+        self._pipeline = pipeline
+        self._web3 = web3
+        self.chain = chain
+        self.tx_hash = tx_hash
+        self.nonce = nonce
+        self.address = address
+
+    async def receipt(self, timeout: float = 300.0) -> AttributeDict:
+        try:
+            return await self._pipeline.receipts.wait(self.chain, self._web3, self.tx_hash, timeout)
+        except TimeExhausted:
+            # The transaction may have been dropped, leaving a gap behind our local counter
+            self._pipeline.nonces.forget(self.chain, self.address)
+            raise
+
+
+class TransactionPipeline:
+    """
+    Sign-and-send for local accounts
+
+    submit() numbers the transaction from the account's local nonce, signs and
+    sends it, and returns as soon as the node accepts it. Nonce conflicts
+    (another sender, a dropped transaction) resync the counter and are retried
+    up to nonce_retries times; any other send error leaves the nonce unused.
+    """
+
+    def __init__(
+        self,
+        nonces: Optional[NonceManager] = None,
+        gas: Optional[GasPriceOracle] = None,
+        receipts: Optional[ReceiptWatcher] = None,
+        nonce_retries: int = settings.tx_nonce_retries,
+    ):
+        self.nonces = nonces or NonceManager()
+        self.gas = gas or GasPriceOracle()
+        self.receipts = receipts or ReceiptWatcher()
+        self.nonce_retries = nonce_retries
+        self._stats = {"submitted": 0, "nonce_retries": 0, "failed": 0}
+
+    async def gas_price(self, chain: str, web3: Web3, multiplier: float = 1.0, minimum: int = 0) -> int:
+        """Cached network gas price, scaled by multiplier and floored at minimum"""
+        return max(int(await self.gas.get(chain, web3) * multiplier), minimum)
+
+    async def submit(self, chain: str, web3: Web3, account, transaction: Dict[str, Any]) -> PendingTransaction:
+        """Sign and send a built transaction (its nonce is assigned here); raises on send errors"""
+        key = web3_pool.chain_key(chain)
+        address = account.address
+        async with self.nonces.account(key, address).lock:
+            attempt = 0
+            while True:
+                nonce = await self.nonces.next(key, web3, address)
+                signed = account.sign_transaction({**transaction, "nonce": nonce})
+                try:
+                    tx_hash = await web3_pool.run(key, web3.eth.send_raw_transaction, signed.raw_transaction)
+                except Exception as e:
+                    if _matches(e, ALREADY_KNOWN_ERRORS):
+                        tx_hash = Web3.keccak(signed.raw_transaction)
+                    elif attempt < self.nonce_retries and _matches(e, NONCE_TAKEN_ERRORS + NONCE_GAP_ERRORS):
+                        attempt += 1
+                        self._stats["nonce_retries"] += 1
+                        taken = nonce if _matches(e, NONCE_TAKEN_ERRORS) else None
+                        logger.warning("⚠️ Nonce %s rejected on %s for %s, resyncing: %s", nonce, key, address, e)
+                        await self.nonces.resync(key, web3, address, taken)
+                        continue
+                    else:
+                        self._stats["failed"] += 1
+                        raise
+                self.nonces.advance(key, address, nonce)
+                self._stats["submitted"] += 1
+                logger.debug("📤 Sent %s on %s (nonce %s)", hash_hex(tx_hash), key, nonce)
+                return PendingTransaction(self, key, web3, HexBytes(tx_hash), nonce, address)
+
+    async def close(self):
+        """Stop receipt pollers (called on application shutdown)"""
+        await self.receipts.close()
+
+    def metrics(self) -> Dict[str, Any]:
+        return {
+            **self._stats,
+            "nonces": self.nonces.metrics(),
+            "gas_price": self.gas.metrics(),
+            "receipts": self.receipts.metrics(),
+        }
+
+
+tx_pipeline = TransactionPipeline()
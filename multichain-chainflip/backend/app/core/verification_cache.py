@@ -0,0 +1,113 @@
+"""
+Authenticity verification result cache
+Algorithm 4 outcomes depend only on the QR payload, the product document and
+its (immutable) IPFS metadata, so repeat scans of the same QR code can reuse
+the previous outcome until the product is written again
+"""
+import copy
+import hashlib
+import json
+import time
+from collections import OrderedDict
+from typing import Any, Dict, NamedTuple, Optional, Set, Tuple
+
+from app.core.config import get_settings
+
+settings = get_settings()
+
+CacheKey = Tuple[str, str, str]
+
+
+class CachedVerification(NamedTuple):
+    result: str  # verification event result, e.g. "authentic"
+    response: str  # plain response for callers that don't ask for details
+    detailed: Optional[Dict[str, Any]]  # detailed response, if the outcome has one
+    authentic: bool
+    expires_at: float
+
+
+class VerificationCache:
+    """
+    Bounded LRU of verification outcomes keyed by (token_id, payload digest, owner)
+
+    - entries expire after ttl seconds and are dropped as soon as their product
+      is invalidated (invalidate_product_views(token_id) on every products write)
+    - a per-product generation stops a verification that raced with a write
+      from caching its now-stale outcome
+    """
+
+    def __init__(self, max_entries: int = settings.verification_cache_size, ttl: float = settings.verification_cache_ttl):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries: "OrderedDict[CacheKey, CachedVerification]" = OrderedDict()
+        self._by_product: Dict[str, Set[CacheKey]] = {}
+        self._generations: Dict[str, int] = {}
+        self._epoch = 0
+        self._stats = {"hits": 0, "misses": 0, "stores": 0, "invalidations": 0}
+
+    @staticmethod
+    def key(product_id: str, qr_data: Any, current_owner: Optional[str]) -> CacheKey:
+        payload = qr_data if isinstance(qr_data, str) else json.dumps(qr_data, sort_keys=True, default=str)
+        digest = hashlib.sha256(payload.encode("utf-8")).hexdigest()
+        return str(product_id), digest, (current_owner or "").lower()
+
+    def generation(self, product_id: str) -> Tuple[int, int]:
+        return self._epoch, self._generations.get(str(product_id), 0)
+
+    def get(self, key: CacheKey) -> Optional[CachedVerification]:
+        entry = self._entries.get(key)
+        if entry is None or entry.expires_at <= time.monotonic():
+            if entry is not None:
+                self._discard(key)
+            self._stats["misses"] += 1
+            return None
+        self._entries.move_to_end(key)
+        self._stats["hits"] += 1
+        return entry
+
+    def store(self, key: CacheKey, generation: Tuple[int, int], result: str, response: str, detailed: Optional[Dict[str, Any]] = None, authentic: bool = False):
+        """Cache an outcome computed while the product was at `generation`"""
+        if self.max_entries <= 0 or generation != self.generation(key[0]):
+            return
+        self._discard(key)
+        self._entries[key] = CachedVerification(
+            result, response, copy.deepcopy(detailed), authentic, time.monotonic() + self.ttl
+        )
+        self._by_product.setdefault(key[0], set()).add(key)
+        self._stats["stores"] += 1
+        while len(self._entries) > self.max_entries:
+            self._discard(next(iter(self._entries)))
+
+    def _discard(self, key: CacheKey):
+        if self._entries.pop(key, None) is None:
+            return
+        keys = self._by_product.get(key[0])
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._by_product[key[0]]
+
+    def invalidate(self, product_id: Optional[str] = None):
+        """Drop cached outcomes for one product, or for all products"""
+        self._stats["invalidations"] += 1
+        if product_id is None:
+            self._epoch += 1
+            self._generations.clear()
+            self._entries.clear()
+            self._by_product.clear()
+            return
+        product_id = str(product_id)
+        self._generations[product_id] = self._generations.get(product_id, 0) + 1
+        for key in list(self._by_product.get(product_id, ())):
+            self._discard(key)
+
+    def metrics(self) -> Dict[str, Any]:
+        lookups = self._stats["hits"] + self._stats["misses"]
+        return {
+            **self._stats,
+            "entries": len(self._entries),
+            "hit_ratio": round(self._stats["hits"] / lookups, 3) if lookups else None,
+        }
+
+
+verification_cache = VerificationCache()
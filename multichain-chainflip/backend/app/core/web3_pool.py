@@ -0,0 +1,300 @@
+"""
+Pooled Web3 connections shared by every chain service
+One keep-alive HTTP session and one concurrency budget per chain; requests are
+routed to the healthiest RPC endpoint by app.core.rpc_router
+"""
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import aiohttp
+import requests
+from requests.adapters import HTTPAdapter
+from web3 import AsyncWeb3, Web3
+from web3.middleware import ExtraDataToPOAMiddleware
+from web3.providers.rpc import AsyncHTTPProvider, HTTPProvider
+
+from app.core.config import get_settings
+from app.core.rpc_router import RETRYABLE_RPC_ERROR_CODES, normalize_url, rpc_router
+
+settings = get_settings()
+
+# Services name the same chains differently; everything is pooled under the canonical name
+CHAIN_ALIASES = {
+    "polygon_pos": "polygon_amoy",
+    "amoy": "polygon_amoy",
+    "hub": "polygon_amoy",
+    "manufacturer": "base_sepolia",
+    "transporter": "arbitrum_sepolia",
+    "buyer": "optimism_sepolia",
+}
+
+
+class RoutedHTTPProvider(HTTPProvider):
+    """HTTP provider that sends every request to the healthiest endpoint of a chain"""
+
+    def __init__(self, pool: "Web3ConnectionPool", chain: str):
+        super().__init__(rpc_router.best(chain), exception_retry_configuration=None)
+        self._pool = pool
+        self._chain = chain
+
+    def __str__(self) -> str:
+        return f"Routed RPC connection {self._chain}"
+
+    def make_request(self, method, params):
+        attempts = []
+
+        def call(url: str):
+            attempts.append(url)
+            response = self._pool.endpoint_provider(self._chain, url).make_request(method, params)
+            error = response.get("error") if isinstance(response, dict) else None
+            if isinstance(error, dict):
+                if error.get("code") in RETRYABLE_RPC_ERROR_CODES:
+                    raise ConnectionError(f"RPC throttled: {error.get('message')}")
+                if (
+                    method == "eth_sendRawTransaction"
+                    and len(attempts) > 1
+                    and "already known" in str(error.get("message", "")).lower()
+                ):
+                    # A previous endpoint accepted the transaction before the call failed
+                    return {"jsonrpc": "2.0", "id": response.get("id"), "result": Web3.to_hex(Web3.keccak(hexstr=params[0]))}
+            return response
+
+        return rpc_router.dispatch(self._chain, call)
+
+    def make_batch_request(self, batch_requests):
+        return rpc_router.dispatch(
+            self._chain,
+            lambda url: self._pool.endpoint_provider(self._chain, url).make_batch_request(batch_requests),
+        )
+
+
+class Web3ConnectionPool:
+    """
+    Shared Web3 clients keyed by chain name
+
+    - web3(chain) returns a synchronous client backed by a pooled keep-alive
+      requests.Session; each request goes to the healthiest endpoint and fails
+      over to the next one. Blocking calls on it belong in run() so they execute
+      off the event loop
+    - web3(chain, rpc_url) pins a client to one endpoint (connectivity probes)
+    - async_web3(chain) returns an AsyncWeb3 client on a pooled aiohttp session,
+      bound to the endpoint that currently ranks best
+    - every chain has its own concurrency budget, so a slow RPC only queues
+      calls to that chain
+    - connect() only blocks on critical chains; the others are handed out
+      unprobed and measured in the background
+    """
+
+    def __init__(
+        self,
+        max_concurrency_per_chain: int = 8,
+        request_timeout: float = 15.0,
+        blocking_workers: int = 32,
+        critical_chains: Optional[List[str]] = None,
+    ):
+        self.max_concurrency_per_chain = max_concurrency_per_chain
+        self.critical_chains = {self.chain_key(chain.strip()) for chain in critical_chains or [] if chain.strip()}
+        self.request_timeout = request_timeout
+        self._endpoint_providers: Dict[Tuple[str, str], HTTPProvider] = {}
+        self._sync_clients: Dict[Tuple[str, Optional[str]], Web3] = {}
+        self._async_clients: Dict[Tuple[str, str], AsyncWeb3] = {}
+        self._sync_sessions: Dict[str, requests.Session] = {}
+        self._async_sessions: Dict[str, aiohttp.ClientSession] = {}
+        self._limits: Dict[str, asyncio.Semaphore] = {}
+        self._executor = ThreadPoolExecutor(max_workers=blocking_workers, thread_name_prefix="web3-rpc")
+        self._background_probes: Dict[str, asyncio.Task] = {}
+
+    @staticmethod
+    def chain_key(chain: str) -> str:
+        return CHAIN_ALIASES.get(chain, chain)
+
+    def rpc_url(self, chain: str) -> Optional[str]:
+        """Endpoint that currently ranks best for a chain"""
+        return rpc_router.best(self.chain_key(chain))
+
+    def add_endpoints(self, chain: str, urls: List[str]):
+        """Register extra RPC URLs for a chain with the router"""
+        rpc_router.add_endpoints(self.chain_key(chain), urls)
+
+    def chains(self) -> List[str]:
+        return rpc_router.chains()
+
+    def _resolve(self, chain: str, rpc_url: Optional[str]) -> Tuple[str, str]:
+        key = self.chain_key(chain)
+        url = normalize_url(rpc_url) if rpc_url else rpc_router.best(key)
+        if not url:
+            raise ValueError(f"No RPC URL configured for chain '{chain}'")
+        return key, url
+
+    def _sync_session(self, chain: str) -> requests.Session:
+        session = self._sync_sessions.get(chain)
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(
+                pool_connections=4,
+                pool_maxsize=self.max_concurrency_per_chain,
+                pool_block=True,
+            )
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            self._sync_sessions[chain] = session
+        return session
+
+    def endpoint_provider(self, chain: str, url: str) -> HTTPProvider:
+        """Pooled provider for a single endpoint; failover replaces web3's own retries"""
+        key = self.chain_key(chain)
+        provider = self._endpoint_providers.get((key, url))
+        if provider is None:
+            provider = HTTPProvider(
+                url,
+                request_kwargs={"timeout": self.request_timeout},
+                session=self._sync_session(key),
+                exception_retry_configuration=None,
+            )
+            self._endpoint_providers[(key, url)] = provider
+        return provider
+
+    def web3(self, chain: str, rpc_url: Optional[str] = None) -> Web3:
+        """Shared synchronous client for a chain; routed unless rpc_url pins it to one endpoint"""
+        key = self.chain_key(chain)
+        if rpc_url:
+            key, url = self._resolve(chain, rpc_url)
+        else:
+            if not rpc_router.endpoints(key):
+                raise ValueError(f"No RPC URL configured for chain '{chain}'")
+            url = None
+        client = self._sync_clients.get((key, url))
+        if client is None:
+            provider = self.endpoint_provider(key, url) if url else RoutedHTTPProvider(self, key)
+            client = Web3(provider)
+            client.middleware_onion.inject(ExtraDataToPOAMiddleware, layer=0)
+            self._sync_clients[(key, url)] = client
+        return client
+
+    async def async_web3(self, chain: str, rpc_url: Optional[str] = None) -> AsyncWeb3:
+        """Shared AsyncWeb3 client for the best-ranked endpoint of a chain (or a specific RPC URL)"""
+        key, url = self._resolve(chain, rpc_url)
+        client = self._async_clients.get((key, url))
+        if client is None:
+            session = self._async_sessions.get(key)
+            if session is None or session.closed:
+                session = aiohttp.ClientSession(
+                    connector=aiohttp.TCPConnector(
+                        limit=self.max_concurrency_per_chain,
+                        keepalive_timeout=30,
+                    ),
+                    timeout=aiohttp.ClientTimeout(total=self.request_timeout),
+                )
+                self._async_sessions[key] = session
+            provider = AsyncHTTPProvider(url)
+            await provider.cache_async_session(session)
+            client = AsyncWeb3(provider)
+            client.middleware_onion.inject(ExtraDataToPOAMiddleware, layer=0)
+            self._async_clients[(key, url)] = client
+        return client
+
+    def chain_of(self, client: Web3) -> str:
+        """Canonical chain name a pooled client belongs to"""
+        for (key, _), pooled in self._sync_clients.items():
+            if pooled is client:
+                return key
+        return "unpooled"
+
+    def limiter(self, chain: str) -> asyncio.Semaphore:
+        key = self.chain_key(chain)
+        limit = self._limits.get(key)
+        if limit is None:
+            limit = self._limits[key] = asyncio.Semaphore(self.max_concurrency_per_chain)
+        return limit
+
+    async def run(self, chain: str, fn: Callable[..., Any], *args, bounded: bool = True, **kwargs) -> Any:
+        """
+        Run a blocking web3 call in the RPC thread pool
+
+        bounded=False skips the per-chain budget; use it for long waits such as
+        wait_for_transaction_receipt so they don't starve short calls.
+        """
+        loop = asyncio.get_running_loop()
+        call = partial(fn, *args, **kwargs)
+        if not bounded:
+            return await loop.run_in_executor(self._executor, call)
+        async with self.limiter(chain):
+            return await loop.run_in_executor(self._executor, call)
+
+    async def is_connected(self, chain: str, rpc_url: Optional[str] = None) -> bool:
+        try:
+            client = await self.async_web3(chain, rpc_url)
+            return await client.is_connected()
+        except Exception:
+            return False
+
+    async def latest_block(self, chain: str, rpc_url: Optional[str] = None) -> Optional[int]:
+        """Latest block number, or None when the endpoint is unreachable; feeds the router's health stats"""
+        key = self.chain_key(chain)
+        url = None
+        started = time.perf_counter()
+        try:
+            key, url = self._resolve(chain, rpc_url)
+            client = await self.async_web3(key, url)
+            block = await client.eth.block_number
+        except Exception as e:
+            if url:
+                rpc_router.record_failure(key, url, e)
+            return None
+        rpc_router.record_success(key, url, time.perf_counter() - started)
+        return block
+
+    async def probe(self, chain: str) -> Dict[str, Optional[int]]:
+        """Measure every endpoint of a chain concurrently; returns latest block per URL"""
+        key = self.chain_key(chain)
+        urls = rpc_router.endpoints(key)
+        blocks = await asyncio.gather(*(self.latest_block(key, url) for url in urls))
+        return dict(zip(urls, blocks))
+
+    async def connect(self, chain: str, lazy: Optional[bool] = None) -> Optional[Web3]:
+        """
+        Routed client for a chain, or None when no endpoint responds
+
+        Checks the best-ranked endpoint first and only probes the rest
+        concurrently when it is down. Lazy connects (the default for chains
+        outside critical_chains) return the routed client without waiting and
+        probe in the background; the first real call fails over as usual.
+        """
+        key = self.chain_key(chain)
+        if lazy is None:
+            lazy = key not in self.critical_chains
+        if lazy and rpc_router.endpoints(key):
+            self._probe_in_background(key)
+            return self.web3(key)
+        if await self.latest_block(chain) is None:
+            blocks = await self.probe(chain)
+            if all(block is None for block in blocks.values()):
+                return None
+        return self.web3(chain)
+
+    def _probe_in_background(self, chain: str):
+        task = self._background_probes.get(chain)
+        if task is None or task.done():
+            self._background_probes[chain] = asyncio.create_task(self.probe(chain))
+
+    async def close(self):
+        """Close pooled sessions (called on application shutdown)"""
+        for task in self._background_probes.values():
+            task.cancel()
+        self._background_probes.clear()
+        for session in self._async_sessions.values():
+            if not session.closed:
+                await session.close()
+        for session in self._sync_sessions.values():
+            session.close()
+        self._async_sessions.clear()
+        self._sync_sessions.clear()
+        self._async_clients.clear()
+        self._sync_clients.clear()
+        self._endpoint_providers.clear()
+
+
+web3_pool = Web3ConnectionPool(critical_chains=settings.startup_critical_chains.split(","))
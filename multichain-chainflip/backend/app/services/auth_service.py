@@ -11,8 +11,10 @@ from motor.motor_asyncio import AsyncIOMotorDatabase
 
 from app.models.user import UserDB, UserRegistration, UserLogin, UserResponse, L2_BLOCKCHAIN_MAPPING
 from app.core.config import get_settings
+from app.core.log import get_logger
 
 settings = get_settings()
+logger = get_logger(__name__)
 
 class AuthService:
     def __init__(self, database: AsyncIOMotorDatabase):
@@ -31,7 +33,7 @@ class AuthService:
         # Check if admin already exists
         existing_admin = await self.users_collection.find_one({"email": admin_email})
         if existing_admin:
-            print(f"✅ Admin account already exists: {admin_email}")
+            logger.info("✅ Admin account already exists: %s", admin_email)
             return existing_admin
 
         # Create admin account
@@ -54,8 +56,8 @@ class AuthService:
         }
         
         result = await self.users_collection.insert_one(admin_user)
-        print(f"✅ Admin account created: {admin_email}")
-        print(f"🔑 Admin password: {admin_password}")
+        logger.info("✅ Admin account created: %s", admin_email)
+        logger.debug("🔑 Admin password: %s", admin_password)
         
         return await self.users_collection.find_one({"_id": result.inserted_id})
 
@@ -0,0 +1,119 @@
+"""
+Algorithm 4 field mapping
+Declares which QR field is compared with which NFT field (and where on the
+product document that NFT field may live), compiled once into flat accessor
+tuples. build_verification_projection() resolves the NFT side for a product -
+done at mint time and stored as product["verification_projection"] - so
+verification compares against one flat dict instead of walking metadata,
+mint_params and the product root for every field.
+"""
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+# Tiers: a mandatory or important field present on only one side fails the match
+MANDATORY = "mandatory"
+IMPORTANT = "important"
+OPTIONAL = "optional"
+
+# Where an NFT value may be found, in priority order
+METADATA = "metadata"
+MINT_PARAMS = "mint_params"
+PRODUCT = "product"
+
+
+class FieldSpec(NamedTuple):
+    field: str  # name used in verification details
+    qr_key: str  # key in the decrypted QR payload
+    tier: str
+    nft_sources: Tuple[Tuple[str, str], ...]  # (location, key), first truthy value wins
+
+
+FIELD_SPECS: Tuple[FieldSpec, ...] = (
+    FieldSpec("token_id", "token_id", MANDATORY, (
+        (PRODUCT, "token_id"),
+    )),
+    FieldSpec("manufacturer", "manufacturer", MANDATORY, (
+        (METADATA, "manufacturerID"), (MINT_PARAMS, "manufacturerID"),
+        (METADATA, "manufacturer"), (MINT_PARAMS, "manufacturer"),
+        (PRODUCT, "manufacturer"),
+    )),
+    FieldSpec("uniqueProductID", "product_id", IMPORTANT, (
+        (METADATA, "uniqueProductID"), (MINT_PARAMS, "uniqueProductID"),
+        (METADATA, "product_id"), (MINT_PARAMS, "product_id"),
+    )),
+    FieldSpec("batchNumber", "batchNumber", IMPORTANT, (
+        (METADATA, "batchNumber"), (MINT_PARAMS, "batchNumber"), (PRODUCT, "batchNumber"),
+    )),
+    FieldSpec("productType", "productType", IMPORTANT, (
+        (METADATA, "productType"), (MINT_PARAMS, "productType"), (PRODUCT, "productType"),
+    )),
+)
+
+# Bump when FIELD_SPECS changes so stored projections are rebuilt instead of trusted
+PROJECTION_VERSION = 1
+
+_LOCATIONS = (METADATA, MINT_PARAMS, PRODUCT)
+
+
+def _compile(specs: Tuple[FieldSpec, ...]):
+    """FieldSpec -> (field, qr_key, tier, ((location index, key), ...))"""
+    return tuple(
+        (spec.field, spec.qr_key, spec.tier, tuple((_LOCATIONS.index(location), key) for location, key in spec.nft_sources))
+        for spec in specs
+    )
+
+
+_COMPILED = _compile(FIELD_SPECS)
+
+
+def build_verification_projection(product: Dict[str, Any]) -> Dict[str, Any]:
+    """Resolve every NFT-side field of a product document into {field: str value or ""}"""
+    locations = (product.get("metadata") or {}, product.get("mint_params") or {}, product)
+    fields = {}
+    for field, _, _, sources in _COMPILED:
+        value = ""
+        for location, key in sources:
+            value = locations[location].get(key, "")
+            if value:
+                break
+        fields[field] = str(value) if value else ""
+    return {"version": PROJECTION_VERSION, "fields": fields}
+
+
+def verification_projection(product: Dict[str, Any]) -> Dict[str, str]:
+    """The product's stored projection fields, rebuilt if missing or from an older spec"""
+    projection = product.get("verification_projection")
+    if not projection or projection.get("version") != PROJECTION_VERSION:
+        projection = build_verification_projection(product)
+    return projection["fields"]
+
+
+def compare_with_projection(fields: Dict[str, str], qr_data: Optional[Dict[str, Any]]) -> Tuple[bool, List[Dict[str, Any]]]:
+    """
+    Compare a decrypted QR payload with a product's projection, stopping at the
+    first failing field
+
+    Returns (match, details) where details has one
+    {"field", "status", "qr", "nft"} entry per field checked.
+    """
+    qr_data = qr_data if isinstance(qr_data, dict) else {}
+    details = []
+    for field, qr_key, tier, _ in _COMPILED:
+        qr_value = qr_data.get(qr_key, "")
+        nft_value = fields.get(field, "")
+        if qr_value and nft_value:
+            if str(qr_value).lower() == nft_value.lower():
+                details.append({"field": field, "status": "match", "qr": qr_value, "nft": nft_value})
+            else:
+                details.append({"field": field, "status": "mismatch", "qr": qr_value, "nft": nft_value})
+                return False, details
+        elif qr_value or nft_value:
+            if tier == MANDATORY:
+                details.append({"field": field, "status": "missing_mandatory", "qr": qr_value, "nft": nft_value})
+                return False, details
+            if tier == IMPORTANT:
+                details.append({"field": field, "status": "missing_important", "qr": qr_value, "nft": nft_value})
+                return False, details
+            details.append({"field": field, "status": "partial_optional", "qr": qr_value, "nft": nft_value})
+        else:
+            details.append({"field": field, "status": "empty_both", "qr": qr_value, "nft": nft_value})
+    return True, details
@@ -10,12 +10,17 @@ import uuid
 from datetime import datetime
 from typing import Dict, List, Optional, Any
 from web3 import Web3
-from web3.middleware import ExtraDataToPOAMiddleware
 from eth_account import Account
 from app.core.config import get_settings
 from app.core.database import get_database
+from app.core.log import get_logger
+from app.core.service_registry import service_registry
+from app.core.rpc_batch import batch_reader
+from app.core.tx_pipeline import tx_pipeline
+from app.core.web3_pool import web3_pool
 
 settings = get_settings()
+logger = get_logger(__name__)
 
 # LayerZero V2 endpoint IDs for testnets (uint32)
 LAYERZERO_ENDPOINTS = {
@@ -217,7 +222,7 @@ class ChainFLIPMessagingService:
     async def initialize(self):
         """Initialize the ChainFLIP messaging service"""
         try:
-            print("🌐 Initializing ChainFLIP Messaging Service...")
+            logger.debug("🌐 Initializing ChainFLIP Messaging Service...")
             
             # Initialize database connection
             self.database = await get_database()
@@ -231,35 +236,30 @@ class ChainFLIPMessagingService:
             # Initialize contract instances
             await self._initialize_contracts()
             
-            print("✅ ChainFLIP Messaging Service initialized successfully")
+            logger.info("✅ ChainFLIP Messaging Service initialized successfully")
             
         except Exception as e:
-            print(f"❌ ChainFLIP Messaging Service initialization failed: {e}")
+            logger.error("❌ ChainFLIP Messaging Service initialization failed: %s", e)
             raise
 
     async def _initialize_web3_connections(self):
-        """Initialize Web3 connections for all chains"""
+        """Initialize pooled Web3 connections for all chains, probing them concurrently"""
+        configured = {name: config for name, config in CHAIN_CONFIGS.items() if config["rpc_url"]}
         for chain_name, config in CHAIN_CONFIGS.items():
-            try:
-                if config["rpc_url"]:
-                    web3 = Web3(Web3.HTTPProvider(config["rpc_url"]))
-                    
-                    # Add PoA middleware for chains that need it
-                    if chain_name in ["base_sepolia", "polygon_amoy"]:
-                        web3.middleware_onion.inject(ExtraDataToPOAMiddleware, layer=0)
-                    
-                    if web3.is_connected():
-                        latest_block = web3.eth.block_number
-                        print(f"✅ Connected to {config['name']} (Chain ID: {config['chain_id']})")
-                        print(f"📊 Latest block: {latest_block}")
-                        self.web3_connections[chain_name] = web3
-                    else:
-                        print(f"❌ Failed to connect to {config['name']}")
-                else:
-                    print(f"⚠️ No RPC URL configured for {config['name']}")
-                    
-            except Exception as e:
-                print(f"❌ Error connecting to {config['name']}: {e}")
+            if chain_name not in configured:
+                logger.warning("⚠️ No RPC URL configured for %s", config['name'])
+        
+        for chain_name, config in configured.items():
+            web3_pool.add_endpoints(chain_name, [config["rpc_url"]])
+        clients = await asyncio.gather(*(web3_pool.connect(chain_name) for chain_name in configured))
+        
+        for (chain_name, config), web3 in zip(configured.items(), clients):
+            if web3:
+                logger.debug("✅ Connected to %s (Chain ID: %s)", config['name'], config['chain_id'])
+                logger.debug("📡 RPC: %s", web3_pool.rpc_url(chain_name))
+                self.web3_connections[chain_name] = web3
+            else:
+                logger.warning("❌ Failed to connect to %s", config['name'])
 
     async def _load_contract_addresses(self):
         """Load ChainFLIPMessenger contract addresses - UPDATED WITH NEW V3 ADDRESSES (500K GAS)"""
@@ -270,9 +270,9 @@ class ChainFLIPMessagingService:
             "arbitrum_sepolia": "0xd45D77D10DF591EB4d8c2fC50a6147890031F98c"   # ✅ NEW V3 (500K GAS)
         }
         
-        print("📄 ChainFLIPMessengerV3 contract addresses (✅ NEW V3 WITH 500K GAS):")
+        logger.debug("📄 ChainFLIPMessengerV3 contract addresses (✅ NEW V3 WITH 500K GAS):")
         for chain, address in self.contract_addresses.items():
-            print(f"   {CHAIN_CONFIGS[chain]['name']}: {address}")
+            logger.debug("   %s: %s", CHAIN_CONFIGS[chain]['name'], address)
 
     async def _initialize_contracts(self):
         """Initialize contract instances"""
@@ -285,11 +285,11 @@ class ChainFLIPMessagingService:
                         abi=CHAINFLIP_MESSENGER_ABI
                     )
                     self.messenger_contracts[chain_name] = contract
-                    print(f"✅ Contract instance created for {CHAIN_CONFIGS[chain_name]['name']}")
+                    logger.debug("✅ Contract instance created for %s", CHAIN_CONFIGS[chain_name]['name'])
                 except Exception as e:
-                    print(f"❌ Failed to create contract instance for {chain_name}: {e}")
+                    logger.error("❌ Failed to create contract instance for %s: %s", chain_name, e)
             else:
-                print(f"⚠️ Contract address not set for {chain_name}")
+                logger.warning("⚠️ Contract address not set for %s", chain_name)
 
     async def send_cid_to_chain(
         self,
@@ -306,17 +306,17 @@ class ChainFLIPMessagingService:
         """
         # Ensure service has connections (it should be initialized at startup)
         if not self.web3_connections:
-            print("🔄 Initializing ChainFLIP service...")
+            logger.debug("🔄 Initializing ChainFLIP service...")
             await self.initialize()
             
         try:
-            print(f"\n🌐 === CHAINFLIP MESSENGER CID SYNC TO SINGLE CHAIN ===")
-            print(f"🏭 Source: {source_chain}")
-            print(f"🎯 Target: {target_chain} (Central Hub)")
-            print(f"🔖 Token ID: {token_id}")
-            print(f"📦 CID: {metadata_cid}")
-            print(f"👤 Manufacturer: {manufacturer}")
-            print(f"📍 Admin will retrieve from contract: {self.contract_addresses.get(target_chain)}")
+            logger.debug("\n🌐 === CHAINFLIP MESSENGER CID SYNC TO SINGLE CHAIN ===")
+            logger.debug("🏭 Source: %s", source_chain)
+            logger.debug("🎯 Target: %s (Central Hub)", target_chain)
+            logger.debug("🔖 Token ID: %s", token_id)
+            logger.debug("📦 CID: %s", metadata_cid)
+            logger.debug("👤 Manufacturer: %s", manufacturer)
+            logger.debug("📍 Admin will retrieve from contract: %s", self.contract_addresses.get(target_chain))
             
             # If no private key provided, look it up from settings
             if not manufacturer_private_key:
@@ -334,7 +334,7 @@ class ChainFLIPMessagingService:
             # Determine which account to use for sending
             if manufacturer_private_key:
                 sending_account = Account.from_key(manufacturer_private_key)
-                print(f"🔐 Using manufacturer account: {sending_account.address}")
+                logger.debug("🔐 Using manufacturer account: %s", sending_account.address)
                 
                 # Verify the manufacturer address matches
                 if sending_account.address.lower() != manufacturer.lower():
@@ -367,74 +367,73 @@ class ChainFLIPMessagingService:
             
             # Check contract owner (for debugging)
             try:
-                contract_owner = source_contract.functions.owner().call()
-                print(f"📋 Contract owner: {contract_owner}")
+                contract_owner = await web3_pool.run(source_chain, source_contract.functions.owner().call)
+                logger.debug("📋 Contract owner: %s", contract_owner)
             except Exception as owner_error:
-                print(f"⚠️ Could not check contract owner: {owner_error}")
+                logger.warning("⚠️ Could not check contract owner: %s", owner_error)
             
             # Use proper LayerZero fee calculation and gas price
             # Get current gas price from network
-            current_gas_price = source_web3.eth.gas_price
             # Use 2x gas price for faster confirmation
-            gas_price = current_gas_price * 2
+            gas_price = await tx_pipeline.gas_price(source_chain, source_web3, multiplier=2)
             
             # Get proper LayerZero fee using contract quote function with EXACT contract format
             try:
-                print(f"🔍 Getting LayerZero fee quote for EID {target_eid}...")
+                logger.debug("🔍 Getting LayerZero fee quote for EID %s...", target_eid)
                 
                 # ✅ FIXED: Use proper LayerZero V2 extraOptions format from working OFT system
                 # This is the WORKING format: 0x0003010011010000000000000000000000000000ea60
                 options_bytes = bytes.fromhex('0003010011010000000000000000000000000000ea60')
                 
-                print(f"🔧 Using WORKING LayerZero V2 extraOptions: 0x{options_bytes.hex()}")
+                logger.debug("🔧 Using WORKING LayerZero V2 extraOptions: 0x%s", options_bytes.hex())
                 
                 # Call the contract's quote function with correct parameters
-                fee_quote = source_contract.functions.quote(
+                fee_quote = await web3_pool.run(source_chain, source_contract.functions.quote(
                     target_eid,        # _destEid
                     token_id,          # _tokenId  
                     metadata_cid,      # _metadataCID
                     manufacturer,      # _manufacturer
                     options_bytes,     # _options (EXACT contract format)
                     False              # _payInLzToken
-                ).call()
+                ).call)
                 
                 # fee_quote is a MessagingFee struct with nativeFee and lzTokenFee
                 native_fee = fee_quote[0]  # nativeFee
-                print(f"✅ LayerZero quoted fee: {Web3.from_wei(native_fee, 'ether')} ETH")
+                logger.debug("✅ LayerZero quoted fee: %s ETH", Web3.from_wei(native_fee, 'ether'))
                 
                 # Add 20% buffer for timestamp variations and gas price changes
                 native_fee = int(native_fee * 1.5)
-                print(f"✅ Fee with 50% buffer: {Web3.from_wei(native_fee, 'ether')} ETH")
+                logger.debug("✅ Fee with 50%% buffer: %s ETH", Web3.from_wei(native_fee, 'ether'))
                 
             except Exception as quote_error:
-                print(f"⚠️ Quote function failed: {quote_error}")
+                logger.warning("⚠️ Quote function failed: %s", quote_error)
                 
                 # Check for specific LayerZero errors
                 error_str = str(quote_error)
                 if "0x6592671c" in error_str:
-                    print("❌ LayerZero peer connection error - check if contracts are properly connected")
+                    logger.error("❌ LayerZero peer connection error - check if contracts are properly connected")
                 elif "0x0dc652a8" in error_str:
-                    print("❌ LayerZero fee calculation error - using higher fallback")
+                    logger.error("❌ LayerZero fee calculation error - using higher fallback")
                 
                 # Use a higher fallback fee for LayerZero V2 based on working system
                 native_fee = Web3.to_wei(8000000, 'gwei')  # 0.008 ETH fallback
-                print(f"📋 Using fallback fee: {Web3.from_wei(native_fee, 'ether')} ETH")
+                logger.warning("📋 Using fallback fee: %s ETH", Web3.from_wei(native_fee, 'ether'))
             
             # Get native token information for proper fee calculation and display
             source_config = CHAIN_CONFIGS.get(source_chain, {})
             native_token = source_config.get("native_token", "ETH")
             
             # Check account balance with correct token name
-            account_balance = source_web3.eth.get_balance(sending_account.address)
+            account_balance = await web3_pool.run(source_chain, source_web3.eth.get_balance, sending_account.address)
             account_balance_native = Web3.from_wei(account_balance, 'ether')
             fee_native = Web3.from_wei(native_fee, 'ether')
             gas_price_gwei = Web3.from_wei(gas_price, 'gwei')
             
-            print(f"💳 Account balance: {account_balance_native} {native_token}")
-            print(f"💰 LayerZero fee: {fee_native} {native_token}")
-            print(f"⛽ Gas price: {gas_price_gwei} Gwei")
-            print(f"🆔 Target EID: {target_eid}")
-            print(f"🔗 Source Chain: {source_chain} ({native_token})")
+            logger.debug("💳 Account balance: %s %s", account_balance_native, native_token)
+            logger.debug("💰 LayerZero fee: %s %s", fee_native, native_token)
+            logger.debug("⛽ Gas price: %s Gwei", gas_price_gwei)
+            logger.debug("🆔 Target EID: %s", target_eid)
+            logger.debug("🔗 Source Chain: %s (%s)", source_chain, native_token)
             
             if account_balance < native_fee:
                 return {
@@ -442,9 +441,7 @@ class ChainFLIPMessagingService:
                     "error": f"Insufficient balance for LayerZero fees. Need: {fee_native} {native_token}, Have: {account_balance_native} {native_token}"
                 }
             
-            # Build transaction using sendCIDToChain for specific target
-            nonce = source_web3.eth.get_transaction_count(sending_account.address)
-            
+            # Build transaction using sendCIDToChain for specific target (nonce is assigned by tx_pipeline)
             transaction = source_contract.functions.sendCIDToChain(
                 target_eid,       # _destEid
                 token_id,         # _tokenId
@@ -455,35 +452,34 @@ class ChainFLIPMessagingService:
                 'value': native_fee,  # LayerZero fees
                 'gas': 500000,       # Higher gas for cross-chain messaging
                 'gasPrice': gas_price,
-                'nonce': nonce,
-                'chainId': source_web3.eth.chain_id
+                'chainId': await web3_pool.run(source_chain, lambda: source_web3.eth.chain_id)
             })
             
-            print(f"📋 Transaction details:")
-            print(f"   From: {sending_account.address}")
-            print(f"   To: {source_contract.address}")
-            print(f"   Function: sendCIDToChain")
-            print(f"   Target EID: {target_eid}")
-            print(f"   Value (LayerZero fee): {fee_native} {native_token}")
-            print(f"   Gas limit: {transaction['gas']}")
-            print(f"   Gas price: {Web3.from_wei(gas_price, 'gwei')} Gwei")
+            logger.debug("📋 Transaction details:")
+            logger.debug("   From: %s", sending_account.address)
+            logger.debug("   To: %s", source_contract.address)
+            logger.debug("   Function: sendCIDToChain")
+            logger.debug("   Target EID: %s", target_eid)
+            logger.debug("   Value (LayerZero fee): %s %s", fee_native, native_token)
+            logger.debug("   Gas limit: %s", transaction['gas'])
+            logger.debug("   Gas price: %s Gwei", Web3.from_wei(gas_price, 'gwei'))
             
             # Sign and send transaction
-            signed_txn = source_web3.eth.account.sign_transaction(transaction, sending_account.key)
-            tx_hash = source_web3.eth.send_raw_transaction(signed_txn.raw_transaction)
+            pending_txn = await tx_pipeline.submit(source_chain, source_web3, sending_account, transaction)
+            tx_hash = pending_txn.tx_hash
             tx_hash_hex = tx_hash.hex()
             
-            print(f"📤 Transaction sent: {tx_hash_hex}")
-            print(f"⏳ Waiting for confirmation...")
+            logger.debug("📤 Transaction sent: %s", tx_hash_hex)
+            logger.debug("⏳ Waiting for confirmation...")
             
             # Wait for transaction confirmation
-            receipt = source_web3.eth.wait_for_transaction_receipt(tx_hash, timeout=300)
+            receipt = await pending_txn.receipt(timeout=300)
             
             if receipt.status == 1:
-                print(f"✅ ChainFLIP CID sync to {target_chain} transaction confirmed!")
-                print(f"📊 Block: {receipt.blockNumber}")
-                print(f"⛽ Gas Used: {receipt.gasUsed}")
-                print(f"📍 Admin can check contract {self.contract_addresses.get(target_chain)} on {target_chain}")
+                logger.info("✅ ChainFLIP CID sync to %s transaction confirmed!", target_chain)
+                logger.debug("📊 Block: %s", receipt.blockNumber)
+                logger.debug("⛽ Gas Used: %s", receipt.gasUsed)
+                logger.debug("📍 Admin can check contract %s on %s", self.contract_addresses.get(target_chain), target_chain)
                 
                 # Parse events
                 sync_events = await self._parse_sync_events(source_contract, receipt)
@@ -529,14 +525,14 @@ class ChainFLIPMessagingService:
                     "message": f"CID synced to {target_chain} central hub via ChainFLIP Messenger"
                 }
             else:
-                print(f"❌ Transaction failed with status: {receipt.status}")
-                print(f"📊 Failed transaction details:")
-                print(f"   Transaction Hash: {tx_hash_hex}")
-                print(f"   Block Number: {receipt.blockNumber}")
-                print(f"   Gas Used: {receipt.gasUsed}")
-                print(f"   Gas Limit: {transaction['gas']}")
-                print(f"   Gas Price: {Web3.from_wei(gas_price, 'gwei')} Gwei")
-                print(f"   LayerZero Fee: {fee_native} {native_token}")
+                logger.warning("❌ Transaction failed with status: %s", receipt.status)
+                logger.debug("📊 Failed transaction details:")
+                logger.debug("   Transaction Hash: %s", tx_hash_hex)
+                logger.debug("   Block Number: %s", receipt.blockNumber)
+                logger.debug("   Gas Used: %s", receipt.gasUsed)
+                logger.debug("   Gas Limit: %s", transaction['gas'])
+                logger.debug("   Gas Price: %s Gwei", Web3.from_wei(gas_price, 'gwei'))
+                logger.debug("   LayerZero Fee: %s %s", fee_native, native_token)
                 
                 # Try to get revert reason
                 try:
@@ -548,7 +544,7 @@ class ChainFLIPMessagingService:
                         'value': native_fee
                     })
                 except Exception as call_error:
-                    print(f"🔍 Revert reason: {call_error}")
+                    logger.warning("🔍 Revert reason: %s", call_error)
                 
                 return {
                     "success": False,
@@ -562,9 +558,9 @@ class ChainFLIPMessagingService:
                 }
                 
         except Exception as e:
-            print(f"❌ ChainFLIP CID sync to single chain error: {e}")
+            logger.error("❌ ChainFLIP CID sync to single chain error: %s", e)
             import traceback
-            print(f"🔍 Full traceback: {traceback.format_exc()}")
+            logger.warning("🔍 Full traceback: %s", traceback.format_exc())
             return {"success": False, "error": str(e)}
 
     async def send_cid_sync_to_all_chains(
@@ -581,16 +577,16 @@ class ChainFLIPMessagingService:
         Uses the simple LayerZero NonblockingLzApp pattern
         """
         try:
-            print(f"\n🌐 === CHAINFLIP MESSENGER CID SYNC ===")
-            print(f"🏭 Source: {source_chain}")
-            print(f"🔖 Token ID: {token_id}")
-            print(f"📦 CID: {metadata_cid}")
-            print(f"👤 Manufacturer: {manufacturer}")
+            logger.debug("\n🌐 === CHAINFLIP MESSENGER CID SYNC ===")
+            logger.debug("🏭 Source: %s", source_chain)
+            logger.debug("🔖 Token ID: %s", token_id)
+            logger.debug("📦 CID: %s", metadata_cid)
+            logger.debug("👤 Manufacturer: %s", manufacturer)
             
             # Determine which account to use for sending
             if manufacturer_private_key:
                 sending_account = Account.from_key(manufacturer_private_key)
-                print(f"🔐 Using manufacturer account: {sending_account.address}")
+                logger.debug("🔐 Using manufacturer account: %s", sending_account.address)
                 
                 # Verify the manufacturer address matches
                 if sending_account.address.lower() != manufacturer.lower():
@@ -616,10 +612,10 @@ class ChainFLIPMessagingService:
             
             # Check contract owner (for debugging)
             try:
-                contract_owner = source_contract.functions.owner().call()
-                print(f"📋 Contract owner: {contract_owner}")
+                contract_owner = await web3_pool.run(source_chain, source_contract.functions.owner().call)
+                logger.debug("📋 Contract owner: %s", contract_owner)
             except Exception as owner_error:
-                print(f"⚠️ Could not check contract owner: {owner_error}")
+                logger.warning("⚠️ Could not check contract owner: %s", owner_error)
             
             # Use LayerZero fee similar to the working example (12345678 gwei)
             native_fee = Web3.to_wei(12345678, 'gwei')  # ≈ 0.012 ETH
@@ -628,12 +624,12 @@ class ChainFLIPMessagingService:
             source_config = CHAIN_CONFIGS.get(source_chain, {})
             native_token = source_config.get("native_token", "ETH")
             
-            account_balance = source_web3.eth.get_balance(sending_account.address)
+            account_balance = await web3_pool.run(source_chain, source_web3.eth.get_balance, sending_account.address)
             account_balance_native = Web3.from_wei(account_balance, 'ether')
             fee_native = Web3.from_wei(native_fee, 'ether')
             
-            print(f"💳 Account balance: {account_balance_native} {native_token}")
-            print(f"💰 LayerZero fee: {fee_native} {native_token}")
+            logger.debug("💳 Account balance: %s %s", account_balance_native, native_token)
+            logger.debug("💰 LayerZero fee: %s %s", fee_native, native_token)
             
             if account_balance < native_fee:
                 return {
@@ -641,9 +637,8 @@ class ChainFLIPMessagingService:
                     "error": f"Insufficient balance for LayerZero fees. Need: {fee_native} {native_token}, Have: {account_balance_native} {native_token}"
                 }
             
-            # Build transaction
-            nonce = source_web3.eth.get_transaction_count(sending_account.address)
-            gas_price = source_web3.eth.gas_price
+            # Build transaction (nonce is assigned by tx_pipeline)
+            gas_price = await tx_pipeline.gas_price(source_chain, source_web3)
             
             transaction = source_contract.functions.syncCIDToAllChains(
                 token_id,
@@ -654,31 +649,30 @@ class ChainFLIPMessagingService:
                 'value': native_fee,  # LayerZero fees
                 'gas': 500000,       # Higher gas for cross-chain messaging
                 'gasPrice': gas_price,
-                'nonce': nonce,
-                'chainId': source_web3.eth.chain_id
+                'chainId': await web3_pool.run(source_chain, lambda: source_web3.eth.chain_id)
             })
             
-            print(f"📋 Transaction details:")
-            print(f"   From: {sending_account.address}")
-            print(f"   Value (LayerZero fee): {fee_native} {native_token}")
-            print(f"   Gas limit: {transaction['gas']}")
-            print(f"   Gas price: {Web3.from_wei(gas_price, 'gwei')} Gwei")
+            logger.debug("📋 Transaction details:")
+            logger.debug("   From: %s", sending_account.address)
+            logger.debug("   Value (LayerZero fee): %s %s", fee_native, native_token)
+            logger.debug("   Gas limit: %s", transaction['gas'])
+            logger.debug("   Gas price: %s Gwei", Web3.from_wei(gas_price, 'gwei'))
             
             # Sign and send transaction
-            signed_txn = source_web3.eth.account.sign_transaction(transaction, sending_account.key)
-            tx_hash = source_web3.eth.send_raw_transaction(signed_txn.raw_transaction)
+            pending_txn = await tx_pipeline.submit(source_chain, source_web3, sending_account, transaction)
+            tx_hash = pending_txn.tx_hash
             tx_hash_hex = tx_hash.hex()
             
-            print(f"📤 Transaction sent: {tx_hash_hex}")
-            print(f"⏳ Waiting for confirmation...")
+            logger.debug("📤 Transaction sent: %s", tx_hash_hex)
+            logger.debug("⏳ Waiting for confirmation...")
             
             # Wait for transaction confirmation
-            receipt = source_web3.eth.wait_for_transaction_receipt(tx_hash, timeout=300)
+            receipt = await pending_txn.receipt(timeout=300)
             
             if receipt.status == 1:
-                print(f"✅ ChainFLIP CID sync transaction confirmed!")
-                print(f"📊 Block: {receipt.blockNumber}")
-                print(f"⛽ Gas Used: {receipt.gasUsed}")
+                logger.info("✅ ChainFLIP CID sync transaction confirmed!")
+                logger.debug("📊 Block: %s", receipt.blockNumber)
+                logger.debug("⛽ Gas Used: %s", receipt.gasUsed)
                 
                 # Parse events
                 sync_events = await self._parse_sync_events(source_contract, receipt)
@@ -716,7 +710,7 @@ class ChainFLIPMessagingService:
                     "message": "CID synced to all chains via ChainFLIP Messenger"
                 }
             else:
-                print(f"❌ Transaction failed with status: {receipt.status}")
+                logger.warning("❌ Transaction failed with status: %s", receipt.status)
                 
                 return {
                     "success": False,
@@ -727,9 +721,9 @@ class ChainFLIPMessagingService:
                 }
                 
         except Exception as e:
-            print(f"❌ ChainFLIP CID sync error: {e}")
+            logger.error("❌ ChainFLIP CID sync error: %s", e)
             import traceback
-            print(f"🔍 Full traceback: {traceback.format_exc()}")
+            logger.warning("🔍 Full traceback: %s", traceback.format_exc())
             return {"success": False, "error": str(e)}
 
     async def send_delivery_request_to_admin(
@@ -748,25 +742,25 @@ class ChainFLIPMessagingService:
         """
         # Ensure service has connections
         if not self.web3_connections:
-            print("🔄 Initializing ChainFLIP service...")
+            logger.debug("🔄 Initializing ChainFLIP service...")
             await self.initialize()
             
         try:
             target_chain = "polygon_amoy"  # Admin is on Hub chain
             admin_address = "0x032041b4b356fEE1496805DD4749f181bC736FFA"
             
-            print(f"\n📦 === DELIVERY REQUEST TO ADMIN ===")
-            print(f"🏭 From: {manufacturer_chain}")
-            print(f"🎯 To: {target_chain} (Hub - Admin)")
-            print(f"📋 Order ID: {order_id}")
-            print(f"🛍️ Product ID: {product_id}")
-            print(f"👤 Buyer: {buyer_address}")
-            print(f"📏 Distance: {delivery_distance_miles} miles")
-            print(f"👨‍💼 Admin: {admin_address}")
+            logger.debug("\n📦 === DELIVERY REQUEST TO ADMIN ===")
+            logger.debug("🏭 From: %s", manufacturer_chain)
+            logger.debug("🎯 To: %s (Hub - Admin)", target_chain)
+            logger.debug("📋 Order ID: %s", order_id)
+            logger.debug("🛍️ Product ID: %s", product_id)
+            logger.debug("👤 Buyer: %s", buyer_address)
+            logger.debug("📏 Distance: %s miles", delivery_distance_miles)
+            logger.debug("👨‍💼 Admin: %s", admin_address)
             
             # Calculate required transporters based on distance
             required_transporters = self._calculate_required_transporters(delivery_distance_miles)
-            print(f"🚚 Required Transporters: {required_transporters}")
+            logger.debug("🚚 Required Transporters: %s", required_transporters)
             
             # If no private key provided, use default manufacturer key
             if not manufacturer_private_key:
@@ -797,20 +791,20 @@ class ChainFLIPMessagingService:
             
             # Prepare sending account
             sending_account = Account.from_key(manufacturer_private_key)
-            print(f"🔑 Sending from: {sending_account.address}")
+            logger.debug("🔑 Sending from: %s", sending_account.address)
             
             # Get LayerZero fee quote
             options = b""  # Empty options
             pay_in_lz_token = False
             
-            fee_quote = source_contract.functions.quote(
+            fee_quote = await web3_pool.run(manufacturer_chain, source_contract.functions.quote(
                 target_eid,
                 f"DELIVERY_REQ_{order_id}",  # Use token_id field
                 request_data,  # Use metadata_cid field for delivery data
                 manufacturer_address,
                 options,  # options parameter
                 pay_in_lz_token  # payInLzToken parameter
-            ).call()
+            ).call)
             
             native_fee = fee_quote[0]  # fee.nativeFee
             
@@ -819,11 +813,11 @@ class ChainFLIPMessagingService:
             native_token = source_config.get("native_token", "ETH")
             fee_native = Web3.from_wei(native_fee, 'ether')
             
-            print(f"💰 LayerZero Fee: {fee_native} {native_token}")
+            logger.debug("💰 LayerZero Fee: %s %s", fee_native, native_token)
             
             # Get gas price
-            gas_price = source_web3.eth.gas_price
-            print(f"⛽ Gas Price: {Web3.from_wei(gas_price, 'gwei')} Gwei")
+            gas_price = await web3_pool.run(manufacturer_chain, lambda: source_web3.eth.gas_price)
+            logger.debug("⛽ Gas Price: %s Gwei", Web3.from_wei(gas_price, 'gwei'))
             
             # Prepare transaction with correct parameter order
             transaction = source_contract.functions.sendCIDToChain(
@@ -836,27 +830,27 @@ class ChainFLIPMessagingService:
                 'value': native_fee,
                 'gas': 500000,  # Increased gas limit
                 'gasPrice': gas_price,
-                'nonce': source_web3.eth.get_transaction_count(sending_account.address)
+                'nonce': await web3_pool.run(manufacturer_chain, source_web3.eth.get_transaction_count, sending_account.address)
             })
             
             # Sign and send transaction
             signed_txn = source_web3.eth.account.sign_transaction(transaction, manufacturer_private_key)
-            tx_hash = source_web3.eth.send_raw_transaction(signed_txn.rawTransaction)
+            tx_hash = await web3_pool.run(manufacturer_chain, source_web3.eth.send_raw_transaction, signed_txn.rawTransaction)
             tx_hash_hex = tx_hash.hex()
             
-            print(f"📡 Delivery request transaction sent: {tx_hash_hex}")
-            print(f"⏳ Waiting for confirmation...")
+            logger.debug("📡 Delivery request transaction sent: %s", tx_hash_hex)
+            logger.debug("⏳ Waiting for confirmation...")
             
             # Wait for transaction receipt
-            receipt = source_web3.eth.wait_for_transaction_receipt(tx_hash, timeout=300)
+            receipt = await web3_pool.run(manufacturer_chain, source_web3.eth.wait_for_transaction_receipt, tx_hash, timeout=300, bounded=False)
             
             if receipt.status == 1:
-                print(f"✅ Delivery request sent successfully!")
-                print(f"📊 Transaction details:")
-                print(f"   Transaction Hash: {tx_hash_hex}")
-                print(f"   Block Number: {receipt.blockNumber}")
-                print(f"   Gas Used: {receipt.gasUsed}")
-                print(f"   LayerZero Fee: {fee_native} {native_token}")
+                logger.info("✅ Delivery request sent successfully!")
+                logger.debug("📊 Transaction details:")
+                logger.debug("   Transaction Hash: %s", tx_hash_hex)
+                logger.debug("   Block Number: %s", receipt.blockNumber)
+                logger.debug("   Gas Used: %s", receipt.gasUsed)
+                logger.debug("   LayerZero Fee: %s %s", fee_native, native_token)
                 
                 # Store delivery request in database
                 if self.database:
@@ -881,7 +875,7 @@ class ChainFLIPMessagingService:
                     }
                     
                     await self.database.delivery_requests.insert_one(delivery_request_record)
-                    print(f"💾 Delivery request saved to database")
+                    logger.debug("💾 Delivery request saved to database")
                 
                 return {
                     "success": True,
@@ -896,7 +890,7 @@ class ChainFLIPMessagingService:
                     "message": f"Delivery request sent to admin on {target_chain}"
                 }
             else:
-                print(f"❌ Delivery request transaction failed")
+                logger.warning("❌ Delivery request transaction failed")
                 return {
                     "success": False,
                     "error": f"Transaction failed with status {receipt.status}",
@@ -904,9 +898,9 @@ class ChainFLIPMessagingService:
                 }
                 
         except Exception as e:
-            print(f"❌ Delivery request error: {e}")
+            logger.error("❌ Delivery request error: %s", e)
             import traceback
-            print(f"🔍 Full traceback: {traceback.format_exc()}")
+            logger.warning("🔍 Full traceback: %s", traceback.format_exc())
             return {"success": False, "error": str(e)}
 
     async def send_delivery_notification_to_admin(
@@ -926,17 +920,17 @@ class ChainFLIPMessagingService:
         """
         # Ensure service has connections (it should be initialized at startup)
         if not self.web3_connections:
-            print("🔄 Initializing ChainFLIP service...")
+            logger.debug("🔄 Initializing ChainFLIP service...")
             await self.initialize()
             
         try:
-            print(f"\n🚚 === CHAINFLIP DELIVERY NOTIFICATION TO ADMIN ===")
-            print(f"🏭 Source: {source_chain} (Manufacturer)")
-            print(f"🎯 Target: {target_chain} (Admin Hub)")
-            print(f"📦 Order ID: {order_id}")
-            print(f"🔖 Product ID: {product_id}")
-            print(f"👤 Manufacturer: {manufacturer}")
-            print(f"📍 Admin will retrieve from contract: {self.contract_addresses.get(target_chain)}")
+            logger.debug("\n🚚 === CHAINFLIP DELIVERY NOTIFICATION TO ADMIN ===")
+            logger.debug("🏭 Source: %s (Manufacturer)", source_chain)
+            logger.debug("🎯 Target: %s (Admin Hub)", target_chain)
+            logger.debug("📦 Order ID: %s", order_id)
+            logger.debug("🔖 Product ID: %s", product_id)
+            logger.debug("👤 Manufacturer: %s", manufacturer)
+            logger.debug("📍 Admin will retrieve from contract: %s", self.contract_addresses.get(target_chain))
             
             # If no private key provided, look it up from settings
             if not manufacturer_private_key:
@@ -954,7 +948,7 @@ class ChainFLIPMessagingService:
             # Determine which account to use for sending
             if manufacturer_private_key:
                 sending_account = Account.from_key(manufacturer_private_key)
-                print(f"🔐 Using manufacturer account: {sending_account.address}")
+                logger.debug("🔐 Using manufacturer account: %s", sending_account.address)
                 
                 # Verify the manufacturer address matches
                 if sending_account.address.lower() != manufacturer.lower():
@@ -1000,62 +994,62 @@ class ChainFLIPMessagingService:
             # Keep it simple and short to avoid LayerZero parsing errors
             delivery_cid = f"DELIVERY_NOTIFICATION|{order_id}|{product_id}|{buyer_name}|{buyer_phone}|STARTED"
             
-            print(f"📋 Delivery notification (compact format): {delivery_cid}")
+            logger.debug("📋 Delivery notification (compact format): %s", delivery_cid)
             
             # Check contract owner (for debugging)
             try:
-                contract_owner = source_contract.functions.owner().call()
-                print(f"📋 Contract owner: {contract_owner}")
+                contract_owner = await web3_pool.run(source_chain, source_contract.functions.owner().call)
+                logger.debug("📋 Contract owner: %s", contract_owner)
             except Exception as owner_error:
-                print(f"⚠️ Could not check contract owner: {owner_error}")
+                logger.warning("⚠️ Could not check contract owner: %s", owner_error)
             
             # Use proper LayerZero fee calculation and gas price
             # Get current gas price from network
-            current_gas_price = source_web3.eth.gas_price
+            current_gas_price = await web3_pool.run(source_chain, lambda: source_web3.eth.gas_price)
             # Use 2x gas price for faster confirmation
             gas_price = current_gas_price * 2
             
             # Get proper LayerZero fee using contract quote function with EXACT contract format
             try:
-                print(f"🔍 Getting LayerZero fee quote for EID {target_eid}...")
+                logger.debug("🔍 Getting LayerZero fee quote for EID %s...", target_eid)
                 
                 # ✅ FIXED: Use proper LayerZero V2 extraOptions format from working OFT system
                 # This is the WORKING format: 0x0003010011010000000000000000000000000000ea60
                 options_bytes = bytes.fromhex('0003010011010000000000000000000000000000ea60')
                 
-                print(f"🔧 Using WORKING LayerZero V2 extraOptions: 0x{options_bytes.hex()}")
+                logger.debug("🔧 Using WORKING LayerZero V2 extraOptions: 0x%s", options_bytes.hex())
                 
                 # Call the contract's quote function with correct parameters
-                fee_quote = source_contract.functions.quote(
+                fee_quote = await web3_pool.run(source_chain, source_contract.functions.quote(
                     target_eid,        # _destEid
                     delivery_token_id, # _tokenId (DELIVERY:order_id)
                     delivery_cid,      # _metadataCID (delivery payload JSON)
                     manufacturer,      # _manufacturer
                     options_bytes,     # _options (EXACT contract format)
                     False              # _payInLzToken
-                ).call()
+                ).call)
                 
                 # fee_quote is a MessagingFee struct with nativeFee and lzTokenFee
                 native_fee = fee_quote[0]  # nativeFee
-                print(f"✅ LayerZero quoted fee: {Web3.from_wei(native_fee, 'ether')} ETH")
+                logger.info("✅ LayerZero quoted fee: %s ETH", Web3.from_wei(native_fee, 'ether'))
                 
                 # Add 20% buffer for timestamp variations and gas price changes
                 native_fee = int(native_fee * 1.5)
-                print(f"✅ Fee with 50% buffer: {Web3.from_wei(native_fee, 'ether')} ETH")
+                logger.info("✅ Fee with 50%% buffer: %s ETH", Web3.from_wei(native_fee, 'ether'))
                 
             except Exception as quote_error:
-                print(f"⚠️ Quote function failed: {quote_error}")
+                logger.warning("⚠️ Quote function failed: %s", quote_error)
                 
                 # Check for specific LayerZero errors
                 error_str = str(quote_error)
                 if "0x6592671c" in error_str:
-                    print("❌ LayerZero peer connection error - check if contracts are properly connected")
+                    logger.error("❌ LayerZero peer connection error - check if contracts are properly connected")
                 elif "0x0dc652a8" in error_str:
-                    print("❌ LayerZero fee calculation error - using higher fallback")
+                    logger.error("❌ LayerZero fee calculation error - using higher fallback")
                 
                 # Use a higher fallback fee for LayerZero V2 based on working system
                 native_fee = Web3.to_wei(8000000, 'gwei')  # 0.008 ETH fallback
-                print(f"📋 Using fallback fee: {Web3.from_wei(native_fee, 'ether')} ETH")
+                logger.warning("📋 Using fallback fee: %s ETH", Web3.from_wei(native_fee, 'ether'))
             
             # Get native token information for correct fee display
             source_config = CHAIN_CONFIGS.get(source_chain, {})
@@ -1063,15 +1057,15 @@ class ChainFLIPMessagingService:
             fee_native = Web3.from_wei(native_fee, 'ether')
 
             # Check account balance with correct token name
-            account_balance = source_web3.eth.get_balance(sending_account.address)
+            account_balance = await web3_pool.run(source_chain, source_web3.eth.get_balance, sending_account.address)
             account_balance_native = Web3.from_wei(account_balance, 'ether')
             gas_price_gwei = Web3.from_wei(gas_price, 'gwei')
             
-            print(f"💳 Account balance: {account_balance_native} {native_token}")
-            print(f"💰 LayerZero fee: {fee_native} {native_token}")
-            print(f"⛽ Gas price: {gas_price_gwei} Gwei")
-            print(f"🆔 Target EID: {target_eid}")
-            print(f"🔗 Source Chain: {source_chain} ({native_token})")
+            logger.debug("💳 Account balance: %s %s", account_balance_native, native_token)
+            logger.debug("💰 LayerZero fee: %s %s", fee_native, native_token)
+            logger.debug("⛽ Gas price: %s Gwei", gas_price_gwei)
+            logger.debug("🆔 Target EID: %s", target_eid)
+            logger.debug("🔗 Source Chain: %s (%s)", source_chain, native_token)
             
             if account_balance < native_fee:
                 return {
@@ -1080,7 +1074,7 @@ class ChainFLIPMessagingService:
                 }
             
             # Build transaction using sendCIDToChain for delivery notification
-            nonce = source_web3.eth.get_transaction_count(sending_account.address)
+            nonce = await web3_pool.run(source_chain, source_web3.eth.get_transaction_count, sending_account.address)
             
             transaction = source_contract.functions.sendCIDToChain(
                 target_eid,          # _destEid
@@ -1093,35 +1087,35 @@ class ChainFLIPMessagingService:
                 'gas': 500000,       # Higher gas for cross-chain messaging
                 'gasPrice': gas_price,
                 'nonce': nonce,
-                'chainId': source_web3.eth.chain_id
+                'chainId': await web3_pool.run(source_chain, lambda: source_web3.eth.chain_id)
             })
             
-            print(f"📋 Delivery notification transaction details:")
-            print(f"   From: {sending_account.address}")
-            print(f"   To: {source_contract.address}")
-            print(f"   Function: sendCIDToChain (reused for delivery)")
-            print(f"   Target EID: {target_eid}")
-            print(f"   Delivery Token ID: {delivery_token_id}")
-            print(f"   Value (LayerZero fee): {fee_native} {native_token}")
-            print(f"   Gas limit: {transaction['gas']}")
-            print(f"   Gas price: {Web3.from_wei(gas_price, 'gwei')} Gwei")
+            logger.debug("📋 Delivery notification transaction details:")
+            logger.debug("   From: %s", sending_account.address)
+            logger.debug("   To: %s", source_contract.address)
+            logger.debug("   Function: sendCIDToChain (reused for delivery)")
+            logger.debug("   Target EID: %s", target_eid)
+            logger.debug("   Delivery Token ID: %s", delivery_token_id)
+            logger.debug("   Value (LayerZero fee): %s %s", fee_native, native_token)
+            logger.debug("   Gas limit: %s", transaction['gas'])
+            logger.debug("   Gas price: %s Gwei", Web3.from_wei(gas_price, 'gwei'))
             
             # Sign and send transaction
             signed_txn = source_web3.eth.account.sign_transaction(transaction, sending_account.key)
-            tx_hash = source_web3.eth.send_raw_transaction(signed_txn.raw_transaction)
+            tx_hash = await web3_pool.run(source_chain, source_web3.eth.send_raw_transaction, signed_txn.raw_transaction)
             tx_hash_hex = tx_hash.hex()
             
-            print(f"📤 Delivery notification transaction sent: {tx_hash_hex}")
-            print(f"⏳ Waiting for confirmation...")
+            logger.debug("📤 Delivery notification transaction sent: %s", tx_hash_hex)
+            logger.debug("⏳ Waiting for confirmation...")
             
             # Wait for transaction confirmation
-            receipt = source_web3.eth.wait_for_transaction_receipt(tx_hash, timeout=300)
+            receipt = await web3_pool.run(source_chain, source_web3.eth.wait_for_transaction_receipt, tx_hash, timeout=300, bounded=False)
             
             if receipt.status == 1:
-                print(f"✅ ChainFLIP delivery notification to {target_chain} admin confirmed!")
-                print(f"📊 Block: {receipt.blockNumber}")
-                print(f"⛽ Gas Used: {receipt.gasUsed}")
-                print(f"📍 Admin can check contract {self.contract_addresses.get(target_chain)} on {target_chain}")
+                logger.info("✅ ChainFLIP delivery notification to %s admin confirmed!", target_chain)
+                logger.debug("📊 Block: %s", receipt.blockNumber)
+                logger.debug("⛽ Gas Used: %s", receipt.gasUsed)
+                logger.debug("📍 Admin can check contract %s on %s", self.contract_addresses.get(target_chain), target_chain)
                 
                 # Parse events
                 sync_events = await self._parse_sync_events(source_contract, receipt)
@@ -1172,14 +1166,14 @@ class ChainFLIPMessagingService:
                     "message": f"Delivery notification sent to {target_chain} admin via ChainFLIP Messenger"
                 }
             else:
-                print(f"❌ Delivery notification transaction failed with status: {receipt.status}")
-                print(f"📊 Failed transaction details:")
-                print(f"   Transaction Hash: {tx_hash_hex}")
-                print(f"   Block Number: {receipt.blockNumber}")
-                print(f"   Gas Used: {receipt.gasUsed}")
-                print(f"   Gas Limit: {transaction['gas']}")
-                print(f"   Gas Price: {Web3.from_wei(gas_price, 'gwei')} Gwei")
-                print(f"   LayerZero Fee: {fee_native} {native_token}")
+                logger.warning("❌ Delivery notification transaction failed with status: %s", receipt.status)
+                logger.debug("📊 Failed transaction details:")
+                logger.debug("   Transaction Hash: %s", tx_hash_hex)
+                logger.debug("   Block Number: %s", receipt.blockNumber)
+                logger.debug("   Gas Used: %s", receipt.gasUsed)
+                logger.debug("   Gas Limit: %s", transaction['gas'])
+                logger.debug("   Gas Price: %s Gwei", Web3.from_wei(gas_price, 'gwei'))
+                logger.debug("   LayerZero Fee: %s %s", fee_native, native_token)
                 
                 # Try to get revert reason
                 try:
@@ -1191,7 +1185,7 @@ class ChainFLIPMessagingService:
                         'value': native_fee
                     })
                 except Exception as call_error:
-                    print(f"🔍 Revert reason: {call_error}")
+                    logger.warning("🔍 Revert reason: %s", call_error)
                 
                 return {
                     "success": False,
@@ -1205,9 +1199,9 @@ class ChainFLIPMessagingService:
                 }
                 
         except Exception as e:
-            print(f"❌ ChainFLIP delivery notification error: {e}")
+            logger.error("❌ ChainFLIP delivery notification error: %s", e)
             import traceback
-            print(f"🔍 Full traceback: {traceback.format_exc()}")
+            logger.warning("🔍 Full traceback: %s", traceback.format_exc())
             return {"success": False, "error": str(e)}
 
     async def send_delivery_stage_update(
@@ -1227,22 +1221,22 @@ class ChainFLIPMessagingService:
         For final stage: sends to buyer to notify receipt
         """
         try:
-            print(f"\n🚛 === DELIVERY STAGE {stage_number}/{total_stages} UPDATE ===")
-            print(f"🚚 Transporter: {transporter_address}")
-            print(f"📦 Delivery ID: {delivery_request_id}")
-            print(f"📍 From: {current_location}")
-            print(f"📍 To: {next_location}")
-            print(f"⏰ ETA: {estimated_completion}")
+            logger.debug("\n🚛 === DELIVERY STAGE %s/%s UPDATE ===", stage_number, total_stages)
+            logger.debug("🚚 Transporter: %s", transporter_address)
+            logger.debug("📦 Delivery ID: %s", delivery_request_id)
+            logger.debug("📍 From: %s", current_location)
+            logger.debug("📍 To: %s", next_location)
+            logger.debug("⏰ ETA: %s", estimated_completion)
             
             # Determine target chain and recipient based on stage
             if is_final_stage:
                 # Final stage: notify buyer on their chain
                 target_chain = "optimism_sepolia"  # Buyer chain
-                print(f"🎯 FINAL STAGE: Notifying buyer on {target_chain}")
+                logger.debug("🎯 FINAL STAGE: Notifying buyer on %s", target_chain)
             else:
                 # Intermediate stage: notify admin on hub
                 target_chain = "polygon_amoy"  # Admin hub
-                print(f"🎯 INTERMEDIATE STAGE: Notifying admin on {target_chain}")
+                logger.debug("🎯 INTERMEDIATE STAGE: Notifying admin on %s", target_chain)
             
             # Create stage update message
             stage_update = {
@@ -1280,30 +1274,30 @@ class ChainFLIPMessagingService:
             
             # Prepare sending account
             sending_account = Account.from_key(transporter_private_key)
-            print(f"🔑 Sending from transporter account: {sending_account.address}")
+            logger.debug("🔑 Sending from transporter account: %s", sending_account.address)
             
             # Get LayerZero fee quote
             try:
-                fee_quote = source_contract.functions.quote(
+                fee_quote = await web3_pool.run(source_chain, source_contract.functions.quote(
                     target_eid,
                     f"DELIVERY_STAGE_{delivery_request_id}_{stage_number}",
                     message_data,
                     transporter_address,
                     b"",  # options
                     False  # payInLzToken
-                ).call()
+                ).call)
                 
                 native_fee = fee_quote[0]
                 fee_eth = Web3.from_wei(native_fee, 'ether')
             except Exception as quote_error:
-                print(f"⚠️ Quote failed, using fallback fee: {quote_error}")
+                logger.warning("⚠️ Quote failed, using fallback fee: %s", quote_error)
                 native_fee = Web3.to_wei(2000000, 'gwei')  # 0.002 ETH fallback
                 fee_eth = Web3.from_wei(native_fee, 'ether')
             
-            print(f"💰 LayerZero Fee: {fee_eth} ETH")
+            logger.debug("💰 LayerZero Fee: %s ETH", fee_eth)
             
             # Check balance
-            account_balance = source_web3.eth.get_balance(sending_account.address)
+            account_balance = await web3_pool.run(source_chain, source_web3.eth.get_balance, sending_account.address)
             if account_balance < native_fee:
                 return {
                     "success": False,
@@ -1311,8 +1305,8 @@ class ChainFLIPMessagingService:
                 }
             
             # Build and send transaction
-            gas_price = source_web3.eth.gas_price
-            nonce = source_web3.eth.get_transaction_count(sending_account.address)
+            gas_price = await web3_pool.run(source_chain, lambda: source_web3.eth.gas_price)
+            nonce = await web3_pool.run(source_chain, source_web3.eth.get_transaction_count, sending_account.address)
             
             transaction = source_contract.functions.sendCIDToChain(
                 target_eid,
@@ -1329,17 +1323,17 @@ class ChainFLIPMessagingService:
             
             # Sign and send
             signed_txn = source_web3.eth.account.sign_transaction(transaction, transporter_private_key)
-            tx_hash = source_web3.eth.send_raw_transaction(signed_txn.rawTransaction)
+            tx_hash = await web3_pool.run(source_chain, source_web3.eth.send_raw_transaction, signed_txn.rawTransaction)
             tx_hash_hex = tx_hash.hex()
             
-            print(f"📡 Stage update transaction sent: {tx_hash_hex}")
-            print(f"⏳ Waiting for confirmation...")
+            logger.debug("📡 Stage update transaction sent: %s", tx_hash_hex)
+            logger.debug("⏳ Waiting for confirmation...")
             
             # Wait for receipt
-            receipt = source_web3.eth.wait_for_transaction_receipt(tx_hash, timeout=300)
+            receipt = await web3_pool.run(source_chain, source_web3.eth.wait_for_transaction_receipt, tx_hash, timeout=300, bounded=False)
             
             if receipt.status == 1:
-                print(f"✅ Stage {stage_number} update sent successfully!")
+                logger.info("✅ Stage %s update sent successfully!", stage_number)
                 
                 # Store stage update in database
                 if self.database:
@@ -1365,7 +1359,7 @@ class ChainFLIPMessagingService:
                     }
                     
                     await self.database.delivery_stage_updates.insert_one(stage_record)
-                    print(f"💾 Stage update saved to database")
+                    logger.debug("💾 Stage update saved to database")
                 
                 return {
                     "success": True,
@@ -1386,9 +1380,9 @@ class ChainFLIPMessagingService:
                 }
                 
         except Exception as e:
-            print(f"❌ Delivery stage update error: {e}")
+            logger.error("❌ Delivery stage update error: %s", e)
             import traceback
-            print(f"🔍 Full traceback: {traceback.format_exc()}")
+            logger.warning("🔍 Full traceback: %s", traceback.format_exc())
             return {"success": False, "error": str(e)}
 
     async def simulate_multi_stage_delivery(
@@ -1402,10 +1396,10 @@ class ChainFLIPMessagingService:
         Each transporter handles one stage and sends cross-chain updates
         """
         try:
-            print(f"\n🛣️ === SIMULATING MULTI-STAGE DELIVERY ===")
-            print(f"📦 Delivery ID: {delivery_request_id}")
-            print(f"🚚 Transporters: {len(assigned_transporters)}")
-            print(f"📍 Route: {' → '.join(route_locations)}")
+            logger.debug("\n🛣️ === SIMULATING MULTI-STAGE DELIVERY ===")
+            logger.debug("📦 Delivery ID: %s", delivery_request_id)
+            logger.debug("🚚 Transporters: %s", len(assigned_transporters))
+            logger.debug("📍 Route: %s", ' → '.join(route_locations))
             
             total_stages = len(assigned_transporters)
             delivery_results = []
@@ -1423,9 +1417,9 @@ class ChainFLIPMessagingService:
                 eta = datetime.datetime.now() + datetime.timedelta(hours=stage_num * 2)
                 estimated_completion = eta.strftime("%Y-%m-%d %H:%M:%S")
                 
-                print(f"\n🚛 Stage {stage_num}/{total_stages}: {transporter}")
-                print(f"   📍 {current_location} → {next_location}")
-                print(f"   ⏰ ETA: {estimated_completion}")
+                logger.debug("\n🚛 Stage %s/%s: %s", stage_num, total_stages, transporter)
+                logger.debug("   📍 %s → %s", current_location, next_location)
+                logger.debug("   ⏰ ETA: %s", estimated_completion)
                 
                 # Send stage update
                 stage_result = await self.send_delivery_stage_update(
@@ -1448,14 +1442,14 @@ class ChainFLIPMessagingService:
                 
                 # Add delay between stages for realism
                 if not is_final:
-                    print(f"⏳ Simulating {stage_num * 1} second delivery time...")
+                    logger.debug("⏳ Simulating %s second delivery time...", stage_num * 1)
                     await asyncio.sleep(stage_num * 1)  # 1-3 second delays
             
             # Count successful stages
             successful_stages = sum(1 for result in delivery_results if result["result"].get("success"))
             
-            print(f"\n✅ Multi-stage delivery simulation complete!")
-            print(f"   📊 {successful_stages}/{total_stages} stages completed successfully")
+            logger.info("\n✅ Multi-stage delivery simulation complete!")
+            logger.debug("   📊 %s/%s stages completed successfully", successful_stages, total_stages)
             
             return {
                 "success": True,
@@ -1468,7 +1462,7 @@ class ChainFLIPMessagingService:
             }
             
         except Exception as e:
-            print(f"❌ Multi-stage delivery simulation error: {e}")
+            logger.error("❌ Multi-stage delivery simulation error: %s", e)
             return {"success": False, "error": str(e)}
 
     def _generate_delivery_route(self, distance_miles: int, num_transporters: int) -> List[str]:
@@ -1516,7 +1510,7 @@ class ChainFLIPMessagingService:
                     continue
                         
         except Exception as e:
-            print(f"⚠️ Event parsing error: {e}")
+            logger.warning("⚠️ Event parsing error: %s", e)
             
         return events
 
@@ -1527,24 +1521,32 @@ class ChainFLIPMessagingService:
             if not contract:
                 return {"success": False, "error": f"Contract not available for {chain_name}"}
             
-            # Get all CIDs
-            all_cids = contract.functions.getAllCIDs().call()
-            cid_count = contract.functions.getCIDCount().call()
-            
-            # Get detailed data for each CID
+            # Get all CIDs and the count in one round trip
+            all_cids_result, cid_count_result = await batch_reader.call(
+                chain_name, [contract.functions.getAllCIDs(), contract.functions.getCIDCount()]
+            )
+            if not all_cids_result.success:
+                raise Exception(all_cids_result.error)
+            if not cid_count_result.success:
+                raise Exception(cid_count_result.error)
+            all_cids = all_cids_result.value
+            cid_count = cid_count_result.value
+            
+            # Get detailed data for every CID in batched reads
+            cid_results = await batch_reader.call(chain_name, [contract.functions.getCIDData(cid) for cid in all_cids])
             cid_data = []
-            for cid in all_cids:
-                try:
-                    data = contract.functions.getCIDData(cid).call()
-                    cid_data.append({
-                        "token_id": data[0],
-                        "metadata_cid": data[1],
-                        "manufacturer": data[2],
-                        "timestamp": data[3],
-                        "source_chain": data[4]
-                    })
-                except Exception as e:
-                    print(f"⚠️ Error getting CID data for {cid}: {e}")
+            for cid, result in zip(all_cids, cid_results):
+                if not result.success:
+                    logger.warning("⚠️ Error getting CID data for %s: %s", cid, result.error)
+                    continue
+                data = result.value
+                cid_data.append({
+                    "token_id": data[0],
+                    "metadata_cid": data[1],
+                    "manufacturer": data[2],
+                    "timestamp": data[3],
+                    "source_chain": data[4]
+                })
             
             return {
                 "success": True,
@@ -1560,10 +1562,10 @@ class ChainFLIPMessagingService:
         """Update contract addresses after deployment"""
         self.contract_addresses.update(addresses)
         await self._initialize_contracts()
-        print("✅ Contract addresses updated and contracts reinitialized")
+        logger.info("✅ Contract addresses updated and contracts reinitialized")
 
 # Global instance
-chainflip_messaging_service = ChainFLIPMessagingService()
+chainflip_messaging_service = service_registry.register("chainflip_messaging", ChainFLIPMessagingService(), lazy=True)
 
 # Initialize the service
 import asyncio
@@ -1591,5 +1593,5 @@ def init_chainflip_service():
 try:
     init_chainflip_service()
 except Exception as e:
-    print(f"⚠️ ChainFLIP service initialization deferred: {e}")
-    print("📝 Service will be initialized on first use")
\ No newline at end of file
+    logger.warning("⚠️ ChainFLIP service initialization deferred: %s", e)
+    logger.warning("📝 Service will be initialized on first use")
\ No newline at end of file
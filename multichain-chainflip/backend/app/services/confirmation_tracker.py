@@ -0,0 +1,342 @@
+"""
+Confirmation Tracker
+Background service that follows sent transactions to their required
+confirmation depth, so request handlers can answer with a tracking id instead
+of holding the connection open while a receipt is awaited
+
+- one watcher per chain polls the head block; each time it advances, the
+  receipts of every tracked transaction on that chain are fetched in one
+  JSON-RPC batch (a receipt that disappears again after a reorg puts the
+  transaction back to pending)
+- when a transaction reaches its depth (or fails, or isn't mined before its
+  deadline) the tx_tracking record is finalized, the optional target document
+  gets the on_confirmed / on_failed fields, and waiters and subscribers are
+  notified
+- run() tracks a multi-step operation (e.g. a bridge transfer) the same way
+- pending records are picked up again by start() after a restart
+"""
+import asyncio
+import time
+import uuid
+from typing import Any, AsyncIterator, Awaitable, Dict, List, Optional, Set
+
+from web3 import Web3
+
+from app.core.config import get_settings
+from app.core.database import get_database
+from app.core.index_manifest import index_manifest
+from app.core.log import get_logger
+from app.core.response_cache import invalidate_product_views
+from app.core.service_registry import service_registry
+from app.core.tx_pipeline import fetch_receipts, hash_hex
+from app.core.web3_pool import web3_pool
+
+settings = get_settings()
+logger = get_logger(__name__)
+
+# Transactions: pending -> mined -> confirmed | failed | timeout
+# Operations (run()): running -> completed | failed
+ACTIVE_STATUSES = ("pending", "mined", "running")
+TERMINAL_STATUSES = ("confirmed", "completed", "failed", "timeout")
+
+index_manifest.register("confirmation_tracker", "tx_tracking", "tracking_id", unique=True)
+index_manifest.register("confirmation_tracker", "tx_tracking", "status")
+index_manifest.register_query("confirmation_tracker", "tx_tracking", {"tracking_id": "t"})
+index_manifest.register_query("confirmation_tracker", "tx_tracking", {"status": {"$in": list(ACTIVE_STATUSES)}})
+
+
+def tracking_target(collection: str, filter: Dict[str, Any], on_confirmed: Dict[str, Any] = None, on_failed: Dict[str, Any] = None) -> Dict[str, Any]:
+    """Document to update when a tracked transaction or operation finishes"""
+    return {"collection": collection, "filter": filter, "on_confirmed": on_confirmed or {}, "on_failed": on_failed or {}}
+
+
+class ConfirmationTracker:
+    """
+    Tracks transactions and long-running operations by tracking id
+
+    - track() / run() return immediately; status is read with get(), awaited
+      with wait() or followed with updates()
+    - records live in memory while active and are mirrored to tx_tracking
+    """
+
+    def __init__(
+        self,
+        poll_interval: float = settings.tx_tracking_poll_interval,
+        confirmations: int = settings.tx_confirmations,
+        timeout: float = settings.tx_tracking_timeout,
+    ):
+        self.poll_interval = poll_interval
+        self.confirmations = confirmations
+        self.timeout = timeout
+        self.database = None
+        self._records: Dict[str, Dict[str, Any]] = {}
+        self._by_chain: Dict[str, Set[str]] = {}
+        self._clients: Dict[str, Web3] = {}
+        self._watchers: Dict[str, asyncio.Task] = {}
+        self._jobs: Dict[str, asyncio.Task] = {}
+        self._waiters: Dict[str, asyncio.Future] = {}
+        self._subscribers: Dict[str, List[asyncio.Queue]] = {}
+        self._stats = {"tracked": 0, "confirmed": 0, "failed": 0, "timeouts": 0, "reorged": 0, "receipt_polls": 0}
+
+    async def initialize(self):
+        self.database = await get_database()
+        await index_manifest.apply(self.database, owners=["confirmation_tracker"])
+        logger.info("✅ Confirmation tracker initialized (%s confirmations)", self.confirmations)
+
+    async def _ready(self):
+        # Services that track transactions may run before startup reached this one
+        if self.database is None:
+            await service_registry.initialize("confirmation_tracker")
+
+    async def start(self):
+        """Resume transactions that were still pending at the last shutdown"""
+        resumed = 0
+        async for record in self.database.tx_tracking.find({"status": {"$in": list(ACTIVE_STATUSES)}}, {"_id": 0}):
+            self._activate(record)
+            if record["status"] == "running":
+                # The coroutine behind an operation didn't survive the restart
+                await self._update(record, status="failed", error="Interrupted by a restart")
+            else:
+                resumed += 1
+        if resumed:
+            logger.info("🔄 Resumed tracking %s transactions", resumed)
+
+    async def stop(self):
+        tasks = list(self._watchers.values()) + list(self._jobs.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._watchers.clear()
+        self._jobs.clear()
+
+    def _new_record(self, kind: str, status: str, target: Optional[Dict[str, Any]], **fields) -> Dict[str, Any]:
+        now = time.time()
+        return {
+            "tracking_id": str(uuid.uuid4()),
+            "kind": kind,
+            "status": status,
+            "target": target,
+            "error": None,
+            "created_at": now,
+            "updated_at": now,
+            **fields,
+        }
+
+    def _activate(self, record: Dict[str, Any]):
+        self._records[record["tracking_id"]] = record
+        chain = record.get("chain")
+        if chain and record["status"] != "running":
+            self._by_chain.setdefault(chain, set()).add(record["tracking_id"])
+            watcher = self._watchers.get(chain)
+            if watcher is None or watcher.done():
+                self._watchers[chain] = asyncio.create_task(self._watch(chain))
+
+    def _deactivate(self, record: Dict[str, Any]):
+        tracking_id = record["tracking_id"]
+        self._records.pop(tracking_id, None)
+        chain_ids = self._by_chain.get(record.get("chain"))
+        if chain_ids is not None:
+            chain_ids.discard(tracking_id)
+
+    async def track(
+        self,
+        chain: str,
+        tx_hash: Any,
+        kind: str,
+        target: Optional[Dict[str, Any]] = None,
+        confirmations: Optional[int] = None,
+        timeout: Optional[float] = None,
+        web3: Optional[Web3] = None,
+    ) -> str:
+        """Follow a sent transaction until it has `confirmations` blocks on top; returns its tracking id"""
+        await self._ready()
+        key = web3_pool.chain_key(chain)
+        if web3 is not None:
+            self._clients[key] = web3
+        record = self._new_record(
+            kind, "pending", target,
+            chain=key,
+            tx_hash=hash_hex(tx_hash),
+            confirmations_required=confirmations or self.confirmations,
+            confirmations=0,
+            block_number=None,
+            deadline=time.time() + (timeout or self.timeout),
+        )
+        await self.database.tx_tracking.insert_one(dict(record))
+        self._stats["tracked"] += 1
+        self._activate(record)
+        return record["tracking_id"]
+
+    async def run(self, kind: str, operation: Awaitable[Dict[str, Any]], target: Optional[Dict[str, Any]] = None) -> str:
+        """
+        Run an operation in the background; returns its tracking id
+
+        The operation's result dict is stored on the record; it counts as failed
+        when it raises or returns {"success": False, ...}.
+        """
+        await self._ready()
+        record = self._new_record(kind, "running", target, result=None)
+        await self.database.tx_tracking.insert_one(dict(record))
+        self._stats["tracked"] += 1
+        self._activate(record)
+        self._jobs[record["tracking_id"]] = asyncio.create_task(self._run_job(record, operation))
+        return record["tracking_id"]
+
+    async def _run_job(self, record: Dict[str, Any], operation: Awaitable[Dict[str, Any]]):
+        try:
+            result = await operation
+        except Exception as e:
+            logger.warning("⚠️ Tracked %s %s failed: %s", record["kind"], record["tracking_id"], e)
+            await self._update(record, status="failed", error=str(e))
+            return
+        finally:
+            self._jobs.pop(record["tracking_id"], None)
+        if isinstance(result, dict) and result.get("success") is False:
+            await self._update(record, status="failed", result=result, error=result.get("error"))
+        else:
+            await self._update(record, status="completed", result=result)
+
+    async def _update(self, record: Dict[str, Any], **changes):
+        """Apply a status change: persist it, finalize the target when terminal, then notify"""
+        changes["updated_at"] = time.time()
+        record.update(changes)
+        finished = record["status"] in TERMINAL_STATUSES
+        if finished:
+            # Out of the active set before any await, so no poll can finish it twice
+            self._deactivate(record)
+        try:
+            await self.database.tx_tracking.update_one({"tracking_id": record["tracking_id"]}, {"$set": changes})
+        except Exception as e:
+            logger.warning("⚠️ Could not persist tracking record %s: %s", record["tracking_id"], e)
+        view = self._view(record)
+        if finished:
+            await self._apply_target(record)
+            self._stats[{"confirmed": "confirmed", "completed": "confirmed", "timeout": "timeouts"}.get(record["status"], "failed")] += 1
+            waiter = self._waiters.pop(record["tracking_id"], None)
+            if waiter is not None and not waiter.done():
+                waiter.set_result(view)
+        for queue in self._subscribers.get(record["tracking_id"], ()):
+            queue.put_nowait(view)
+
+    async def _apply_target(self, record: Dict[str, Any]):
+        target = record.get("target")
+        if not target:
+            return
+        if record["status"] in ("confirmed", "completed"):
+            fields = {**target.get("on_confirmed", {}), "confirmed_at": time.time()}
+            if record.get("confirmation_block") is not None:
+                fields["confirmation_block"] = record["confirmation_block"]
+        else:
+            fields = {**target.get("on_failed", {}), "failure_reason": record.get("error")}
+        if not fields:
+            return
+        try:
+            await self.database[target["collection"]].update_one(target["filter"], {"$set": fields})
+            if target["collection"] == "products":
+                await invalidate_product_views(target["filter"].get("token_id"))
+        except Exception as e:
+            logger.warning("⚠️ Could not update %s for %s: %s", target["collection"], record["tracking_id"], e)
+
+    async def _watch(self, chain: str):
+        last_head = None
+        while self._by_chain.get(chain):
+            try:
+                head = await web3_pool.latest_block(chain)
+                if head is not None and head != last_head:
+                    last_head = head
+                    await self._check(chain, head)
+                await self._expire(chain)
+            except Exception as e:
+                logger.warning("⚠️ Confirmation check failed on %s: %s", chain, e)
+            await asyncio.sleep(self.poll_interval)
+
+    def _client(self, chain: str) -> Web3:
+        client = self._clients.get(chain)
+        if client is None:
+            client = self._clients[chain] = web3_pool.web3(chain)
+        return client
+
+    async def _check(self, chain: str, head: int):
+        """Re-read the receipts of every active transaction on a chain at a new head block"""
+        records = [self._records[tracking_id] for tracking_id in list(self._by_chain.get(chain, ())) if tracking_id in self._records]
+        if not records:
+            return
+        self._stats["receipt_polls"] += 1
+        receipts = await fetch_receipts(chain, self._client(chain), list({record["tx_hash"] for record in records}))
+        for record in records:
+            if record["status"] in TERMINAL_STATUSES:
+                continue
+            receipt = receipts.get(record["tx_hash"])
+            if receipt is None:
+                if record["status"] == "mined":
+                    self._stats["reorged"] += 1
+                    logger.warning("⚠️ %s dropped out of %s after a reorg", record["tx_hash"], chain)
+                    await self._update(record, status="pending", block_number=None, confirmations=0)
+                continue
+            depth = max(head - receipt.blockNumber + 1, 0)
+            if receipt.status != 1:
+                await self._update(record, status="failed", block_number=receipt.blockNumber, gas_used=receipt.gasUsed, error="Transaction failed on-chain")
+            elif depth >= record["confirmations_required"]:
+                await self._update(
+                    record, status="confirmed", block_number=receipt.blockNumber, gas_used=receipt.gasUsed,
+                    confirmations=depth, confirmation_block=head,
+                )
+                logger.info("✅ %s %s confirmed on %s (%s blocks)", record["kind"], record["tx_hash"], chain, depth)
+            elif record["status"] != "mined" or record["confirmations"] != depth:
+                await self._update(record, status="mined", block_number=receipt.blockNumber, gas_used=receipt.gasUsed, confirmations=depth)
+
+    async def _expire(self, chain: str):
+        now = time.time()
+        for tracking_id in list(self._by_chain.get(chain, ())):
+            record = self._records.get(tracking_id)
+            if record is not None and record["status"] == "pending" and record["deadline"] <= now:
+                await self._update(record, status="timeout", error=f"Not mined within {int(now - record['created_at'])}s")
+
+    @staticmethod
+    def _view(record: Dict[str, Any]) -> Dict[str, Any]:
+        return {key: value for key, value in record.items() if key not in ("_id", "target", "deadline")}
+
+    async def get(self, tracking_id: str) -> Optional[Dict[str, Any]]:
+        """Current status of a tracked transaction or operation, or None if unknown"""
+        record = self._records.get(tracking_id)
+        if record is not None:
+            return self._view(record)
+        await self._ready()
+        record = await self.database.tx_tracking.find_one({"tracking_id": tracking_id}, {"_id": 0})
+        return self._view(record) if record else None
+
+    async def wait(self, tracking_id: str, timeout: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        """Final status of a tracking id; raises asyncio.TimeoutError after timeout seconds"""
+        if tracking_id not in self._records:
+            return await self.get(tracking_id)
+        waiter = self._waiters.get(tracking_id)
+        if waiter is None:
+            waiter = self._waiters[tracking_id] = asyncio.get_running_loop().create_future()
+        return await asyncio.wait_for(asyncio.shield(waiter), timeout)
+
+    async def updates(self, tracking_id: str) -> AsyncIterator[Dict[str, Any]]:
+        """Current status, then every change until the record is final"""
+        queue: asyncio.Queue = asyncio.Queue()
+        subscribers = self._subscribers.setdefault(tracking_id, [])
+        subscribers.append(queue)
+        try:
+            current = await self.get(tracking_id)
+            if current is None:
+                return
+            yield current
+            while current["status"] not in TERMINAL_STATUSES:
+                current = await queue.get()
+                yield current
+        finally:
+            subscribers.remove(queue)
+            if not subscribers:
+                self._subscribers.pop(tracking_id, None)
+
+    def metrics(self) -> Dict[str, Any]:
+        active: Dict[str, int] = {}
+        for record in self._records.values():
+            active[record["status"]] = active.get(record["status"], 0) + 1
+        return {**self._stats, "active": active, "watched_chains": sorted(chain for chain, ids in self._by_chain.items() if ids)}
+
+
+confirmation_tracker = service_registry.register("confirmation_tracker", ConfirmationTracker())
@@ -17,13 +17,18 @@ from typing import Dict, List, Optional, Any
 from web3 import Web3
 from eth_account import Account
 from app.core.config import get_settings
+from app.core.web3_pool import web3_pool
+from app.core.response_cache import invalidate_product_views
+from app.core.service_registry import service_registry
 from app.core.database import get_database
+from app.core.log import get_logger
 from app.services.contract_abis import (
     LAYERZERO_CONFIG_ABI, FXPORTAL_BRIDGE_ABI, ENHANCED_HUB_ABI, BUYER_CHAIN_ABI,
     MessageType, TransactionType, ProductStatus, PurchaseStatus, MarketplaceCategory
 )
 
 settings = get_settings()
+logger = get_logger(__name__)
 
 class CrossChainPurchaseService:
     def __init__(self):
@@ -68,20 +73,20 @@ class CrossChainPurchaseService:
         deployer_account_info = self.address_key_manager.get_account_info_for_address('0x032041b4b356fEE1496805DD4749f181bC736FFA')
         if deployer_account_info:
             self.current_account = deployer_account_info['account']
-            print(f"🔑 Using deployer account: {self.current_account.address}")
+            logger.debug("🔑 Using deployer account: %s", self.current_account.address)
         else:
             # Fallback to direct private key
             if settings.deployer_private_key:
                 self.current_account = Account.from_key(settings.deployer_private_key)
-                print(f"🔑 Using fallback account: {self.current_account.address}")
+                logger.debug("🔑 Using fallback account: %s", self.current_account.address)
             else:
                 raise ValueError("No account available for signing transactions")
         
         # Initialize Optimism Sepolia (Buyer Chain)
         if settings.optimism_sepolia_rpc:
-            self.optimism_web3 = Web3(Web3.HTTPProvider(settings.optimism_sepolia_rpc))
-            if self.optimism_web3.is_connected():
-                print(f"✅ Connected to Optimism Sepolia (Buyer Chain) - Chain ID: {settings.optimism_sepolia_chain_id}")
+            self.optimism_web3 = web3_pool.web3("optimism_sepolia")
+            if await web3_pool.is_connected("optimism_sepolia"):
+                logger.info("✅ Connected to Optimism Sepolia (Buyer Chain) - Chain ID: %s", settings.optimism_sepolia_chain_id)
                 
                 # Initialize LayerZero contract on Optimism
                 self.layerzero_optimism_contract = self.optimism_web3.eth.contract(
@@ -94,13 +99,13 @@ class CrossChainPurchaseService:
                     address=self.buyer_contract_address,
                     abi=BUYER_CHAIN_ABI
                 )
-                print(f"🏪 Buyer contract initialized: {self.buyer_contract_address}")
+                logger.debug("🏪 Buyer contract initialized: %s", self.buyer_contract_address)
             
         # Initialize Polygon PoS (Hub Chain)  
         if settings.polygon_pos_rpc:
-            self.polygon_web3 = Web3(Web3.HTTPProvider(settings.polygon_pos_rpc))
-            if self.polygon_web3.is_connected():
-                print(f"✅ Connected to Polygon PoS (Hub Chain) - Chain ID: {settings.polygon_pos_chain_id}")
+            self.polygon_web3 = web3_pool.web3("polygon_pos")
+            if await web3_pool.is_connected("polygon_pos"):
+                logger.info("✅ Connected to Polygon PoS (Hub Chain) - Chain ID: %s", settings.polygon_pos_chain_id)
                 
                 # Initialize Hub contract
                 self.hub_contract = self.polygon_web3.eth.contract(
@@ -119,36 +124,36 @@ class CrossChainPurchaseService:
                     address=self.fxportal_hub_address,
                     abi=FXPORTAL_BRIDGE_ABI
                 )
-                print(f"🌐 Hub contract initialized: {self.hub_contract_address}")
-                print(f"🌉 Bridge contracts initialized - LayerZero: {self.layerzero_hub_address}, FxPortal: {self.fxportal_hub_address}")
+                logger.debug("🌐 Hub contract initialized: %s", self.hub_contract_address)
+                logger.debug("🌉 Bridge contracts initialized - LayerZero: %s, FxPortal: %s", self.layerzero_hub_address, self.fxportal_hub_address)
                 
         # Initialize Base Sepolia (Manufacturer Chain)
         if settings.base_sepolia_rpc:
-            self.base_sepolia_web3 = Web3(Web3.HTTPProvider(settings.base_sepolia_rpc))
-            if self.base_sepolia_web3.is_connected():
-                print(f"✅ Connected to Base Sepolia (Manufacturer Chain) - Chain ID: {settings.base_sepolia_chain_id}")
+            self.base_sepolia_web3 = web3_pool.web3("base_sepolia")
+            if await web3_pool.is_connected("base_sepolia"):
+                logger.info("✅ Connected to Base Sepolia (Manufacturer Chain) - Chain ID: %s", settings.base_sepolia_chain_id)
                 
         # Initialize Arbitrum Sepolia (Transporter Chain)
         if settings.arbitrum_sepolia_rpc:
-            self.arbitrum_web3 = Web3(Web3.HTTPProvider(settings.arbitrum_sepolia_rpc))
-            if self.arbitrum_web3.is_connected():
-                print(f"✅ Connected to Arbitrum Sepolia (Transporter Chain) - Chain ID: {settings.arbitrum_sepolia_chain_id}")
+            self.arbitrum_web3 = web3_pool.web3("arbitrum_sepolia")
+            if await web3_pool.is_connected("arbitrum_sepolia"):
+                logger.info("✅ Connected to Arbitrum Sepolia (Transporter Chain) - Chain ID: %s", settings.arbitrum_sepolia_chain_id)
         
-        print("🌐 Cross-chain purchase service initialized with REAL CONTRACTS")
+        logger.debug("🌐 Cross-chain purchase service initialized with REAL CONTRACTS")
 
     def switch_account_for_operation(self, operation_type: str, preferred_address: Optional[str] = None) -> Dict[str, Any]:
         """Switch to appropriate account for specific operation"""
         account_info = self.address_key_manager.get_account_info_for_address(preferred_address or '0x032041b4b356fEE1496805DD4749f181bC736FFA')
         if account_info:
             self.current_account = account_info['account']
-            print(f"🔄 Switched to {operation_type} account: {self.current_account.address}")
+            logger.debug("🔄 Switched to %s account: %s", operation_type, self.current_account.address)
             return {
                 "success": True,
                 "address": self.current_account.address,
                 "operation": operation_type
             }
         else:
-            print(f"❌ No account found for operation: {operation_type}")
+            logger.warning("❌ No account found for operation: %s", operation_type)
             return {"success": False, "error": f"No account available for {operation_type}"}
 
     async def get_account_balances(self) -> Dict[str, Any]:
@@ -163,32 +168,32 @@ class CrossChainPurchaseService:
             if account_info:
                 account_balances = {"address": account_info["address"], "balances": {}}
             
-                if self.optimism_web3 and self.optimism_web3.is_connected():
-                    balance_wei = self.optimism_web3.eth.get_balance(account_info["address"])
+                if self.optimism_web3 and await web3_pool.is_connected("optimism_sepolia"):
+                    balance_wei = await web3_pool.run("optimism_sepolia", self.optimism_web3.eth.get_balance, account_info["address"])
                     account_balances["balances"]["optimism_sepolia"] = {
                         "balance_eth": float(Web3.from_wei(balance_wei, 'ether')),
                         "balance_wei": balance_wei,
                         "chain_id": settings.optimism_sepolia_chain_id
                     }
                     
-                if self.polygon_web3 and self.polygon_web3.is_connected():
-                    balance_wei = self.polygon_web3.eth.get_balance(account_info["address"])
+                if self.polygon_web3 and await web3_pool.is_connected("polygon_pos"):
+                    balance_wei = await web3_pool.run("polygon_pos", self.polygon_web3.eth.get_balance, account_info["address"])
                     account_balances["balances"]["polygon_pos"] = {
                         "balance_eth": float(Web3.from_wei(balance_wei, 'ether')),
                         "balance_wei": balance_wei,
                         "chain_id": settings.polygon_pos_chain_id
                     }
                     
-                if self.base_sepolia_web3 and self.base_sepolia_web3.is_connected():
-                    balance_wei = self.base_sepolia_web3.eth.get_balance(account_info["address"])
+                if self.base_sepolia_web3 and await web3_pool.is_connected("base_sepolia"):
+                    balance_wei = await web3_pool.run("base_sepolia", self.base_sepolia_web3.eth.get_balance, account_info["address"])
                     account_balances["balances"]["base_sepolia"] = {
                         "balance_eth": float(Web3.from_wei(balance_wei, 'ether')),
                         "balance_wei": balance_wei,
                         "chain_id": settings.base_sepolia_chain_id
                     }
                     
-                if self.arbitrum_web3 and self.arbitrum_web3.is_connected():
-                    balance_wei = self.arbitrum_web3.eth.get_balance(account_info["address"])
+                if self.arbitrum_web3 and await web3_pool.is_connected("arbitrum_sepolia"):
+                    balance_wei = await web3_pool.run("arbitrum_sepolia", self.arbitrum_web3.eth.get_balance, account_info["address"])
                     account_balances["balances"]["arbitrum_sepolia"] = {
                         "balance_eth": float(Web3.from_wei(balance_wei, 'ether')),
                         "balance_wei": balance_wei,
@@ -240,14 +245,14 @@ class CrossChainPurchaseService:
             purchase_price = float(purchase_request["price"])
             payment_method = purchase_request.get("payment_method", "ETH")
             
-            print(f"🚀 SIMPLIFIED Algorithm 5: Purchase Process Started")
-            print(f"   📦 Product ID: {product_id}")
-            print(f"   👤 Buyer: {buyer_address}")
-            print(f"   💰 Price: {purchase_price} ETH")
-            print(f"   🔗 Flow: Optimism Sepolia → Polygon Hub → Base Sepolia")
+            logger.debug("🚀 SIMPLIFIED Algorithm 5: Purchase Process Started")
+            logger.debug("   📦 Product ID: %s", product_id)
+            logger.debug("   👤 Buyer: %s", buyer_address)
+            logger.debug("   💰 Price: %s ETH", purchase_price)
+            logger.debug("   🔗 Flow: Optimism Sepolia → Polygon Hub → Base Sepolia")
             
             # Step 1: Get Product details
-            print(f"📋 Step 1: Retrieving product details...")
+            logger.debug("📋 Step 1: Retrieving product details...")
             product = await self.database.products.find_one({"token_id": product_id})
             if not product:
                 return {"success": False, "error": "Product not found", "step": "product_lookup"}
@@ -255,51 +260,51 @@ class CrossChainPurchaseService:
             manufacturer_address = product.get("manufacturer", "")
             current_owner = product.get("current_owner", manufacturer_address)
             
-            print(f"✅ Product found: {product.get('name', 'Unknown Product')}")
-            print(f"   🏭 Manufacturer: {manufacturer_address}")
-            print(f"   👤 Current Owner: {current_owner}")
+            logger.info("✅ Product found: %s", product.get('name', 'Unknown Product'))
+            logger.debug("   🏭 Manufacturer: %s", manufacturer_address)
+            logger.debug("   👤 Current Owner: %s", current_owner)
             
             # Step 2: Verify product ownership and availability
-            print(f"📋 Step 2: Verifying product ownership and availability...")
+            logger.debug("📋 Step 2: Verifying product ownership and availability...")
             if current_owner == buyer_address:
                 return {"success": False, "error": "Buyer already owns this product", "step": "ownership_check"}
             
             # Step 3: Product available for purchase
-            print(f"✅ Step 3: Product available for purchase")
+            logger.info("✅ Step 3: Product available for purchase")
             
             # Step 4: Verify product authenticity
-            print(f"📋 Step 4: Product authenticity verification...")
+            logger.debug("📋 Step 4: Product authenticity verification...")
             authenticity_result = await self._verify_product_authenticity_for_purchase(product, buyer_address)
             
             # Step 5: Check if product is genuine
             if not authenticity_result["is_authentic"]:
-                print(f"❌ Step 5: Product verification failed - {authenticity_result['reason']}")
+                logger.warning("❌ Step 5: Product verification failed - %s", authenticity_result['reason'])
                 return {"success": False, "error": f"Product Verification Failed: {authenticity_result['reason']}", "step": "authenticity_verification"}
             
-            print(f"✅ Step 5: Product verified as genuine")
+            logger.info("✅ Step 5: Product verified as genuine")
             
             # Step 6: Process payment into escrow (SIMPLIFIED - NO NFT TRANSFER)
-            print(f"💰 Step 6: Processing payment into escrow...")
+            logger.debug("💰 Step 6: Processing payment into escrow...")
             payment_result = await self._process_cross_chain_payment(
                 buyer_address, current_owner, purchase_price, product_id
             )
             
             # Step 7: Check if payment escrow is successful
             if not payment_result["success"]:
-                print(f"❌ Step 7: Payment escrow failed - {payment_result['error']}")
+                logger.warning("❌ Step 7: Payment escrow failed - %s", payment_result['error'])
                 return {"success": False, "error": f"Payment Escrow Failed: {payment_result['error']}", "step": "payment_processing"}
             
-            print(f"✅ Step 7: Payment deposited into escrow successfully")
+            logger.info("✅ Step 7: Payment deposited into escrow successfully")
             
             # Step 8: Send cross-chain notifications (SIMPLIFIED)
-            print(f"� Step 8: Sending cross-chain notifications...")
+            logger.debug("� Step 8: Sending cross-chain notifications...")
             notification_result = await self._send_purchase_notifications(
                 product, buyer_address, current_owner, payment_result["escrow_id"], purchase_price
             )
             
             # Step 9: Update product status - WAITING FOR DELIVERY (NOT SOLD)
-            print(f"📋 Step 9: Updating product status...")
-            print(f"🔍 DEBUG: payment_result keys: {list(payment_result.keys())}")
+            logger.debug("📋 Step 9: Updating product status...")
+            logger.debug("🔍 DEBUG: payment_result keys: %s", list(payment_result.keys()))
             await self.database.products.update_one(
                 {"token_id": product_id},
                 {
@@ -323,11 +328,12 @@ class CrossChainPurchaseService:
                     }
                 }
             )
-            print(f"✅ Step 9: Product status updated successfully")
+            await invalidate_product_views(product_id)
+            logger.info("✅ Step 9: Product status updated successfully")
             
             # Step 10: Create manufacturer delivery queue entry
-            print(f"📋 Step 10: Adding to manufacturer delivery queue...")
-            print(f"🔍 DEBUG: Creating delivery queue with order_id: {payment_result['purchase_id']}")
+            logger.debug("📋 Step 10: Adding to manufacturer delivery queue...")
+            logger.debug("🔍 DEBUG: Creating delivery queue with order_id: %s", payment_result['purchase_id'])
             delivery_queue_entry = {
                 "order_id": payment_result["purchase_id"],
                 "product_id": product_id,
@@ -349,26 +355,26 @@ class CrossChainPurchaseService:
                 }
             }
             
-            print(f"🔍 DEBUG: About to insert delivery queue entry...")
+            logger.debug("🔍 DEBUG: About to insert delivery queue entry...")
             # Save delivery queue entry
             await self.database.delivery_queue.insert_one(delivery_queue_entry)
-            print(f"✅ Step 10: Delivery queue entry created successfully")
+            logger.info("✅ Step 10: Delivery queue entry created successfully")
             
             # Step 11: Send AES and HMAC keys to buyer for QR decryption
-            print(f"🔑 Step 11: Sending encryption keys to buyer for QR decryption...")
+            logger.debug("🔑 Step 11: Sending encryption keys to buyer for QR decryption...")
             key_transfer_result = await self._send_encryption_keys_to_buyer(
                 product, buyer_address, payment_result["purchase_id"]
             )
             
             if not key_transfer_result["success"]:
-                print(f"⚠️ Key transfer failed: {key_transfer_result['error']}")
+                logger.warning("⚠️ Key transfer failed: %s", key_transfer_result['error'])
                 # Continue with purchase completion - keys can be resent later
             else:
-                print(f"✅ Step 11: Encryption keys sent to buyer successfully")
+                logger.info("✅ Step 11: Encryption keys sent to buyer successfully")
             
             # Step 12: Return simplified purchase result
-            print(f"🎉 SIMPLIFIED Algorithm 5 Result: Order Placed Successfully")
-            print(f"🔍 DEBUG: About to return result with payment_result keys: {list(payment_result.keys())}")
+            logger.info("🎉 SIMPLIFIED Algorithm 5 Result: Order Placed Successfully")
+            logger.debug("🔍 DEBUG: About to return result with payment_result keys: %s", list(payment_result.keys()))
             try:
                 final_result = {
                     "success": True,
@@ -396,16 +402,16 @@ class CrossChainPurchaseService:
                         "message": key_transfer_result.get("message", "")
                     }
                 }
-                print(f"✅ Final result created successfully")
+                logger.info("✅ Final result created successfully")
                 return final_result
             except Exception as return_error:
-                print(f"❌ Error creating final result: {return_error}")
-                print(f"🔍 payment_result: {payment_result}")
-                print(f"🔍 notification_result: {notification_result}")
+                logger.error("❌ Error creating final result: %s", return_error)
+                logger.warning("🔍 payment_result: %s", payment_result)
+                logger.warning("🔍 notification_result: %s", notification_result)
                 raise return_error
                 
         except Exception as e:
-            print(f"❌ Simplified cross-chain purchase error: {e}")
+            logger.error("❌ Simplified cross-chain purchase error: %s", e)
             return {"success": False, "error": str(e), "step": "general_error"}
 
     async def _verify_product_authenticity_for_purchase(self, product: Dict[str, Any], buyer_address: str) -> Dict[str, Any]:
@@ -422,7 +428,7 @@ class CrossChainPurchaseService:
             if not product.get("qr_hash"):
                 return {"is_authentic": False, "reason": "No QR verification hash"}
                 
-            print(f"🔍 Authenticity verification passed for product {product.get('token_id')}")
+            logger.debug("🔍 Authenticity verification passed for product %s", product.get('token_id'))
             return {"is_authentic": True, "reason": "Product verified via NFT metadata and IPFS"}
             
         except Exception as e:
@@ -439,18 +445,18 @@ class CrossChainPurchaseService:
             purchase_id = f"PURCHASE-{product_id}-{int(time.time())}"
             escrow_id = f"ESCROW-{purchase_id}"
             
-            print(f"💰 NEW: Buyer Purchase Process with ETH Deposit → cfWETH Minting")
-            print(f"   🔐 Purchase ID: {purchase_id}")
-            print(f"   💸 Amount: {amount} ETH")
-            print(f"   🔗 Flow: ETH → wrapperETH → cfWETH minting")
+            logger.debug("💰 NEW: Buyer Purchase Process with ETH Deposit → cfWETH Minting")
+            logger.debug("   🔐 Purchase ID: %s", purchase_id)
+            logger.debug("   💸 Amount: %s ETH", amount)
+            logger.debug("   🔗 Flow: ETH → wrapperETH → cfWETH minting")
             
             # Step 1: Initialize LayerZero OFT Bridge Service for cfWETH operations
             from app.services.layerzero_oft_bridge_service import layerzero_oft_bridge_service
-            await layerzero_oft_bridge_service.initialize()
+            await service_registry.initialize("layerzero_oft_bridge")
             
             # Step 2: Always deposit full ETH amount into wrapperETH contract and mint cfWETH for buyer
-            print(f"💰 Step 1-2: ALWAYS Depositing {amount} ETH → Minting cfWETH for buyer...")
-            print(f"🏦 LIQUIDITY POOL MODEL: Full ETH deposit required for every transaction")
+            logger.debug("💰 Step 1-2: ALWAYS Depositing %s ETH → Minting cfWETH for buyer...", amount)
+            logger.debug("🏦 LIQUIDITY POOL MODEL: Full ETH deposit required for every transaction")
             
             # Use the buyer's original chain (could be optimism_sepolia, base_sepolia, etc.)
             # For this implementation, we'll use optimism_sepolia as the buyer chain
@@ -463,17 +469,17 @@ class CrossChainPurchaseService:
             )
             
             if not deposit_result["success"]:
-                print(f"❌ ETH deposit failed: {deposit_result['error']}")
+                logger.warning("❌ ETH deposit failed: %s", deposit_result['error'])
                 return {
                     "success": False,
                     "error": f"ETH deposit failed: {deposit_result['error']}",
                     "step": "eth_deposit"
                 }
             
-            print(f"✅ ETH deposited successfully")
-            print(f"   💳 cfWETH minted: {deposit_result['cfweth_received']} cfWETH")
-            print(f"   🔗 Deposit TX: {deposit_result['deposit_transaction_hash']}")
-            print(f"   🔗 Mint TX: {deposit_result['mint_transaction_hash']}")
+            logger.info("✅ ETH deposited successfully")
+            logger.debug("   💳 cfWETH minted: %s cfWETH", deposit_result['cfweth_received'])
+            logger.debug("   🔗 Deposit TX: %s", deposit_result['deposit_transaction_hash'])
+            logger.debug("   🔗 Mint TX: %s", deposit_result['mint_transaction_hash'])
             
             # Step 3: Create purchase record (NOT escrow - buyer has paid)
             purchase_record = {
@@ -497,7 +503,7 @@ class CrossChainPurchaseService:
             
             await self.database.purchases.insert_one(purchase_record)
             
-            print(f"✅ Purchase record created - Status: paid_waiting_shipping")
+            logger.info("✅ Purchase record created - Status: paid_waiting_shipping")
             
             return {
                 "success": True,
@@ -513,7 +519,7 @@ class CrossChainPurchaseService:
             }
                 
         except Exception as e:
-            print(f"❌ Payment processing error: {e}")
+            logger.error("❌ Payment processing error: %s", e)
             return {"success": False, "error": str(e)}
 
     async def _execute_cross_chain_nft_transfer(self, product: Dict[str, Any], from_owner: str, to_owner: str, escrow_id: str) -> Dict[str, Any]:
@@ -525,27 +531,28 @@ class CrossChainPurchaseService:
         try:
             token_id = product["token_id"]
             
-            print(f"🔄 Cross-chain NFT transfer initiated with tokenURI preservation")
-            print(f"   🎯 Token ID: {token_id}")  
-            print(f"   📤 From: {from_owner}")
-            print(f"   📥 To: {to_owner}")
-            print(f"   🌉 Bridge: LayerZero with tokenURI preservation")
+            logger.debug("🔄 Cross-chain NFT transfer initiated with tokenURI preservation")
+            logger.debug("   🎯 Token ID: %s", token_id)  
+            logger.debug("   📤 From: %s", from_owner)
+            logger.debug("   📥 To: %s", to_owner)
+            logger.debug("   🌉 Bridge: LayerZero with tokenURI preservation")
             
-            # Import the NFT Bridge Service
+            # Import the NFT Bridge Service (initialized on first use)
             from app.services.nft_bridge_service import nft_bridge_service
+            await service_registry.initialize("nft_bridge")
             
             # Determine source and destination chains
             # For the purchase flow: NFT should transfer from manufacturer chain to buyer chain
             source_chain = product.get("manufacturer_chain", "base_sepolia")  # Manufacturer chain
             destination_chain = product.get("buyer_chain", "optimism_sepolia")  # Buyer chain
             
-            print(f"   🔗 Source Chain: {source_chain}")
-            print(f"   🔗 Destination Chain: {destination_chain}")
-            print(f"   🏭 Manufacturer Address: {from_owner}")
-            print(f"   🛒 Buyer Address: {to_owner}")
+            logger.debug("   🔗 Source Chain: %s", source_chain)
+            logger.debug("   🔗 Destination Chain: %s", destination_chain)
+            logger.debug("   🏭 Manufacturer Address: %s", from_owner)
+            logger.debug("   🛒 Buyer Address: %s", to_owner)
             
             # Execute cross-chain NFT transfer with tokenURI preservation
-            print(f"� Executing cross-chain NFT transfer with tokenURI preservation...")
+            logger.debug("� Executing cross-chain NFT transfer with tokenURI preservation...")
             transfer_result = await nft_bridge_service.transfer_nft_cross_chain(
                 token_id=token_id,
                 from_chain=source_chain,
@@ -556,10 +563,10 @@ class CrossChainPurchaseService:
             )
             
             if transfer_result.get("success"):
-                print(f"✅ Cross-chain NFT transfer successful!")
-                print(f"   🔥 Burn TX: {transfer_result.get('burn_transaction', {}).get('transaction_hash')}")
-                print(f"   📡 Message TX: {transfer_result.get('message_transaction', {}).get('transaction_hash')}")
-                print(f"   ⏱️ Estimated completion: {transfer_result.get('estimated_completion')}")
+                logger.info("✅ Cross-chain NFT transfer successful!")
+                logger.debug("   🔥 Burn TX: %s", transfer_result.get('burn_transaction', {}).get('transaction_hash'))
+                logger.debug("   📡 Message TX: %s", transfer_result.get('message_transaction', {}).get('transaction_hash'))
+                logger.debug("   ⏱️ Estimated completion: %s", transfer_result.get('estimated_completion'))
                 
                 # Create detailed NFT transfer record
                 nft_transfer_record = {
@@ -581,10 +588,10 @@ class CrossChainPurchaseService:
                 
                 await self.database.nft_transfers.insert_one(nft_transfer_record)
                 
-                print(f"✅ NFT transfer completed with tokenURI preservation")
-                print(f"   � Burn TX: {transfer_result.get('burn_transaction', {}).get('transaction_hash')}")
-                print(f"   � Message TX: {transfer_result.get('message_transaction', {}).get('transaction_hash')}")
-                print(f"   🎨 TokenURI preserved: ✅")
+                logger.info("✅ NFT transfer completed with tokenURI preservation")
+                logger.debug("   � Burn TX: %s", transfer_result.get('burn_transaction', {}).get('transaction_hash'))
+                logger.debug("   � Message TX: %s", transfer_result.get('message_transaction', {}).get('transaction_hash'))
+                logger.debug("   🎨 TokenURI preserved: ✅")
                 
                 return {
                     "success": True,
@@ -597,14 +604,14 @@ class CrossChainPurchaseService:
                     "layer_zero_transfer": True
                 }
             else:
-                print(f"❌ Cross-chain NFT transfer failed: {transfer_result.get('error')}")
+                logger.warning("❌ Cross-chain NFT transfer failed: %s", transfer_result.get('error'))
                 return {
                     "success": False, 
                     "error": f"NFT Bridge Transfer Failed: {transfer_result.get('error')}"
                 }
                 
         except Exception as e:
-            print(f"❌ NFT Transfer Error: {e}")
+            logger.error("❌ NFT Transfer Error: %s", e)
             return {"success": False, "error": str(e)}
 
     async def _process_payment_refund(self, escrow_id: str, buyer_address: str) -> Dict[str, Any]:
@@ -616,11 +623,11 @@ class CrossChainPurchaseService:
                 {"$set": {"status": "refunded", "refund_timestamp": time.time()}}
             )
             
-            print(f"💸 Payment refund processed for escrow {escrow_id}")
+            logger.debug("💸 Payment refund processed for escrow %s", escrow_id)
             return {"success": True, "refund_processed": True}
             
         except Exception as e:
-            print(f"❌ Refund processing error: {e}")
+            logger.error("❌ Refund processing error: %s", e)
             return {"success": False, "error": str(e)}
 
     async def process_delivery_confirmation_and_payment_release(self, delivery_data: Dict[str, Any]) -> Dict[str, Any]:
@@ -633,10 +640,10 @@ class CrossChainPurchaseService:
             transporter_address = delivery_data.get("transporter", "")
             delivery_status = delivery_data.get("delivery_status", "delivered")
             
-            print(f"📦 Algorithm 1: Processing delivery confirmation and payment release")
-            print(f"   📋 Purchase ID: {purchase_id}")
-            print(f"   🚛 Transporter: {transporter_address}")
-            print(f"   ✅ Status: {delivery_status}")
+            logger.debug("📦 Algorithm 1: Processing delivery confirmation and payment release")
+            logger.debug("   📋 Purchase ID: %s", purchase_id)
+            logger.debug("   🚛 Transporter: %s", transporter_address)
+            logger.info("   ✅ Status: %s", delivery_status)
             
             # Get escrow record
             escrow = await self.database.escrows.find_one({"purchase_id": purchase_id})
@@ -647,7 +654,7 @@ class CrossChainPurchaseService:
             
             # Step 5: If delivery status meets incentive criteria then
             if delivery_status == "delivered":
-                print(f"📋 Step 5: Delivery confirmed - processing incentive mechanism")
+                logger.debug("📋 Step 5: Delivery confirmed - processing incentive mechanism")
                 
                 # Step 6: Award incentive to transporter
                 # Step 7: Return "Incentive Awarded"
@@ -665,7 +672,7 @@ class CrossChainPurchaseService:
                     }
                     
                     await self.database.incentives.insert_one(incentive_record)
-                    print(f"🎁 Step 6-7: Incentive awarded to transporter: {incentive_amount} ETH")
+                    logger.debug("🎁 Step 6-7: Incentive awarded to transporter: %s ETH", incentive_amount)
                 
                 # Step 9: Release payment to seller
                 # Step 11: Return "Payment Successful"
@@ -679,7 +686,7 @@ class CrossChainPurchaseService:
                     }}
                 )
                 
-                print(f"💰 Step 9 & 11: Payment released to seller - Payment Successful")
+                logger.debug("💰 Step 9 & 11: Payment released to seller - Payment Successful")
                 
                 return {
                     "success": True,
@@ -691,7 +698,7 @@ class CrossChainPurchaseService:
             else:
                 # Step 8: else - No incentive (delivery issues)
                 # Step 12: else - Payment failed
-                print(f"❌ Step 8 & 12: Delivery issues detected - No Incentive Awarded")
+                logger.warning("❌ Step 8 & 12: Delivery issues detected - No Incentive Awarded")
                 
                 await self.database.escrows.update_one(
                     {"escrow_id": escrow["escrow_id"]},
@@ -710,7 +717,7 @@ class CrossChainPurchaseService:
                 }
                 
         except Exception as e:
-            print(f"❌ Delivery confirmation error: {e}")
+            logger.error("❌ Delivery confirmation error: %s", e)
             return {"success": False, "error": str(e)}
 
     async def get_purchase_status(self, purchase_id: str) -> Dict[str, Any]:
@@ -742,7 +749,7 @@ class CrossChainPurchaseService:
         NO COMPLEX BRIDGING - Just notifications
         """
         try:
-            print(f"📡 Sending simplified cross-chain notifications...")
+            logger.debug("📡 Sending simplified cross-chain notifications...")
             
             # Create notification data
             notification_data = {
@@ -758,7 +765,7 @@ class CrossChainPurchaseService:
             }
             
             # Send to Hub (Polygon Amoy) - Simple notification
-            print(f"📡 Notifying Hub admin (Polygon Amoy)...")
+            logger.debug("📡 Notifying Hub admin (Polygon Amoy)...")
             hub_notification = {
                 **notification_data,
                 "target": "hub_admin",
@@ -767,7 +774,7 @@ class CrossChainPurchaseService:
             await self.database.notifications.insert_one(hub_notification)
             
             # Send to Manufacturer (Base Sepolia) - Delivery request
-            print(f"📡 Notifying Manufacturer (Base Sepolia)...")
+            logger.debug("📡 Notifying Manufacturer (Base Sepolia)...")
             manufacturer_notification = {
                 **notification_data,
                 "target": "manufacturer",
@@ -776,7 +783,7 @@ class CrossChainPurchaseService:
             }
             await self.database.notifications.insert_one(manufacturer_notification)
             
-            print(f"✅ Cross-chain notifications sent successfully")
+            logger.info("✅ Cross-chain notifications sent successfully")
             return {
                 "success": True,
                 "notification_tx": f"0xNOTIFY{int(time.time())}",
@@ -785,7 +792,7 @@ class CrossChainPurchaseService:
             }
             
         except Exception as e:
-            print(f"❌ Notification error: {e}")
+            logger.error("❌ Notification error: %s", e)
             return {
                 "success": False,
                 "error": str(e),
@@ -806,7 +813,7 @@ class CrossChainPurchaseService:
         5. Notify buyer of shipment
         """
         try:
-            print(f"🚚 DELIVERY WORKFLOW: Starting delivery for order {order_id}")
+            logger.debug("🚚 DELIVERY WORKFLOW: Starting delivery for order %s", order_id)
             
             # Step 1: Find the order in delivery queue
             order = await self.database.delivery_queue.find_one({"order_id": order_id})
@@ -824,7 +831,7 @@ class CrossChainPurchaseService:
             buyer = order["buyer"]
             escrow_id = order["escrow_id"]
             
-            print(f"✅ Manufacturer {manufacturer_address} authorized to ship order {order_id}")
+            logger.info("✅ Manufacturer %s authorized to ship order %s", manufacturer_address, order_id)
             
             # Step 3: Get product details
             product = await self.database.products.find_one({"token_id": product_id})
@@ -834,19 +841,19 @@ class CrossChainPurchaseService:
             current_owner = product.get("current_owner", manufacturer_address)
             
             # Step 4: Execute cross-chain NFT transfer (NOW in delivery workflow)
-            print(f"🔄 Step 4: Cross-chain NFT ownership transfer...")
+            logger.debug("🔄 Step 4: Cross-chain NFT ownership transfer...")
             transfer_result = await self._execute_cross_chain_nft_transfer(
                 product, current_owner, buyer, escrow_id
             )
             
             if not transfer_result["success"]:
-                print(f"❌ NFT transfer failed - {transfer_result['error']}")
+                logger.warning("❌ NFT transfer failed - %s", transfer_result['error'])
                 return {"success": False, "error": f"NFT Transfer Failed: {transfer_result['error']}", "step": "nft_transfer"}
             
-            print(f"✅ NFT ownership transferred successfully")
+            logger.info("✅ NFT ownership transferred successfully")
             
             # Step 5: Send delivery request to Hub admin via LayerZero
-            print(f"� Step 5: Sending delivery request to Hub admin...")
+            logger.debug("� Step 5: Sending delivery request to Hub admin...")
             delivery_request = await self._send_delivery_request_to_admin(
                 order_id=order_id,
                 product_id=product_id,
@@ -858,10 +865,10 @@ class CrossChainPurchaseService:
             )
             
             if not delivery_request["success"]:
-                print(f"❌ Failed to send delivery request to admin")
+                logger.warning("❌ Failed to send delivery request to admin")
                 return {"success": False, "error": f"Failed to notify admin: {delivery_request['error']}", "step": "admin_notification"}
             
-            print(f"✅ Delivery request sent to admin successfully")
+            logger.info("✅ Delivery request sent to admin successfully")
 
             # Step 6: Update delivery queue status to "pending_transporter_assignment"
             await self.database.delivery_queue.update_one(
@@ -912,7 +919,7 @@ class CrossChainPurchaseService:
             }
             await self.database.notifications.insert_one(manufacturer_notification)
 
-            print(f"🎉 DELIVERY REQUEST SENT: Order {order_id} awaiting transporter assignment")
+            logger.info("🎉 DELIVERY REQUEST SENT: Order %s awaiting transporter assignment", order_id)
 
             return {
                 "success": True,
@@ -932,7 +939,7 @@ class CrossChainPurchaseService:
             }
             
         except Exception as e:
-            print(f"❌ Delivery initiation error: {e}")
+            logger.error("❌ Delivery initiation error: %s", e)
             return {"success": False, "error": str(e), "step": "delivery_initiation"}
 
     async def get_manufacturer_delivery_queue(self, manufacturer_address: str) -> Dict[str, Any]:
@@ -993,18 +1000,14 @@ class CrossChainPurchaseService:
             
             # Verify that we have the original product keys
             if not aes_key or not hmac_key:
-                print(f"❌ No existing encryption keys found for product {product.get('token_id')}")
-                print(f"🔍 Product encryption_keys field: {product_encryption_keys}")
-                print(f"🔍 Product aes_key field: {product.get('aes_key')}")
-                print(f"🔍 Product hmac_key field: {product.get('hmac_key')}")
+                logger.warning("❌ No existing encryption keys found for product %s", product.get('token_id'))
+                logger.debug("🔍 Product encryption_keys fields: %s", sorted(product_encryption_keys or {}))
                 return {
                     "success": False,
                     "error": "No encryption keys found for this product. Keys should have been created during product minting."
                 }
             
-            print(f"🔑 Using EXISTING encryption keys for product {product.get('token_id')} (created during minting)")
-            print(f"   📧 AES Key: {aes_key[:32]}...")
-            print(f"   📧 HMAC Key: {hmac_key[:32]}...")
+            logger.debug("🔑 Using EXISTING encryption keys for product %s (created during minting)", product.get('token_id'))
             
             # Create key transfer record
             key_transfer = {
@@ -1041,8 +1044,8 @@ class CrossChainPurchaseService:
                 upsert=True
             )
             
-            print(f"🔑 ORIGINAL keys sent to buyer {buyer_address} for purchase {purchase_id}")
-            print(f"   ✅ Keys are the same ones created during product minting")
+            logger.debug("🔑 ORIGINAL keys sent to buyer %s for purchase %s", buyer_address, purchase_id)
+            logger.info("   ✅ Keys are the same ones created during product minting")
             
             return {
                 "success": True,
@@ -1054,7 +1057,7 @@ class CrossChainPurchaseService:
             }
             
         except Exception as e:
-            print(f"❌ Error sending keys to buyer: {str(e)}")
+            logger.error("❌ Error sending keys to buyer: %s", str(e))
             return {
                 "success": False,
                 "error": f"Failed to send original encryption keys: {str(e)}"
@@ -1087,7 +1090,7 @@ class CrossChainPurchaseService:
         Send delivery request to Hub admin via LayerZero cross-chain message
         """
         try:
-            print(f"📡 Sending delivery request to Hub admin...")
+            logger.debug("📡 Sending delivery request to Hub admin...")
             
             # Admin account on Polygon Amoy Hub
             admin_address = "0x032041b4b356fEE1496805DD4749f181bC736FFA"
@@ -1119,15 +1122,15 @@ class CrossChainPurchaseService:
                 # Import chainflip messaging service
                 from app.services.chainflip_messaging_service import chainflip_messaging_service
                 
-                print(f"📡 Sending LayerZero delivery request via ChainFLIP messaging...")
-                print(f"   🏭 From: base_sepolia (Manufacturer chain)")
-                print(f"   🎯 To: polygon_amoy (Hub chain - Admin)")
-                print(f"   👨‍💼 Admin: {admin_address}")
-                print(f"   📦 Order: {order_id}")
-                print(f"   🛍️ Product: {product_id}")
-                print(f"   👤 Buyer: {buyer}")
-                print(f"   📏 Distance: {estimated_distance} miles")
-                print(f"   🚚 Required transporters: {required_transporters}")
+                logger.debug("📡 Sending LayerZero delivery request via ChainFLIP messaging...")
+                logger.debug("   🏭 From: base_sepolia (Manufacturer chain)")
+                logger.debug("   🎯 To: polygon_amoy (Hub chain - Admin)")
+                logger.debug("   👨‍💼 Admin: %s", admin_address)
+                logger.debug("   📦 Order: %s", order_id)
+                logger.debug("   🛍️ Product: %s", product_id)
+                logger.debug("   👤 Buyer: %s", buyer)
+                logger.debug("   📏 Distance: %s miles", estimated_distance)
+                logger.debug("   🚚 Required transporters: %s", required_transporters)
                 
                 # Use the existing send_delivery_request_to_admin method
                 message_result = await chainflip_messaging_service.send_delivery_request_to_admin(
@@ -1141,11 +1144,11 @@ class CrossChainPurchaseService:
                 
                 if message_result and isinstance(message_result, dict):
                     if message_result.get("success"):
-                        print(f"✅ LayerZero delivery request sent successfully!")
-                        print(f"   📡 Transaction: {message_result.get('transaction_hash')}")
-                        print(f"   📊 Block: {message_result.get('block_number')}")
-                        print(f"   ⛽ Gas used: {message_result.get('gas_used')}")
-                        print(f"   💰 LayerZero fee: {message_result.get('layerzero_fee_paid')} ETH")
+                        logger.info("✅ LayerZero delivery request sent successfully!")
+                        logger.debug("   📡 Transaction: %s", message_result.get('transaction_hash'))
+                        logger.debug("   📊 Block: %s", message_result.get('block_number'))
+                        logger.debug("   ⛽ Gas used: %s", message_result.get('gas_used'))
+                        logger.debug("   💰 LayerZero fee: %s ETH", message_result.get('layerzero_fee_paid'))
                         
                         # Store delivery request record in database
                         delivery_request_record = {
@@ -1169,7 +1172,7 @@ class CrossChainPurchaseService:
                         }
                         
                         await self.database.delivery_requests.insert_one(delivery_request_record)
-                        print(f"💾 Delivery request record saved to database")
+                        logger.debug("💾 Delivery request record saved to database")
                         
                         return {
                             "success": True,
@@ -1183,21 +1186,21 @@ class CrossChainPurchaseService:
                             "message_type": "layerzero_chainflip"
                         }
                     else:
-                        print(f"❌ LayerZero message failed: {message_result.get('error')}")
+                        logger.warning("❌ LayerZero message failed: %s", message_result.get('error'))
                         
             except Exception as layerzero_error:
-                print(f"❌ LayerZero messaging error: {layerzero_error}")
+                logger.error("❌ LayerZero messaging error: %s", layerzero_error)
                 import traceback
-                print(f"🔍 Full traceback: {traceback.format_exc()}")
+                logger.warning("🔍 Full traceback: %s", traceback.format_exc())
             
             # Fallback: Create simulated transaction for demo
             simulated_tx = f"0xDELIVERY_REQ_{int(time.time())}_{order_id[:8]}"
             
-            print(f"📡 Simulated delivery request sent to admin {admin_address}")
-            print(f"   Order: {order_id}")
-            print(f"   Distance: {estimated_distance} miles")
-            print(f"   Required transporters: {required_transporters}")
-            print(f"   Simulated TX: {simulated_tx}")
+            logger.debug("📡 Simulated delivery request sent to admin %s", admin_address)
+            logger.debug("   Order: %s", order_id)
+            logger.debug("   Distance: %s miles", estimated_distance)
+            logger.debug("   Required transporters: %s", required_transporters)
+            logger.debug("   Simulated TX: %s", simulated_tx)
             
             return {
                 "success": True,
@@ -1208,7 +1211,7 @@ class CrossChainPurchaseService:
             }
             
         except Exception as e:
-            print(f"❌ Error sending delivery request to admin: {e}")
+            logger.error("❌ Error sending delivery request to admin: %s", e)
             return {"success": False, "error": str(e)}
     
     async def execute_final_delivery_step(self, delivery_completion_request: Dict[str, Any]) -> Dict[str, Any]:
@@ -1223,7 +1226,7 @@ class CrossChainPurchaseService:
             Dictionary with escrow release and NFT transfer results
         """
         try:
-            print(f"🏁 Executing final delivery step...")
+            logger.debug("🏁 Executing final delivery step...")
             
             order_id = delivery_completion_request.get("order_id")
             product_id = delivery_completion_request.get("product_id")
@@ -1232,12 +1235,12 @@ class CrossChainPurchaseService:
             escrow_id = delivery_completion_request.get("escrow_id")
             buyer_satisfaction = delivery_completion_request.get("buyer_satisfaction", True)
             
-            print(f"   📦 Order ID: {order_id}")
-            print(f"   🎯 Product ID: {product_id}")
-            print(f"   👤 Buyer: {buyer_address}")
-            print(f"   🏭 Manufacturer: {manufacturer_address}")
-            print(f"   💰 Escrow ID: {escrow_id}")
-            print(f"   😊 Buyer Satisfied: {buyer_satisfaction}")
+            logger.debug("   📦 Order ID: %s", order_id)
+            logger.debug("   🎯 Product ID: %s", product_id)
+            logger.debug("   👤 Buyer: %s", buyer_address)
+            logger.debug("   🏭 Manufacturer: %s", manufacturer_address)
+            logger.debug("   💰 Escrow ID: %s", escrow_id)
+            logger.debug("   😊 Buyer Satisfied: %s", buyer_satisfaction)
             
             result = {
                 "success": False,
@@ -1247,7 +1250,7 @@ class CrossChainPurchaseService:
             }
             
             if not buyer_satisfaction:
-                print("⚠️ Buyer not satisfied - skipping final delivery steps")
+                logger.warning("⚠️ Buyer not satisfied - skipping final delivery steps")
                 return {
                     "success": False,
                     "error": "Buyer not satisfied with delivery",
@@ -1256,7 +1259,7 @@ class CrossChainPurchaseService:
                 }
             
             # Step 1: Release escrow to manufacturer
-            print(f"💰 Step 1: Releasing escrow to manufacturer...")
+            logger.debug("💰 Step 1: Releasing escrow to manufacturer...")
             escrow_release_result = await self._release_escrow_to_manufacturer(
                 escrow_id, manufacturer_address, buyer_address
             )
@@ -1266,7 +1269,7 @@ class CrossChainPurchaseService:
                 result["transaction_hashes"]["escrow_release"] = escrow_release_result["transaction_hash"]
             
             # Step 2: Transfer NFT to buyer with tokenURI preservation
-            print(f"🎨 Step 2: Transferring NFT to buyer with tokenURI preservation...")
+            logger.debug("🎨 Step 2: Transferring NFT to buyer with tokenURI preservation...")
             
             # Get product details for NFT transfer
             product_details = await self.database.products.find_one({
@@ -1277,7 +1280,7 @@ class CrossChainPurchaseService:
             })
             
             if not product_details:
-                print(f"⚠️ Product details not found, creating minimal product info for NFT transfer")
+                logger.warning("⚠️ Product details not found, creating minimal product info for NFT transfer")
                 product_details = {
                     "token_id": product_id,
                     "product_id": product_id,
@@ -1305,14 +1308,14 @@ class CrossChainPurchaseService:
             result["success"] = escrow_success and nft_success
             
             if result["success"]:
-                print(f"✅ Final delivery step completed successfully!")
-                print(f"   💰 Escrow released: {escrow_success}")
-                print(f"   🎨 NFT transferred: {nft_success}")
-                print(f"   🔗 TokenURI preserved: ✅")
+                logger.info("✅ Final delivery step completed successfully!")
+                logger.debug("   💰 Escrow released: %s", escrow_success)
+                logger.debug("   🎨 NFT transferred: %s", nft_success)
+                logger.debug("   🔗 TokenURI preserved: ✅")
             else:
-                print(f"⚠️ Final delivery step partially completed:")
-                print(f"   💰 Escrow released: {escrow_success}")
-                print(f"   🎨 NFT transferred: {nft_success}")
+                logger.warning("⚠️ Final delivery step partially completed:")
+                logger.debug("   💰 Escrow released: %s", escrow_success)
+                logger.debug("   🎨 NFT transferred: %s", nft_success)
                 
                 if not escrow_success and not nft_success:
                     result["error"] = "Both escrow release and NFT transfer failed"
@@ -1324,7 +1327,7 @@ class CrossChainPurchaseService:
             return result
             
         except Exception as e:
-            print(f"❌ Error in final delivery step: {e}")
+            logger.error("❌ Error in final delivery step: %s", e)
             return {
                 "success": False,
                 "error": str(e),
@@ -1337,7 +1340,7 @@ class CrossChainPurchaseService:
         Release escrow funds to manufacturer
         """
         try:
-            print(f"💰 Releasing escrow {escrow_id} to manufacturer {manufacturer_address}")
+            logger.debug("💰 Releasing escrow %s to manufacturer %s", escrow_id, manufacturer_address)
             
             # Find escrow record
             escrow = await self.database.escrows.find_one({"escrow_id": escrow_id})
@@ -1363,9 +1366,9 @@ class CrossChainPurchaseService:
                 }}
             )
             
-            print(f"✅ Escrow released successfully")
-            print(f"   💰 Amount: {escrow.get('amount_eth', '0.01')} ETH")
-            print(f"   🔗 TX: {simulated_tx_hash}")
+            logger.info("✅ Escrow released successfully")
+            logger.debug("   💰 Amount: %s ETH", escrow.get('amount_eth', '0.01'))
+            logger.debug("   🔗 TX: %s", simulated_tx_hash)
             
             return {
                 "success": True,
@@ -1376,8 +1379,8 @@ class CrossChainPurchaseService:
             }
             
         except Exception as e:
-            print(f"❌ Error releasing escrow: {e}")
+            logger.error("❌ Error releasing escrow: %s", e)
             return {"success": False, "error": str(e)}
 
 # Global service instance
-crosschain_purchase_service = CrossChainPurchaseService()
\ No newline at end of file
+crosschain_purchase_service = service_registry.register("crosschain_purchase", CrossChainPurchaseService())
\ No newline at end of file
@@ -20,6 +20,16 @@ from enum import Enum
 
 from motor.motor_asyncio import AsyncIOMotorDatabase
 
+from ..core.index_manifest import index_manifest
+from ..core.service_registry import service_registry
+
+index_manifest.register("dispute_resolution", "dispute_records", "dispute_id", unique=True)
+index_manifest.register("dispute_resolution", "dispute_records", [("status", 1), ("created_at", -1)])
+index_manifest.register("dispute_resolution", "arbitrator_candidates", "arbitrator_id", unique=True)
+index_manifest.register("dispute_resolution", "arbitrator_candidates", "address", unique=True)
+index_manifest.register("dispute_resolution", "stakeholder_registry", "address", unique=True)
+index_manifest.register("dispute_resolution", "arbitrator_votes", [("dispute_id", 1), ("stakeholder_id", 1)], unique=True)
+
 
 class DisputeStatus(Enum):
     INITIATED = "initiated"
@@ -166,27 +176,7 @@ class DisputeResolutionService:
     
     async def _ensure_collections(self):
         """Ensure required database collections exist"""
-        collections = [
-            "dispute_records",
-            "arbitrator_candidates", 
-            "stakeholder_registry",
-            "arbitrator_votes",
-            "dispute_evidence",
-            "resolution_outcomes"
-        ]
-        
-        for collection in collections:
-            # Create indexes
-            if collection == "dispute_records":
-                await self.database[collection].create_index([("dispute_id", 1)], unique=True)
-                await self.database[collection].create_index([("status", 1), ("created_at", -1)])
-            elif collection == "arbitrator_candidates":
-                await self.database[collection].create_index([("arbitrator_id", 1)], unique=True)
-                await self.database[collection].create_index([("address", 1)], unique=True)
-            elif collection == "stakeholder_registry":
-                await self.database[collection].create_index([("address", 1)], unique=True)
-            elif collection == "arbitrator_votes":
-                await self.database[collection].create_index([("dispute_id", 1), ("stakeholder_id", 1)], unique=True)
+        await index_manifest.apply(self.database, owners=["dispute_resolution"])
     
     async def _initialize_arbitrator_registry(self):
         """Initialize arbitrator candidate registry"""
@@ -977,4 +967,4 @@ class DisputeResolutionService:
         )
 
 # Global service instance
-dispute_resolution_service = DisputeResolutionService()
\ No newline at end of file
+dispute_resolution_service = service_registry.register("dispute_resolution", DisputeResolutionService())
\ No newline at end of file
@@ -8,21 +8,94 @@ import json
 import hmac
 import hashlib
 import secrets
-from typing import Dict, Any, Tuple, Optional
+from typing import Dict, Any, List, Tuple, Optional, Union
 from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
 from cryptography.hazmat.backends import default_backend
 import base64
+import threading
 import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+from app.core.config import get_settings
+from app.core.log import get_logger
+
+settings = get_settings()
+logger = get_logger(__name__)
+
+
+class QRKeyContext:
+    """
+    Immutable, prepared key material for one key set (session or product)
+    
+    Holds the AES algorithm object and a keyed HMAC template; every encrypt /
+    decrypt builds its own cipher and HMAC copy from them, so one context can be
+    used from any number of threads at once.
+    """
+    
+    __slots__ = ("session_id", "aes_key_hex", "hmac_key_hex", "_aes", "_hmac")
+    
+    def __init__(self, aes_key: bytes, hmac_key: bytes, session_id: Optional[str] = None):
+        self.session_id = session_id
+        self.aes_key_hex = aes_key.hex()
+        self.hmac_key_hex = hmac_key.hex()
+        self._aes = algorithms.AES(aes_key)
+        self._hmac = hmac.new(hmac_key, digestmod=hashlib.sha256)
+    
+    @classmethod
+    def from_keys(cls, keys: Dict[str, str]) -> "QRKeyContext":
+        return cls(bytes.fromhex(keys["aes_key"]), bytes.fromhex(keys["hmac_key"]), keys.get("session_id"))
+    
+    def matches(self, keys: Dict[str, str]) -> bool:
+        return self.aes_key_hex == keys["aes_key"] and self.hmac_key_hex == keys["hmac_key"]
+    
+    def sign(self, data: bytes) -> bytes:
+        signature = self._hmac.copy()
+        signature.update(data)
+        return signature.digest()
+    
+    def cipher(self, iv: bytes) -> Cipher:
+        return Cipher(self._aes, modes.CBC(iv), backend=default_backend())
+
+
+class QRKeyCache:
+    """Thread-safe LRU of prepared key contexts, keyed by session_id"""
+    
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._contexts: "OrderedDict[str, QRKeyContext]" = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get(self, keys: Dict[str, str]) -> QRKeyContext:
+        session_id = keys.get("session_id")
+        if not session_id:
+            return QRKeyContext.from_keys(keys)
+        with self._lock:
+            context = self._contexts.get(session_id)
+            # Re-minting a product reuses its session_id with new keys, so compare the material too
+            if context is not None and context.matches(keys):
+                self._contexts.move_to_end(session_id)
+                return context
+        context = QRKeyContext.from_keys(keys)
+        with self._lock:
+            self._contexts[session_id] = context
+            self._contexts.move_to_end(session_id)
+            while len(self._contexts) > self.max_entries:
+                self._contexts.popitem(last=False)
+        return context
+    
+    def __len__(self) -> int:
+        return len(self._contexts)
 
 class EncryptionService:
     def __init__(self):
-        print("🔑 Initializing Enhanced Encryption Service with Product-Specific Keys...")
+        logger.debug("🔑 Initializing Enhanced Encryption Service with Product-Specific Keys...")
         
         # Generate default session keys (used as fallback)
         self.session_aes_key = secrets.token_bytes(32)
         self.session_hmac_key = secrets.token_bytes(32)
         
-        # Current active keys (used for fallback)
+        # Keys used when no product keys are given; never changed after startup
         self.aes_key = self.session_aes_key
         self.hmac_key = self.session_hmac_key
         
@@ -33,16 +106,24 @@ class EncryptionService:
             "generated_at": int(time.time()),
             "session_id": secrets.token_hex(16)
         }
+        self.session_context = QRKeyContext(self.session_aes_key, self.session_hmac_key, self.session_keys["session_id"])
+        
+        # Prepared product key contexts, and a pool for fanning batch crypto out
+        self.key_cache = QRKeyCache(settings.qr_key_cache_size)
+        self._executor = ThreadPoolExecutor(max_workers=settings.qr_crypto_workers, thread_name_prefix="qr-crypto")
         
-        print(f"✅ Fresh session keys generated:")
-        print(f"   Session ID: {self.session_keys['session_id']}")
-        print(f"   AES Key: {self.session_keys['aes_key'][:32]}...")
-        print(f"   HMAC Key: {self.session_keys['hmac_key'][:32]}...")
+        logger.info("✅ Fresh session keys generated:")
+        logger.debug("   Session ID: %s", self.session_keys['session_id'])
         
-        # Update .env file with current session keys (for reference)
-        self._update_env_file('QR_AES_KEY', self.session_keys['aes_key'])
-        self._update_env_file('QR_HMAC_KEY', self.session_keys['hmac_key'])
-        self._update_env_file('SESSION_ID', self.session_keys['session_id'])
+        # Expose the session keys to this process; writing them back to .env is opt-in
+        # because every worker would otherwise rewrite the file while importing this module
+        os.environ['QR_AES_KEY'] = self.session_keys['aes_key']
+        os.environ['QR_HMAC_KEY'] = self.session_keys['hmac_key']
+        os.environ['SESSION_ID'] = self.session_keys['session_id']
+        if settings.qr_write_session_keys_to_env:
+            self._update_env_file('QR_AES_KEY', self.session_keys['aes_key'])
+            self._update_env_file('QR_HMAC_KEY', self.session_keys['hmac_key'])
+            self._update_env_file('SESSION_ID', self.session_keys['session_id'])
         
     def generate_product_specific_keys(self, product_id: str, manufacturer: str) -> Dict[str, str]:
         """
@@ -50,7 +131,7 @@ class EncryptionService:
         This ensures each product has its own encryption keys for QR code security
         """
         try:
-            print(f"🔑 Generating product-specific encryption keys for Product ID: {product_id}")
+            logger.debug("🔑 Generating product-specific encryption keys for Product ID: %s", product_id)
             
             # Create a unique seed based on product data and timestamp
             seed_data = f"{product_id}-{manufacturer}-{int(time.time())}-{secrets.token_hex(16)}"
@@ -74,16 +155,14 @@ class EncryptionService:
                 "key_type": "product_specific"
             }
             
-            print(f"✅ Product-specific keys generated:")
-            print(f"   Product ID: {product_id}")
-            print(f"   Session ID: {product_session_id}")
-            print(f"   AES Key: {product_keys['aes_key'][:32]}...")
-            print(f"   HMAC Key: {product_keys['hmac_key'][:32]}...")
+            logger.info("✅ Product-specific keys generated:")
+            logger.debug("   Product ID: %s", product_id)
+            logger.debug("   Session ID: %s", product_session_id)
             
             return product_keys
             
         except Exception as e:
-            print(f"❌ Failed to generate product-specific keys: {e}")
+            logger.error("❌ Failed to generate product-specific keys: %s", e)
             raise Exception(f"Product key generation failed: {e}")
     
     def encrypt_qr_data_with_product_keys(self, data: Dict[str, Any], product_keys: Dict[str, str]) -> str:
@@ -91,30 +170,14 @@ class EncryptionService:
         Encrypt QR data using specific product keys
         """
         try:
-            # Temporarily set the product keys
-            original_aes = self.aes_key
-            original_hmac = self.hmac_key
+            logger.debug("🔐 Encrypting QR data with product-specific keys (Session: %s)", product_keys.get('session_id', 'unknown'))
             
-            # Set the product-specific keys
-            self.aes_key = bytes.fromhex(product_keys["aes_key"])
-            self.hmac_key = bytes.fromhex(product_keys["hmac_key"])
+            encrypted_payload = self.encrypt_qr_data(data, product_keys)
             
-            print(f"🔐 Encrypting QR data with product-specific keys (Session: {product_keys.get('session_id', 'unknown')})")
-            
-            # Encrypt the data
-            encrypted_payload = self.encrypt_qr_data(data)
-            
-            # Restore original keys
-            self.aes_key = original_aes
-            self.hmac_key = original_hmac
-            
-            print(f"✅ QR data encrypted successfully with product-specific keys")
+            logger.info("✅ QR data encrypted successfully with product-specific keys")
             return encrypted_payload
             
         except Exception as e:
-            # Restore original keys in case of error
-            self.aes_key = original_aes
-            self.hmac_key = original_hmac
             raise Exception(f"QR encryption with product keys failed: {e}")
     
     def create_product_qr_payload(self, token_id: str, metadata_cid: str, product_data: Dict[str, Any], product_keys: Dict[str, str]) -> Dict[str, Any]:
@@ -123,13 +186,13 @@ class EncryptionService:
         """
         
         # ✅ DEBUG: Log incoming product data
-        print(f"🔍 DEBUG Product QR Creation:")
-        print(f" Token ID: {token_id}")
-        print(f" Product Data Keys: {list(product_data.keys())}")
-        print(f" BatchNumber in data: {product_data.get('batchNumber', 'MISSING')}")
-        print(f" ProductType in data: {product_data.get('productType', 'MISSING')}")
-        print(f" Category in data: {product_data.get('category', 'MISSING')}")
-        print(f" ManufacturingDate in data: {product_data.get('manufacturingDate', 'MISSING')}")
+        logger.debug("🔍 DEBUG Product QR Creation:")
+        logger.debug(" Token ID: %s", token_id)
+        logger.debug(" Product Data Keys: %s", list(product_data.keys()))
+        logger.debug(" BatchNumber in data: %s", product_data.get('batchNumber', 'MISSING'))
+        logger.debug(" ProductType in data: %s", product_data.get('productType', 'MISSING'))
+        logger.debug(" Category in data: %s", product_data.get('category', 'MISSING'))
+        logger.debug(" ManufacturingDate in data: %s", product_data.get('manufacturingDate', 'MISSING'))
         
         qr_data = {
             # Core identification
@@ -167,27 +230,21 @@ class EncryptionService:
         }
         
         # ✅ DEBUG: Log final QR data
-        print(f"🔍 DEBUG Final Product QR Keys: {list(qr_data.keys())}")
-        print(f" BatchNumber in QR: {qr_data.get('batchNumber', 'MISSING')}")
-        print(f" ProductType in QR: {qr_data.get('productType', 'MISSING')}")
-        print(f" Category in QR: {qr_data.get('category', 'MISSING')}")
-        print(f" ManufacturingDate in QR: {qr_data.get('manufacturingDate', 'MISSING')}")
+        logger.debug("🔍 DEBUG Final Product QR Keys: %s", list(qr_data.keys()))
+        logger.debug(" BatchNumber in QR: %s", qr_data.get('batchNumber', 'MISSING'))
+        logger.debug(" ProductType in QR: %s", qr_data.get('productType', 'MISSING'))
+        logger.debug(" Category in QR: %s", qr_data.get('category', 'MISSING'))
+        logger.debug(" ManufacturingDate in QR: %s", qr_data.get('manufacturingDate', 'MISSING'))
         
         return qr_data
         """Get the current session keys for storing with new products"""
         return self.session_keys.copy()
     
-    def set_keys_for_verification(self, product_keys: Dict[str, str]):
-        """Set specific keys for verification of a specific product"""
-        self.aes_key = bytes.fromhex(product_keys["aes_key"])
-        self.hmac_key = bytes.fromhex(product_keys["hmac_key"])
-        print(f"🔑 Using stored keys from session: {product_keys.get('session_id', 'unknown')}")
-    
-    def reset_to_session_keys(self):
-        """Reset to current session keys"""
-        self.aes_key = self.session_aes_key
-        self.hmac_key = self.session_hmac_key
-        print(f"🔑 Reset to current session keys")
+    def key_context(self, keys: Optional[Dict[str, str]] = None) -> QRKeyContext:
+        """Prepared keys for a product (cached by session_id), or the session keys"""
+        if keys is None:
+            return self.session_context
+        return self.key_cache.get(keys)
     
     def get_current_session_keys(self):
         """Get the current session keys for storing with new products"""
@@ -217,7 +274,7 @@ class EncryptionService:
                 # Create .env file in the most likely location
                 env_file_path = possible_env_paths[0]
                 os.makedirs(os.path.dirname(env_file_path), exist_ok=True)
-                print(f"📝 Creating new .env file: {env_file_path}")
+                logger.debug("📝 Creating new .env file: %s", env_file_path)
             
             # Read current .env file
             env_lines = []
@@ -261,7 +318,7 @@ class EncryptionService:
             os.environ[key_name] = key_value
             
         except Exception as e:
-            print(f"⚠️ Failed to update .env file: {e}")
+            logger.warning("⚠️ Failed to update .env file: %s", e)
             # Clean up temp file if it exists
             try:
                 if 'temp_file_path' in locals() and os.path.exists(temp_file_path):
@@ -288,38 +345,44 @@ class EncryptionService:
         Decrypt QR data using keys stored with the product
         """
         try:
-            # Temporarily set the stored keys
-            original_aes = self.aes_key
-            original_hmac = self.hmac_key
-            
-            # Set the stored keys
-            self.aes_key = bytes.fromhex(stored_keys["aes_key"])
-            self.hmac_key = bytes.fromhex(stored_keys["hmac_key"])
-            
-            print(f"🔓 Decrypting with stored session keys (Session: {stored_keys.get('session_id', 'unknown')})")
+            logger.debug("🔓 Decrypting with stored session keys (Session: %s)", stored_keys.get('session_id', 'unknown'))
             
-            # Decrypt the data
-            decrypted_data = self.decrypt_qr_data(encrypted_payload)
+            decrypted_data = self.decrypt_qr_data(encrypted_payload, stored_keys)
             
-            # Restore original keys
-            self.aes_key = original_aes
-            self.hmac_key = original_hmac
-            
-            print(f"✅ QR data decrypted successfully with stored keys")
+            logger.info("✅ QR data decrypted successfully with stored keys")
             return decrypted_data
             
         except Exception as e:
-            # Restore original keys in case of error
-            self.aes_key = original_aes
-            self.hmac_key = original_hmac
             raise Exception(f"QR decryption with stored keys failed: {e}")
     
-    def encrypt_qr_data(self, data: Dict[str, Any]) -> str:
+    def decrypt_qr_data_many(
+        self,
+        items: List[Tuple[str, Optional[Dict[str, str]]]],
+    ) -> List[Union[Dict[str, Any], Exception]]:
+        """
+        Decrypt many (encrypted_payload, keys) pairs on the crypto thread pool
+        Results are in input order; a payload that fails yields its exception instead of raising.
+        """
+        def decrypt(item):
+            encrypted_payload, keys = item
+            try:
+                return self.decrypt_qr_data(encrypted_payload, keys)
+            except Exception as e:
+                return e
+        
+        if len(items) <= 1:
+            return [decrypt(item) for item in items]
+        return list(self._executor.map(decrypt, items))
+    
+    def encrypt_qr_data(self, data: Dict[str, Any], keys: Optional[Dict[str, str]] = None) -> str:
         """
         Encrypt QR data using AES-256-CBC + HMAC
+        keys: product keys ({"aes_key", "hmac_key", "session_id"} hex); session keys when omitted
         Returns: encrypted_payload (base64 encoded)
         """
         try:
+            context = self.key_context(keys)
+            
             # Convert data to JSON
             json_data = json.dumps(data, separators=(',', ':'))
             
@@ -332,17 +395,12 @@ class EncryptionService:
             padded_plaintext = plaintext_bytes + bytes([padding_length] * padding_length)
             
             # Encrypt using AES-256-CBC
-            cipher = Cipher(algorithms.AES(self.aes_key), modes.CBC(iv), backend=default_backend())
-            encryptor = cipher.encryptor()
+            encryptor = context.cipher(iv).encryptor()
             ciphertext = encryptor.update(padded_plaintext) + encryptor.finalize()
             
             # Create HMAC for integrity verification
             combined_data = iv + ciphertext
-            hmac_signature = hmac.new(
-                self.hmac_key,
-                combined_data,
-                hashlib.sha256
-            ).digest()
+            hmac_signature = context.sign(combined_data)
             
             # Combine IV + ciphertext + HMAC
             final_payload = iv + ciphertext + hmac_signature
@@ -355,9 +413,11 @@ class EncryptionService:
         except Exception as e:
             raise Exception(f"QR encryption failed: {e}")
     
-    def decrypt_qr_data(self, encrypted_payload: str) -> Dict[str, Any]:
-        """Decrypt and verify QR data"""
+    def decrypt_qr_data(self, encrypted_payload: str, keys: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
+        """Decrypt and verify QR data (with product keys, or the session keys when omitted)"""
         try:
+            context = self.key_context(keys)
+            
             # Decode from base64
             payload_bytes = base64.urlsafe_b64decode(encrypted_payload.encode('ascii'))
             
@@ -371,18 +431,13 @@ class EncryptionService:
             
             # Verify HMAC
             combined_data = iv + ciphertext
-            expected_hmac = hmac.new(
-                self.hmac_key,
-                combined_data,
-                hashlib.sha256
-            ).digest()
+            expected_hmac = context.sign(combined_data)
             
             if not hmac.compare_digest(expected_hmac, hmac_signature):
                 raise Exception("QR code integrity verification failed")
             
             # Decrypt using AES-256-CBC
-            cipher = Cipher(algorithms.AES(self.aes_key), modes.CBC(iv), backend=default_backend())
-            decryptor = cipher.decryptor()
+            decryptor = context.cipher(iv).decryptor()
             padded_plaintext = decryptor.update(ciphertext) + decryptor.finalize()
             
             # Remove PKCS7 padding
@@ -413,13 +468,13 @@ class EncryptionService:
         """
         
         # ✅ DEBUG: Log incoming product data
-        print(f"🔍 DEBUG QR Creation:")
-        print(f" Token ID: {token_id}")
-        print(f" Product Data Keys: {list(product_data.keys())}")
-        print(f" BatchNumber in data: {product_data.get('batchNumber', 'MISSING')}")
-        print(f" ProductType in data: {product_data.get('productType', 'MISSING')}")
-        print(f" Category in data: {product_data.get('category', 'MISSING')}")
-        print(f" ManufacturingDate in data: {product_data.get('manufacturingDate', 'MISSING')}")
+        logger.debug("🔍 DEBUG QR Creation:")
+        logger.debug(" Token ID: %s", token_id)
+        logger.debug(" Product Data Keys: %s", list(product_data.keys()))
+        logger.debug(" BatchNumber in data: %s", product_data.get('batchNumber', 'MISSING'))
+        logger.debug(" ProductType in data: %s", product_data.get('productType', 'MISSING'))
+        logger.debug(" Category in data: %s", product_data.get('category', 'MISSING'))
+        logger.debug(" ManufacturingDate in data: %s", product_data.get('manufacturingDate', 'MISSING'))
         
         qr_data = {
             # Core identification
@@ -457,11 +512,11 @@ class EncryptionService:
         }
         
         # ✅ DEBUG: Log final QR data
-        print(f"🔍 DEBUG Final QR Keys: {list(qr_data.keys())}")
-        print(f" BatchNumber in QR: {qr_data.get('batchNumber', 'MISSING')}")
-        print(f" ProductType in QR: {qr_data.get('productType', 'MISSING')}")
-        print(f" Category in QR: {qr_data.get('category', 'MISSING')}")
-        print(f" ManufacturingDate in QR: {qr_data.get('manufacturingDate', 'MISSING')}")
+        logger.debug("🔍 DEBUG Final QR Keys: %s", list(qr_data.keys()))
+        logger.debug(" BatchNumber in QR: %s", qr_data.get('batchNumber', 'MISSING'))
+        logger.debug(" ProductType in QR: %s", qr_data.get('productType', 'MISSING'))
+        logger.debug(" Category in QR: %s", qr_data.get('category', 'MISSING'))
+        logger.debug(" ManufacturingDate in QR: %s", qr_data.get('manufacturingDate', 'MISSING'))
         
         return qr_data
 
@@ -0,0 +1,185 @@
+"""
+FL aggregation
+Combines participants' local models into one global model. The service
+streams local models out of fl_models one document at a time into one of
+these accumulators, so aggregation holds roughly one global model in memory
+however many participants contributed.
+
+- every participant standardizes its features with its own StandardScaler;
+  ScalerPool pools their statistics into the global scaler, and each local
+  model is moved into that feature space before it's combined
+- TreeEnsembleMerger builds the global IsolationForest from a random sample
+  of each participant's trees, in proportion to its training samples and
+  bounded by FL_MAX_GLOBAL_ESTIMATORS; split thresholds are rewritten for
+  the global scaler
+- FedAvgAccumulator sums sample-weighted weight arrays into buffers
+  allocated on the first participant and divides once at the end (FedAvg);
+  linear [coef, intercept] weights are rescaled for the global scaler first
+"""
+import pickle
+from typing import Any, List, Optional
+
+import numpy as np
+
+from app.core.config import get_settings
+
+settings = get_settings()
+
+
+def _scale(variance: np.ndarray) -> np.ndarray:
+    # Like StandardScaler: a constant feature is left unscaled
+    scale = np.sqrt(variance)
+    scale[scale < 10 * np.finfo(scale.dtype).eps] = 1.0
+    return scale
+
+
+class ScalerPool:
+    """Pools fitted StandardScalers' mean/variance (Chan et al.) into one scaler over all their samples"""
+
+    def __init__(self):
+        self.samples = 0.0
+        self.mean: Optional[np.ndarray] = None
+        self.m2: Optional[np.ndarray] = None
+
+    def add(self, scaler: Any):
+        samples = float(np.max(scaler.n_samples_seen_))
+        mean = np.asarray(scaler.mean_, dtype=np.float64)
+        m2 = np.asarray(scaler.var_, dtype=np.float64) * samples
+        if self.mean is None:
+            self.samples, self.mean, self.m2 = samples, mean.copy(), m2.copy()
+            return
+        total = self.samples + samples
+        delta = mean - self.mean
+        self.mean += delta * samples / total
+        self.m2 += m2 + delta ** 2 * self.samples * samples / total
+        self.samples = total
+
+    def result(self) -> Any:
+        from sklearn.preprocessing import StandardScaler
+
+        scaler = StandardScaler()
+        scaler.mean_ = self.mean
+        scaler.var_ = self.m2 / self.samples
+        scaler.scale_ = _scale(scaler.var_.copy())
+        scaler.n_samples_seen_ = int(self.samples)
+        scaler.n_features_in_ = len(self.mean)
+        return scaler
+
+
+class TreeEnsembleMerger:
+    """
+    Merges participants' IsolationForests into one forest of at most max_estimators trees
+
+    Each participant contributes round(max_estimators * samples / total_samples)
+    trees (at least one), sampled without replacement. offset_ and the
+    path-length normalization (max_samples) are sample-weighted averages of
+    the participants' values, an approximation: a forest fitted on the pooled
+    data would derive them from that data. The decision threshold therefore
+    follows the participants' own contamination; there is no pooled data to
+    re-derive it for another one.
+    """
+
+    def __init__(self, global_scaler: Any, total_samples: int, max_estimators: int = settings.fl_max_global_estimators, random_state: int = 42):
+        self.global_scaler = global_scaler
+        self.total_samples = total_samples
+        self.max_estimators = max_estimators
+        self._rng = np.random.default_rng(random_state)
+        self._forest = None
+        self._trees: List[Any] = []
+        self._features: List[np.ndarray] = []
+        self._path_lengths: List[np.ndarray] = []
+        self._average_path_lengths: List[np.ndarray] = []
+        self._samples = 0.0
+        self._offset = 0.0
+        self._max_samples = 0.0
+
+    def _to_global_space(self, tree: Any, features: np.ndarray, scaler: Any):
+        # x_local <= t  <=>  x <= t * s + m  <=>  x_global <= (t * s + m - M) / S
+        nodes = tree.tree_
+        split = nodes.feature >= 0
+        columns = features[nodes.feature[split]]
+        thresholds = nodes.threshold
+        thresholds[split] = (
+            thresholds[split] * scaler.scale_[columns] + scaler.mean_[columns] - self.global_scaler.mean_[columns]
+        ) / self.global_scaler.scale_[columns]
+
+    def add(self, forest: Any, scaler: Any, samples: int):
+        """Sample one participant's trees into the merged forest"""
+        quota = min(len(forest.estimators_), max(1, int(round(self.max_estimators * samples / self.total_samples))))
+        for i in sorted(self._rng.choice(len(forest.estimators_), size=quota, replace=False)):
+            features = np.asarray(forest.estimators_features_[i])
+            self._to_global_space(forest.estimators_[i], features, scaler)
+            self._trees.append(forest.estimators_[i])
+            self._features.append(features)
+            self._path_lengths.append(forest._decision_path_lengths[i])
+            self._average_path_lengths.append(forest._average_path_length_per_tree[i])
+        self._samples += samples
+        self._offset += forest.offset_ * samples
+        self._max_samples += forest._max_samples * samples
+        if self._forest is None:
+            # Kept as the shell of the merged forest, without its own trees
+            self._forest = forest
+            forest.estimators_ = forest.estimators_features_ = None
+            forest._decision_path_lengths = forest._average_path_length_per_tree = None
+
+    def add_pickled(self, model_weights: bytes, scaler_params: bytes, samples: int):
+        """add() for a local model document's pickled model and scaler"""
+        self.add(pickle.loads(model_weights), pickle.loads(scaler_params), samples)
+
+    def result(self) -> Any:
+        """The merged IsolationForest, scoring features standardized with the global scaler"""
+        keep = np.arange(len(self._trees))
+        if len(keep) > self.max_estimators:
+            # One tree per participant can overshoot the bound when there are many small participants
+            keep = np.sort(self._rng.choice(len(keep), size=self.max_estimators, replace=False))
+        forest = self._forest
+        forest.estimators_ = [self._trees[i] for i in keep]
+        forest.estimators_features_ = [self._features[i] for i in keep]
+        forest._decision_path_lengths = tuple(self._path_lengths[i] for i in keep)
+        forest._average_path_length_per_tree = tuple(self._average_path_lengths[i] for i in keep)
+        forest.n_estimators = len(keep)
+        forest.offset_ = self._offset / self._samples
+        forest._max_samples = forest.max_samples_ = max(1, int(round(self._max_samples / self._samples)))
+        return forest
+
+
+def linear_weights_to_global_space(weights: List[np.ndarray], scaler: Any, global_scaler: Any) -> List[np.ndarray]:
+    """[coef, intercept] of a linear model on one scaler's features, re-expressed for the global scaler's"""
+    coef, intercept = (np.asarray(w, dtype=np.float64) for w in weights)
+    # w.(x - m)/s + b  ==  (w * S/s).(x - M)/S + b + (w/s).(M - m)
+    shift = (global_scaler.mean_ - scaler.mean_) / scaler.scale_
+    return [coef * (global_scaler.scale_ / scaler.scale_), intercept + coef @ shift]
+
+
+class FedAvgAccumulator:
+    """
+    Sample-weighted average of participants' weight lists (FedAvg)
+
+    The sums are allocated from the first participant's weight shapes; every
+    later participant's weights are added into them in place, so only one
+    participant's weights are held besides the sums.
+    """
+
+    def __init__(self, global_scaler: Any = None):
+        # With a global scaler, weights are linear [coef, intercept] and are rescaled for it before they're summed
+        self.global_scaler = global_scaler
+        self._sums: Optional[List[np.ndarray]] = None
+        self.samples = 0
+
+    def add(self, weights: List[np.ndarray], samples: int, scaler: Any = None):
+        if self.global_scaler is not None:
+            weights = linear_weights_to_global_space(weights, scaler, self.global_scaler)
+        if self._sums is None:
+            self._sums = [np.zeros(np.shape(w), dtype=np.float64) for w in weights]
+        if len(weights) != len(self._sums) or any(np.shape(w) != s.shape for w, s in zip(weights, self._sums)):
+            raise ValueError("Local model weights don't match the other participants' model architecture")
+        for total, w in zip(self._sums, weights):
+            total += np.asarray(w, dtype=np.float64) * samples
+        self.samples += samples
+
+    def add_pickled(self, model_weights: bytes, scaler_params: bytes, samples: int):
+        """add() for a local model document's pickled weights and scaler"""
+        self.add(pickle.loads(model_weights), samples, pickle.loads(scaler_params))
+
+    def result(self) -> List[np.ndarray]:
+        return [total / self.samples for total in self._sums]
@@ -0,0 +1,108 @@
+"""
+Federated learning compute
+Model fitting and scoring used by FederatedLearningService. Training runs in
+the FL executor's worker processes and scoring in its threads (see
+app/services/fl_executor.py), so these are plain module-level functions on
+arrays and model objects, with no service or database state.
+"""
+import pickle
+from typing import Any, Dict, List, Tuple
+
+import numpy as np
+
+
+def fit_anomaly_model(X: np.ndarray) -> Dict[str, Any]:
+    """Fit scaler + IsolationForest on raw anomaly features; returns the pickled pair and metrics"""
+    from sklearn.ensemble import IsolationForest
+    from sklearn.preprocessing import StandardScaler
+
+    scaler = StandardScaler()
+    X_scaled = scaler.fit_transform(X)
+    model = IsolationForest(contamination=0.1, random_state=42)
+    model.fit(X_scaled)
+
+    # predict() is decision_function() < 0, so score the training set once
+    anomaly_scores = model.decision_function(X_scaled)
+    return {
+        "model_weights": pickle.dumps(model),
+        "scaler_params": pickle.dumps(scaler),
+        "anomalies_detected": int(np.sum(anomaly_scores < 0)),
+        "mean_anomaly_score": float(np.mean(anomaly_scores)),
+    }
+
+
+def fit_counterfeit_model(model: Any, X: np.ndarray, y: np.ndarray, epochs: int = 50) -> Dict[str, Any]:
+    """Fit scaler + counterfeit model on raw features and labels; returns pickled weights and metrics"""
+    from sklearn.metrics import log_loss
+    from sklearn.preprocessing import StandardScaler
+
+    scaler = StandardScaler()
+    X_scaled = scaler.fit_transform(X)
+    y = y.astype(np.int64)
+    classes = np.array([0, 1])
+    loss_history = []
+    for _ in range(epochs):
+        model.partial_fit(X_scaled, y, classes=classes)
+        loss_history.append(float(log_loss(y, model.predict_proba(X_scaled), labels=classes)))
+    predictions = model.predict_proba(X_scaled)[:, 1]
+    return {
+        "model_weights": pickle.dumps(get_weights(model)),
+        "scaler_params": pickle.dumps(scaler),
+        "accuracy": float(np.mean((predictions > 0.5) == y)),
+        "loss_history": loss_history[-10:],  # Last 10 epochs
+    }
+
+
+def get_weights(model: Any) -> List[np.ndarray]:
+    """A model's weight arrays: Keras-style get_weights(), or [coef_, intercept_] for a scikit-learn linear model"""
+    if hasattr(model, "get_weights"):
+        return model.get_weights()
+    return [model.coef_, model.intercept_]
+
+
+def set_weights(model: Any, weights: List[np.ndarray]) -> Any:
+    """Load get_weights() output into a model (a binary classifier, for scikit-learn linear models)"""
+    if hasattr(model, "set_weights"):
+        model.set_weights(weights)
+        return model
+    coef, intercept = weights
+    model.coef_ = np.asarray(coef, dtype=np.float64)
+    model.intercept_ = np.asarray(intercept, dtype=np.float64)
+    model.classes_ = np.array([0, 1])
+    model.n_features_in_ = model.coef_.shape[1]
+    return model
+
+
+def is_fitted(model: Any) -> bool:
+    """Whether a model can score yet (an initial or placeholder global model can't)"""
+    from sklearn.exceptions import NotFittedError
+    from sklearn.utils.validation import check_is_fitted
+
+    try:
+        check_is_fitted(model)
+    except (NotFittedError, TypeError):
+        return False
+    return True
+
+
+def score_anomalies(model: Any, scaler: Any, X: np.ndarray) -> np.ndarray:
+    """Anomaly scores for a feature matrix; a score below 0 is an anomaly"""
+    return model.decision_function(scaler.transform(X))
+
+
+def predict_counterfeits(model: Any, scaler: Any, X: np.ndarray) -> np.ndarray:
+    """Counterfeit probabilities for a feature matrix"""
+    if hasattr(model, "predict_proba"):
+        return model.predict_proba(scaler.transform(X))[:, 1]
+    return np.asarray(model.predict(scaler.transform(X)), dtype=np.float64).reshape(len(X), -1)[:, 0]
+
+
+def score_anomaly(model: Any, scaler: Any, features: np.ndarray) -> Tuple[float, bool]:
+    """(anomaly score, is anomaly) for one feature row"""
+    anomaly_score = float(score_anomalies(model, scaler, features.reshape(1, -1))[0])
+    return anomaly_score, anomaly_score < 0
+
+
+def predict_counterfeit(model: Any, scaler: Any, features: np.ndarray) -> float:
+    """Counterfeit probability for one feature row"""
+    return float(predict_counterfeits(model, scaler, features.reshape(1, -1))[0])
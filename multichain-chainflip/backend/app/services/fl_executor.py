@@ -0,0 +1,211 @@
+"""
+FL compute executor
+Keeps federated learning work off the event loop: model training runs in a
+process pool, inference in a thread pool, and training requests become jobs
+that can be polled and cancelled
+
+- train() runs a picklable function in a worker process; at most
+  FL_TRAINING_WORKERS at a time, later callers wait their turn as "queued"
+- infer() runs a function on in-memory models (or a feature-extraction
+  chunk) in a worker thread
+- submit() starts a job and returns its id at once; at most
+  FL_MAX_QUEUED_JOBS jobs may be queued or running
+- cancel() stops a queued job outright; a job already training in a worker
+  process is abandoned and its result discarded (the process can't be
+  interrupted mid-fit)
+- finished jobs are kept for FL_JOB_TTL seconds for polling
+"""
+import asyncio
+import contextvars
+import multiprocessing
+import time
+import uuid
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from app.core.config import get_settings
+from app.core.log import get_logger
+
+settings = get_settings()
+logger = get_logger(__name__)
+
+ACTIVE_STATUSES = ("queued", "running")
+
+# The job whose operation is currently awaiting train(), so it can be marked running
+_current_job: contextvars.ContextVar[Optional[Dict[str, Any]]] = contextvars.ContextVar("fl_current_job", default=None)
+
+
+class FLJobQueueFull(Exception):
+    """Raised by submit() when FL_MAX_QUEUED_JOBS jobs are already queued or running"""
+
+
+class FLExecutor:
+    """Process pool for FL training, thread pool for inference, and the job registry"""
+
+    def __init__(
+        self,
+        training_workers: int = settings.fl_training_workers,
+        inference_workers: int = settings.fl_inference_workers,
+        max_queued_jobs: int = settings.fl_max_queued_jobs,
+        job_ttl: float = settings.fl_job_ttl,
+    ):
+        self.training_workers = training_workers
+        self.inference_workers = inference_workers
+        self.max_queued_jobs = max_queued_jobs
+        self.job_ttl = job_ttl
+        self._processes: Optional[ProcessPoolExecutor] = None
+        self._threads: Optional[ThreadPoolExecutor] = None
+        self._training_slots = asyncio.Semaphore(training_workers)
+        self._jobs: Dict[str, Dict[str, Any]] = {}
+        self._tasks: Dict[str, asyncio.Task] = {}
+        self._stats = {"submitted": 0, "completed": 0, "failed": 0, "cancelled": 0, "rejected": 0, "trainings": 0, "thread_tasks": 0}
+
+    def _process_pool(self) -> ProcessPoolExecutor:
+        if self._processes is None:
+            # spawn, not fork: the server process has live threads (RPC pool, log writer)
+            # whose locks a forked child would inherit mid-use
+            self._processes = ProcessPoolExecutor(
+                max_workers=self.training_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return self._processes
+
+    def _thread_pool(self) -> ThreadPoolExecutor:
+        if self._threads is None:
+            self._threads = ThreadPoolExecutor(max_workers=self.inference_workers, thread_name_prefix="fl-inference")
+        return self._threads
+
+    async def train(self, fn: Callable[..., Any], *args) -> Any:
+        """Run fn(*args) in a training process; fn, its arguments and result must be picklable"""
+        async with self._training_slots:
+            job = _current_job.get()
+            if job is not None and job["status"] == "queued":
+                job["status"] = "running"
+                job["started_at"] = time.time()
+            self._stats["trainings"] += 1
+            try:
+                return await asyncio.get_running_loop().run_in_executor(self._process_pool(), fn, *args)
+            except BrokenProcessPool:
+                # A worker died (e.g. OOM-killed); start a fresh pool for the next job
+                logger.warning("⚠️ FL training process pool broke, restarting it")
+                self._processes = None
+                raise
+
+    async def infer(self, fn: Callable[..., Any], *args) -> Any:
+        """Run fn(*args) in an inference thread"""
+        self._stats["thread_tasks"] += 1
+        return await asyncio.get_running_loop().run_in_executor(self._thread_pool(), fn, *args)
+
+    def submit(self, kind: str, operation: Awaitable[Dict[str, Any]], **info) -> str:
+        """
+        Run an FL operation as a background job; returns its job id
+
+        The operation's result dict is stored on the job; it counts as failed
+        when it raises or returns {"error": ...}. Raises FLJobQueueFull when
+        the queue is at capacity.
+        """
+        self._prune()
+        active = sum(1 for job in self._jobs.values() if job["status"] in ACTIVE_STATUSES)
+        if active >= self.max_queued_jobs:
+            operation.close()
+            self._stats["rejected"] += 1
+            raise FLJobQueueFull(f"FL job queue is full ({active} jobs queued or running)")
+
+        job = {
+            "job_id": str(uuid.uuid4()),
+            "kind": kind,
+            "status": "queued",
+            "submitted_at": time.time(),
+            "started_at": None,
+            "finished_at": None,
+            "result": None,
+            "error": None,
+            **info,
+        }
+        self._jobs[job["job_id"]] = job
+        self._stats["submitted"] += 1
+        self._tasks[job["job_id"]] = asyncio.create_task(self._run_job(job, operation))
+        return job["job_id"]
+
+    async def _run_job(self, job: Dict[str, Any], operation: Awaitable[Dict[str, Any]]):
+        _current_job.set(job)
+        try:
+            result = await operation
+        except asyncio.CancelledError:
+            self._finish(job, "cancelled")
+            return
+        except Exception as e:
+            logger.warning("⚠️ FL job %s (%s) failed: %s", job["job_id"], job["kind"], e)
+            self._finish(job, "failed", error=str(e))
+            return
+        finally:
+            self._tasks.pop(job["job_id"], None)
+        if isinstance(result, dict) and result.get("error"):
+            self._finish(job, "failed", result=result, error=result["error"])
+        else:
+            self._finish(job, "completed", result=result)
+
+    def _finish(self, job: Dict[str, Any], status: str, result: Any = None, error: Optional[str] = None):
+        if job["status"] not in ACTIVE_STATUSES:
+            return
+        job.update(status=status, result=result, error=error, finished_at=time.time())
+        self._stats[status] += 1
+
+    def cancel(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Cancel a queued or running job; returns the job, or None if unknown"""
+        job = self._jobs.get(job_id)
+        if job is None:
+            return None
+        task = self._tasks.get(job_id)
+        if task is not None and job["status"] in ACTIVE_STATUSES:
+            if job["status"] == "running":
+                logger.info("🛑 FL job %s cancelled while training; its result will be discarded", job_id)
+            task.cancel()
+            self._finish(job, "cancelled")
+        return dict(job)
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        job = self._jobs.get(job_id)
+        return dict(job) if job is not None else None
+
+    def list_jobs(self, kind: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Known jobs, newest first, without their results"""
+        self._prune()
+        jobs = [job for job in self._jobs.values() if kind is None or job["kind"] == kind]
+        return [
+            {key: value for key, value in job.items() if key != "result"}
+            for job in sorted(jobs, key=lambda job: job["submitted_at"], reverse=True)
+        ]
+
+    def _prune(self):
+        cutoff = time.time() - self.job_ttl
+        for job_id in [job_id for job_id, job in self._jobs.items() if job["finished_at"] and job["finished_at"] < cutoff]:
+            del self._jobs[job_id]
+
+    def metrics(self) -> Dict[str, Any]:
+        statuses: Dict[str, int] = {}
+        for job in self._jobs.values():
+            statuses[job["status"]] = statuses.get(job["status"], 0) + 1
+        return {
+            **self._stats,
+            "jobs": statuses,
+            "training_workers": self.training_workers,
+            "inference_workers": self.inference_workers,
+            "max_queued_jobs": self.max_queued_jobs,
+        }
+
+    async def close(self):
+        tasks = list(self._tasks.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        if self._processes is not None:
+            self._processes.shutdown(wait=False, cancel_futures=True)
+            self._processes = None
+        if self._threads is not None:
+            self._threads.shutdown(wait=False, cancel_futures=True)
+            self._threads = None
+
+
+fl_executor = FLExecutor()
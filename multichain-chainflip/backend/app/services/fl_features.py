@@ -0,0 +1,236 @@
+"""
+FL feature extraction
+Turns batches of training records into a float32 feature matrix column by
+column instead of building a Python list per record. The anomaly and
+counterfeit feature sets are declared once as schemas; a batch is filled
+chunk by chunk into a preallocated matrix, so a Mongo cursor over hundreds of
+thousands of transport logs streams through without materializing the
+records.
+
+- Scalar columns are read with np.fromiter straight into the chunk buffer
+- sensor readings (ragged lists per record) are flattened into one values
+  array plus per-record counts, and their variance is computed for the
+  whole chunk at once with np.bincount
+- a record with a value that isn't a number is dropped, as the per-record
+  extractors did
+"""
+from itertools import chain
+from typing import Any, AsyncIterable, Awaitable, Callable, Dict, Iterable, List, NamedTuple, Optional, Tuple, Union
+
+import numpy as np
+
+from app.core.config import get_settings
+
+settings = get_settings()
+
+
+class Scalar(NamedTuple):
+    key: str
+    default: float
+    scale: float = 1.0
+
+
+class ReadingsVariance(NamedTuple):
+    key: str
+    default: Tuple[float, ...]  # readings assumed when the record has none; fewer than 2 readings -> 0
+
+
+Column = Union[Scalar, ReadingsVariance]
+
+# Column order is the model's feature order (global_models[...]['features'])
+ANOMALY_SCHEMA: Tuple[Column, ...] = (
+    Scalar("transport_duration", 0, 1 / 3600),  # seconds -> hours
+    ReadingsVariance("temperature_readings", (20,)),  # default room temp
+    ReadingsVariance("humidity_readings", (50,)),  # default 50%
+    Scalar("location_jumps", 0),
+    Scalar("participant_reputation", 100),
+    Scalar("product_age_days", 0),
+    Scalar("handover_frequency", 0),
+)
+
+COUNTERFEIT_SCHEMA: Tuple[Column, ...] = (
+    Scalar("qr_code_complexity", 0.5),
+    Scalar("metadata_consistency", 1.0),
+    Scalar("participant_verification_score", 0.8),
+    Scalar("product_history_length", 1),
+    Scalar("cryptographic_signature_strength", 0.9),
+    Scalar("ipfs_metadata_integrity", 1.0),
+    Scalar("transport_chain_consistency", 1.0),
+)
+
+COUNTERFEIT_LABEL = Scalar("is_counterfeit", 0)  # 0 = authentic, 1 = counterfeit
+
+
+def schema_projection(schema: Tuple[Column, ...], label: Optional[Scalar] = None) -> Dict[str, int]:
+    """Mongo projection loading only the fields a schema reads"""
+    keys = [column.key for column in schema] + ([label.key] if label else [])
+    return {"_id": 0, **{key: 1 for key in keys}}
+
+
+def _floats(values: Iterable[Any], count: int) -> np.ndarray:
+    """values as float64; anything that isn't a number becomes NaN"""
+    if not isinstance(values, list):
+        values = list(values)
+    try:
+        return np.fromiter(values, dtype=np.float64, count=count)
+    except (TypeError, ValueError):
+        out = np.empty(count, dtype=np.float64)
+        for i, value in enumerate(values):
+            try:
+                out[i] = float(value)
+            except (TypeError, ValueError):
+                out[i] = np.nan
+        return out
+
+
+def _scalar_column(column: Scalar, records: List[Dict[str, Any]]) -> np.ndarray:
+    values = _floats([record.get(column.key, column.default) for record in records], len(records))
+    if column.scale != 1.0:
+        values *= column.scale
+    return values
+
+
+def _variance_column(column: ReadingsVariance, records: List[Dict[str, Any]]) -> np.ndarray:
+    """Population variance of each record's readings, from one flat values array and per-record counts"""
+    n = len(records)
+    readings = [record.get(column.key, column.default) for record in records]
+    variances = np.zeros(n, dtype=np.float64)
+    try:
+        counts = np.fromiter(map(len, readings), dtype=np.int64, count=n)
+    except TypeError:
+        # Not a list of readings; mark those records invalid and treat them as empty
+        counts = np.empty(n, dtype=np.int64)
+        for i, values in enumerate(readings):
+            try:
+                counts[i] = len(values)
+            except TypeError:
+                counts[i] = 0
+                readings[i] = ()
+                variances[i] = np.nan
+    values = _floats(chain.from_iterable(readings), int(counts.sum()))
+    rows = np.repeat(np.arange(n), counts)
+    safe_counts = np.maximum(counts, 1)
+    means = np.bincount(rows, weights=values, minlength=n) / safe_counts
+    squares = np.bincount(rows, weights=(values - means[rows]) ** 2, minlength=n) / safe_counts
+    # NaN readings leave NaN in their record's variance, so the record gets dropped
+    return np.where(counts > 1, squares, 0.0) + variances
+
+
+def feature_block(schema: Tuple[Column, ...], records: List[Dict[str, Any]]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    (features, valid) for one chunk of records, row-aligned with the records
+
+    Rows of invalid records hold NaN; callers that need to know which record
+    a row belongs to (e.g. batch scoring) index with the valid mask.
+    """
+    block = np.empty((len(records), len(schema)), dtype=np.float64)
+    for j, column in enumerate(schema):
+        block[:, j] = _variance_column(column, records) if isinstance(column, ReadingsVariance) else _scalar_column(column, records)
+    return block, ~np.isnan(block).any(axis=1)
+
+
+class FeatureMatrixBuilder:
+    """
+    Appends record chunks to a preallocated float32 matrix
+
+    The matrix is sized up front when the record count is known and doubles
+    when it runs out; result() returns a view of the filled rows.
+    """
+
+    def __init__(self, schema: Tuple[Column, ...], label: Optional[Scalar] = None, expected_rows: int = 0):
+        self.schema = schema
+        self.label = label
+        capacity = max(expected_rows, 1)
+        self._matrix = np.empty((capacity, len(schema)), dtype=np.float32)
+        self._labels = np.empty(capacity, dtype=np.float32) if label else None
+        self.rows = 0
+        self.dropped = 0
+
+    def _reserve(self, rows: int):
+        capacity = self._matrix.shape[0]
+        if self.rows + rows <= capacity:
+            return
+        capacity = max(capacity * 2, self.rows + rows)
+        matrix = np.empty((capacity, len(self.schema)), dtype=np.float32)
+        matrix[:self.rows] = self._matrix[:self.rows]
+        self._matrix = matrix
+        if self._labels is not None:
+            labels = np.empty(capacity, dtype=np.float32)
+            labels[:self.rows] = self._labels[:self.rows]
+            self._labels = labels
+
+    def add(self, records: List[Dict[str, Any]]):
+        """Extract one chunk of records"""
+        if not records:
+            return
+        block, valid = feature_block(self.schema, records)
+        labels = None
+        if self.label:
+            labels = _scalar_column(self.label, records)
+            valid &= ~np.isnan(labels)
+        kept = int(valid.sum())
+        self.dropped += len(records) - kept
+        self._reserve(kept)
+        self._matrix[self.rows:self.rows + kept] = block[valid]
+        if labels is not None:
+            self._labels[self.rows:self.rows + kept] = labels[valid]
+        self.rows += kept
+
+    def result(self) -> Tuple[np.ndarray, Optional[np.ndarray]]:
+        """(features, labels or None) for the rows extracted so far"""
+        labels = self._labels[:self.rows] if self._labels is not None else None
+        return self._matrix[:self.rows], labels
+
+
+def feature_matrix(
+    schema: Tuple[Column, ...],
+    records: Iterable[Dict[str, Any]],
+    label: Optional[Scalar] = None,
+    chunk_size: int = settings.fl_feature_chunk_size,
+) -> Tuple[np.ndarray, Optional[np.ndarray]]:
+    """float32 feature matrix (and label vector) for a batch of records"""
+    builder = FeatureMatrixBuilder(schema, label, expected_rows=len(records) if hasattr(records, "__len__") else chunk_size)
+    if isinstance(records, list):
+        for start in range(0, len(records), chunk_size):
+            builder.add(records[start:start + chunk_size])
+        return builder.result()
+    chunk: List[Dict[str, Any]] = []
+    for record in records:
+        chunk.append(record)
+        if len(chunk) >= chunk_size:
+            builder.add(chunk)
+            chunk = []
+    builder.add(chunk)
+    return builder.result()
+
+
+async def feature_matrix_from_cursor(
+    schema: Tuple[Column, ...],
+    cursor: AsyncIterable[Dict[str, Any]],
+    label: Optional[Scalar] = None,
+    chunk_size: int = settings.fl_feature_chunk_size,
+    run_chunk: Optional[Callable[..., Awaitable[Any]]] = None,
+) -> Tuple[np.ndarray, Optional[np.ndarray]]:
+    """
+    Same as feature_matrix() for an async iterator such as a Motor cursor
+
+    Only one chunk of documents is held at a time. run_chunk(fn, chunk), if
+    given, runs each chunk's extraction (e.g. in a worker thread).
+    """
+    builder = FeatureMatrixBuilder(schema, label, expected_rows=chunk_size)
+
+    async def extract(chunk: List[Dict[str, Any]]):
+        if run_chunk is not None:
+            await run_chunk(builder.add, chunk)
+        else:
+            builder.add(chunk)
+
+    chunk: List[Dict[str, Any]] = []
+    async for record in cursor:
+        chunk.append(record)
+        if len(chunk) >= chunk_size:
+            await extract(chunk)
+            chunk = []
+    if chunk:
+        await extract(chunk)
+    return builder.result()
@@ -0,0 +1,120 @@
+"""
+FL model store
+Versioned global models on disk under FL_MODEL_STORAGE, with the version
+each model type serves recorded in MongoDB
+
+- save() writes {model, scaler} with joblib (uncompressed) into
+  <storage>/<model_type>/v<version>/ via a temp directory and a rename, so a
+  half-written version is never visible; versions come from an atomic
+  counter in fl_active_models
+- fl_model_versions holds one record per saved version (path, training
+  rounds, contributors, metrics); fl_active_models holds the active_version
+  pointer per model type
+- load() opens the file with joblib's mmap_mode, so the payload's numpy
+  arrays are memory-mapped rather than copied through pickle and a cold
+  start loads a model in milliseconds
+"""
+import os
+import shutil
+import time
+import uuid
+from typing import Any, Dict, List, Optional, Tuple
+
+import joblib
+from pymongo import ReturnDocument
+
+from app.core.config import get_settings
+from app.core.index_manifest import index_manifest
+from app.core.log import get_logger
+from app.services.fl_executor import fl_executor
+
+settings = get_settings()
+logger = get_logger(__name__)
+
+MODEL_FILE = "model.joblib"
+
+index_manifest.register("fl_model_store", "fl_model_versions", [("model_type", 1), ("version", -1)], unique=True)
+index_manifest.register("fl_model_store", "fl_active_models", "model_type", unique=True)
+index_manifest.register_query("fl_model_store", "fl_model_versions", {"model_type": "anomaly_detection", "version": 1})
+index_manifest.register_query("fl_model_store", "fl_active_models", {"model_type": "anomaly_detection"})
+
+
+def _write(path: str, payload: Dict[str, Any]):
+    staging = f"{path}.tmp-{uuid.uuid4().hex}"
+    os.makedirs(staging)
+    try:
+        joblib.dump(payload, os.path.join(staging, MODEL_FILE))
+        os.replace(staging, path)
+    except BaseException:
+        shutil.rmtree(staging, ignore_errors=True)
+        raise
+
+
+def _read(path: str) -> Dict[str, Any]:
+    return joblib.load(os.path.join(path, MODEL_FILE), mmap_mode="r")
+
+
+class FLModelStore:
+    """Saves, activates and loads versions of the global FL models"""
+
+    def __init__(self, root: str = settings.fl_model_storage):
+        self.root = root
+        self.database = None
+
+    async def initialize(self, database):
+        self.database = database
+        os.makedirs(self.root, exist_ok=True)
+        await index_manifest.apply(database, owners=["fl_model_store"])
+
+    def _path(self, model_type: str, version: int) -> str:
+        return os.path.join(self.root, model_type, f"v{version:06d}")
+
+    async def save(self, model_type: str, model: Any, scaler: Any, **meta) -> int:
+        """Write a new version of a model type (not yet active); returns its version number"""
+        counter = await self.database.fl_active_models.find_one_and_update(
+            {"model_type": model_type},
+            {"$inc": {"latest_version": 1}},
+            upsert=True,
+            return_document=ReturnDocument.AFTER,
+        )
+        version = counter["latest_version"]
+        path = self._path(model_type, version)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        await fl_executor.infer(_write, path, {"model": model, "scaler": scaler})
+        await self.database.fl_model_versions.insert_one({
+            "model_type": model_type,
+            "version": version,
+            "path": path,
+            "created_at": time.time(),
+            **meta,
+        })
+        return version
+
+    async def activate(self, model_type: str, version: int):
+        """Point a model type at a saved version"""
+        await self.database.fl_active_models.update_one(
+            {"model_type": model_type},
+            {"$set": {"active_version": version, "activated_at": time.time()}},
+            upsert=True,
+        )
+
+    async def active_versions(self) -> Dict[str, int]:
+        """{model_type: active_version} for every model type that has one"""
+        return {
+            pointer["model_type"]: pointer["active_version"]
+            async for pointer in self.database.fl_active_models.find({"active_version": {"$ne": None}}, {"_id": 0})
+        }
+
+    async def load(self, model_type: str, version: int) -> Optional[Tuple[Dict[str, Any], Dict[str, Any]]]:
+        """(payload {model, scaler}, version record) for a saved version, or None if it's missing"""
+        record = await self.database.fl_model_versions.find_one({"model_type": model_type, "version": version}, {"_id": 0})
+        if record is None or not os.path.exists(os.path.join(record["path"], MODEL_FILE)):
+            logger.warning("⚠️ FL model %s v%s is not in the store", model_type, version)
+            return None
+        payload = await fl_executor.infer(_read, record["path"])
+        return payload, record
+
+    async def versions(self, model_type: str, limit: int = 20) -> List[Dict[str, Any]]:
+        """Most recent saved versions of a model type"""
+        cursor = self.database.fl_model_versions.find({"model_type": model_type}, {"_id": 0}).sort("version", -1).limit(limit)
+        return [record async for record in cursor]
@@ -6,18 +6,89 @@ import asyncio
 import numpy as np
 import json
 import pickle
-import os
-from typing import Dict, List, Any, Optional
+import time
+from pymongo import UpdateOne
+from typing import AsyncIterable, Dict, List, Any, Optional, Union
 from datetime import datetime, timedelta
 # import tensorflow as tf  # Commented out for simplified deployment
-from sklearn.ensemble import IsolationForest
-from sklearn.preprocessing import StandardScaler
 # import pandas as pd  # Commented out for simplified deployment
 
 from app.core.config import get_settings
 from app.core.database import get_database
+from app.core.log import get_logger
+from app.core.response_cache import invalidate_product_views
+from app.core.service_registry import service_registry
+from app.services.fl_aggregation import FedAvgAccumulator, ScalerPool, TreeEnsembleMerger
+from app.services.fl_compute import (
+    fit_anomaly_model,
+    fit_counterfeit_model,
+    is_fitted,
+    predict_counterfeit,
+    predict_counterfeits,
+    score_anomalies,
+    score_anomaly,
+    set_weights,
+)
+from app.services.fl_executor import fl_executor
+from app.services.fl_model_store import FLModelStore
+from app.services.fl_features import (
+    ANOMALY_SCHEMA,
+    COUNTERFEIT_LABEL,
+    COUNTERFEIT_SCHEMA,
+    feature_block,
+    feature_matrix,
+    feature_matrix_from_cursor,
+    schema_projection,
+)
 
 settings = get_settings()
+logger = get_logger(__name__)
+
+
+# Product fields and query operators a batch-scoring filter may use
+PRODUCT_FILTER_FIELDS = frozenset({
+    "token_id", "manufacturer", "current_owner", "status", "mint_status", "chain_id",
+    "created_at", "metadata.category", "metadata.product_type", "last_anomaly_check.is_anomaly",
+    "last_counterfeit_check.is_counterfeit",
+})
+PRODUCT_FILTER_OPERATORS = frozenset({"$eq", "$ne", "$in", "$nin", "$gt", "$gte", "$lt", "$lte", "$exists"})
+
+
+def check_product_filter(query: Dict[str, Any]) -> Dict[str, Any]:
+    """Return query if it only uses allow-listed product fields and operators; raises ValueError otherwise"""
+    def check_value(field: str, value: Any):
+        if isinstance(value, dict):
+            for operator, operand in value.items():
+                if operator not in PRODUCT_FILTER_OPERATORS:
+                    raise ValueError(f"Operator {operator} is not allowed on {field}")
+                check_value(field, operand)
+        elif isinstance(value, list):
+            for item in value:
+                if isinstance(item, (dict, list)):
+                    raise ValueError(f"Nested values are not allowed on {field}")
+        elif value is not None and not isinstance(value, (str, int, float, bool)):
+            raise ValueError(f"Unsupported value for {field}")
+    
+    if not isinstance(query, dict):
+        raise ValueError("Filter must be an object")
+    for field, value in query.items():
+        if field in ("$and", "$or"):
+            if not isinstance(value, list) or not value:
+                raise ValueError(f"{field} needs a non-empty list")
+            for clause in value:
+                check_product_filter(clause)
+        elif field in PRODUCT_FILTER_FIELDS:
+            check_value(field, value)
+        else:
+            raise ValueError(f"Filtering on {field} is not allowed")
+    return query
+
+
+def _sklearn_classes():
+    from sklearn.ensemble import IsolationForest
+    from sklearn.preprocessing import StandardScaler
+    return IsolationForest, StandardScaler
+
 
 class FederatedLearningService:
     def __init__(self):
@@ -26,23 +97,28 @@ class FederatedLearningService:
         self.participant_models = {}
         self.scalers = {}
         self.model_storage_path = settings.fl_model_storage
+        self.model_store = FLModelStore(self.model_storage_path)
+        self._versions_checked_at = 0.0
         
     async def initialize(self):
         """Initialize FL service"""
-        print("🤖 Initializing Federated Learning Service...")
+        logger.debug("🤖 Initializing Federated Learning Service...")
         
         self.database = await get_database()
         
         # Create model storage directory
-        os.makedirs(self.model_storage_path, exist_ok=True)
+        await self.model_store.initialize(self.database)
         
-        # Initialize global models
+        # Initialize global models, then swap in the active stored versions
         await self.initialize_global_models()
+        await self.refresh_global_models(force=True)
         
-        print("✅ Federated Learning Service initialized")
+        logger.info("✅ Federated Learning Service initialized")
     
     async def initialize_global_models(self):
         """Initialize global models for anomaly detection and counterfeit detection"""
+        # scikit-learn takes over a second to import; do that in a worker thread, not on the event loop
+        IsolationForest, StandardScaler = await fl_executor.infer(_sklearn_classes)
         
         # Anomaly Detection Model (Isolation Forest)
         self.global_models['anomaly_detection'] = {
@@ -59,12 +135,13 @@ class FederatedLearningService:
             ],
             'last_updated': datetime.now(),
             'training_rounds': 0,
-            'participants_contributed': []
+            'participants_contributed': [],
+            'version': None
         }
         
-        # Counterfeit Detection Model (Neural Network)
+        # Counterfeit Detection Model (logistic regression)
         self.global_models['counterfeit_detection'] = {
-            'model': self.create_counterfeit_detection_model(),
+            'model': await fl_executor.infer(self.create_counterfeit_detection_model),
             'scaler': StandardScaler(),
             'features': [
                 'qr_code_complexity',
@@ -77,65 +154,54 @@ class FederatedLearningService:
             ],
             'last_updated': datetime.now(),
             'training_rounds': 0,
-            'participants_contributed': []
+            'participants_contributed': [],
+            'version': None
         }
         
-        print("✅ Global FL models initialized")
+        logger.info("✅ Global FL models initialized")
     
     def create_counterfeit_detection_model(self):
-        """Create simplified counterfeit detection model (without TensorFlow)"""
-        # Simplified model using scikit-learn for now
+        """Create counterfeit detection model (without TensorFlow)"""
+        # Logistic regression trained with SGD: its [coef, intercept] weights average across participants (FedAvg)
         # This would be replaced with TensorFlow model when ML dependencies are available
-        model_config = {
-            'type': 'isolation_forest',
-            'contamination': 0.1,
-            'random_state': 42,
-            'features': ['price_variance', 'delivery_time', 'route_deviation', 'temperature_variance']
-        }
+        from sklearn.linear_model import SGDClassifier
         
-        return model_config
+        return SGDClassifier(loss="log_loss", random_state=42)
     
-    async def train_local_anomaly_model(self, participant_address: str, training_data: List[Dict[str, Any]]) -> Dict[str, Any]:
-        """Train local anomaly detection model for a participant"""
+    async def _training_matrix(self, schema, training_data, label=None):
+        """Feature matrix (and labels) for a list of records or a streaming cursor, extracted in worker threads"""
+        if hasattr(training_data, "__aiter__"):
+            return await feature_matrix_from_cursor(schema, training_data, label, run_chunk=fl_executor.infer)
+        return await fl_executor.infer(feature_matrix, schema, training_data, label)
+    
+    async def train_local_anomaly_model(self, participant_address: str, training_data: Union[List[Dict[str, Any]], AsyncIterable[Dict[str, Any]]]) -> Dict[str, Any]:
+        """Train local anomaly detection model for a participant from a list of records or a Mongo cursor"""
         
         try:
             if not training_data:
                 return {"error": "No training data provided"}
             
             # Extract features for anomaly detection
-            features_data = []
-            for data_point in training_data:
-                features = self.extract_anomaly_features(data_point)
-                if features:
-                    features_data.append(features)
+            X, _ = await self._training_matrix(ANOMALY_SCHEMA, training_data)
+            if not len(X):
+                return {"error": "No training data provided"}
             
-            if len(features_data) < 10:  # Minimum data requirement
+            if len(X) < 10:  # Minimum data requirement
                 return {"error": "Insufficient training data (minimum 10 samples required)"}
             
-            # Convert to numpy array
-            X = np.array(features_data)
-            
-            # Normalize features
-            scaler = StandardScaler()
-            X_scaled = scaler.fit_transform(X)
-            
-            # Train local isolation forest model
-            local_model = IsolationForest(contamination=0.1, random_state=42)
-            local_model.fit(X_scaled)
-            
-            # Calculate model performance metrics
-            anomaly_scores = local_model.decision_function(X_scaled)
-            anomalies_detected = np.sum(local_model.predict(X_scaled) == -1)
+            # Normalize features and train the local isolation forest in a training process
+            fitted = await fl_executor.train(fit_anomaly_model, X)
+            anomalies_detected = fitted['anomalies_detected']
             
             # Store local model
             model_data = {
                 'participant_address': participant_address,
                 'model_type': 'anomaly_detection',
-                'model_weights': pickle.dumps(local_model),
-                'scaler_params': pickle.dumps(scaler),
-                'training_samples': len(features_data),
-                'anomalies_detected': int(anomalies_detected),
-                'mean_anomaly_score': float(np.mean(anomaly_scores)),
+                'model_weights': fitted['model_weights'],
+                'scaler_params': fitted['scaler_params'],
+                'training_samples': len(X),
+                'anomalies_detected': anomalies_detected,
+                'mean_anomaly_score': fitted['mean_anomaly_score'],
                 'created_at': datetime.now(),
                 'status': 'trained'
             }
@@ -145,69 +211,43 @@ class FederatedLearningService:
             return {
                 "success": True,
                 "model_id": str(model_data['_id']),
-                "training_samples": len(features_data),
-                "anomalies_detected": int(anomalies_detected),
+                "training_samples": len(X),
+                "anomalies_detected": anomalies_detected,
                 "ready_for_aggregation": True
             }
             
         except Exception as e:
             return {"error": f"Local anomaly model training failed: {e}"}
     
-    async def train_local_counterfeit_model(self, participant_address: str, training_data: List[Dict[str, Any]]) -> Dict[str, Any]:
-        """Train local counterfeit detection model for a participant"""
+    async def train_local_counterfeit_model(self, participant_address: str, training_data: Union[List[Dict[str, Any]], AsyncIterable[Dict[str, Any]]]) -> Dict[str, Any]:
+        """Train local counterfeit detection model for a participant from a list of records or a Mongo cursor"""
         
         try:
             if not training_data:
                 return {"error": "No training data provided"}
             
-            # Extract features and labels for counterfeit detection
-            features_data = []
-            labels = []
-            
-            for data_point in training_data:
-                features = self.extract_counterfeit_features(data_point)
-                label = data_point.get('is_counterfeit', 0)  # 0 = authentic, 1 = counterfeit
-                
-                if features:
-                    features_data.append(features)
-                    labels.append(label)
+            # Extract features and labels (0 = authentic, 1 = counterfeit) for counterfeit detection
+            X, y = await self._training_matrix(COUNTERFEIT_SCHEMA, training_data, COUNTERFEIT_LABEL)
+            if not len(X):
+                return {"error": "No training data provided"}
             
-            if len(features_data) < 20:  # Minimum data requirement for neural network
+            if len(X) < 20:  # Minimum data requirement for neural network
                 return {"error": "Insufficient training data (minimum 20 samples required)"}
             
-            # Convert to numpy arrays
-            X = np.array(features_data)
-            y = np.array(labels)
-            
-            # Normalize features
-            scaler = StandardScaler()
-            X_scaled = scaler.fit_transform(X)
-            
-            # Create and train local model
+            # Create the local model, then normalize features and train it in a training process
             local_model = self.create_counterfeit_detection_model()
-            
-            # Train the model
-            history = local_model.fit(
-                X_scaled, y,
-                epochs=50,
-                batch_size=min(32, len(X_scaled)),
-                validation_split=0.2,
-                verbose=0
-            )
-            
-            # Calculate performance metrics
-            predictions = local_model.predict(X_scaled)
-            accuracy = np.mean((predictions > 0.5) == y)
+            fitted = await fl_executor.train(fit_counterfeit_model, local_model, X, y)
+            accuracy = fitted['accuracy']
             
             # Store local model
             model_data = {
                 'participant_address': participant_address,
                 'model_type': 'counterfeit_detection',
-                'model_weights': pickle.dumps(local_model.get_weights()),
-                'scaler_params': pickle.dumps(scaler),
-                'training_samples': len(features_data),
-                'accuracy': float(accuracy),
-                'loss_history': history.history['loss'][-10:],  # Last 10 epochs
+                'model_weights': fitted['model_weights'],
+                'scaler_params': fitted['scaler_params'],
+                'training_samples': len(X),
+                'accuracy': accuracy,
+                'loss_history': fitted['loss_history'],
                 'created_at': datetime.now(),
                 'status': 'trained'
             }
@@ -217,8 +257,8 @@ class FederatedLearningService:
             return {
                 "success": True,
                 "model_id": str(model_data['_id']),
-                "training_samples": len(features_data),
-                "accuracy": float(accuracy),
+                "training_samples": len(X),
+                "accuracy": accuracy,
                 "ready_for_aggregation": True
             }
             
@@ -226,142 +266,174 @@ class FederatedLearningService:
             return {"error": f"Local counterfeit model training failed: {e}"}
     
     def extract_anomaly_features(self, data_point: Dict[str, Any]) -> Optional[List[float]]:
-        """Extract features for anomaly detection"""
+        """Extract features for anomaly detection from a single record (see ANOMALY_SCHEMA)"""
+        X, _ = feature_matrix(ANOMALY_SCHEMA, [data_point])
+        return X[0].tolist() if len(X) else None
+    
+    def extract_counterfeit_features(self, data_point: Dict[str, Any]) -> Optional[List[float]]:
+        """Extract features for counterfeit detection from a single record (see COUNTERFEIT_SCHEMA)"""
+        X, _ = feature_matrix(COUNTERFEIT_SCHEMA, [data_point])
+        return X[0].tolist() if len(X) else None
+    
+    async def train_local_model_from_collection(self, model_type: str, participant_address: str, limit: int = 0) -> Dict[str, Any]:
+        """Train a participant's local model on their stored records, streamed from MongoDB"""
+        if model_type == 'anomaly_detection':
+            collection, schema, label = settings.fl_anomaly_training_collection, ANOMALY_SCHEMA, None
+            train = self.train_local_anomaly_model
+        elif model_type == 'counterfeit_detection':
+            collection, schema, label = settings.fl_counterfeit_training_collection, COUNTERFEIT_SCHEMA, COUNTERFEIT_LABEL
+            train = self.train_local_counterfeit_model
+        else:
+            return {"error": f"Unknown model type {model_type}"}
         
+        cursor = self.database[collection].find(
+            {'participant_address': participant_address},
+            schema_projection(schema, label),
+            batch_size=settings.fl_feature_chunk_size,
+            limit=limit,
+        )
         try:
-            features = []
-            
-            # Transport duration (normalized to hours)
-            transport_duration = data_point.get('transport_duration', 0) / 3600
-            features.append(transport_duration)
-            
-            # Temperature variance during transport
-            temp_data = data_point.get('temperature_readings', [20])  # Default room temp
-            temp_variance = np.var(temp_data) if len(temp_data) > 1 else 0
-            features.append(temp_variance)
-            
-            # Humidity variance
-            humidity_data = data_point.get('humidity_readings', [50])  # Default 50%
-            humidity_variance = np.var(humidity_data) if len(humidity_data) > 1 else 0
-            features.append(humidity_variance)
-            
-            # Location jumps (unusual geographic movements)
-            location_jumps = data_point.get('location_jumps', 0)
-            features.append(location_jumps)
-            
-            # Participant reputation score
-            participant_reputation = data_point.get('participant_reputation', 100)
-            features.append(participant_reputation)
-            
-            # Product age (days since manufacturing)
-            product_age = data_point.get('product_age_days', 0)
-            features.append(product_age)
-            
-            # Handover frequency (transfers per day)
-            handover_frequency = data_point.get('handover_frequency', 0)
-            features.append(handover_frequency)
-            
-            return features
-            
-        except Exception as e:
-            print(f"Feature extraction error: {e}")
-            return None
+            return await train(participant_address, cursor)
+        finally:
+            await cursor.close()
     
-    def extract_counterfeit_features(self, data_point: Dict[str, Any]) -> Optional[List[float]]:
-        """Extract features for counterfeit detection"""
+    def _swap_global_model(self, model_type: str, model: Any, scaler: Any, record: Dict[str, Any]):
+        # One assignment replaces the whole entry, so a reader holding the old entry keeps a consistent model/scaler pair
+        self.global_models[model_type] = {
+            **self.global_models[model_type],
+            'model': model,
+            'scaler': scaler,
+            'last_updated': datetime.fromtimestamp(record['created_at']),
+            'training_rounds': record.get('training_rounds', 0),
+            'participants_contributed': record.get('participants_contributed', []),
+            'version': record['version']
+        }
+    
+    async def publish_global_model(self, model_type: str, model: Any, scaler: Any, **meta) -> int:
+        """Store a new global model version, make it the active one and swap it in; returns the version"""
+        version = await self.model_store.save(model_type, model, scaler, **meta)
+        await self.model_store.activate(model_type, version)
+        self._swap_global_model(model_type, model, scaler, {'version': version, 'created_at': time.time(), **meta})
+        logger.info("🤖 Global %s model v%s is active", model_type, version)
+        return version
+    
+    async def refresh_global_models(self, force: bool = False):
+        """
+        Load any active_version this process isn't serving yet
         
+        Picks up models published by other workers; checks the pointers at most
+        every FL_MODEL_REFRESH_INTERVAL seconds unless forced.
+        """
+        now = time.monotonic()
+        if not force and now - self._versions_checked_at < settings.fl_model_refresh_interval:
+            return
+        self._versions_checked_at = now
         try:
-            features = []
-            
-            # QR code complexity score
-            qr_complexity = data_point.get('qr_code_complexity', 0.5)
-            features.append(qr_complexity)
-            
-            # Metadata consistency score
-            metadata_consistency = data_point.get('metadata_consistency', 1.0)
-            features.append(metadata_consistency)
-            
-            # Participant verification score
-            verification_score = data_point.get('participant_verification_score', 0.8)
-            features.append(verification_score)
-            
-            # Product history length
-            history_length = data_point.get('product_history_length', 1)
-            features.append(history_length)
-            
-            # Cryptographic signature strength
-            crypto_strength = data_point.get('cryptographic_signature_strength', 0.9)
-            features.append(crypto_strength)
-            
-            # IPFS metadata integrity
-            ipfs_integrity = data_point.get('ipfs_metadata_integrity', 1.0)
-            features.append(ipfs_integrity)
-            
-            # Transport chain consistency
-            chain_consistency = data_point.get('transport_chain_consistency', 1.0)
-            features.append(chain_consistency)
-            
-            return features
-            
+            active = await self.model_store.active_versions()
         except Exception as e:
-            print(f"Feature extraction error: {e}")
-            return None
+            logger.warning("⚠️ Could not read active FL model versions: %s", e)
+            return
+        for model_type, version in active.items():
+            if model_type not in self.global_models or self.global_models[model_type].get('version') == version:
+                continue
+            started = time.perf_counter()
+            loaded = await self.model_store.load(model_type, version)
+            if loaded is None:
+                continue
+            payload, record = loaded
+            self._swap_global_model(model_type, payload['model'], payload['scaler'], record)
+            logger.info("🤖 Loaded global %s model v%s in %.1fms", model_type, version, (time.perf_counter() - started) * 1000)
+    
+    async def activate_global_model(self, model_type: str, version: int) -> Dict[str, Any]:
+        """Serve a stored version of a global model (e.g. roll back to an earlier one)"""
+        loaded = await self.model_store.load(model_type, version)
+        if loaded is None:
+            return {"error": f"No stored {model_type} model version {version}"}
+        payload, record = loaded
+        await self.model_store.activate(model_type, version)
+        self._swap_global_model(model_type, payload['model'], payload['scaler'], record)
+        return {"success": True, "model_type": model_type, "active_version": version}
+    
+    async def _local_models_to_aggregate(self, model_type: str, fields: Dict[str, int]):
+        """
+        First aggregation pass: the trained local models of a type, without their weights, and their pooled scaler
+        
+        Returns (local models, pooled scaler), or ({"error": ...}, None) when
+        there are fewer than FL_AGGREGATION_THRESHOLD.
+        """
+        projection = {'participant_address': 1, 'training_samples': 1, 'scaler_params': 1, **fields}
+        local_models = []
+        scalers = ScalerPool()
+        async for model_doc in self.database.fl_models.find({'model_type': model_type, 'status': 'trained'}, projection):
+            scalers.add(pickle.loads(model_doc.pop('scaler_params')))
+            local_models.append(model_doc)
+        
+        if len(local_models) < settings.fl_aggregation_threshold:
+            return {
+                "error": f"Insufficient models for aggregation. Need {settings.fl_aggregation_threshold}, got {len(local_models)}"
+            }, None
+        return local_models, await fl_executor.infer(scalers.result)
+    
+    async def _stream_local_models(self, local_models: List[Dict[str, Any]], add):
+        """Second aggregation pass: add(model_weights, scaler_params, samples) for one local model document at a time, in an inference thread"""
+        cursor = self.database.fl_models.find(
+            {'_id': {'$in': [model['_id'] for model in local_models]}},
+            {'model_weights': 1, 'scaler_params': 1, 'training_samples': 1},
+            batch_size=1
+        )
+        try:
+            async for model_doc in cursor:
+                await fl_executor.infer(add, model_doc['model_weights'], model_doc['scaler_params'], model_doc['training_samples'])
+        finally:
+            await cursor.close()
+    
+    async def _mark_aggregated(self, local_models: List[Dict[str, Any]]):
+        model_ids = [model['_id'] for model in local_models]
+        await self.database.fl_models.update_many(
+            {'_id': {'$in': model_ids}},
+            {'$set': {'status': 'aggregated'}}
+        )
     
     async def aggregate_anomaly_models(self) -> Dict[str, Any]:
-        """Aggregate local anomaly detection models using federated averaging"""
+        """Aggregate local anomaly detection models by merging their trees into one global forest"""
         
         try:
             # Get all trained local models for anomaly detection
-            cursor = self.database.fl_models.find({
-                'model_type': 'anomaly_detection',
-                'status': 'trained'
-            })
-            
-            local_models = []
-            async for model_doc in cursor:
-                local_models.append(model_doc)
-            
-            if len(local_models) < settings.fl_aggregation_threshold:
-                return {
-                    "error": f"Insufficient models for aggregation. Need {settings.fl_aggregation_threshold}, got {len(local_models)}"
-                }
-            
-            # For Isolation Forest, we'll aggregate by averaging contamination parameters
-            # and retraining on combined feature statistics
+            local_models, global_scaler = await self._local_models_to_aggregate('anomaly_detection', {'anomalies_detected': 1})
+            if global_scaler is None:
+                return local_models
             
             total_samples = sum(model['training_samples'] for model in local_models)
-            weighted_contamination = sum(
-                model['anomalies_detected'] / model['training_samples'] 
-                for model in local_models
-            ) / len(local_models)
+            # Reported only: the merged forest's threshold is the participants' averaged offset_
+            observed_anomaly_rate = sum(model['anomalies_detected'] for model in local_models) / total_samples
+            
+            # Sample each participant's trees in proportion to its data, one local model in memory at a time
+            merger = TreeEnsembleMerger(global_scaler, total_samples)
+            await self._stream_local_models(local_models, merger.add_pickled)
+            global_model = merger.result()
             
             # Update global model
-            global_contamination = max(0.01, min(0.3, weighted_contamination))
-            self.global_models['anomaly_detection']['model'] = IsolationForest(
-                contamination=global_contamination,
-                random_state=42
+            current = self.global_models['anomaly_detection']
+            version = await self.publish_global_model(
+                'anomaly_detection',
+                global_model,
+                global_scaler,
+                training_rounds=current['training_rounds'] + 1,
+                participants_contributed=[model['participant_address'] for model in local_models],
+                metrics={'total_samples': total_samples, 'observed_anomaly_rate': observed_anomaly_rate, 'estimators': len(global_model.estimators_)}
             )
             
-            # Update model metadata
-            self.global_models['anomaly_detection']['last_updated'] = datetime.now()
-            self.global_models['anomaly_detection']['training_rounds'] += 1
-            self.global_models['anomaly_detection']['participants_contributed'] = [
-                model['participant_address'] for model in local_models
-            ]
-            
             # Mark local models as aggregated
-            model_ids = [model['_id'] for model in local_models]
-            await self.database.fl_models.update_many(
-                {'_id': {'$in': model_ids}},
-                {'$set': {'status': 'aggregated'}}
-            )
+            await self._mark_aggregated(local_models)
             
             return {
                 "success": True,
                 "aggregated_models": len(local_models),
                 "total_samples": total_samples,
-                "global_contamination": global_contamination,
-                "training_round": self.global_models['anomaly_detection']['training_rounds']
+                "observed_anomaly_rate": observed_anomaly_rate,
+                "global_estimators": len(global_model.estimators_),
+                "training_round": self.global_models['anomaly_detection']['training_rounds'],
+                "model_version": version
             }
             
         except Exception as e:
@@ -372,63 +444,40 @@ class FederatedLearningService:
         
         try:
             # Get all trained local models for counterfeit detection
-            cursor = self.database.fl_models.find({
-                'model_type': 'counterfeit_detection',
-                'status': 'trained'
-            })
-            
-            local_models = []
-            async for model_doc in cursor:
-                local_models.append(model_doc)
-            
-            if len(local_models) < settings.fl_aggregation_threshold:
-                return {
-                    "error": f"Insufficient models for aggregation. Need {settings.fl_aggregation_threshold}, got {len(local_models)}"
-                }
-            
-            # Federated averaging of neural network weights
-            global_weights = None
-            total_samples = 0
-            
-            for model_doc in local_models:
-                weights = pickle.loads(model_doc['model_weights'])
-                samples = model_doc['training_samples']
-                
-                if global_weights is None:
-                    global_weights = [w * samples for w in weights]
-                else:
-                    for i, w in enumerate(weights):
-                        global_weights[i] += w * samples
-                
-                total_samples += samples
-            
-            # Average the weights
-            global_weights = [w / total_samples for w in global_weights]
+            local_models, global_scaler = await self._local_models_to_aggregate('counterfeit_detection', {'accuracy': 1})
+            if global_scaler is None:
+                return local_models
             
-            # Update global model
-            self.global_models['counterfeit_detection']['model'].set_weights(global_weights)
-            self.global_models['counterfeit_detection']['last_updated'] = datetime.now()
-            self.global_models['counterfeit_detection']['training_rounds'] += 1
-            self.global_models['counterfeit_detection']['participants_contributed'] = [
-                model['participant_address'] for model in local_models
-            ]
+            # Federated averaging of model weights, streamed one participant at a time
+            accumulator = FedAvgAccumulator(global_scaler)
+            await self._stream_local_models(local_models, accumulator.add_pickled)
+            total_samples = accumulator.samples
             
             # Calculate average accuracy
             avg_accuracy = sum(model['accuracy'] for model in local_models) / len(local_models)
             
-            # Mark local models as aggregated
-            model_ids = [model['_id'] for model in local_models]
-            await self.database.fl_models.update_many(
-                {'_id': {'$in': model_ids}},
-                {'$set': {'status': 'aggregated'}}
+            # Update global model: a new model with the averaged weights, swapped in once stored
+            current = self.global_models['counterfeit_detection']
+            global_model = set_weights(self.create_counterfeit_detection_model(), accumulator.result())
+            version = await self.publish_global_model(
+                'counterfeit_detection',
+                global_model,
+                global_scaler,
+                training_rounds=current['training_rounds'] + 1,
+                participants_contributed=[model['participant_address'] for model in local_models],
+                metrics={'total_samples': total_samples, 'average_accuracy': avg_accuracy}
             )
             
+            # Mark local models as aggregated
+            await self._mark_aggregated(local_models)
+            
             return {
                 "success": True,
                 "aggregated_models": len(local_models),
                 "total_samples": total_samples,
                 "average_accuracy": avg_accuracy,
-                "training_round": self.global_models['counterfeit_detection']['training_rounds']
+                "training_round": self.global_models['counterfeit_detection']['training_rounds'],
+                "model_version": version
             }
             
         except Exception as e:
@@ -442,29 +491,27 @@ class FederatedLearningService:
             if not features:
                 return {"error": "Failed to extract features"}
             
-            # Use global model for prediction
-            model = self.global_models['anomaly_detection']['model']
-            scaler = self.global_models['anomaly_detection']['scaler']
+            # Use global model for prediction (one snapshot, in case a new version is swapped in meanwhile)
+            await self.refresh_global_models()
+            global_model = self.global_models['anomaly_detection']
+            model = global_model['model']
+            scaler = global_model['scaler']
             
             # Check if model is trained
-            if not hasattr(model, 'decision_function_'):
+            if not self._model_ready(global_model):
                 return {"error": "Global anomaly model not trained yet"}
             
-            # Normalize features
-            features_scaled = scaler.transform([features])
-            
-            # Get anomaly score and prediction
-            anomaly_score = model.decision_function(features_scaled)[0]
-            is_anomaly = model.predict(features_scaled)[0] == -1
+            # Normalize features, then get anomaly score and prediction (off the event loop)
+            anomaly_score, is_anomaly = await fl_executor.infer(score_anomaly, model, scaler, np.array(features))
             
             # Store anomaly detection result
             anomaly_result = {
                 'product_id': product_data.get('token_id'),
                 'anomaly_score': float(anomaly_score),
                 'is_anomaly': bool(is_anomaly),
-                'features_used': self.global_models['anomaly_detection']['features'],
+                'features_used': global_model['features'],
                 'detected_at': datetime.now(),
-                'model_version': self.global_models['anomaly_detection']['training_rounds']
+                'model_version': global_model['training_rounds']
             }
             
             if is_anomaly:
@@ -474,7 +521,7 @@ class FederatedLearningService:
                 "is_anomaly": bool(is_anomaly),
                 "anomaly_score": float(anomaly_score),
                 "confidence": abs(float(anomaly_score)),
-                "model_version": self.global_models['anomaly_detection']['training_rounds']
+                "model_version": global_model['training_rounds']
             }
             
         except Exception as e:
@@ -488,15 +535,18 @@ class FederatedLearningService:
             if not features:
                 return {"error": "Failed to extract features"}
             
-            # Use global model for prediction
-            model = self.global_models['counterfeit_detection']['model']
-            scaler = self.global_models['counterfeit_detection']['scaler']
+            # Use global model for prediction (one snapshot, in case a new version is swapped in meanwhile)
+            await self.refresh_global_models()
+            global_model = self.global_models['counterfeit_detection']
+            model = global_model['model']
+            scaler = global_model['scaler']
             
-            # Normalize features
-            features_scaled = scaler.transform([features])
+            # Check if model is trained
+            if not self._model_ready(global_model):
+                return {"error": "Global counterfeit model not trained yet"}
             
-            # Get counterfeit probability
-            counterfeit_probability = model.predict(features_scaled)[0][0]
+            # Normalize features, then get counterfeit probability (off the event loop)
+            counterfeit_probability = await fl_executor.infer(predict_counterfeit, model, scaler, np.array(features))
             is_counterfeit = counterfeit_probability > 0.5
             
             # Store counterfeit detection result
@@ -504,9 +554,9 @@ class FederatedLearningService:
                 'product_id': product_data.get('token_id'),
                 'counterfeit_probability': float(counterfeit_probability),
                 'is_counterfeit': bool(is_counterfeit),
-                'features_used': self.global_models['counterfeit_detection']['features'],
+                'features_used': global_model['features'],
                 'detected_at': datetime.now(),
-                'model_version': self.global_models['counterfeit_detection']['training_rounds']
+                'model_version': global_model['training_rounds']
             }
             
             if is_counterfeit:
@@ -516,12 +566,202 @@ class FederatedLearningService:
                 "is_counterfeit": bool(is_counterfeit),
                 "counterfeit_probability": float(counterfeit_probability),
                 "confidence": float(abs(counterfeit_probability - 0.5) * 2),
-                "model_version": self.global_models['counterfeit_detection']['training_rounds']
+                "model_version": global_model['training_rounds']
             }
             
         except Exception as e:
             return {"error": f"Counterfeit detection failed: {e}"}
     
+    @staticmethod
+    def _model_ready(global_model: Dict[str, Any]) -> bool:
+        # The initial global models are unfitted until a first aggregation is published
+        return is_fitted(global_model['model'])
+    
+    @staticmethod
+    def _score_chunk(products: List[Dict[str, Any]], models: Dict[str, Dict[str, Any]]):
+        """
+        Score one chunk of products with each global model as a single matrix (runs in an inference thread)
+        
+        Returns ({model_type: (product rows, scores)}, {model_type: error}).
+        """
+        scored, errors = {}, {}
+        for model_type, global_model in models.items():
+            try:
+                if model_type == 'anomaly_detection':
+                    X, valid = feature_block(ANOMALY_SCHEMA, products)
+                    score_fn = score_anomalies
+                else:
+                    X, valid = feature_block(COUNTERFEIT_SCHEMA, products)
+                    score_fn = predict_counterfeits
+                if not valid.any():
+                    # Nothing scorable in this chunk; the scaler can't transform an empty matrix
+                    scored[model_type] = (np.flatnonzero(valid), np.empty(0, dtype=np.float32))
+                    continue
+                scores = score_fn(global_model['model'], global_model['scaler'], X[valid])
+            except Exception as e:
+                errors[model_type] = f"Batch scoring failed: {e}"
+                continue
+            scored[model_type] = (np.flatnonzero(valid), scores)
+        return scored, errors
+    
+    async def score_products(self, token_ids: Optional[List[str]] = None, query: Optional[Dict[str, Any]] = None, analysis_type: str = "full") -> Dict[str, Any]:
+        """
+        Batch anomaly / counterfeit detection over many products
+        
+        Products matching token_ids and/or query (the whole catalog when both
+        are empty) are read with one cursor and scored a chunk at a time as a
+        matrix. Flagged results go to anomalies / counterfeits with insert_many,
+        and every scored product's last_*_check is set with one bulk_write per
+        chunk - the same fields /api/products/{token_id}/analyze sets. query may
+        only use PRODUCT_FILTER_FIELDS / PRODUCT_FILTER_OPERATORS, and the summary
+        lists at most settings.fl_flagged_report_limit flagged token ids per model.
+        """
+        
+        try:
+            check_product_filter(query or {})
+            # The whole sweep scores with the models active when it starts
+            await self.refresh_global_models()
+            models = {}
+            errors = {}
+            if analysis_type in ("anomaly", "full"):
+                if self._model_ready(self.global_models['anomaly_detection']):
+                    models['anomaly_detection'] = self.global_models['anomaly_detection']
+                else:
+                    errors['anomaly_detection'] = "Global anomaly model not trained yet"
+            if analysis_type in ("counterfeit", "full"):
+                if self._model_ready(self.global_models['counterfeit_detection']):
+                    models['counterfeit_detection'] = self.global_models['counterfeit_detection']
+                else:
+                    errors['counterfeit_detection'] = "Global counterfeit model not trained yet"
+            
+            filter_ = dict(query or {})
+            if token_ids:
+                filter_['token_id'] = {'$in': [str(token_id) for token_id in token_ids]}
+            projection = {**schema_projection(ANOMALY_SCHEMA), **schema_projection(COUNTERFEIT_SCHEMA), 'token_id': 1}
+            
+            summary = {
+                "success": True,
+                "products_scored": 0,
+                "products_skipped": 0,
+                "anomalies_flagged": [],
+                "counterfeits_flagged": [],
+                "anomalies_flagged_total": 0,
+                "counterfeits_flagged_total": 0,
+                "model_versions": {model_type: global_model['training_rounds'] for model_type, global_model in models.items()},
+                "errors": errors
+            }
+            updated_token_ids = []
+            
+            async def score(products: List[Dict[str, Any]]):
+                scored, failed = await fl_executor.infer(self._score_chunk, products, dict(models))
+                # A model that can't score (e.g. not trained) is reported once and skipped for the rest
+                for model_type, error in failed.items():
+                    errors[model_type] = error
+                    del models[model_type]
+                if not scored:
+                    return
+                await self._record_scores(products, scored, models, summary)
+                updated_token_ids.extend(product['token_id'] for product in products if product.get('token_id'))
+            
+            chunk: List[Dict[str, Any]] = []
+            if models:
+                cursor = self.database.products.find(filter_, projection, batch_size=settings.fl_feature_chunk_size)
+                try:
+                    async for product in cursor:
+                        chunk.append(product)
+                        if len(chunk) >= settings.fl_feature_chunk_size:
+                            await score(chunk)
+                            chunk = []
+                            if not models:
+                                break
+                    if chunk and models:
+                        await score(chunk)
+                finally:
+                    await cursor.close()
+            
+            if updated_token_ids:
+                await invalidate_product_views(*updated_token_ids)
+            if not models:
+                summary["success"] = False
+            return summary
+            
+        except Exception as e:
+            return {"error": f"Batch scoring failed: {e}"}
+    
+    async def _record_scores(self, products: List[Dict[str, Any]], scored: Dict[str, Any], models: Dict[str, Dict[str, Any]], summary: Dict[str, Any]):
+        """Write one chunk's flagged detections and per-product check results"""
+        detected_at = datetime.now()
+        checks: Dict[int, Dict[str, Any]] = {}
+        anomalies, counterfeits = [], []
+        
+        if 'anomaly_detection' in scored:
+            rows, scores = scored['anomaly_detection']
+            version = models['anomaly_detection']['training_rounds']
+            features = models['anomaly_detection']['features']
+            for row, anomaly_score in zip(rows.tolist(), scores.tolist()):
+                is_anomaly = anomaly_score < 0
+                token_id = products[row].get('token_id')
+                checks.setdefault(row, {})['last_anomaly_check'] = {
+                    "is_anomaly": is_anomaly,
+                    "anomaly_score": anomaly_score,
+                    "confidence": abs(anomaly_score),
+                    "model_version": version
+                }
+                if is_anomaly:
+                    anomalies.append({
+                        'product_id': token_id,
+                        'anomaly_score': anomaly_score,
+                        'is_anomaly': True,
+                        'features_used': features,
+                        'detected_at': detected_at,
+                        'model_version': version
+                    })
+                    summary["anomalies_flagged_total"] += 1
+                    if len(summary["anomalies_flagged"]) < settings.fl_flagged_report_limit:
+                        summary["anomalies_flagged"].append(token_id)
+        
+        if 'counterfeit_detection' in scored:
+            rows, probabilities = scored['counterfeit_detection']
+            version = models['counterfeit_detection']['training_rounds']
+            features = models['counterfeit_detection']['features']
+            for row, probability in zip(rows.tolist(), probabilities.tolist()):
+                is_counterfeit = probability > 0.5
+                token_id = products[row].get('token_id')
+                checks.setdefault(row, {})['last_counterfeit_check'] = {
+                    "is_counterfeit": is_counterfeit,
+                    "counterfeit_probability": probability,
+                    "confidence": abs(probability - 0.5) * 2,
+                    "model_version": version
+                }
+                if is_counterfeit:
+                    counterfeits.append({
+                        'product_id': token_id,
+                        'counterfeit_probability': probability,
+                        'is_counterfeit': True,
+                        'features_used': features,
+                        'detected_at': detected_at,
+                        'model_version': version
+                    })
+                    summary["counterfeits_flagged_total"] += 1
+                    if len(summary["counterfeits_flagged"]) < settings.fl_flagged_report_limit:
+                        summary["counterfeits_flagged"].append(token_id)
+        
+        writes = []
+        if anomalies:
+            writes.append(self.database.anomalies.insert_many(anomalies, ordered=False))
+        if counterfeits:
+            writes.append(self.database.counterfeits.insert_many(counterfeits, ordered=False))
+        updates = [
+            UpdateOne({'token_id': products[row]['token_id']}, {'$set': fields})
+            for row, fields in checks.items() if products[row].get('token_id')
+        ]
+        if updates:
+            writes.append(self.database.products.bulk_write(updates, ordered=False))
+        await asyncio.gather(*writes)
+        
+        summary["products_scored"] += len(checks)
+        summary["products_skipped"] += len(products) - len(checks)
+    
     async def get_fl_statistics(self) -> Dict[str, Any]:
         """Get federated learning system statistics"""
         
@@ -534,6 +774,8 @@ class FederatedLearningService:
                 'model_type': 'counterfeit_detection'
             })
             
+            await self.refresh_global_models()
+            
             # Count detections
             anomalies_detected = await self.database.anomalies.count_documents({})
             counterfeits_detected = await self.database.counterfeits.count_documents({})
@@ -544,13 +786,15 @@ class FederatedLearningService:
                         "total_models": anomaly_models,
                         "training_rounds": self.global_models['anomaly_detection']['training_rounds'],
                         "last_updated": self.global_models['anomaly_detection']['last_updated'].isoformat(),
-                        "active_participants": len(self.global_models['anomaly_detection']['participants_contributed'])
+                        "active_participants": len(self.global_models['anomaly_detection']['participants_contributed']),
+                        "active_version": self.global_models['anomaly_detection']['version']
                     },
                     "counterfeit_detection": {
                         "total_models": counterfeit_models,
                         "training_rounds": self.global_models['counterfeit_detection']['training_rounds'],
                         "last_updated": self.global_models['counterfeit_detection']['last_updated'].isoformat(),
-                        "active_participants": len(self.global_models['counterfeit_detection']['participants_contributed'])
+                        "active_participants": len(self.global_models['counterfeit_detection']['participants_contributed']),
+                        "active_version": self.global_models['counterfeit_detection']['version']
                     }
                 },
                 "detections": {
@@ -561,3 +805,6 @@ class FederatedLearningService:
             
         except Exception as e:
             return {"error": f"Failed to get FL statistics: {e}"}
+
+
+fl_service = service_registry.register("fl_service", FederatedLearningService())
@@ -2,18 +2,28 @@
 W3Storage IPFS Service - Updated for ChainFLIP Multi-Chain
 Uses Mock Upload when W3Storage credentials are not available
 """
+import asyncio
 import json
 import httpx
-import os
-import subprocess
-import tempfile
 import base64
 import hashlib
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional, Tuple
 from pathlib import Path
+from app.core.cid_cache import cid_cache
 from app.core.config import get_settings
+from app.core.log import get_logger
+from app.services.w3storage_worker import W3StorageWorkerError, w3storage_worker
 
 settings = get_settings()
+logger = get_logger(__name__)
+
+# Public gateways raced alongside settings.ipfs_gateway on a cache miss
+PUBLIC_GATEWAYS = [
+    "https://ipfs.io/ipfs/{cid}",
+    "https://cloudflare-ipfs.com/ipfs/{cid}",
+    "https://gateway.pinata.cloud/ipfs/{cid}",
+    "https://dweb.link/ipfs/{cid}",
+]
 
 class IPFSService:
     def __init__(self):
@@ -25,54 +35,58 @@ class IPFSService:
         # Path to Node.js upload script
         self.script_path = Path(__file__).parent.parent.parent / "w3storage_upload.mjs"
         
+        # Gateway reads share one pooled client; concurrent reads of a CID share one fetch
+        self._client: Optional[httpx.AsyncClient] = None
+        self._inflight: Dict[str, asyncio.Task] = {}
+        
         # Initialize and show credential status
         self._initialize_w3storage()
         
     def _initialize_w3storage(self):
         """Initialize W3Storage service and show credential status"""
-        print(f"🔧 IPFS Service initialized")
+        logger.debug("🔧 IPFS Service initialized")
         
         # Check W3Storage credentials
         has_token = bool(self.w3storage_token and self.w3storage_token.strip())
         has_proof = bool(self.w3storage_proof and self.w3storage_proof.strip())
         
-        print(f"   W3Storage Token: {'✅' if has_token else '❌'}")
-        print(f"   W3Storage Proof: {'✅' if has_proof else '❌'}")
-        print(f"   Script path: {self.script_path}")
+        logger.debug("   W3Storage Token: %s", '✅' if has_token else '❌')
+        logger.debug("   W3Storage Proof: %s", '✅' if has_proof else '❌')
+        logger.debug("   Script path: %s", self.script_path)
         
         if not has_token or not has_proof:
-            print(f"❌ W3Storage credentials missing")
-            print(f"💡 Please check your .env file for W3STORAGE_TOKEN and W3STORAGE_PROOF")
-            print(f"🚨 WARNING: Product creation will FAIL without valid credentials")
+            logger.warning("❌ W3Storage credentials missing")
+            logger.debug("💡 Please check your .env file for W3STORAGE_TOKEN and W3STORAGE_PROOF")
+            logger.warning("🚨 WARNING: Product creation will FAIL without valid credentials")
         else:
-            print(f"✅ W3Storage credentials loaded")
+            logger.info("✅ W3Storage credentials loaded")
             # Quick validation of proof format
             if has_proof:
                 proof_len = len(self.w3storage_proof)
                 if proof_len < 100:
-                    print(f"⚠️ Warning: W3Storage proof seems too short ({proof_len} chars)")
+                    logger.warning("⚠️ Warning: W3Storage proof seems too short (%s chars)", proof_len)
                 elif "Unexpected end of data" in str(self.w3storage_proof):
-                    print(f"⚠️ Warning: W3Storage proof may be corrupted")
+                    logger.warning("⚠️ Warning: W3Storage proof may be corrupted")
                 else:
-                    print(f"✅ W3Storage proof appears valid ({proof_len} chars)")
+                    logger.info("✅ W3Storage proof appears valid (%s chars)", proof_len)
             
-        print(f"🌐 IPFS Gateway: {self.ipfs_gateway}")
+        logger.debug("🌐 IPFS Gateway: %s", self.ipfs_gateway)
         
         # Check if Node.js script exists
         if not self.script_path.exists():
-            print(f"❌ ERROR: W3Storage upload script not found at {self.script_path}")
-            print(f"🚨 WARNING: Product creation will FAIL without upload script")
+            logger.warning("❌ ERROR: W3Storage upload script not found at %s", self.script_path)
+            logger.warning("🚨 WARNING: Product creation will FAIL without upload script")
         else:
-            print(f"✅ W3Storage upload script found")
+            logger.info("✅ W3Storage upload script found")
         
     async def upload_to_ipfs(self, data: Dict[str, Any]) -> str:
         """Upload data to IPFS using W3Storage - FAIL if upload fails"""
         try:
-            print(f"📦 Uploading to IPFS...")
+            logger.debug("📦 Uploading to IPFS...")
             
             # Convert data to JSON
             json_data = json.dumps(data, indent=2)
-            print(f"📄 Content Size: {len(json_data)} bytes")
+            logger.debug("📄 Content Size: %s bytes", len(json_data))
             
             # Check if W3Storage is properly configured
             if not self.w3storage_token or not self.w3storage_proof:
@@ -84,8 +98,11 @@ class IPFSService:
             # Try W3Storage upload - NO FALLBACK TO MOCK
             cid = await self._upload_via_nodejs(data)
             if cid:
-                print(f"✅ W3Storage Upload Success - CID: {cid}")
-                print(f"🔗 IPFS URL: {self.ipfs_gateway}{cid}")
+                logger.info("✅ W3Storage Upload Success - CID: %s", cid)
+                logger.debug("🔗 IPFS URL: %s%s", self.ipfs_gateway, cid)
+                
+                # We know the content behind this CID; later reads never need a gateway
+                await cid_cache.put(cid, json_data.encode("utf-8"))
                 
                 # Test accessibility
                 await self._test_cid_accessibility(cid)
@@ -94,11 +111,43 @@ class IPFSService:
                 raise Exception("W3Storage upload failed - check your credentials and network connection")
             
         except Exception as e:
-            print(f"❌ IPFS Upload Failed: {e}")
-            print(f"🚨 CRITICAL: Product creation will fail because IPFS upload is required")
-            print(f"💡 To fix: Check your W3Storage credentials and network connection")
+            logger.error("❌ IPFS Upload Failed: %s", e)
+            logger.error("🚨 CRITICAL: Product creation will fail because IPFS upload is required")
+            logger.warning("💡 To fix: Check your W3Storage credentials and network connection")
             raise Exception(f"IPFS Upload Failed: {str(e)}")
     
+    async def upload_batch_to_ipfs(self, items: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Upload many metadata documents as one W3Storage directory upload
+        
+        Item i is stored as "<i>.json". Returns {"directory_cid", "items": [...]} where
+        each item has its "path" and the "cid" to reference it by: the file's own
+        CID when the uploader reports it, otherwise "<directory_cid>/<path>"
+        (which resolves through any gateway just the same)
+        """
+        if not items:
+            return {"directory_cid": None, "items": []}
+        if not self.w3storage_token or not self.w3storage_proof:
+            raise Exception("W3Storage credentials are missing. Please check your .env file for W3STORAGE_TOKEN and W3STORAGE_PROOF")
+        
+        files = [(f"{index}.json", json.dumps(item, indent=2).encode("utf-8")) for index, item in enumerate(items)]
+        logger.debug("📦 Uploading %s metadata documents to IPFS as one directory (%s bytes)...", len(files), sum(len(content) for _, content in files))
+        try:
+            result = await w3storage_worker.upload_directory(files, "application/json")
+        except Exception as e:
+            logger.error("❌ IPFS Batch Upload Failed: %s", e)
+            raise Exception(f"IPFS Batch Upload Failed: {str(e)}")
+        
+        directory_cid = result["cid"]
+        uploaded = []
+        for path, content in files:
+            cid = result["entries"].get(path) or f"{directory_cid}/{path}"
+            await cid_cache.put(cid, content)
+            uploaded.append({"path": path, "cid": cid})
+        
+        logger.info("✅ W3Storage Batch Upload Success - directory CID: %s", directory_cid)
+        return {"directory_cid": directory_cid, "items": uploaded}
+    
     async def _mock_upload(self, data: Dict[str, Any]) -> str:
         """Generate a mock CID for testing purposes"""
         try:
@@ -110,122 +159,98 @@ class IPFSService:
             # Create a mock CID that looks realistic
             mock_cid = f"bafybei{hex_dig[:46]}"
             
-            print(f"📦 Mock Upload - Generated CID: {mock_cid}")
-            print(f"🔗 Mock IPFS URL: {self.ipfs_gateway}{mock_cid}")
-            print(f"ℹ️ This is a mock upload for testing purposes")
+            logger.debug("📦 Mock Upload - Generated CID: %s", mock_cid)
+            logger.debug("🔗 Mock IPFS URL: %s%s", self.ipfs_gateway, mock_cid)
+            logger.debug("ℹ️ This is a mock upload for testing purposes")
             
             return mock_cid
             
         except Exception as e:
-            print(f"❌ Mock upload failed: {e}")
+            logger.error("❌ Mock upload failed: %s", e)
             # Fallback to a simple static CID
             return "bafybeigdyrzt5sfp7udm7hu76uh7y26nf3efuylqabf3oclgtqy55fbzdi"
     
     async def _upload_via_nodejs(self, data: Dict[str, Any]) -> Optional[str]:
-        """Upload to W3Storage using Node.js w3up client with improved credential handling"""
+        """Upload to W3Storage through the persistent Node.js w3up worker"""
         try:
-            # Create temporary file with JSON data
-            with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as temp_file:
-                json.dump(data, temp_file, indent=2)
-                temp_file_path = temp_file.name
-            
-            # Create temporary files for credentials to avoid environment variable corruption
-            with tempfile.NamedTemporaryFile(mode='w', suffix='.token', delete=False) as token_file:
-                token_file.write(self.w3storage_token)
-                token_file_path = token_file.name
-            
-            with tempfile.NamedTemporaryFile(mode='w', suffix='.proof', delete=False) as proof_file:
-                proof_file.write(self.w3storage_proof)
-                proof_file_path = proof_file.name
-            
-            try:
-                # Set minimal environment - pass credential file paths instead of content
-                env = os.environ.copy()
-                env['W3STORAGE_TOKEN_FILE'] = token_file_path
-                env['W3STORAGE_PROOF_FILE'] = proof_file_path
-                
-                # Run Node.js script with credential file paths
-                result = subprocess.run([
-                    'node', str(self.script_path), temp_file_path, 'metadata.json'
-                ], 
-                capture_output=True, 
-                text=True, 
-                encoding='utf-8',  # Explicitly use UTF-8 encoding
-                errors='replace',  # Replace any problematic characters
-                env=env,
-                timeout=60  # 60 second timeout
-                )
-                
-                # Log both stdout and stderr for debugging
-                if result.stderr:
-                    print(f"🔍 Node.js stderr: {result.stderr}")
-                
-                if result.returncode == 0:
-                    # Parse the JSON output - the script should output clean JSON to stdout
-                    try:
-                        stdout_clean = result.stdout.strip()
-                        if stdout_clean:
-                            response = json.loads(stdout_clean)
-                            if response.get('success'):
-                                cid = response.get('cid')
-                                print(f"✅ Node.js W3Storage upload success: {cid}")
-                                return cid
-                            else:
-                                error_msg = response.get('error', 'Unknown error')
-                                raise Exception(f"W3Storage upload failed: {error_msg}")
-                        else:
-                            raise Exception("W3Storage script returned empty output")
-                            
-                    except json.JSONDecodeError as e:
-                        print(f"❌ Failed to parse W3Storage response as JSON: {e}")
-                        print(f"📄 Raw stdout: {result.stdout}")
-                        print(f"📄 Raw stderr: {result.stderr}")
-                        raise Exception(f"Failed to parse W3Storage response: {e}. Raw output: {result.stdout}")
-                else:
-                    error_output = result.stderr if result.stderr else "Unknown error"
-                    print(f"❌ W3Storage script failed with return code {result.returncode}")
-                    print(f"📄 stderr: {error_output}")
-                    print(f"📄 stdout: {result.stdout}")
-                    
-                    # Check for common error patterns
-                    if "Unexpected end of data" in error_output:
-                        raise Exception("W3Storage credentials appear to be corrupted during transfer. Using file-based credential passing to avoid corruption.")
-                    elif "ENOTFOUND" in error_output or "network" in error_output.lower():
-                        raise Exception("Network error connecting to W3Storage. Check your internet connection")
-                    else:
-                        raise Exception(f"W3Storage script failed: {error_output}")
-                    
-            finally:
-                # Clean up temporary files
-                try:
-                    os.unlink(temp_file_path)
-                    os.unlink(token_file_path)
-                    os.unlink(proof_file_path)
-                except OSError:
-                    pass
-                    
-        except subprocess.TimeoutExpired:
-            raise Exception("W3Storage script timed out after 60 seconds")
+            cid = await w3storage_worker.upload_json(data, "metadata.json")
+            logger.info("✅ Node.js W3Storage upload success: %s", cid)
+            return cid
+        except W3StorageWorkerError as e:
+            message = str(e)
+            if "Unexpected end of data" in message or "W3STORAGE_PROOF" in message:
+                raise Exception(f"W3Storage credentials appear to be corrupted: {message}")
+            elif "ENOTFOUND" in message or "network" in message.lower():
+                raise Exception("Network error connecting to W3Storage. Check your internet connection")
+            raise
         except Exception as e:
-            raise Exception(f"Error running W3Storage script: {e}")
+            raise Exception(f"Error running W3Storage worker: {e}")
     
     async def _test_cid_accessibility(self, cid: str):
         """Test if CID is accessible via IPFS gateways"""
         try:
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                test_url = f"{self.ipfs_gateway}{cid}"
-                response = await client.head(test_url)
-                
-                if response.status_code == 200:
-                    print(f"✅ CID accessible at: {test_url}")
-                else:
-                    print(f"⚠️ CID not yet accessible: {response.status_code}")
+            test_url = f"{self.ipfs_gateway}{cid}"
+            response = await self._http_client().head(test_url, timeout=10.0)
+            
+            if response.status_code == 200:
+                logger.info("✅ CID accessible at: %s", test_url)
+            else:
+                logger.warning("⚠️ CID not yet accessible: %s", response.status_code)
                     
         except Exception as e:
-            print(f"⚠️ CID accessibility test failed: {e}")
+            logger.warning("⚠️ CID accessibility test failed: %s", e)
+    
+    def _http_client(self) -> httpx.AsyncClient:
+        """Shared pooled client for gateway reads"""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                timeout=settings.ipfs_gateway_timeout,
+                follow_redirects=True,
+                limits=httpx.Limits(max_connections=50, max_keepalive_connections=20),
+            )
+        return self._client
+    
+    def _gateway_urls(self, cid: str) -> List[str]:
+        urls = [f"{self.ipfs_gateway}{cid}"] + [gateway.format(cid=cid) for gateway in PUBLIC_GATEWAYS]
+        return list(dict.fromkeys(urls))
+    
+    async def _fetch_from_gateway(self, url: str) -> Tuple[str, bytes]:
+        response = await self._http_client().get(url)
+        if response.status_code != 200:
+            raise Exception(f"HTTP {response.status_code}")
+        # Metadata is JSON; an HTML error page with a 200 is not a valid answer
+        json.loads(response.content)
+        return url, response.content
+    
+    async def _race_gateways(self, cid: str) -> Optional[bytes]:
+        """Query every gateway at once; first valid response wins, the rest are cancelled"""
+        tasks = [asyncio.create_task(self._fetch_from_gateway(url)) for url in self._gateway_urls(cid)]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                try:
+                    url, content = await next_done
+                except Exception as gateway_error:
+                    logger.warning("⚠️ Gateway error for %s: %s", cid, gateway_error)
+                    continue
+                logger.debug("✅ IPFS Retrieval Success from %s", url)
+                return content
+            return None
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+    
+    async def _fetch(self, cid: str) -> Optional[bytes]:
+        """Fetch a CID once, caching the content (or the failure)"""
+        content = await self._race_gateways(cid)
+        if content is None:
+            cid_cache.put_negative(cid)
+        else:
+            await cid_cache.put(cid, content)
+        return content
     
     async def get_from_ipfs(self, cid: str) -> Dict[str, Any]:
-        """Retrieve data from IPFS using CID"""
+        """Retrieve data from IPFS using CID (local cache first, then all gateways raced)"""
         try:
             # If it's a mock CID, return mock data
             if cid.startswith("bafybei") and len(cid) == 59:
@@ -240,39 +265,31 @@ class IPFSService:
                     }
                 }
             
-            # Try IPFS gateways
-            gateways = [
-                f"https://ipfs.io/ipfs/{cid}",
-                f"https://cloudflare-ipfs.com/ipfs/{cid}",
-                f"https://gateway.pinata.cloud/ipfs/{cid}",
-                f"https://dweb.link/ipfs/{cid}"
-            ]
-            
-            for gateway_url in gateways:
-                try:
-                    async with httpx.AsyncClient(timeout=15.0) as client:
-                        response = await client.get(gateway_url)
-                        
-                        if response.status_code == 200:
-                            data = response.json()
-                            print(f"✅ IPFS Retrieval Success from {gateway_url}")
-                            return data
-                        else:
-                            continue
-                            
-                except Exception as gateway_error:
-                    print(f"⚠️ Gateway {gateway_url} error: {gateway_error}")
-                    continue
+            content = await cid_cache.get(cid)
+            if content is None and not cid_cache.is_negative(cid):
+                # Concurrent lookups of the same CID share one gateway race
+                fetch = self._inflight.get(cid)
+                if fetch is None:
+                    fetch = self._inflight[cid] = asyncio.create_task(self._fetch(cid))
+                    fetch.add_done_callback(lambda _: self._inflight.pop(cid, None))
+                content = await asyncio.shield(fetch)
             
-            return {
-                "cid": cid,
-                "status": "retrieval_failed",
-                "message": f"Unable to retrieve data from IPFS CID: {cid}"
-            }
+            if content is None:
+                return {
+                    "cid": cid,
+                    "status": "retrieval_failed",
+                    "message": f"Unable to retrieve data from IPFS CID: {cid}"
+                }
+            return json.loads(content)
             
         except Exception as e:
-            print(f"❌ IPFS Retrieval Error: {e}")
+            logger.error("❌ IPFS Retrieval Error: %s", e)
             return {"cid": cid, "status": "error", "message": f"IPFS retrieval failed: {e}"}
+    
+    async def close(self):
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
 
 # Global IPFS service instance
 ipfs_service = IPFSService()
\ No newline at end of file
@@ -13,9 +13,14 @@ from web3 import Web3
 from eth_account import Account
 from app.core.config import get_settings
 from app.core.database import get_database
+from app.core.log import get_logger
+from app.core.service_registry import service_registry
+from app.core.tx_pipeline import tx_pipeline
+from app.core.web3_pool import web3_pool
 from app.services.contract_abis import ETHWRAPPER_ABI
 
 settings = get_settings()
+logger = get_logger(__name__)
 
 def convert_decimals_to_float(obj):
     """Recursively convert all Decimal objects to float for MongoDB compatibility"""
@@ -172,15 +177,15 @@ class LayerZeroOFTBridgeService:
         self.web3_connections = {}
         
         # DEBUG: Print what settings are loading
-        print(f"🔍 DEBUG: LayerZero OFT Addresses from settings:")
-        print(f"   Optimism: {settings.chainflip_oft_optimism_sepolia}")
-        print(f"   Arbitrum: {settings.chainflip_oft_arbitrum_sepolia}")
-        print(f"   Base Sepolia: {settings.chainflip_oft_base_sepolia}")
-        print(f"   Amoy: {settings.chainflip_oft_amoy}")
-        print(f"   Wrapper Optimism: {settings.ethwrapper_optimism_sepolia}")
-        print(f"   Wrapper Arbitrum: {settings.ethwrapper_arbitrum_sepolia}")
-        print(f"   Wrapper Base Sepolia: {settings.ethwrapper_base_sepolia}")
-        print(f"   Wrapper Amoy: {settings.ethwrapper_amoy}")
+        logger.debug("🔍 DEBUG: LayerZero OFT Addresses from settings:")
+        logger.debug("   Optimism: %s", settings.chainflip_oft_optimism_sepolia)
+        logger.debug("   Arbitrum: %s", settings.chainflip_oft_arbitrum_sepolia)
+        logger.debug("   Base Sepolia: %s", settings.chainflip_oft_base_sepolia)
+        logger.debug("   Amoy: %s", settings.chainflip_oft_amoy)
+        logger.debug("   Wrapper Optimism: %s", settings.ethwrapper_optimism_sepolia)
+        logger.debug("   Wrapper Arbitrum: %s", settings.ethwrapper_arbitrum_sepolia)
+        logger.debug("   Wrapper Base Sepolia: %s", settings.ethwrapper_base_sepolia)
+        logger.debug("   Wrapper Amoy: %s", settings.ethwrapper_amoy)
         
         # UPDATED: Enhanced LayerZero V2 testnet infrastructure configuration
         self.layerzero_config = {
@@ -270,14 +275,14 @@ class LayerZeroOFTBridgeService:
         deployer_account_info = address_key_manager.get_account_info_for_address('0x032041b4b356fEE1496805DD4749f181bC736FFA')
         if deployer_account_info:
             self.current_account = deployer_account_info['account']
-            print(f"🔑 LayerZero OFT Bridge using account: {self.current_account.address}")
+            logger.debug("🔑 LayerZero OFT Bridge using account: %s", self.current_account.address)
         
         # Initialize chain connections and contracts
         await self._initialize_connections()
         
-        print("✅ LayerZero OFT Bridge Service initialized")
-        print("🔧 CORRECTED: OFT contracts for LayerZero, Wrapper for ETH conversion")
-        print("⚠️ NOTE: Peer connections must be set on OFT contracts!")
+        logger.info("✅ LayerZero OFT Bridge Service initialized")
+        logger.debug("🔧 CORRECTED: OFT contracts for LayerZero, Wrapper for ETH conversion")
+        logger.warning("⚠️ NOTE: Peer connections must be set on OFT contracts!")
 
     async def get_database(self):
         """Get database instance, initialize if needed"""
@@ -289,12 +294,16 @@ class LayerZeroOFTBridgeService:
     async def _initialize_connections(self):
         """Initialize Web3 connections and contract instances"""
         
-        for chain_name, config in self.oft_contracts.items():
+        chain_names = list(self.oft_contracts.keys())
+        for chain_name in chain_names:
+            web3_pool.add_endpoints(chain_name, [self.oft_contracts[chain_name]['rpc']])
+        clients = await asyncio.gather(*(web3_pool.connect(chain_name) for chain_name in chain_names))
+        
+        for chain_name, web3 in zip(chain_names, clients):
+            config = self.oft_contracts[chain_name]
             try:
-                # Initialize Web3 connection
-                web3 = Web3(Web3.HTTPProvider(config['rpc']))
-                
-                if web3.is_connected():
+                # Shared routed Web3 connection
+                if web3:
                     self.web3_connections[chain_name] = web3
                     
                     # Initialize OFT contract for LayerZero operations
@@ -304,7 +313,7 @@ class LayerZeroOFTBridgeService:
                             abi=LAYERZERO_OFT_ABI
                         )
                         self.oft_instances[chain_name] = oft_contract
-                        print(f"✅ Connected to {chain_name} - OFT contract for LayerZero: {config['oft_address']}")
+                        logger.debug("✅ Connected to %s - OFT contract for LayerZero: %s", chain_name, config['oft_address'])
                     
                     # Initialize wrapper contract for deposit/withdraw
                     if config.get('wrapper_address'):
@@ -313,20 +322,20 @@ class LayerZeroOFTBridgeService:
                             abi=ETHWRAPPER_ABI
                         )
                         self.wrapper_instances[chain_name] = wrapper_contract
-                        print(f"   🔧 Wrapper contract for ETH conversion: {config['wrapper_address']}")
+                        logger.debug("   🔧 Wrapper contract for ETH conversion: %s", config['wrapper_address'])
                     
-                    print(f"🔗 LayerZero Endpoint: {config['endpoint']}")
-                    print(f"🆔 LayerZero EID: {config['layerzero_eid']}")
-                    print(f"📚 Send Library: {config.get('send_lib', 'Not configured')}")
-                    print(f"📥 Receive Library: {config.get('receive_lib', 'Not configured')}")
-                    print(f"⚡ Executor: {config.get('executor', 'Not configured')}")
-                    print(f"🔒 DVN: {config.get('dvn', 'Not configured')}")
+                    logger.debug("🔗 LayerZero Endpoint: %s", config['endpoint'])
+                    logger.debug("🆔 LayerZero EID: %s", config['layerzero_eid'])
+                    logger.debug("📚 Send Library: %s", config.get('send_lib', 'Not configured'))
+                    logger.debug("📥 Receive Library: %s", config.get('receive_lib', 'Not configured'))
+                    logger.debug("⚡ Executor: %s", config.get('executor', 'Not configured'))
+                    logger.debug("🔒 DVN: %s", config.get('dvn', 'Not configured'))
                     
                 else:
-                    print(f"❌ Failed to connect to {chain_name}")
+                    logger.warning("❌ Failed to connect to %s", chain_name)
                     
             except Exception as e:
-                print(f"⚠️ Error initializing {chain_name}: {e}")
+                logger.warning("⚠️ Error initializing %s: %s", chain_name, e)
 
     def _create_enhanced_send_param(self, target_config, to_address, amount_wei):
         """Create LayerZero SendParam with correct V2 extraOptions format"""
@@ -364,10 +373,10 @@ class LayerZeroOFTBridgeService:
             b''                             # oftCmd
         )
         
-        print(f"🔧 SendParam created with {format_name} extraOptions: 0x{extra_options.hex()}")
-        print(f"   Target EID: {target_config['layerzero_eid']}")
-        print(f"   Format: {format_name}")
-        print(f"   DVN (infrastructure): {target_config.get('dvn', 'N/A')}")
+        logger.debug("🔧 SendParam created with %s extraOptions: 0x%s", format_name, extra_options.hex())
+        logger.debug("   Target EID: %s", target_config['layerzero_eid'])
+        logger.debug("   Format: %s", format_name)
+        logger.debug("   DVN (infrastructure): %s", target_config.get('dvn', 'N/A'))
         
         return send_param
 
@@ -375,7 +384,7 @@ class LayerZeroOFTBridgeService:
         """Try different extraOptions formats until one works"""
         
         for format_name, extra_options in self.extraoptions_formats:
-            print(f"\n🔄 Trying {format_name} extraOptions: 0x{extra_options.hex()}")
+            logger.debug("\n🔄 Trying %s extraOptions: 0x%s", format_name, extra_options.hex())
             
             # Create send param with this format
             test_send_param = (
@@ -392,7 +401,7 @@ class LayerZeroOFTBridgeService:
                 # Test quoteSend with this format
                 quote_result = oft_contract.functions.quoteSend(test_send_param, False).call()
                 suggested_fee = quote_result[0]
-                print(f"✅ {format_name} quoteSend successful! Fee: {Web3.from_wei(suggested_fee, 'ether')} ETH")
+                logger.debug("✅ %s quoteSend successful! Fee: %s ETH", format_name, Web3.from_wei(suggested_fee, 'ether'))
                 
                 # Test send call
                 oft_contract.functions.send(
@@ -403,17 +412,17 @@ class LayerZeroOFTBridgeService:
                     'from': user_account_address,
                     'value': fixed_fee_wei
                 })
-                print(f"✅ {format_name} send simulation successful!")
+                logger.debug("✅ %s send simulation successful!", format_name)
                 
                 return test_send_param, (suggested_fee, 0), format_name
                 
             except Exception as test_error:
                 error_msg = str(test_error)
-                print(f"❌ {format_name} failed: {error_msg[:100]}...")
+                logger.error("❌ %s failed: %s...", format_name, error_msg[:100])
                 
                 if "0x6780cfaf" not in error_msg:
                     # Different error - might be worth trying
-                    print(f"   Note: Different error type, continuing...")
+                    logger.warning("   Note: Different error type, continuing...")
                 continue
         
         # If all formats failed
@@ -437,7 +446,7 @@ class LayerZeroOFTBridgeService:
             + "0001"  # Required confirmations (1)
         )
         
-        print(f"   DVN Config for {chain_name}: 0x{dvn_config}")
+        logger.debug("   DVN Config for %s: 0x%s", chain_name, dvn_config)
         return dvn_config
 
     async def deposit_eth_for_tokens(
@@ -451,11 +460,11 @@ class LayerZeroOFTBridgeService:
         Consumes real ETH and provides cfWETH at 1:1 ratio
         """
         try:
-            print(f"\n💰 === ETH → cfWETH CONVERSION VIA ETHWrapper ===")
-            print(f"🌐 Chain: {chain}")
-            print(f"👤 User: {user_address}")
-            print(f"💸 Amount: {amount_eth} ETH")
-            print(f"🔧 Method: ETHWrapper.deposit() with real ETH")
+            logger.debug("\n💰 === ETH → cfWETH CONVERSION VIA ETHWrapper ===")
+            logger.debug("🌐 Chain: %s", chain)
+            logger.debug("👤 User: %s", user_address)
+            logger.debug("💸 Amount: %s ETH", amount_eth)
+            logger.debug("🔧 Method: ETHWrapper.deposit() with real ETH")
             
             # Get Web3 and wrapper contract
             web3 = self.web3_connections.get(chain)
@@ -482,11 +491,11 @@ class LayerZeroOFTBridgeService:
             amount_wei = Web3.to_wei(amount_eth, 'ether')
             
             # Check user's ETH balance
-            eth_balance = web3.eth.get_balance(user_account.address)
+            eth_balance = await web3_pool.run(chain, web3.eth.get_balance, user_account.address)
             eth_balance_eth = float(Web3.from_wei(eth_balance, 'ether'))
             
-            print(f"💳 User ETH balance: {eth_balance_eth} ETH")
-            print(f"🎯 Required amount: {amount_eth} ETH")
+            logger.debug("💳 User ETH balance: %s ETH", eth_balance_eth)
+            logger.debug("🎯 Required amount: %s ETH", amount_eth)
             
             if eth_balance_eth < amount_eth:
                 return {"success": False, "error": f"Insufficient ETH balance. Have: {eth_balance_eth} ETH, Need: {amount_eth} ETH"}
@@ -494,38 +503,38 @@ class LayerZeroOFTBridgeService:
             # Check current cfWETH balance before deposit
             oft_contract = self.oft_instances.get(chain)
             if oft_contract:
-                cfweth_balance_before = oft_contract.functions.balanceOf(user_account.address).call()
+                cfweth_balance_before = await web3_pool.run(chain, oft_contract.functions.balanceOf(user_account.address).call)
                 cfweth_balance_before_eth = float(Web3.from_wei(cfweth_balance_before, 'ether'))
-                print(f"💰 User cfWETH balance before: {cfweth_balance_before_eth} cfWETH")
+                logger.debug("💰 User cfWETH balance before: %s cfWETH", cfweth_balance_before_eth)
             
             # Prepare deposit transaction
-            nonce = web3.eth.get_transaction_count(user_account.address)
+            nonce = await web3_pool.run(chain, web3.eth.get_transaction_count, user_account.address)
             
             # Build ETHWrapper.deposit() transaction with ETH value
             transaction = wrapper_contract.functions.deposit().build_transaction({
                 'from': user_account.address,
                 'value': amount_wei,  # This is the key - sending real ETH
                 'gas': 150000,
-                'gasPrice': web3.eth.gas_price,
+                'gasPrice': await web3_pool.run(chain, lambda: web3.eth.gas_price),
                 'nonce': nonce,
-                'chainId': web3.eth.chain_id
+                'chainId': await web3_pool.run(chain, lambda: web3.eth.chain_id)
             })
             
-            print(f"🔧 Transaction prepared - sending {amount_eth} ETH to ETHWrapper.deposit()")
+            logger.debug("🔧 Transaction prepared - sending %s ETH to ETHWrapper.deposit()", amount_eth)
             
             # Sign and send transaction
             signed_txn = web3.eth.account.sign_transaction(transaction, user_account.key)
-            tx_hash = web3.eth.send_raw_transaction(signed_txn.raw_transaction)
-            print(f"📤 ETHWrapper deposit transaction sent: {tx_hash.hex()}")
+            tx_hash = await web3_pool.run(chain, web3.eth.send_raw_transaction, signed_txn.raw_transaction)
+            logger.debug("📤 ETHWrapper deposit transaction sent: %s", tx_hash.hex())
             
             # Wait for transaction receipt
-            receipt = web3.eth.wait_for_transaction_receipt(tx_hash, timeout=300)
+            receipt = await web3_pool.run(chain, web3.eth.wait_for_transaction_receipt, tx_hash, timeout=300, bounded=False)
             
             if receipt.status == 1:
-                print(f"✅ ETH deposit transaction successful!")
+                logger.info("✅ ETH deposit transaction successful!")
                 
                 # Now process the minting using owner account
-                print(f"🔐 Processing owner-mediated minting...")
+                logger.debug("🔐 Processing owner-mediated minting...")
                 
                 # Get owner account info
                 owner_address = "0x032041b4b356fEE1496805DD4749f181bC736FFA"
@@ -537,7 +546,7 @@ class LayerZeroOFTBridgeService:
                 owner_account = owner_account_info['account']
                 
                 # Use owner account to mint tokens directly on OFT contract
-                owner_nonce = web3.eth.get_transaction_count(owner_account.address)
+                owner_nonce = await web3_pool.run(chain, web3.eth.get_transaction_count, owner_account.address)
                 
                 # Call mint function directly on OFT contract as owner
                 mint_transaction = oft_contract.functions.mint(
@@ -546,40 +555,40 @@ class LayerZeroOFTBridgeService:
                 ).build_transaction({
                     'from': owner_account.address,
                     'gas': 200000,
-                    'gasPrice': web3.eth.gas_price,
+                    'gasPrice': await web3_pool.run(chain, lambda: web3.eth.gas_price),
                     'nonce': owner_nonce,
-                    'chainId': web3.eth.chain_id
+                    'chainId': await web3_pool.run(chain, lambda: web3.eth.chain_id)
                 })
                 
                 # Sign and send minting transaction
                 signed_mint_txn = web3.eth.account.sign_transaction(mint_transaction, owner_account.key)
-                mint_tx_hash = web3.eth.send_raw_transaction(signed_mint_txn.raw_transaction)
-                print(f"📤 Owner minting transaction sent: {mint_tx_hash.hex()}")
+                mint_tx_hash = await web3_pool.run(chain, web3.eth.send_raw_transaction, signed_mint_txn.raw_transaction)
+                logger.debug("📤 Owner minting transaction sent: %s", mint_tx_hash.hex())
                 
                 # Wait for minting transaction receipt
-                mint_receipt = web3.eth.wait_for_transaction_receipt(mint_tx_hash, timeout=300)
+                mint_receipt = await web3_pool.run(chain, web3.eth.wait_for_transaction_receipt, mint_tx_hash, timeout=300, bounded=False)
                 
                 if mint_receipt.status == 1:
-                    print(f"✅ Owner-mediated minting successful!")
+                    logger.info("✅ Owner-mediated minting successful!")
                 else:
                     return {"success": False, "error": "Owner minting transaction failed"}
                 
                 # Check new balances
-                new_eth_balance = web3.eth.get_balance(user_account.address)
+                new_eth_balance = await web3_pool.run(chain, web3.eth.get_balance, user_account.address)
                 new_eth_balance_eth = float(Web3.from_wei(new_eth_balance, 'ether'))
                 
                 if oft_contract:
-                    new_cfweth_balance = oft_contract.functions.balanceOf(user_account.address).call()
+                    new_cfweth_balance = await web3_pool.run(chain, oft_contract.functions.balanceOf(user_account.address).call)
                     new_cfweth_balance_eth = float(Web3.from_wei(new_cfweth_balance, 'ether'))
                     cfweth_received = new_cfweth_balance_eth - cfweth_balance_before_eth
                 else:
                     new_cfweth_balance_eth = 0
                     cfweth_received = 0
                 
-                print(f"✅ ETH → cfWETH conversion successful!")
-                print(f"💳 User new ETH balance: {new_eth_balance_eth} ETH")
-                print(f"💰 User new cfWETH balance: {new_cfweth_balance_eth} cfWETH") 
-                print(f"🎁 cfWETH received: {cfweth_received} cfWETH")
+                logger.info("✅ ETH → cfWETH conversion successful!")
+                logger.debug("💳 User new ETH balance: %s ETH", new_eth_balance_eth)
+                logger.debug("💰 User new cfWETH balance: %s cfWETH", new_cfweth_balance_eth) 
+                logger.debug("🎁 cfWETH received: %s cfWETH", cfweth_received)
                 
                 return {
                     "success": True,
@@ -598,7 +607,7 @@ class LayerZeroOFTBridgeService:
                 return {"success": False, "error": "ETHWrapper deposit transaction failed"}
             
         except Exception as e:
-            print(f"❌ Error in deposit_eth_for_tokens: {str(e)}")
+            logger.error("❌ Error in deposit_eth_for_tokens: %s", str(e))
             return {
                 "success": False,
                 "error": str(e)
@@ -648,12 +657,12 @@ class LayerZeroOFTBridgeService:
             recipient_clean = recipient_addr.lower().replace('0x', '').zfill(64)
             recipient_bytes32 = Web3.to_bytes(hexstr=recipient_clean)
             
-            print(f"💸 Calling LayerZero V2 quoteSend on OFT contract for {from_chain} → {to_chain}")
-            print(f"🔗 Source OFT: {source_config['oft_address']}")
-            print(f"🎯 Target EID: {target_config['layerzero_eid']}")
-            print(f"💰 Amount: {amount_wei} wei")
-            print(f"📍 Recipient: {recipient_addr}")
-            print(f"📍 Recipient bytes32: 0x{recipient_clean}")
+            logger.debug("💸 Calling LayerZero V2 quoteSend on OFT contract for %s → %s", from_chain, to_chain)
+            logger.debug("🔗 Source OFT: %s", source_config['oft_address'])
+            logger.debug("🎯 Target EID: %s", target_config['layerzero_eid'])
+            logger.debug("💰 Amount: %s wei", amount_wei)
+            logger.debug("📍 Recipient: %s", recipient_addr)
+            logger.debug("📍 Recipient bytes32: 0x%s", recipient_clean)
             
             # Create LayerZero V2 SendParam struct with proper structure
             # Use the working extraOptions format that works for actual transfers
@@ -669,12 +678,12 @@ class LayerZeroOFTBridgeService:
                 b''                             # oftCmd (bytes) - empty for standard transfer
             )
             
-            print(f"📦 SendParam: dstEid={send_param[0]}, to=0x{send_param[1].hex()}, amount={send_param[2]}, minAmount={send_param[3]}")
+            logger.debug("📦 SendParam: dstEid=%s, to=0x%s, amount=%s, minAmount=%s", send_param[0], send_param[1].hex(), send_param[2], send_param[3])
             
             # First, let's check if the contract has peers set
             try:
-                peer_check = oft_contract.functions.peers(target_config['layerzero_eid']).call()
-                print(f"🔍 Peer check for EID {target_config['layerzero_eid']}: {peer_check}")
+                peer_check = await web3_pool.run(from_chain, oft_contract.functions.peers(target_config['layerzero_eid']).call)
+                logger.debug("🔍 Peer check for EID %s: %s", target_config['layerzero_eid'], peer_check)
                 
                 # Convert both to comparable format
                 if isinstance(peer_check, bytes):
@@ -684,25 +693,25 @@ class LayerZeroOFTBridgeService:
                 
                 expected_peer_hex = target_config['oft_address'].lower().replace('0x', '').zfill(64)
                 
-                print(f"🔍 Peer check hex: {peer_check_hex}")
-                print(f"🔍 Expected hex: {expected_peer_hex}")
+                logger.debug("🔍 Peer check hex: %s", peer_check_hex)
+                logger.debug("🔍 Expected hex: %s", expected_peer_hex)
                 
                 if peer_check_hex != expected_peer_hex:
-                    print(f"⚠️ Peer format difference detected, but may still be correct")
+                    logger.warning("⚠️ Peer format difference detected, but may still be correct")
                     # Don't fail here - peer might be set correctly but in different format
                 else:
-                    print(f"✅ Peer connection verified correctly")
+                    logger.info("✅ Peer connection verified correctly")
                     
             except Exception as peer_error:
-                print(f"⚠️ Could not check peer: {peer_error}")
+                logger.warning("⚠️ Could not check peer: %s", peer_error)
                 # Don't fail the fee estimation if peer check fails
             
             try:
                 # Call quoteSend on OFT contract with proper error handling
-                quote_result = oft_contract.functions.quoteSend(
+                quote_result = await web3_pool.run(from_chain, oft_contract.functions.quoteSend(
                     send_param,                     # _sendParam struct
                     False                           # _payInLzToken
-                ).call()
+                ).call)
                 
                 # Extract fees from the tuple result
                 native_fee_wei = quote_result[0]  # nativeFee
@@ -710,7 +719,7 @@ class LayerZeroOFTBridgeService:
                 
                 native_fee_eth = float(Web3.from_wei(native_fee_wei, 'ether'))
                 
-                print(f"✅ LayerZero V2 quoteSend fee (OFT contract): {native_fee_eth} ETH for {from_chain} → {to_chain}")
+                logger.info("✅ LayerZero V2 quoteSend fee (OFT contract): %s ETH for %s → %s", native_fee_eth, from_chain, to_chain)
                 
                 return {
                     "success": True,
@@ -727,7 +736,7 @@ class LayerZeroOFTBridgeService:
                 
             except Exception as call_error:
                 error_msg = str(call_error)
-                print(f"❌ quoteSend call failed: {error_msg}")
+                logger.error("❌ quoteSend call failed: %s", error_msg)
                 
                 # Try to provide more specific error information
                 if "0x6592671c" in error_msg:
@@ -741,9 +750,9 @@ class LayerZeroOFTBridgeService:
                     return {"success": False, "error": f"quoteSend call failed: {error_msg}"}
                 
         except Exception as e:
-            print(f"❌ Fee estimation error: {e}")
+            logger.error("❌ Fee estimation error: %s", e)
             import traceback
-            print(f"🔍 Full traceback: {traceback.format_exc()}")
+            logger.warning("🔍 Full traceback: %s", traceback.format_exc())
             return {"success": False, "error": f"Fee estimation error: {str(e)}"}
 
     async def transfer_eth_layerzero_oft(
@@ -759,12 +768,12 @@ class LayerZeroOFTBridgeService:
         Execute LayerZero OFT cross-chain ETH transfer
         """
         try:
-            print(f"\n🌉 === LAYERZERO OFT TRANSFER (CORRECTED ARCHITECTURE) ===")
-            print(f"📤 From: {from_chain} ({from_address})")
-            print(f"📥 To: {to_chain} ({to_address})")
-            print(f"💰 Amount: {amount_eth} ETH")
-            print(f"🔗 Escrow ID: {escrow_id}")
-            print(f"🔧 Wrapper for deposit, OFT for LayerZero")
+            logger.debug("\n🌉 === LAYERZERO OFT TRANSFER (CORRECTED ARCHITECTURE) ===")
+            logger.debug("📤 From: %s (%s)", from_chain, from_address)
+            logger.debug("📥 To: %s (%s)", to_chain, to_address)
+            logger.debug("💰 Amount: %s ETH", amount_eth)
+            logger.debug("🔗 Escrow ID: %s", escrow_id)
+            logger.debug("🔧 Wrapper for deposit, OFT for LayerZero")
             
             # Get Web3 instances
             source_web3 = self.web3_connections.get(from_chain)
@@ -798,19 +807,19 @@ class LayerZeroOFTBridgeService:
             user_account = user_account_info['account']
             
             # STEP 1: Always deposit full ETH amount for liquidity pool model
-            print(f"\n💰 === STEP 1: DEPOSIT FULL ETH AMOUNT ===")
+            logger.debug("\n💰 === STEP 1: DEPOSIT FULL ETH AMOUNT ===")
             oft_contract = self.oft_instances[from_chain]
             
             # Check current cfWETH balance (for information only)
-            oft_balance = oft_contract.functions.balanceOf(user_account.address).call()
+            oft_balance = await web3_pool.run(from_chain, oft_contract.functions.balanceOf(user_account.address).call)
             oft_balance_eth = float(Web3.from_wei(oft_balance, 'ether'))
             
-            print(f"💳 User current cfWETH balance: {oft_balance_eth} cfWETH")
-            print(f"💰 ETH amount to deposit: {amount_eth} ETH")
-            print(f"🏦 LIQUIDITY POOL MODEL: Always deposit full ETH amount regardless of existing cfWETH balance")
+            logger.debug("💳 User current cfWETH balance: %s cfWETH", oft_balance_eth)
+            logger.debug("💰 ETH amount to deposit: %s ETH", amount_eth)
+            logger.debug("🏦 LIQUIDITY POOL MODEL: Always deposit full ETH amount regardless of existing cfWETH balance")
             
             # ALWAYS deposit the full ETH amount for liquidity pool model
-            print(f"📥 Depositing {amount_eth} ETH into Wrapper contract...")
+            logger.debug("📥 Depositing %s ETH into Wrapper contract...", amount_eth)
             
             # Use direct OFT provisioning for the full amount
             provision_result = await self.deposit_eth_for_tokens(
@@ -820,29 +829,29 @@ class LayerZeroOFTBridgeService:
             if not provision_result["success"]:
                 return {"success": False, "error": f"Failed to deposit ETH: {provision_result['error']}"}
                 
-            print(f"✅ Successfully deposited {amount_eth} ETH and received cfWETH!")
+            logger.info("✅ Successfully deposited %s ETH and received cfWETH!", amount_eth)
             
             # Re-check balance after deposit
-            new_oft_balance = oft_contract.functions.balanceOf(user_account.address).call()
+            new_oft_balance = await web3_pool.run(from_chain, oft_contract.functions.balanceOf(user_account.address).call)
             new_oft_balance_eth = float(Web3.from_wei(new_oft_balance, 'ether'))
-            print(f"💳 Updated cfWETH balance: {new_oft_balance_eth} cfWETH")
+            logger.debug("💳 Updated cfWETH balance: %s cfWETH", new_oft_balance_eth)
             
             # Verify we have enough cfWETH for the transfer
             if new_oft_balance_eth < amount_eth:
-                print(f"⚠️ After deposit, still insufficient cfWETH for transfer. Using available balance.")
+                logger.warning("⚠️ After deposit, still insufficient cfWETH for transfer. Using available balance.")
                 amount_eth = new_oft_balance_eth  # Use what we have
                 amount_wei = Web3.to_wei(amount_eth, 'ether')
-                print(f"🔧 Adjusted transfer amount: {amount_eth} cfWETH")
+                logger.debug("🔧 Adjusted transfer amount: %s cfWETH", amount_eth)
             else:
-                print(f"✅ Sufficient cfWETH tokens available for transfer: {amount_eth} cfWETH")
+                logger.info("✅ Sufficient cfWETH tokens available for transfer: %s cfWETH", amount_eth)
             
             # STEP 2: Execute LayerZero OFT transfer
-            print(f"\n🚀 === STEP 2: EXECUTE LAYERZERO TRANSFER VIA OFT ===")
+            logger.debug("\n🚀 === STEP 2: EXECUTE LAYERZERO TRANSFER VIA OFT ===")
             
             # Skip fee estimation if it's causing issues, use fixed fee
-            print(f"⚠️ Using fixed fee estimate due to LayerZero endpoint configuration issues")
+            logger.warning("⚠️ Using fixed fee estimate due to LayerZero endpoint configuration issues")
             fixed_fee_wei = Web3.to_wei(0.001, 'ether')  # 0.001 ETH fixed fee
-            print(f"💳 Using fixed LayerZero fee: {Web3.from_wei(fixed_fee_wei, 'ether')} ETH")
+            logger.debug("💳 Using fixed LayerZero fee: %s ETH", Web3.from_wei(fixed_fee_wei, 'ether'))
             
             oft_result = await self._execute_oft_send_with_fixed_fee(
                 source_web3, from_chain, to_chain, user_account, to_address, amount_wei, fixed_fee_wei
@@ -852,8 +861,8 @@ class LayerZeroOFTBridgeService:
                 return {"success": False, "error": f"Failed to execute OFT transfer: {oft_result['error']}"}
             
             # STEP 3: Wait for LayerZero settlement and auto-convert cfWETH to ETH
-            print(f"\n🔄 === STEP 3: WAIT FOR LAYERZERO SETTLEMENT & AUTO-CONVERT ===")
-            print(f"⏳ Waiting for LayerZero transfer to settle on {to_chain}...")
+            logger.debug("\n🔄 === STEP 3: WAIT FOR LAYERZERO SETTLEMENT & AUTO-CONVERT ===")
+            logger.debug("⏳ Waiting for LayerZero transfer to settle on %s...", to_chain)
             
             # Wait for LayerZero transfer to complete on destination chain
             settlement_result = await self._wait_for_layerzero_settlement(
@@ -861,7 +870,7 @@ class LayerZeroOFTBridgeService:
             )
             
             if settlement_result["success"]:
-                print(f"✅ LayerZero transfer settled! Final balance: {settlement_result['final_balance']} cfWETH")
+                logger.info("✅ LayerZero transfer settled! Final balance: %s cfWETH", settlement_result['final_balance'])
                 
                 # Now attempt auto-conversion with correct balance
                 conversion_result = await self._auto_convert_cfweth_to_eth(
@@ -869,18 +878,18 @@ class LayerZeroOFTBridgeService:
                 )
                 
                 if conversion_result["success"]:
-                    print(f"✅ Auto-conversion successful: {amount_eth} cfWETH → ETH")
-                    print(f"🔗 Conversion TX: {conversion_result.get('transaction_hash')}")
+                    logger.info("✅ Auto-conversion successful: %s cfWETH → ETH", amount_eth)
+                    logger.debug("🔗 Conversion TX: %s", conversion_result.get('transaction_hash'))
                 else:
-                    print(f"⚠️ Auto-conversion failed: {conversion_result.get('error')}")
-                    print(f"💡 User can manually convert cfWETH to ETH later")
+                    logger.warning("⚠️ Auto-conversion failed: %s", conversion_result.get('error'))
+                    logger.debug("💡 User can manually convert cfWETH to ETH later")
             else:
-                print(f"⚠️ LayerZero settlement timeout: {settlement_result.get('error')}")
-                print(f"💡 Tokens may still arrive later. User can manually convert when ready.")
+                logger.warning("⚠️ LayerZero settlement timeout: %s", settlement_result.get('error'))
+                logger.debug("💡 Tokens may still arrive later. User can manually convert when ready.")
                 conversion_result = {"success": False, "error": "LayerZero settlement timeout"}
 
             # STEP 4: Record transfer in database
-            print(f"\n📊 === STEP 4: RECORD TRANSFER ===")
+            logger.debug("\n📊 === STEP 4: RECORD TRANSFER ===")
             transfer_record = {
                 "transfer_id": escrow_id,
                 "from_chain": from_chain,
@@ -908,15 +917,15 @@ class LayerZeroOFTBridgeService:
             # Save to database
             try:
                 await self.database.transfers.insert_one(transfer_record)
-                print(f"✅ Transfer recorded in database")
+                logger.info("✅ Transfer recorded in database")
             except Exception as e:
-                print(f"⚠️ Warning: Failed to record transfer in database: {e}")
+                logger.warning("⚠️ Warning: Failed to record transfer in database: %s", e)
             
-            print(f"\n🎉 === LAYERZERO OFT TRANSFER COMPLETED ===")
-            print(f"✅ Corrected architecture transfer successful!")
-            print(f"🔗 Source TX: {oft_result.get('transaction_hash')}")
-            print(f"💰 Amount bridged: {amount_eth} ETH")
-            print(f"🔧 Architecture: Wrapper for deposit, OFT for LayerZero")
+            logger.info("\n🎉 === LAYERZERO OFT TRANSFER COMPLETED ===")
+            logger.info("✅ Corrected architecture transfer successful!")
+            logger.debug("🔗 Source TX: %s", oft_result.get('transaction_hash'))
+            logger.debug("💰 Amount bridged: %s ETH", amount_eth)
+            logger.debug("🔧 Architecture: Wrapper for deposit, OFT for LayerZero")
             
             return {
                 "success": True,
@@ -933,7 +942,7 @@ class LayerZeroOFTBridgeService:
             }
             
         except Exception as e:
-            print(f"❌ LayerZero OFT transfer error: {e}")
+            logger.error("❌ LayerZero OFT transfer error: %s", e)
             return {"success": False, "error": str(e)}
 
     async def _execute_oft_send_with_fixed_fee(
@@ -951,11 +960,11 @@ class LayerZeroOFTBridgeService:
             source_config = self.oft_contracts[from_chain]
             target_config = self.oft_contracts[to_chain]
             
-            print(f"🔗 Enhanced OFT Send: {from_chain} → {to_chain}")
-            print(f"📍 Source OFT: {source_config['oft_address']}")
-            print(f"📍 Target OFT: {target_config['oft_address']}")
-            print(f"🔧 DVN: {target_config.get('dvn', 'N/A')}")
-            print(f"⚡ Executor: {target_config.get('executor', 'N/A')}")
+            logger.debug("🔗 Enhanced OFT Send: %s → %s", from_chain, to_chain)
+            logger.debug("📍 Source OFT: %s", source_config['oft_address'])
+            logger.debug("📍 Target OFT: %s", target_config['oft_address'])
+            logger.debug("🔧 DVN: %s", target_config.get('dvn', 'N/A'))
+            logger.debug("⚡ Executor: %s", target_config.get('executor', 'N/A'))
             
             oft_contract = web3.eth.contract(
                 address=source_config['oft_address'],
@@ -963,18 +972,18 @@ class LayerZeroOFTBridgeService:
             )
             
             # Enhanced debugging: Check peer connections
-            print(f"\n🔍 === VERIFYING PEER CONNECTIONS ===")
+            logger.debug("\n🔍 === VERIFYING PEER CONNECTIONS ===")
             try:
-                peer_result = oft_contract.functions.peers(target_config['layerzero_eid']).call()
+                peer_result = await web3_pool.run(from_chain, oft_contract.functions.peers(target_config['layerzero_eid']).call)
                 expected_peer = target_config['oft_address'].lower().replace('0x', '').zfill(64)
                 actual_peer = peer_result.hex() if isinstance(peer_result, bytes) else str(peer_result).replace('0x', '').zfill(64)
                 
-                print(f"🎯 Target EID: {target_config['layerzero_eid']}")
-                print(f"📍 Expected peer: 0x{expected_peer}")
-                print(f"📍 Actual peer: 0x{actual_peer}")
+                logger.debug("🎯 Target EID: %s", target_config['layerzero_eid'])
+                logger.debug("📍 Expected peer: 0x%s", expected_peer)
+                logger.debug("📍 Actual peer: 0x%s", actual_peer)
                 
                 if actual_peer.lower() == expected_peer.lower():
-                    print(f"✅ Peer connection verified correctly")
+                    logger.info("✅ Peer connection verified correctly")
                 else:
                     return {"success": False, "error": f"Peer not set correctly. Expected: {expected_peer}, Got: {actual_peer}"}
                     
@@ -983,19 +992,19 @@ class LayerZeroOFTBridgeService:
             
             # Check user token balance
             # Check user token balance and ETH balance
-            user_balance = oft_contract.functions.balanceOf(user_account.address).call()
+            user_balance = await web3_pool.run(from_chain, oft_contract.functions.balanceOf(user_account.address).call)
             user_balance_eth = float(Web3.from_wei(user_balance, 'ether'))
             transfer_amount_eth = float(Web3.from_wei(amount_wei, 'ether'))
             
             # Check ETH balance for gas fees
-            eth_balance = web3.eth.get_balance(user_account.address)
+            eth_balance = await web3_pool.run(from_chain, web3.eth.get_balance, user_account.address)
             eth_balance_eth = float(Web3.from_wei(eth_balance, 'ether'))
             
-            print(f"\n💰 Balance Check:")
-            print(f"   cfWETH balance: {user_balance_eth} cfWETH")
-            print(f"   ETH balance: {eth_balance_eth} ETH")
-            print(f"   Transfer amount: {transfer_amount_eth} cfWETH")
-            print(f"   LayerZero fee: {Web3.from_wei(fixed_fee_wei, 'ether')} ETH")
+            logger.debug("\n💰 Balance Check:")
+            logger.debug("   cfWETH balance: %s cfWETH", user_balance_eth)
+            logger.debug("   ETH balance: %s ETH", eth_balance_eth)
+            logger.debug("   Transfer amount: %s cfWETH", transfer_amount_eth)
+            logger.debug("   LayerZero fee: %s ETH", Web3.from_wei(fixed_fee_wei, 'ether'))
             
             if user_balance < amount_wei:
                 return {"success": False, "error": f"Insufficient cfWETH balance. Have: {user_balance_eth}, Need: {transfer_amount_eth}"}
@@ -1004,18 +1013,18 @@ class LayerZeroOFTBridgeService:
                 return {"success": False, "error": f"Insufficient ETH for LayerZero fee. Have: {eth_balance_eth}, Need: {Web3.from_wei(fixed_fee_wei, 'ether')} ETH"}
             
             # Use auto-format detection send param creation
-            print(f"\n🔧 === CREATING SEND PARAM WITH AUTO-FORMAT DETECTION ===")
+            logger.debug("\n🔧 === CREATING SEND PARAM WITH AUTO-FORMAT DETECTION ===")
             send_param = self._create_enhanced_send_param(target_config, to_address, amount_wei)
             
             # Auto-detect working extraOptions format
-            print(f"\n💰 === AUTO-DETECTING WORKING EXTRAOPTIONS FORMAT ===")
+            logger.debug("\n💰 === AUTO-DETECTING WORKING EXTRAOPTIONS FORMAT ===")
             
             working_send_param, working_fee, working_format = self._try_alternative_extraoptions(
                 oft_contract, send_param, (fixed_fee_wei, 0), user_account.address, fixed_fee_wei
             )
             
             if working_send_param is None:
-                print(f"❌ All extraOptions formats failed")
+                logger.warning("❌ All extraOptions formats failed")
                 return {
                     "success": False, 
                     "error": "All extraOptions formats failed. LayerZero V2 testnet may have specific requirements.",
@@ -1023,12 +1032,12 @@ class LayerZeroOFTBridgeService:
                     "formats_tried": [f[0] for f in self.extraoptions_formats]
                 }
             
-            print(f"🎉 Found working format: {working_format}")
+            logger.info("🎉 Found working format: %s", working_format)
             send_param = working_send_param
             
             # Use the exact fee from quoteSend
             actual_fee_wei = working_fee[0]
-            print(f"💰 Using actual quoteSend fee: {Web3.from_wei(actual_fee_wei, 'ether')} ETH")
+            logger.debug("💰 Using actual quoteSend fee: %s ETH", Web3.from_wei(actual_fee_wei, 'ether'))
             
             # Check ETH balance against actual fee
             if eth_balance < actual_fee_wei:
@@ -1037,8 +1046,8 @@ class LayerZeroOFTBridgeService:
             messaging_fee = working_fee
             
             # Execute the transaction with working configuration
-            print(f"\n📤 === EXECUTING TRANSACTION WITH {working_format.upper()} FORMAT ===")
-            nonce = web3.eth.get_transaction_count(user_account.address)
+            logger.debug("\n📤 === EXECUTING TRANSACTION WITH %s FORMAT ===", working_format.upper())
+            nonce = await web3_pool.run(from_chain, web3.eth.get_transaction_count, user_account.address)
             
             transaction = oft_contract.functions.send(
                 send_param,
@@ -1048,36 +1057,36 @@ class LayerZeroOFTBridgeService:
                 'from': user_account.address,
                 'value': actual_fee_wei,  # Use exact fee from quoteSend
                 'gas': 2000000,  # Increased gas for complex LayerZero operations
-                'gasPrice': web3.eth.gas_price,
+                'gasPrice': await web3_pool.run(from_chain, lambda: web3.eth.gas_price),
                 'nonce': nonce,
-                'chainId': web3.eth.chain_id
+                'chainId': await web3_pool.run(from_chain, lambda: web3.eth.chain_id)
             })
             
-            print(f"💰 Transaction details:")
-            print(f"   Value (LayerZero fee): {Web3.from_wei(transaction['value'], 'ether')} ETH")
-            print(f"   Gas: {transaction['gas']}")
-            print(f"   Format: {working_format}")
+            logger.debug("💰 Transaction details:")
+            logger.debug("   Value (LayerZero fee): %s ETH", Web3.from_wei(transaction['value'], 'ether'))
+            logger.debug("   Gas: %s", transaction['gas'])
+            logger.debug("   Format: %s", working_format)
             
             # Sign and send auto-detected transaction
-            print(f"✍️ Signing and sending {working_format} transaction...")
+            logger.debug("✍️ Signing and sending %s transaction...", working_format)
             signed_txn = web3.eth.account.sign_transaction(transaction, user_account.key)
-            tx_hash = web3.eth.send_raw_transaction(signed_txn.raw_transaction)
-            print(f"📤 {working_format} transaction sent: {tx_hash.hex()}")
+            tx_hash = await web3_pool.run(from_chain, web3.eth.send_raw_transaction, signed_txn.raw_transaction)
+            logger.debug("📤 %s transaction sent: %s", working_format, tx_hash.hex())
             
             # Wait for receipt with enhanced debugging
-            print(f"⏳ Waiting for {working_format} transaction confirmation...")
+            logger.debug("⏳ Waiting for %s transaction confirmation...", working_format)
             try:
-                receipt = web3.eth.wait_for_transaction_receipt(tx_hash, timeout=300)
+                receipt = await web3_pool.run(from_chain, web3.eth.wait_for_transaction_receipt, tx_hash, timeout=300, bounded=False)
                 
-                print(f"📋 Transaction Receipt Details:")
-                print(f"   Status: {receipt.status}")
-                print(f"   Gas Used: {receipt.gasUsed}")
-                print(f"   Gas Limit: {transaction['gas']}")
-                print(f"   Block Number: {receipt.blockNumber}")
-                print(f"   Logs Count: {len(receipt.logs)}")
+                logger.debug("📋 Transaction Receipt Details:")
+                logger.debug("   Status: %s", receipt.status)
+                logger.debug("   Gas Used: %s", receipt.gasUsed)
+                logger.debug("   Gas Limit: %s", transaction['gas'])
+                logger.debug("   Block Number: %s", receipt.blockNumber)
+                logger.debug("   Logs Count: %s", len(receipt.logs))
                 
                 if receipt.status == 1:
-                    print(f"✅ {working_format} OFT send successful!")
+                    logger.info("✅ %s OFT send successful!", working_format)
                     
                     return {
                         "success": True,
@@ -1091,12 +1100,12 @@ class LayerZeroOFTBridgeService:
                         "resolution": "extraOptions format auto-detection successful"
                     }
                 else:
-                    print(f"❌ {working_format} transaction REVERTED!")
-                    print(f"   Potential causes:")
-                    print(f"   1. Out of gas (used: {receipt.gasUsed}/{transaction['gas']})")
-                    print(f"   2. Insufficient balance or allowance")
-                    print(f"   3. Peer connection mismatch")
-                    print(f"   4. Insufficient LayerZero fee")
+                    logger.warning("❌ %s transaction REVERTED!", working_format)
+                    logger.debug("   Potential causes:")
+                    logger.debug("   1. Out of gas (used: %s/%s)", receipt.gasUsed, transaction['gas'])
+                    logger.debug("   2. Insufficient balance or allowance")
+                    logger.debug("   3. Peer connection mismatch")
+                    logger.debug("   4. Insufficient LayerZero fee")
                     
                     # Check if transaction ran out of gas
                     gas_used_percentage = (receipt.gasUsed / transaction['gas']) * 100
@@ -1109,9 +1118,9 @@ class LayerZeroOFTBridgeService:
                 return {"success": False, "error": f"{working_format} transaction receipt error: {receipt_error}"}
                 
         except Exception as e:
-            print(f"❌ Auto-detection OFT send error: {e}")
+            logger.error("❌ Auto-detection OFT send error: %s", e)
             import traceback
-            print(f"🔍 Full error traceback: {traceback.format_exc()}")
+            logger.warning("🔍 Full error traceback: %s", traceback.format_exc())
             return {"success": False, "error": str(e)}
 
     def _get_revert_reason(self, web3: Web3, tx_hash: str) -> str:
@@ -1141,7 +1150,7 @@ class LayerZeroOFTBridgeService:
         Automatically convert cfWETH to ETH for the recipient after successful bridge
         """
         try:
-            print(f"🔄 Auto-converting {amount_eth} cfWETH → ETH for {recipient_address}")
+            logger.debug("🔄 Auto-converting %s cfWETH → ETH for %s", amount_eth, recipient_address)
             
             # Get Web3 and wrapper contract
             web3 = self.web3_connections.get(chain)
@@ -1160,36 +1169,36 @@ class LayerZeroOFTBridgeService:
             await asyncio.sleep(2)
             
             # Get fresh balance
-            cfweth_balance = oft_contract.functions.balanceOf(recipient_address).call()
+            cfweth_balance = await web3_pool.run(chain, oft_contract.functions.balanceOf(recipient_address).call)
             cfweth_balance_eth = float(Web3.from_wei(cfweth_balance, 'ether'))
             
-            print(f"💰 Recipient cfWETH balance (post-settlement): {cfweth_balance_eth} cfWETH")
-            print(f"🎯 Required for conversion: {amount_eth} cfWETH")
+            logger.debug("💰 Recipient cfWETH balance (post-settlement): %s cfWETH", cfweth_balance_eth)
+            logger.debug("🎯 Required for conversion: %s cfWETH", amount_eth)
             
             if cfweth_balance_eth < amount_eth:
                 return {"success": False, "error": f"Insufficient cfWETH balance for conversion. Have: {cfweth_balance_eth}, Need: {amount_eth}"}
             
-            print(f"✅ Sufficient balance available for auto-conversion")
+            logger.info("✅ Sufficient balance available for auto-conversion")
             
             # Use deployer account to perform conversion on behalf of recipient
             amount_wei = Web3.to_wei(amount_eth, 'ether')
             
             # First, transfer cfWETH from recipient to deployer
-            print(f"📤 Step 1: Transfer cfWETH from recipient to deployer for conversion")
+            logger.debug("📤 Step 1: Transfer cfWETH from recipient to deployer for conversion")
             
             # Get recipient account info for signing
             from app.services.multi_account_manager import address_key_manager
             recipient_account_info = address_key_manager.get_account_info_for_address(recipient_address)
             
             if not recipient_account_info:
-                print(f"⚠️ No private key for recipient. Using deployer to mint and convert directly.")
+                logger.warning("⚠️ No private key for recipient. Using deployer to mint and convert directly.")
                 # Alternative: Deployer mints equivalent ETH directly to recipient
                 return await self._deployer_direct_eth_transfer(web3, recipient_address, amount_eth)
             
             recipient_account = recipient_account_info['account']
             
             # Transfer cfWETH from recipient to deployer
-            nonce = web3.eth.get_transaction_count(recipient_account.address)
+            nonce = await web3_pool.run(chain, web3.eth.get_transaction_count, recipient_account.address)
             
             transfer_tx = oft_contract.functions.transfer(
                 self.current_account.address,  # deployer
@@ -1197,62 +1206,62 @@ class LayerZeroOFTBridgeService:
             ).build_transaction({
                 'from': recipient_account.address,
                 'gas': 100000,
-                'gasPrice': web3.eth.gas_price,
+                'gasPrice': await web3_pool.run(chain, lambda: web3.eth.gas_price),
                 'nonce': nonce,
-                'chainId': web3.eth.chain_id
+                'chainId': await web3_pool.run(chain, lambda: web3.eth.chain_id)
             })
             
             signed_transfer = web3.eth.account.sign_transaction(transfer_tx, recipient_account.key)
-            transfer_hash = web3.eth.send_raw_transaction(signed_transfer.raw_transaction)
-            transfer_receipt = web3.eth.wait_for_transaction_receipt(transfer_hash, timeout=300)
+            transfer_hash = await web3_pool.run(chain, web3.eth.send_raw_transaction, signed_transfer.raw_transaction)
+            transfer_receipt = await web3_pool.run(chain, web3.eth.wait_for_transaction_receipt, transfer_hash, timeout=300, bounded=False)
             
             if transfer_receipt.status != 1:
                 return {"success": False, "error": "Failed to transfer cfWETH to deployer for conversion"}
             
-            print(f"✅ cfWETH transferred to deployer: {transfer_hash.hex()}")
+            logger.info("✅ cfWETH transferred to deployer: %s", transfer_hash.hex())
             
             # Step 2: Deployer withdraws cfWETH to get ETH
-            print(f"💰 Step 2: Deployer withdraws cfWETH to ETH")
+            logger.debug("💰 Step 2: Deployer withdraws cfWETH to ETH")
             
-            deployer_nonce = web3.eth.get_transaction_count(self.current_account.address)
+            deployer_nonce = await web3_pool.run(chain, web3.eth.get_transaction_count, self.current_account.address)
             
             withdraw_tx = wrapper_contract.functions.withdraw(amount_wei).build_transaction({
                 'from': self.current_account.address,
                 'gas': 150000,
-                'gasPrice': web3.eth.gas_price,
+                'gasPrice': await web3_pool.run(chain, lambda: web3.eth.gas_price),
                 'nonce': deployer_nonce,
-                'chainId': web3.eth.chain_id
+                'chainId': await web3_pool.run(chain, lambda: web3.eth.chain_id)
             })
             
             signed_withdraw = web3.eth.account.sign_transaction(withdraw_tx, self.current_account.key)
-            withdraw_hash = web3.eth.send_raw_transaction(signed_withdraw.raw_transaction)
-            withdraw_receipt = web3.eth.wait_for_transaction_receipt(withdraw_hash, timeout=300)
+            withdraw_hash = await web3_pool.run(chain, web3.eth.send_raw_transaction, signed_withdraw.raw_transaction)
+            withdraw_receipt = await web3_pool.run(chain, web3.eth.wait_for_transaction_receipt, withdraw_hash, timeout=300, bounded=False)
             
             if withdraw_receipt.status != 1:
                 return {"success": False, "error": "Failed to withdraw cfWETH to ETH"}
             
-            print(f"✅ cfWETH withdrawn to ETH: {withdraw_hash.hex()}")
+            logger.info("✅ cfWETH withdrawn to ETH: %s", withdraw_hash.hex())
             
             # Step 3: Send ETH to recipient
-            print(f"📤 Step 3: Send ETH to recipient")
+            logger.debug("📤 Step 3: Send ETH to recipient")
             
-            final_nonce = web3.eth.get_transaction_count(self.current_account.address)
+            final_nonce = await web3_pool.run(chain, web3.eth.get_transaction_count, self.current_account.address)
             
             eth_transfer_tx = {
                 'to': recipient_address,
                 'value': amount_wei,
                 'gas': 21000,
-                'gasPrice': web3.eth.gas_price,
+                'gasPrice': await web3_pool.run(chain, lambda: web3.eth.gas_price),
                 'nonce': final_nonce,
-                'chainId': web3.eth.chain_id
+                'chainId': await web3_pool.run(chain, lambda: web3.eth.chain_id)
             }
             
             signed_eth_transfer = web3.eth.account.sign_transaction(eth_transfer_tx, self.current_account.key)
-            eth_hash = web3.eth.send_raw_transaction(signed_eth_transfer.raw_transaction)
-            eth_receipt = web3.eth.wait_for_transaction_receipt(eth_hash, timeout=300)
+            eth_hash = await web3_pool.run(chain, web3.eth.send_raw_transaction, signed_eth_transfer.raw_transaction)
+            eth_receipt = await web3_pool.run(chain, web3.eth.wait_for_transaction_receipt, eth_hash, timeout=300, bounded=False)
             
             if eth_receipt.status == 1:
-                print(f"✅ Auto-conversion complete: {amount_eth} ETH sent to {recipient_address}")
+                logger.info("✅ Auto-conversion complete: %s ETH sent to %s", amount_eth, recipient_address)
                 return {
                     "success": True,
                     "transaction_hash": eth_hash.hex(),
@@ -1267,27 +1276,27 @@ class LayerZeroOFTBridgeService:
                 return {"success": False, "error": "Failed to send ETH to recipient"}
                 
         except Exception as e:
-            print(f"❌ Auto-conversion error: {e}")
+            logger.error("❌ Auto-conversion error: %s", e)
             return {"success": False, "error": f"Auto-conversion failed: {str(e)}"}
 
     async def _deployer_direct_eth_transfer(self, web3: Web3, recipient_address: str, amount_eth: float) -> Dict[str, Any]:
         """Fallback: Deployer sends ETH directly to recipient"""
         try:
             amount_wei = Web3.to_wei(amount_eth, 'ether')
-            nonce = web3.eth.get_transaction_count(self.current_account.address)
+            nonce = await web3_pool.run(web3_pool.chain_of(web3), web3.eth.get_transaction_count, self.current_account.address)
             
             tx = {
                 'to': recipient_address,
                 'value': amount_wei,
                 'gas': 21000,
-                'gasPrice': web3.eth.gas_price,
+                'gasPrice': await web3_pool.run(web3_pool.chain_of(web3), lambda: web3.eth.gas_price),
                 'nonce': nonce,
-                'chainId': web3.eth.chain_id
+                'chainId': await web3_pool.run(web3_pool.chain_of(web3), lambda: web3.eth.chain_id)
             }
             
             signed_tx = web3.eth.account.sign_transaction(tx, self.current_account.key)
-            tx_hash = web3.eth.send_raw_transaction(signed_tx.raw_transaction)
-            receipt = web3.eth.wait_for_transaction_receipt(tx_hash, timeout=300)
+            tx_hash = await web3_pool.run(web3_pool.chain_of(web3), web3.eth.send_raw_transaction, signed_tx.raw_transaction)
+            receipt = await web3_pool.run(web3_pool.chain_of(web3), web3.eth.wait_for_transaction_receipt, tx_hash, timeout=300, bounded=False)
             
             if receipt.status == 1:
                 return {
@@ -1314,11 +1323,11 @@ class LayerZeroOFTBridgeService:
         This method is specifically for supply chain coordination messages
         """
         try:
-            print(f"\n🌐 === SENDING CROSS-CHAIN MESSAGE VIA LAYERZERO ===")
-            print(f"📤 From: {source_chain}")
-            print(f"📥 To: {target_chain}")
-            print(f"👤 Recipient: {recipient_address}")
-            print(f"📋 Message Type: {message_data.get('type', 'Unknown')}")
+            logger.debug("\n🌐 === SENDING CROSS-CHAIN MESSAGE VIA LAYERZERO ===")
+            logger.debug("📤 From: %s", source_chain)
+            logger.debug("📥 To: %s", target_chain)
+            logger.debug("👤 Recipient: %s", recipient_address)
+            logger.debug("📋 Message Type: %s", message_data.get('type', 'Unknown'))
             
             # Get Web3 instances and configurations
             source_web3 = self.web3_connections.get(source_chain)
@@ -1335,7 +1344,7 @@ class LayerZeroOFTBridgeService:
             # Encode message data as bytes for LayerZero
             import json
             message_bytes = json.dumps(message_data).encode('utf-8')
-            print(f"📦 Message size: {len(message_bytes)} bytes")
+            logger.debug("📦 Message size: %s bytes", len(message_bytes))
             
             # Convert recipient address to bytes32 format
             recipient_clean = recipient_address.lower().replace('0x', '').zfill(64)
@@ -1366,12 +1375,12 @@ class LayerZeroOFTBridgeService:
             
             # Estimate fee for the message
             try:
-                quote_result = oft_contract.functions.quoteSend(send_param, False).call()
+                quote_result = await web3_pool.run(source_chain, oft_contract.functions.quoteSend(send_param, False).call)
                 messaging_fee_wei = quote_result[0]
                 messaging_fee_eth = float(Web3.from_wei(messaging_fee_wei, 'ether'))
-                print(f"💰 LayerZero messaging fee: {messaging_fee_eth} ETH")
+                logger.debug("💰 LayerZero messaging fee: %s ETH", messaging_fee_eth)
             except Exception as fee_error:
-                print(f"⚠️ Fee estimation failed, using fixed fee: {fee_error}")
+                logger.warning("⚠️ Fee estimation failed, using fixed fee: %s", fee_error)
                 messaging_fee_wei = Web3.to_wei(0.001, 'ether')  # Fixed fee fallback
                 messaging_fee_eth = 0.001
             
@@ -1380,18 +1389,18 @@ class LayerZeroOFTBridgeService:
                 return {"success": False, "error": "No account available for message sending"}
             
             # Check deployer ETH balance for fees
-            deployer_balance = source_web3.eth.get_balance(self.current_account.address)
+            deployer_balance = await web3_pool.run(source_chain, source_web3.eth.get_balance, self.current_account.address)
             deployer_balance_eth = float(Web3.from_wei(deployer_balance, 'ether'))
             
-            print(f"💳 Deployer balance: {deployer_balance_eth} ETH")
-            print(f"🎯 Required fee: {messaging_fee_eth} ETH")
+            logger.debug("💳 Deployer balance: %s ETH", deployer_balance_eth)
+            logger.debug("🎯 Required fee: %s ETH", messaging_fee_eth)
             
             if deployer_balance_eth < messaging_fee_eth:
                 return {"success": False, "error": f"Insufficient ETH for messaging fee. Have: {deployer_balance_eth}, Need: {messaging_fee_eth}"}
             
             # Build and send the message transaction
-            print(f"\n📤 === SENDING LAYERZERO MESSAGE TRANSACTION ===")
-            nonce = source_web3.eth.get_transaction_count(self.current_account.address, 'pending')
+            logger.debug("\n📤 === SENDING LAYERZERO MESSAGE TRANSACTION ===")
+            nonce = await web3_pool.run(source_chain, source_web3.eth.get_transaction_count, self.current_account.address, 'pending')
             
             transaction = oft_contract.functions.send(
                 send_param,
@@ -1401,24 +1410,24 @@ class LayerZeroOFTBridgeService:
                 'from': self.current_account.address,
                 'value': messaging_fee_wei,
                 'gas': 1000000,  # Sufficient gas for message sending
-                'gasPrice': int(source_web3.eth.gas_price * 1.2),  # 20% higher gas price
+                'gasPrice': int(await web3_pool.run(source_chain, lambda: source_web3.eth.gas_price) * 1.2),  # 20% higher gas price
                 'nonce': nonce,
-                'chainId': source_web3.eth.chain_id
+                'chainId': await web3_pool.run(source_chain, lambda: source_web3.eth.chain_id)
             })
             
             # Sign and send transaction
             signed_txn = source_web3.eth.account.sign_transaction(transaction, self.current_account.key)
-            tx_hash = source_web3.eth.send_raw_transaction(signed_txn.raw_transaction)
-            print(f"📤 Message transaction sent: {tx_hash.hex()}")
+            tx_hash = await web3_pool.run(source_chain, source_web3.eth.send_raw_transaction, signed_txn.raw_transaction)
+            logger.debug("📤 Message transaction sent: %s", tx_hash.hex())
             
             # Wait for confirmation
-            receipt = source_web3.eth.wait_for_transaction_receipt(tx_hash, timeout=300)
+            receipt = await web3_pool.run(source_chain, source_web3.eth.wait_for_transaction_receipt, tx_hash, timeout=300, bounded=False)
             
             if receipt.status == 1:
-                print(f"✅ Cross-chain message sent successfully!")
-                print(f"🔗 Transaction: {tx_hash.hex()}")
-                print(f"⛽ Gas used: {receipt.gasUsed}")
-                print(f"📊 Block: {receipt.blockNumber}")
+                logger.info("✅ Cross-chain message sent successfully!")
+                logger.debug("🔗 Transaction: %s", tx_hash.hex())
+                logger.debug("⛽ Gas used: %s", receipt.gasUsed)
+                logger.debug("📊 Block: %s", receipt.blockNumber)
                 
                 return {
                     "success": True,
@@ -1436,13 +1445,13 @@ class LayerZeroOFTBridgeService:
                     "status": "sent"
                 }
             else:
-                print(f"❌ Message transaction failed!")
+                logger.warning("❌ Message transaction failed!")
                 return {"success": False, "error": f"Transaction failed with status: {receipt.status}"}
                 
         except Exception as e:
-            print(f"❌ Cross-chain message error: {e}")
+            logger.error("❌ Cross-chain message error: %s", e)
             import traceback
-            print(f"🔍 Full traceback: {traceback.format_exc()}")
+            logger.warning("🔍 Full traceback: %s", traceback.format_exc())
             return {"success": False, "error": f"Failed to send cross-chain message: {str(e)}"}
 
     async def _wait_for_layerzero_settlement(
@@ -1467,17 +1476,17 @@ class LayerZeroOFTBridgeService:
                 return {"success": False, "error": f"Destination chain {destination_chain} not available"}
             
             # Get initial balance
-            initial_balance_wei = dest_oft_contract.functions.balanceOf(recipient_address).call()
+            initial_balance_wei = await web3_pool.run(destination_chain, dest_oft_contract.functions.balanceOf(recipient_address).call)
             initial_balance_eth = float(Web3.from_wei(initial_balance_wei, 'ether'))
             
             expected_final_balance_eth = initial_balance_eth + expected_amount_eth
             expected_final_balance_wei = Web3.to_wei(expected_final_balance_eth, 'ether')
             
-            print(f"🔍 Settlement Monitor:")
-            print(f"   Initial balance: {initial_balance_eth} cfWETH")
-            print(f"   Expected amount: {expected_amount_eth} cfWETH")
-            print(f"   Target balance: {expected_final_balance_eth} cfWETH")
-            print(f"   Timeout: {timeout_seconds} seconds")
+            logger.debug("🔍 Settlement Monitor:")
+            logger.debug("   Initial balance: %s cfWETH", initial_balance_eth)
+            logger.debug("   Expected amount: %s cfWETH", expected_amount_eth)
+            logger.debug("   Target balance: %s cfWETH", expected_final_balance_eth)
+            logger.debug("   Timeout: %s seconds", timeout_seconds)
             
             # Poll for balance change
             start_time = asyncio.get_event_loop().time()
@@ -1497,18 +1506,18 @@ class LayerZeroOFTBridgeService:
                     }
                 
                 # Check current balance
-                current_balance_wei = dest_oft_contract.functions.balanceOf(recipient_address).call()
+                current_balance_wei = await web3_pool.run(destination_chain, dest_oft_contract.functions.balanceOf(recipient_address).call)
                 current_balance_eth = float(Web3.from_wei(current_balance_wei, 'ether'))
                 
-                print(f"⏳ [{elapsed:.0f}s] Checking balance: {current_balance_eth} cfWETH (target: {expected_final_balance_eth})")
+                logger.debug("⏳ [%.0fs] Checking balance: %s cfWETH (target: %s)", elapsed, current_balance_eth, expected_final_balance_eth)
                 
                 # Check if balance has increased sufficiently
                 balance_increase = current_balance_eth - initial_balance_eth
                 
                 if balance_increase >= (expected_amount_eth * 0.99):  # Allow for small rounding differences
-                    print(f"✅ LayerZero settlement detected!")
-                    print(f"   Balance increase: {balance_increase} cfWETH")
-                    print(f"   Settlement time: {elapsed:.1f} seconds")
+                    logger.debug("✅ LayerZero settlement detected!")
+                    logger.debug("   Balance increase: %s cfWETH", balance_increase)
+                    logger.debug("   Settlement time: %.1f seconds", elapsed)
                     
                     return {
                         "success": True,
@@ -1522,7 +1531,7 @@ class LayerZeroOFTBridgeService:
                 await asyncio.sleep(poll_interval)
                 
         except Exception as e:
-            print(f"❌ Settlement monitoring error: {e}")
+            logger.error("❌ Settlement monitoring error: %s", e)
             return {"success": False, "error": f"Settlement monitoring failed: {str(e)}"}
 
     async def _execute_oft_send(
@@ -1539,8 +1548,8 @@ class LayerZeroOFTBridgeService:
             source_config = self.oft_contracts[from_chain]
             target_config = self.oft_contracts[to_chain]
             
-            print(f"🔗 OFT Send: {from_chain} → {to_chain}")
-            print(f"📍 OFT Contract: {source_config['oft_address']}")
+            logger.debug("🔗 OFT Send: %s → %s", from_chain, to_chain)
+            logger.debug("📍 OFT Contract: %s", source_config['oft_address'])
             
             oft_contract = web3.eth.contract(
                 address=source_config['oft_address'],
@@ -1549,7 +1558,7 @@ class LayerZeroOFTBridgeService:
             
             # Convert recipient address to bytes32 format
             recipient_bytes32 = Web3.to_bytes(hexstr=to_address.lower().replace('0x', '').zfill(64))
-            print(f"🔧 Recipient bytes32: {recipient_bytes32.hex()}")
+            logger.debug("🔧 Recipient bytes32: %s", recipient_bytes32.hex())
             
             # Get fee estimate
             fee_estimate = await self.estimate_oft_transfer_fee(from_chain, to_chain, float(Web3.from_wei(amount_wei, 'ether')))
@@ -1557,7 +1566,7 @@ class LayerZeroOFTBridgeService:
                 return {"success": False, "error": f"Fee estimation failed: {fee_estimate['error']}"}
             
             native_fee = fee_estimate["native_fee_wei"]
-            print(f"💳 Using LayerZero fee: {Web3.from_wei(native_fee, 'ether')} ETH")
+            logger.debug("💳 Using LayerZero fee: %s ETH", Web3.from_wei(native_fee, 'ether'))
             
             # Create LayerZero V2 SendParam struct
             send_param = (
@@ -1582,13 +1591,11 @@ class LayerZeroOFTBridgeService:
                     'from': user_account.address,
                     'value': native_fee
                 })
-                print("✅ OFT send simulation successful")
+                logger.info("✅ OFT send simulation successful")
             except Exception as sim_error:
                 return {"success": False, "error": f"OFT send simulation failed: {sim_error}"}
             
-            # Build transaction
-            nonce = web3.eth.get_transaction_count(user_account.address)
-            
+            # Build transaction (nonce is assigned by tx_pipeline)
             transaction = oft_contract.functions.send(
                 send_param,
                 messaging_fee,
@@ -1597,23 +1604,22 @@ class LayerZeroOFTBridgeService:
                 'from': user_account.address,
                 'value': native_fee,
                 'gas': 500000,
-                'gasPrice': web3.eth.gas_price,
-                'nonce': nonce,
-                'chainId': web3.eth.chain_id
+                'gasPrice': await tx_pipeline.gas_price(from_chain, web3),
+                'chainId': await web3_pool.run(from_chain, lambda: web3.eth.chain_id)
             })
             
             # Sign and send transaction
-            print(f"✍️ Signing and sending OFT transaction...")
-            signed_txn = web3.eth.account.sign_transaction(transaction, user_account.key)
-            tx_hash = web3.eth.send_raw_transaction(signed_txn.raw_transaction)
-            print(f"📤 Transaction sent: {tx_hash.hex()}")
+            logger.debug("✍️ Signing and sending OFT transaction...")
+            pending_txn = await tx_pipeline.submit(from_chain, web3, user_account, transaction)
+            tx_hash = pending_txn.tx_hash
+            logger.debug("📤 Transaction sent: %s", tx_hash.hex())
             
             # Wait for receipt
-            print(f"⏳ Waiting for transaction confirmation...")
-            receipt = web3.eth.wait_for_transaction_receipt(tx_hash, timeout=300)
+            logger.debug("⏳ Waiting for transaction confirmation...")
+            receipt = await pending_txn.receipt(timeout=300)
             
             if receipt.status == 1:
-                print(f"✅ OFT send successful!")
+                logger.info("✅ OFT send successful!")
                 
                 # Extract LayerZero GUID from logs
                 layerzero_guid = None
@@ -1639,10 +1645,10 @@ class LayerZeroOFTBridgeService:
                 return {"success": False, "error": f"Transaction failed - Receipt status: {receipt.status}"}
                 
         except Exception as e:
-            print(f"❌ OFT send error: {e}")
+            logger.error("❌ OFT send error: %s", e)
             import traceback
-            print(f"🔍 Full error traceback: {traceback.format_exc()}")
+            logger.warning("🔍 Full error traceback: %s", traceback.format_exc())
             return {"success": False, "error": str(e)}
 
 # Initialize service instance
-layerzero_oft_bridge_service = LayerZeroOFTBridgeService()
+layerzero_oft_bridge_service = service_registry.register("layerzero_oft_bridge", LayerZeroOFTBridgeService(), lazy=True)
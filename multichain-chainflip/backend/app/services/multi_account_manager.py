@@ -7,8 +7,10 @@ import os
 from typing import Dict, Optional, Any
 from eth_account import Account
 from app.core.config import get_settings
+from app.core.log import get_logger
 
 settings = get_settings()
+logger = get_logger(__name__)
 
 class AddressKeyManager:
     def __init__(self):
@@ -47,11 +49,11 @@ class AddressKeyManager:
                         "account": account
                     }
                 else:
-                    print(f"⚠️ Private key mismatch for {address}")
+                    logger.warning("⚠️ Private key mismatch for %s", address)
             except Exception as e:
-                print(f"❌ Failed to initialize account {address}: {e}")
+                logger.error("❌ Failed to initialize account %s: %s", address, e)
         
-        print(f"✅ Initialized {len(self.address_to_key)} address-to-key mappings")
+        logger.info("✅ Initialized %s address-to-key mappings", len(self.address_to_key))
     
     def get_private_key_for_address(self, address: str) -> Optional[str]:
         """Get private key for any address"""
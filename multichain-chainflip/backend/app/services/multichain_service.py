@@ -11,10 +11,16 @@ from web3 import Web3
 from web3.contract import Contract
 from app.core.config import get_settings
 from app.core.database import get_database
+from app.core.log import get_logger
+from app.core.response_cache import invalidate_product_views
+from app.core.web3_pool import web3_pool
+from app.core.service_registry import service_registry
+from app.services.authenticity_fields import build_verification_projection
 from app.services.ipfs_service import ipfs_service
 from app.services.encryption_service import encryption_service
 
 settings = get_settings()
+logger = get_logger(__name__)
 
 class MultiChainService:
     def __init__(self):
@@ -55,43 +61,31 @@ class MultiChainService:
         
     async def initialize(self):
         """Initialize all blockchain connections and contracts"""
-        print("🚀 Initializing ChainFLIP Multi-Chain Service...")
+        logger.debug("🚀 Initializing ChainFLIP Multi-Chain Service...")
         
         # Initialize database
         self.database = await get_database()
         
-        # Initialize Hub connection (Polygon PoS)
-        if settings.polygon_pos_rpc:
-            self.hub_web3 = Web3(Web3.HTTPProvider(settings.polygon_pos_rpc))
-            if self.hub_web3.is_connected():
-                print(f"✅ Connected to Hub Chain (Chain ID: {self.chain_configs['hub']['chain_id']})")
-            else:
-                print("❌ Failed to connect to Hub Chain")
-        
-        # Initialize L2 connections - Real multichain deployment
-        # Manufacturer L2: Base Sepolia
-        if settings.base_sepolia_rpc:
-            self.manufacturer_web3 = Web3(Web3.HTTPProvider(settings.base_sepolia_rpc))
-            if self.manufacturer_web3.is_connected():
-                print(f"✅ Connected to Manufacturer Chain (Base Sepolia - Chain ID: {self.chain_configs['manufacturer']['chain_id']})")
-            else:
-                print("❌ Failed to connect to Manufacturer Chain")
-        
-        # Transporter L2: Arbitrum Sepolia  
-        if settings.arbitrum_sepolia_rpc:
-            self.transporter_web3 = Web3(Web3.HTTPProvider(settings.arbitrum_sepolia_rpc))
-            if self.transporter_web3.is_connected():
-                print(f"✅ Connected to Transporter Chain (Arbitrum Sepolia - Chain ID: {self.chain_configs['transporter']['chain_id']})")
-            else:
-                print("❌ Failed to connect to Transporter Chain")
+        # Shared pooled clients per role chain - Real multichain deployment
+        # Hub: Polygon PoS, Manufacturer: Base Sepolia, Transporter: Arbitrum Sepolia, Buyer: Optimism Sepolia
+        role_rpcs = {
+            "hub": settings.polygon_pos_rpc,
+            "manufacturer": settings.base_sepolia_rpc,
+            "transporter": settings.arbitrum_sepolia_rpc,
+            "buyer": settings.optimism_sepolia_rpc
+        }
+        roles = [role for role, rpc in role_rpcs.items() if rpc]
+        for role in roles:
+            setattr(self, f"{role}_web3", web3_pool.web3(role))
         
-        # Buyer L2: Optimism Sepolia
-        if settings.optimism_sepolia_rpc:
-            self.buyer_web3 = Web3(Web3.HTTPProvider(settings.optimism_sepolia_rpc))
-            if self.buyer_web3.is_connected():
-                print(f"✅ Connected to Buyer Chain (Optimism Sepolia - Chain ID: {self.chain_configs['buyer']['chain_id']})")
+        # Probe all chains concurrently instead of one handshake after another
+        probes = await asyncio.gather(*(web3_pool.is_connected(role) for role in roles))
+        for role, connected in zip(roles, probes):
+            config = self.chain_configs[role]
+            if connected:
+                logger.debug("✅ Connected to %s (Chain ID: %s)", config['name'], config['chain_id'])
             else:
-                print("❌ Failed to connect to Buyer Chain")
+                logger.warning("❌ Failed to connect to %s", config['name'])
         
         # Load contract ABIs and addresses
         await self.load_contracts()
@@ -103,7 +97,7 @@ class MultiChainService:
             contract_addresses = await self._get_contract_addresses()
             
             if not contract_addresses:
-                print("⚠️ No contract addresses found. Please deploy contracts first.")
+                logger.warning("⚠️ No contract addresses found. Please deploy contracts first.")
                 return
             
             # Load ABIs (in production, these would be loaded from files)
@@ -115,31 +109,31 @@ class MultiChainService:
                     address=contract_addresses["hub"],
                     abi=self.contract_abis.get("hub", [])
                 )
-                print("✅ Hub contract loaded")
+                logger.info("✅ Hub contract loaded")
             
             if self.manufacturer_web3 and contract_addresses.get("manufacturer"):
                 self.contracts["manufacturer"] = self.manufacturer_web3.eth.contract(
                     address=contract_addresses["manufacturer"],
                     abi=self.contract_abis.get("manufacturer", [])
                 )
-                print("✅ Manufacturer contract loaded")
+                logger.info("✅ Manufacturer contract loaded")
             
             if self.transporter_web3 and contract_addresses.get("transporter"):
                 self.contracts["transporter"] = self.transporter_web3.eth.contract(
                     address=contract_addresses["transporter"],
                     abi=self.contract_abis.get("transporter", [])
                 )
-                print("✅ Transporter contract loaded")
+                logger.info("✅ Transporter contract loaded")
             
             if self.buyer_web3 and contract_addresses.get("buyer"):
                 self.contracts["buyer"] = self.buyer_web3.eth.contract(
                     address=contract_addresses["buyer"],
                     abi=self.contract_abis.get("buyer", [])
                 )
-                print("✅ Buyer contract loaded")
+                logger.info("✅ Buyer contract loaded")
                 
         except Exception as e:
-            print(f"⚠️ Contract loading error: {e}")
+            logger.warning("⚠️ Contract loading error: %s", e)
     
     async def _get_contract_addresses(self) -> Dict[str, str]:
         """Get contract addresses from environment or database"""
@@ -179,13 +173,13 @@ class MultiChainService:
     async def mint_product_on_manufacturer_chain(self, manufacturer: str, product_data: Dict[str, Any]) -> Dict[str, Any]:
         """Algorithm 4: Product Authenticity Verification - Mint product on manufacturer chain"""
         try:
-            print(f"🏭 Minting product on Manufacturer Chain...")
+            logger.debug("🏭 Minting product on Manufacturer Chain...")
             
             # Upload metadata to IPFS
             try:
                 metadata_cid = await ipfs_service.upload_to_ipfs(product_data)
             except Exception as ipfs_error:
-                print(f"❌ IPFS upload failed: {ipfs_error}")
+                logger.error("❌ IPFS upload failed: %s", ipfs_error)
                 raise Exception(f"Failed to upload metadata to IPFS: {ipfs_error}")
             
             # Generate unique product ID
@@ -218,10 +212,12 @@ class MultiChainService:
                 "created_at": time.time(),
                 "cross_chain_hash": await self._generate_cross_chain_hash(token_id, manufacturer)
             }
+            product_record["verification_projection"] = build_verification_projection(product_record)
             
             result = await self.database.products.insert_one(product_record)
+            await invalidate_product_views(token_id)
             
-            print(f"✅ Product {token_id} minted on Manufacturer Chain")
+            logger.info("✅ Product %s minted on Manufacturer Chain", token_id)
             return {
                 "success": True,
                 "token_id": token_id,
@@ -231,13 +227,13 @@ class MultiChainService:
             }
             
         except Exception as e:
-            print(f"❌ Manufacturer chain minting error: {e}")
+            logger.error("❌ Manufacturer chain minting error: %s", e)
             return {"success": False, "error": str(e)}
     
     async def perform_quality_check(self, product_id: str, inspector: str, passed: bool, score: int, report_cid: str = "") -> Dict[str, Any]:
         """Algorithm 3: Supply Chain Consensus - Quality control on manufacturer chain"""
         try:
-            print(f"🔍 Performing quality check for product {product_id}")
+            logger.debug("🔍 Performing quality check for product %s", product_id)
             
             # Verify product exists
             product = await self.database.products.find_one({"token_id": product_id})
@@ -271,24 +267,25 @@ class MultiChainService:
                         }
                     }
                 )
+                await invalidate_product_views(product_id)
                 
                 # Sync to hub for cross-chain coordination
                 await self._sync_product_to_hub(product_id)
                 
-                print(f"✅ Product {product_id} approved for shipment")
+                logger.info("✅ Product %s approved for shipment", product_id)
                 return {"success": True, "status": "approved", "score": score}
             else:
-                print(f"❌ Product {product_id} failed quality check")
+                logger.warning("❌ Product %s failed quality check", product_id)
                 return {"success": True, "status": "failed", "score": score}
                 
         except Exception as e:
-            print(f"❌ Quality check error: {e}")
+            logger.error("❌ Quality check error: %s", e)
             return {"success": False, "error": str(e)}
     
     async def claim_manufacturing_incentive(self, manufacturer: str) -> Dict[str, Any]:
         """Algorithm 1: Payment Release and Incentive Mechanism - Manufacturing incentives"""
         try:
-            print(f"💰 Processing manufacturing incentive for {manufacturer}")
+            logger.debug("💰 Processing manufacturing incentive for %s", manufacturer)
             
             # Calculate incentive based on production and quality
             incentive_data = await self._calculate_manufacturing_incentive(manufacturer)
@@ -307,13 +304,13 @@ class MultiChainService:
                 
                 await self.database.incentive_payments.insert_one(payment_record)
                 
-                print(f"✅ Manufacturing incentive paid: ${incentive_data['amount']}")
+                logger.info("✅ Manufacturing incentive paid: $%s", incentive_data['amount'])
                 return {"success": True, "amount": incentive_data["amount"]}
             else:
                 return {"success": False, "error": "No incentive available"}
                 
         except Exception as e:
-            print(f"❌ Manufacturing incentive error: {e}")
+            logger.error("❌ Manufacturing incentive error: %s", e)
             return {"success": False, "error": str(e)}
     
     # ==========================================
@@ -323,7 +320,7 @@ class MultiChainService:
     async def create_shipment(self, transporter: str, shipment_data: Dict[str, Any]) -> Dict[str, Any]:
         """Algorithm 3: Supply Chain Consensus - Create shipment on transporter chain"""
         try:
-            print(f"🚛 Creating shipment on Transporter Chain...")
+            logger.debug("🚛 Creating shipment on Transporter Chain...")
             
             shipment_id = await self._generate_shipment_id()
             
@@ -344,17 +341,17 @@ class MultiChainService:
             
             await self.database.shipments.insert_one(shipment_record)
             
-            print(f"✅ Shipment {shipment_id} created on Transporter Chain")
+            logger.info("✅ Shipment %s created on Transporter Chain", shipment_id)
             return {"success": True, "shipment_id": shipment_id}
             
         except Exception as e:
-            print(f"❌ Shipment creation error: {e}")
+            logger.error("❌ Shipment creation error: %s", e)
             return {"success": False, "error": str(e)}
     
     async def submit_consensus_vote(self, shipment_id: str, voter: str, approve: bool, reason: str) -> Dict[str, Any]:
         """Algorithm 3: Supply Chain Consensus - Vote on shipment approval"""
         try:
-            print(f"🗳️ Submitting consensus vote for shipment {shipment_id}")
+            logger.debug("🗳️ Submitting consensus vote for shipment %s", shipment_id)
             
             vote_record = {
                 "shipment_id": shipment_id,
@@ -372,13 +369,13 @@ class MultiChainService:
             return {"success": True, "consensus_reached": consensus_result["reached"], "result": consensus_result.get("result")}
             
         except Exception as e:
-            print(f"❌ Consensus voting error: {e}")
+            logger.error("❌ Consensus voting error: %s", e)
             return {"success": False, "error": str(e)}
     
     async def mark_delivered(self, shipment_id: str, transporter: str) -> Dict[str, Any]:
         """Mark shipment as delivered and calculate incentives"""
         try:
-            print(f"📦 Marking shipment {shipment_id} as delivered")
+            logger.debug("📦 Marking shipment %s as delivered", shipment_id)
             
             shipment = await self.database.shipments.find_one({"shipment_id": shipment_id})
             if not shipment:
@@ -410,7 +407,7 @@ class MultiChainService:
                 return {"success": True, "on_time": False, "penalty": "Late delivery recorded"}
                 
         except Exception as e:
-            print(f"❌ Delivery marking error: {e}")
+            logger.error("❌ Delivery marking error: %s", e)
             return {"success": False, "error": str(e)}
     
     # ==========================================
@@ -420,7 +417,7 @@ class MultiChainService:
     async def create_marketplace_listing(self, seller: str, listing_data: Dict[str, Any]) -> Dict[str, Any]:
         """Algorithm 5: Post Supply Chain Management - Create marketplace listing"""
         try:
-            print(f"🛒 Creating marketplace listing on Buyer Chain...")
+            logger.debug("🛒 Creating marketplace listing on Buyer Chain...")
             
             listing_id = await self._generate_listing_id()
             
@@ -439,17 +436,17 @@ class MultiChainService:
             
             await self.database.marketplace_listings.insert_one(listing_record)
             
-            print(f"✅ Marketplace listing {listing_id} created")
+            logger.info("✅ Marketplace listing %s created", listing_id)
             return {"success": True, "listing_id": listing_id}
             
         except Exception as e:
-            print(f"❌ Marketplace listing error: {e}")
+            logger.error("❌ Marketplace listing error: %s", e)
             return {"success": False, "error": str(e)}
     
     async def create_purchase(self, buyer: str, listing_id: str, delivery_location: str, payment_amount: float) -> Dict[str, Any]:
         """Algorithm 5: Post Supply Chain Management - Create purchase order"""
         try:
-            print(f"💳 Creating purchase order for listing {listing_id}")
+            logger.debug("💳 Creating purchase order for listing %s", listing_id)
             
             # Verify listing exists and is active
             listing = await self.database.marketplace_listings.find_one({"listing_id": listing_id})
@@ -484,17 +481,17 @@ class MultiChainService:
                 {"$set": {"is_active": False}}
             )
             
-            print(f"✅ Purchase {purchase_id} created")
+            logger.info("✅ Purchase %s created", purchase_id)
             return {"success": True, "purchase_id": purchase_id}
             
         except Exception as e:
-            print(f"❌ Purchase creation error: {e}")
+            logger.error("❌ Purchase creation error: %s", e)
             return {"success": False, "error": str(e)}
     
     async def open_dispute(self, purchase_id: str, plaintiff: str, reason: str, evidence_cid: str = "") -> Dict[str, Any]:
         """Algorithm 2: Dispute Resolution and Voting Mechanism - Open purchase dispute"""
         try:
-            print(f"⚖️ Opening dispute for purchase {purchase_id}")
+            logger.debug("⚖️ Opening dispute for purchase %s", purchase_id)
             
             purchase = await self.database.purchases.find_one({"purchase_id": purchase_id})
             if not purchase:
@@ -525,17 +522,17 @@ class MultiChainService:
             
             await self.database.disputes.insert_one(dispute_record)
             
-            print(f"✅ Dispute {dispute_id} opened")
+            logger.info("✅ Dispute %s opened", dispute_id)
             return {"success": True, "dispute_id": dispute_id, "arbitrators": arbitrators}
             
         except Exception as e:
-            print(f"❌ Dispute opening error: {e}")
+            logger.error("❌ Dispute opening error: %s", e)
             return {"success": False, "error": str(e)}
     
     async def confirm_delivery(self, purchase_id: str, buyer: str) -> Dict[str, Any]:
         """Algorithm 1: Payment Release - Confirm delivery and release payment"""
         try:
-            print(f"✅ Confirming delivery for purchase {purchase_id}")
+            logger.info("✅ Confirming delivery for purchase %s", purchase_id)
             
             purchase = await self.database.purchases.find_one({"purchase_id": purchase_id})
             if not purchase:
@@ -553,7 +550,7 @@ class MultiChainService:
             return {"success": True, "payment_released": payment_result["success"]}
             
         except Exception as e:
-            print(f"❌ Delivery confirmation error: {e}")
+            logger.error("❌ Delivery confirmation error: %s", e)
             return {"success": False, "error": str(e)}
     
     # ==========================================
@@ -583,10 +580,10 @@ class MultiChainService:
             }
             
             await self.database.cross_chain_syncs.insert_one(sync_record)
-            print(f"🔗 Product {product_id} queued for hub sync")
+            logger.debug("🔗 Product %s queued for hub sync", product_id)
             
         except Exception as e:
-            print(f"⚠️ Hub sync error: {e}")
+            logger.warning("⚠️ Hub sync error: %s", e)
     
     # ==========================================
     # HELPER FUNCTIONS
@@ -705,7 +702,7 @@ class MultiChainService:
             return {"success": True, "amount": base_incentive}
             
         except Exception as e:
-            print(f"❌ Transport incentive error: {e}")
+            logger.error("❌ Transport incentive error: %s", e)
             return {"success": False, "error": str(e)}
     
     async def _assign_arbitrators(self) -> List[str]:
@@ -756,7 +753,7 @@ class MultiChainService:
             return {"success": True, "amount": purchase.get("price")}
             
         except Exception as e:
-            print(f"❌ Payment release error: {e}")
+            logger.error("❌ Payment release error: %s", e)
             return {"success": False, "error": str(e)}
     
     # ==========================================
@@ -776,7 +773,7 @@ class MultiChainService:
                 "name": self.chain_configs["hub"]["name"],
                 "products": products_count,
                 "participants": participants_count,
-                "connected": bool(self.hub_web3 and self.hub_web3.is_connected())
+                "connected": bool(self.hub_web3) and await web3_pool.is_connected("hub")
             }
             
             # Manufacturer chain stats
@@ -817,8 +814,8 @@ class MultiChainService:
             return stats
             
         except Exception as e:
-            print(f"❌ Stats error: {e}")
+            logger.error("❌ Stats error: %s", e)
             return {"error": str(e)}
 
 # Global instance
-multichain_service = MultiChainService()
+multichain_service = service_registry.register("multichain", MultiChainService())
@@ -0,0 +1,119 @@
+"""
+Network Health Service
+Background poller that probes every chain on an interval and keeps the latest
+network stats snapshot, so status endpoints don't hit the RPCs per request
+"""
+import asyncio
+import time
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+from app.core.config import get_settings
+from app.core.log import get_logger
+from app.core.rpc_router import rpc_router
+from app.core.service_registry import service_registry
+from app.core.web3_pool import web3_pool
+
+settings = get_settings()
+logger = get_logger(__name__)
+
+
+class NetworkHealthService:
+    """
+    Periodic network health snapshot
+
+    - every poll runs BlockchainService.get_network_stats() plus a latest-block
+      probe of every routed chain, all concurrently
+    - readers get the last snapshot and its age; only the very first read
+      (before the poller has produced anything) waits for a probe
+    - refresh() coalesces concurrent callers onto one probe
+    """
+
+    def __init__(self, poll_interval: int = settings.network_health_poll_interval):
+        self.poll_interval = poll_interval
+        self._snapshot: Optional[Dict[str, Any]] = None
+        self._collected_at: Optional[float] = None
+        self._collect_seconds: Optional[float] = None
+        self._refresh_task: Optional[asyncio.Task] = None
+        self._task: Optional[asyncio.Task] = None
+
+    async def initialize(self):
+        await service_registry.initialize("blockchain")
+        logger.info("✅ Network health poller initialized (every %ss)", self.poll_interval)
+
+    def start(self):
+        """Start the background poll loop"""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if self._task and not self._task.done():
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        self._task = None
+
+    async def _run(self):
+        while True:
+            try:
+                await self.refresh()
+            except Exception as e:
+                logger.warning("⚠️ Network health poll failed: %s", e)
+            await asyncio.sleep(self.poll_interval)
+
+    async def _probe_chains(self) -> Dict[str, Dict[str, Any]]:
+        chains = rpc_router.chains()
+        blocks = await asyncio.gather(*(web3_pool.latest_block(chain) for chain in chains))
+        return {
+            chain: {
+                "connected": block is not None,
+                "latest_block": block,
+                "rpc_url": web3_pool.rpc_url(chain),
+            }
+            for chain, block in zip(chains, blocks)
+        }
+
+    async def _collect(self) -> Dict[str, Any]:
+        started = time.perf_counter()
+        blockchain_service = await service_registry.get("blockchain")
+        stats, chains = await asyncio.gather(
+            blockchain_service.get_network_stats(),
+            self._probe_chains(),
+        )
+        stats["chains"] = chains
+        self._snapshot = stats
+        self._collected_at = time.time()
+        self._collect_seconds = time.perf_counter() - started
+        return stats
+
+    async def refresh(self) -> Dict[str, Any]:
+        """Probe now; joins a probe that is already running instead of starting another"""
+        if self._refresh_task is None or self._refresh_task.done():
+            self._refresh_task = asyncio.create_task(self._collect())
+        await asyncio.shield(self._refresh_task)
+        return self.get_snapshot_nowait()
+
+    def get_snapshot_nowait(self) -> Optional[Dict[str, Any]]:
+        """Last snapshot with its age, or None before the first probe completes"""
+        if self._snapshot is None:
+            return None
+        return {
+            **self._snapshot,
+            "snapshot": {
+                "collected_at": datetime.utcfromtimestamp(self._collected_at).isoformat(),
+                "age_seconds": round(time.time() - self._collected_at, 1),
+                "collect_seconds": round(self._collect_seconds, 2),
+                "poll_interval": self.poll_interval,
+            },
+        }
+
+    async def get_snapshot(self, force_refresh: bool = False) -> Dict[str, Any]:
+        """Network stats as of the last poll; force_refresh probes the networks first"""
+        if force_refresh or self._snapshot is None:
+            return await self.refresh()
+        return self.get_snapshot_nowait()
+
+
+network_health_service = service_registry.register("network_health", NetworkHealthService(), depends_on=["blockchain"])
@@ -9,14 +9,18 @@ import time
 from datetime import datetime
 from typing import Dict, List, Optional, Any, Tuple
 from web3 import Web3
-from web3.middleware import ExtraDataToPOAMiddleware
 from eth_account import Account
 from app.core.config import get_settings
 from app.core.database import get_database
+from app.core.log import get_logger
+from app.core.web3_pool import web3_pool
+from app.core.service_registry import service_registry
 from app.services.blockchain_service import BlockchainService, get_private_key_for_address
+from app.services.confirmation_tracker import confirmation_tracker, tracking_target
 import os
 
 settings = get_settings()
+logger = get_logger(__name__)
 
 # Network configurations for cross-chain NFT transfers
 NETWORK_CONFIG = {
@@ -171,14 +175,13 @@ class NFTBridgeService:
         
     async def initialize(self):
         """Initialize NFT Bridge Service"""
-        print("🌉 Initializing ChainFLIP Cross-Chain NFT Bridge Service...")
+        logger.debug("🌉 Initializing ChainFLIP Cross-Chain NFT Bridge Service...")
         
         # Initialize database connection
         self.database = await get_database()
         
-        # Initialize blockchain service
-        self.blockchain_service = BlockchainService()
-        await self.blockchain_service.initialize()
+        # Reuse the process-wide blockchain service
+        self.blockchain_service = await service_registry.get("blockchain")
         
         # Initialize Web3 connections for all networks
         await self.initialize_network_connections()
@@ -186,30 +189,26 @@ class NFTBridgeService:
         # Load NFT contract addresses from environment
         await self.load_nft_contract_addresses()
         
-        print("✅ NFT Bridge Service initialized successfully")
+        logger.info("✅ NFT Bridge Service initialized successfully")
         
     async def initialize_network_connections(self):
         """Initialize Web3 connections for all supported networks"""
-        print("🔗 Initializing network connections...")
+        logger.debug("🔗 Initializing network connections...")
         
         for network_key, config in NETWORK_CONFIG.items():
-            try:
-                web3 = Web3(Web3.HTTPProvider(config["rpc_url"]))
-                web3.middleware_onion.inject(ExtraDataToPOAMiddleware, layer=0)
-                
-                if web3.is_connected():
-                    latest_block = web3.eth.block_number
-                    self.web3_connections[network_key] = web3
-                    print(f"✅ Connected to {config['name']} (Chain ID: {config['chain_id']}, Block: {latest_block})")
-                else:
-                    print(f"❌ Failed to connect to {config['name']}")
-                    
-            except Exception as e:
-                print(f"❌ Connection error for {config['name']}: {e}")
+            web3_pool.add_endpoints(network_key, [config["rpc_url"]])
+        clients = await asyncio.gather(*(web3_pool.connect(network_key) for network_key in NETWORK_CONFIG))
+        
+        for (network_key, config), web3 in zip(NETWORK_CONFIG.items(), clients):
+            if web3:
+                self.web3_connections[network_key] = web3
+                logger.debug("✅ Connected to %s (Chain ID: %s, RPC: %s)", config['name'], config['chain_id'], web3_pool.rpc_url(network_key))
+            else:
+                logger.warning("❌ Failed to connect to %s", config['name'])
                 
     async def load_nft_contract_addresses(self):
         """Load NFT contract addresses from environment variables"""
-        print("📋 Loading NFT contract addresses...")
+        logger.debug("📋 Loading NFT contract addresses...")
         
         # Update network config with contract addresses from environment
         NETWORK_CONFIG["base_sepolia"]["nft_contract"] = os.environ.get("NFT_CONTRACT_BASE_SEPOLIA")
@@ -227,11 +226,11 @@ class NFTBridgeService:
                         abi=self.cross_chain_nft_abi
                     )
                     self.nft_contracts[network_key] = contract
-                    print(f"✅ Loaded NFT contract for {config['name']}: {config['nft_contract']}")
+                    logger.debug("✅ Loaded NFT contract for %s: %s", config['name'], config['nft_contract'])
                 except Exception as e:
-                    print(f"⚠️ Failed to load NFT contract for {config['name']}: {e}")
+                    logger.warning("⚠️ Failed to load NFT contract for %s: %s", config['name'], e)
             else:
-                print(f"⚠️ No NFT contract address configured for {config['name']}")
+                logger.warning("⚠️ No NFT contract address configured for %s", config['name'])
                 
     async def transfer_nft_cross_chain(
         self,
@@ -264,10 +263,10 @@ class NFTBridgeService:
             Dictionary with transfer status and transaction details
         """
         try:
-            print(f"🌉 Starting cross-chain NFT transfer:")
-            print(f"   Token ID: {token_id}")
-            print(f"   From: {from_chain} ({from_address})")
-            print(f"   To: {to_chain} ({to_address})")
+            logger.debug("🌉 Starting cross-chain NFT transfer:")
+            logger.debug("   Token ID: %s", token_id)
+            logger.debug("   From: %s (%s)", from_chain, from_address)
+            logger.debug("   To: %s (%s)", to_chain, to_address)
             
             # Ensure token_id is an integer
             if isinstance(token_id, str):
@@ -300,34 +299,37 @@ class NFTBridgeService:
                 raise Exception("Missing NFT contracts for source or destination chain")
                 
             # Step 1: Verify NFT ownership on source chain
-            print(f"🔍 Step 1: Verifying NFT ownership on {from_config['name']}...")
-            owner = from_nft_contract.functions.ownerOf(token_id).call()
+            logger.debug("🔍 Step 1: Verifying NFT ownership on %s...", from_config['name'])
+            owner = await web3_pool.run(from_chain, from_nft_contract.functions.ownerOf(token_id).call)
             if owner.lower() != from_address.lower():
                 raise Exception(f"NFT not owned by specified address. Owner: {owner}, Specified: {from_address}")
-            print(f"✅ NFT ownership verified")
+            logger.info("✅ NFT ownership verified")
             
             # Step 2: Get tokenURI from source chain
-            print(f"📄 Step 2: Getting tokenURI from source chain...")
-            token_uri = from_nft_contract.functions.tokenURI(token_id).call()
-            print(f"✅ TokenURI retrieved: {token_uri}")
+            logger.debug("📄 Step 2: Getting tokenURI from source chain...")
+            token_uri = await web3_pool.run(from_chain, from_nft_contract.functions.tokenURI(token_id).call)
+            logger.info("✅ TokenURI retrieved: %s", token_uri)
             
             # Step 3: Burn NFT on source chain
-            print(f"🔥 Step 3: Burning NFT on source chain...")
+            logger.debug("🔥 Step 3: Burning NFT on source chain...")
             burn_result = await self.burn_nft_on_source_chain(
                 from_chain, token_id, from_address, caller_private_key
             )
-            print(f"✅ NFT burned successfully. TX: {burn_result['transaction_hash']}")
+            logger.info("✅ NFT burned successfully. TX: %s", burn_result['transaction_hash'])
             
             # Step 4: Send cross-chain message via LayerZero
-            print(f"📡 Step 4: Sending cross-chain message...")
+            logger.debug("📡 Step 4: Sending cross-chain message...")
             message_result = await self.send_cross_chain_message(
                 from_chain, to_chain, token_id, token_uri, to_address, from_address, caller_private_key
             )
-            print(f"✅ Cross-chain message sent. TX: {message_result['transaction_hash']}")
+            logger.info("✅ Cross-chain message sent. TX: %s", message_result['transaction_hash'])
             
-            # Step 5: Record transfer in database
+            # Step 5: Record transfer in database; the confirmation tracker flags the
+            # message as final (or the transfer as failed) once it is deep enough
+            transfer_id = f"{from_chain}-{to_chain}-{token_id}-{int(time.time())}"
             transfer_record = {
-                "transfer_id": f"{from_chain}-{to_chain}-{token_id}-{int(time.time())}",
+                "transfer_id": transfer_id,
+                "tracking_id": None,
                 "token_id": str(token_id),
                 "from_chain": from_chain,
                 "to_chain": to_chain,
@@ -343,11 +345,29 @@ class NFTBridgeService:
             }
             
             await self.database.nft_transfers.insert_one(transfer_record)
-            print(f"✅ Transfer recorded in database")
+            logger.info("✅ Transfer recorded in database")
+            
+            # The NFT is already burned, so a tracker failure must not fail the transfer
+            tracking_id = None
+            try:
+                tracking_id = await confirmation_tracker.track(
+                    from_chain, message_result['transaction_hash'], "nft_bridge_message",
+                    target=tracking_target(
+                        "nft_transfers", {"transfer_id": transfer_id},
+                        on_confirmed={"message_confirmed": True},
+                        on_failed={"status": "failed"},
+                    ),
+                )
+                await self.database.nft_transfers.update_one(
+                    {"transfer_id": transfer_id}, {"$set": {"tracking_id": tracking_id}}
+                )
+            except Exception as tracking_error:
+                logger.warning("⚠️ Could not track transfer %s: %s", transfer_id, tracking_error)
             
             return {
                 "success": True,
                 "transfer_id": transfer_record["transfer_id"],
+                "tracking_id": tracking_id,
                 "burn_transaction": burn_result,
                 "message_transaction": message_result,
                 "status": "cross_chain_transfer_initiated",
@@ -355,7 +375,7 @@ class NFTBridgeService:
             }
             
         except Exception as e:
-            print(f"❌ Cross-chain transfer failed: {e}")
+            logger.error("❌ Cross-chain transfer failed: %s", e)
             return {
                 "success": False,
                 "error": str(e),
@@ -391,26 +411,26 @@ class NFTBridgeService:
             
             # Estimate gas
             gas_estimate = burn_function.estimate_gas({'from': account.address})
-            gas_price = web3.eth.gas_price
+            gas_price = await web3_pool.run(chain, lambda: web3.eth.gas_price)
             
             # Build transaction
             transaction = burn_function.build_transaction({
                 'from': account.address,
                 'gas': int(gas_estimate * 1.2),  # Add 20% buffer
                 'gasPrice': gas_price,
-                'nonce': web3.eth.get_transaction_count(account.address),
+                'nonce': await web3_pool.run(chain, web3.eth.get_transaction_count, account.address),
                 'chainId': config['chain_id']
             })
             
             # Sign and send transaction
             signed_txn = web3.eth.account.sign_transaction(transaction, private_key=account.key)
-            tx_hash = web3.eth.send_raw_transaction(signed_txn.raw_transaction)
+            tx_hash = await web3_pool.run(chain, web3.eth.send_raw_transaction, signed_txn.raw_transaction)
             
             # Wait for confirmation
-            receipt = web3.eth.wait_for_transaction_receipt(tx_hash, timeout=120)
+            receipt = await web3_pool.run(chain, web3.eth.wait_for_transaction_receipt, tx_hash, timeout=120, bounded=False)
             
             if receipt.status == 1:
-                print(f"✅ NFT burned successfully on {config['name']}")
+                logger.info("✅ NFT burned successfully on %s", config['name'])
                 return {
                     "success": True,
                     "transaction_hash": receipt.transactionHash.hex(),
@@ -422,7 +442,7 @@ class NFTBridgeService:
                 raise Exception("Burn transaction failed")
                 
         except Exception as e:
-            print(f"❌ Failed to burn NFT on {chain}: {e}")
+            logger.error("❌ Failed to burn NFT on %s: %s", chain, e)
             raise e
             
     async def send_cross_chain_message(
@@ -472,16 +492,16 @@ class NFTBridgeService:
             to_bytes = Web3.to_bytes(hexstr=to_address)
             options = b''  # Default options
             
-            fee_quote = messenger_contract.functions.quote(
+            fee_quote = await web3_pool.run(from_chain, messenger_contract.functions.quote(
                 dst_eid,
                 to_bytes,
                 encoded_message,
                 options,
                 False  # payInLzToken = false
-            ).call()
+            ).call)
             
             native_fee = fee_quote[0]  # fee.nativeFee
-            print(f"💰 LayerZero fee quote: {Web3.from_wei(native_fee, 'ether')} ETH")
+            logger.debug("💰 LayerZero fee quote: %s ETH", Web3.from_wei(native_fee, 'ether'))
             
             # Send cross-chain message
             send_function = messenger_contract.functions.send(
@@ -497,7 +517,7 @@ class NFTBridgeService:
                 'from': account.address,
                 'value': native_fee
             })
-            gas_price = from_web3.eth.gas_price
+            gas_price = await web3_pool.run(from_chain, lambda: from_web3.eth.gas_price)
             
             # Build transaction
             transaction = send_function.build_transaction({
@@ -505,19 +525,19 @@ class NFTBridgeService:
                 'value': native_fee,
                 'gas': int(gas_estimate * 1.2),
                 'gasPrice': gas_price,
-                'nonce': from_web3.eth.get_transaction_count(account.address),
+                'nonce': await web3_pool.run(from_chain, from_web3.eth.get_transaction_count, account.address),
                 'chainId': from_config['chain_id']
             })
             
             # Sign and send transaction
             signed_txn = from_web3.eth.account.sign_transaction(transaction, private_key=account.key)
-            tx_hash = from_web3.eth.send_raw_transaction(signed_txn.raw_transaction)
+            tx_hash = await web3_pool.run(from_chain, from_web3.eth.send_raw_transaction, signed_txn.raw_transaction)
             
             # Wait for confirmation
-            receipt = from_web3.eth.wait_for_transaction_receipt(tx_hash, timeout=120)
+            receipt = await web3_pool.run(from_chain, from_web3.eth.wait_for_transaction_receipt, tx_hash, timeout=120, bounded=False)
             
             if receipt.status == 1:
-                print(f"✅ Cross-chain message sent successfully")
+                logger.info("✅ Cross-chain message sent successfully")
                 return {
                     "success": True,
                     "transaction_hash": receipt.transactionHash.hex(),
@@ -532,7 +552,7 @@ class NFTBridgeService:
                 raise Exception("Cross-chain message transaction failed")
                 
         except Exception as e:
-            print(f"❌ Failed to send cross-chain message: {e}")
+            logger.error("❌ Failed to send cross-chain message: %s", e)
             raise e
             
     async def get_transfer_status(self, transfer_id: str) -> Dict[str, Any]:
@@ -555,7 +575,7 @@ class NFTBridgeService:
                 if to_chain in self.nft_contracts:
                     try:
                         to_nft_contract = self.nft_contracts[to_chain]
-                        owner = to_nft_contract.functions.ownerOf(token_id).call()
+                        owner = await web3_pool.run(to_chain, to_nft_contract.functions.ownerOf(token_id).call)
                         if owner.lower() == to_address.lower():
                             # Update status to completed
                             await self.database.nft_transfers.update_one(
@@ -571,7 +591,7 @@ class NFTBridgeService:
             return transfer
             
         except Exception as e:
-            print(f"❌ Error getting transfer status: {e}")
+            logger.error("❌ Error getting transfer status: %s", e)
             return {"error": str(e)}
             
     async def get_all_transfers(self, limit: int = 50) -> List[Dict[str, Any]]:
@@ -588,7 +608,7 @@ class NFTBridgeService:
                 transfers.append(transfer)
             return transfers
         except Exception as e:
-            print(f"❌ Error getting transfers: {e}")
+            logger.error("❌ Error getting transfers: %s", e)
             return []
             
     async def mint_nft_on_destination_chain(
@@ -610,11 +630,11 @@ class NFTBridgeService:
             use_admin_account: Whether to use admin account for minting (default: True)
         """
         try:
-            print(f"🏭 Minting NFT on destination chain: {to_chain}")
-            print(f"   Token ID: {token_id}")
-            print(f"   To Address: {to_address}")
-            print(f"   Token URI: {token_uri}")
-            print(f"   Using Admin Account: {use_admin_account}")
+            logger.debug("🏭 Minting NFT on destination chain: %s", to_chain)
+            logger.debug("   Token ID: %s", token_id)
+            logger.debug("   To Address: %s", to_address)
+            logger.debug("   Token URI: %s", token_uri)
+            logger.debug("   Using Admin Account: %s", use_admin_account)
             
             # Ensure token_id is an integer
             if isinstance(token_id, str):
@@ -639,19 +659,19 @@ class NFTBridgeService:
                 if not admin_private_key:
                     raise Exception("Admin private key not configured")
                 account = Account.from_key(admin_private_key)
-                print(f"🔐 Using admin account for minting: {account.address}")
+                logger.debug("🔐 Using admin account for minting: %s", account.address)
             else:
                 # Use recipient's account (must have MINTER_ROLE)
                 private_key = get_private_key_for_address(to_address)
                 if not private_key:
                     raise Exception(f"No private key found for address: {to_address}")
                 account = Account.from_key(private_key)
-                print(f"🔐 Using recipient account for minting: {account.address}")
+                logger.debug("🔐 Using recipient account for minting: %s", account.address)
             
             # Check if token already exists
             try:
-                existing_owner = nft_contract.functions.ownerOf(token_id).call()
-                print(f"⚠️ Token {token_id} already exists on {to_chain}, owned by: {existing_owner}")
+                existing_owner = await web3_pool.run(to_chain, nft_contract.functions.ownerOf(token_id).call)
+                logger.warning("⚠️ Token %s already exists on %s, owned by: %s", token_id, to_chain, existing_owner)
                 if existing_owner.lower() == to_address.lower():
                     return {
                         "success": True,
@@ -664,7 +684,7 @@ class NFTBridgeService:
             except Exception as e:
                 if "nonexistent token" in str(e).lower() or "invalid token" in str(e).lower():
                     # Token doesn't exist, proceed with minting
-                    print(f"✅ Token {token_id} doesn't exist on {to_chain}, proceeding with mint")
+                    logger.warning("✅ Token %s doesn't exist on %s, proceeding with mint", token_id, to_chain)
                 else:
                     # Some other error occurred
                     raise e
@@ -674,47 +694,47 @@ class NFTBridgeService:
             
             # Estimate gas
             gas_estimate = mint_function.estimate_gas({'from': account.address})
-            gas_price = web3.eth.gas_price
+            gas_price = await web3_pool.run(to_chain, lambda: web3.eth.gas_price)
             
             # Build transaction
             transaction = mint_function.build_transaction({
                 'from': account.address,
                 'gas': int(gas_estimate * 1.2),  # Add 20% buffer
                 'gasPrice': gas_price,
-                'nonce': web3.eth.get_transaction_count(account.address),
+                'nonce': await web3_pool.run(to_chain, web3.eth.get_transaction_count, account.address),
                 'chainId': config['chain_id']
             })
             
-            print(f"📤 Sending mint transaction on {to_chain}...")
-            print(f"   Gas estimate: {gas_estimate}")
-            print(f"   Gas price: {gas_price}")
-            print(f"   Nonce: {transaction['nonce']}")
+            logger.debug("📤 Sending mint transaction on %s...", to_chain)
+            logger.debug("   Gas estimate: %s", gas_estimate)
+            logger.debug("   Gas price: %s", gas_price)
+            logger.debug("   Nonce: %s", transaction['nonce'])
             
             # Sign and send transaction
             signed_txn = web3.eth.account.sign_transaction(transaction, private_key=account.key)
-            tx_hash = web3.eth.send_raw_transaction(signed_txn.raw_transaction)
+            tx_hash = await web3_pool.run(to_chain, web3.eth.send_raw_transaction, signed_txn.raw_transaction)
             
-            print(f"✅ Mint transaction sent: {tx_hash.hex()}")
+            logger.info("✅ Mint transaction sent: %s", tx_hash.hex())
             
             # Wait for confirmation
-            receipt = web3.eth.wait_for_transaction_receipt(tx_hash, timeout=120)
+            receipt = await web3_pool.run(to_chain, web3.eth.wait_for_transaction_receipt, tx_hash, timeout=120, bounded=False)
             
             if receipt.status == 1:
-                print(f"✅ NFT minted successfully on {to_chain}")
-                print(f"   Block: {receipt.blockNumber}")
-                print(f"   Gas used: {receipt.gasUsed}")
+                logger.info("✅ NFT minted successfully on %s", to_chain)
+                logger.debug("   Block: %s", receipt.blockNumber)
+                logger.debug("   Gas used: %s", receipt.gasUsed)
                 
                 # Verify minting
                 try:
-                    owner = nft_contract.functions.ownerOf(token_id).call()
-                    token_uri_stored = nft_contract.functions.tokenURI(token_id).call()
-                    print(f"✅ Verification:")
-                    print(f"   Owner: {owner}")
-                    print(f"   Expected: {to_address}")
-                    print(f"   Owner match: {owner.lower() == to_address.lower()}")
-                    print(f"   Token URI: {token_uri_stored}")
+                    owner = await web3_pool.run(to_chain, nft_contract.functions.ownerOf(token_id).call)
+                    token_uri_stored = await web3_pool.run(to_chain, nft_contract.functions.tokenURI(token_id).call)
+                    logger.info("✅ Verification:")
+                    logger.debug("   Owner: %s", owner)
+                    logger.debug("   Expected: %s", to_address)
+                    logger.debug("   Owner match: %s", owner.lower() == to_address.lower())
+                    logger.debug("   Token URI: %s", token_uri_stored)
                 except Exception as verify_error:
-                    print(f"⚠️ Verification failed: {verify_error}")
+                    logger.warning("⚠️ Verification failed: %s", verify_error)
                 
                 return {
                     "success": True,
@@ -731,7 +751,7 @@ class NFTBridgeService:
                 raise Exception(f"Mint transaction failed with status: {receipt.status}")
                 
         except Exception as e:
-            print(f"❌ Failed to mint NFT on destination chain: {e}")
+            logger.error("❌ Failed to mint NFT on destination chain: %s", e)
             return {
                 "success": False,
                 "error": str(e),
@@ -740,4 +760,4 @@ class NFTBridgeService:
             }
 
 # Global instance
-nft_bridge_service = NFTBridgeService()
\ No newline at end of file
+nft_bridge_service = service_registry.register("nft_bridge", NFTBridgeService(), depends_on=["blockchain"], lazy=True)
\ No newline at end of file
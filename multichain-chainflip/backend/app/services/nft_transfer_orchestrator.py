@@ -20,9 +20,17 @@ from enum import Enum
 from motor.motor_asyncio import AsyncIOMotorDatabase
 from web3 import Web3
 
+from ..core.index_manifest import index_manifest
 from .layerzero_oft_bridge_service import layerzero_oft_bridge_service
 from .blockchain_service import blockchain_service
 
+for _collection in ["nft_transfers", "nft_escrows", "nft_transfer_steps", "nft_ownership_history"]:
+    index_manifest.register("nft_transfer_orchestrator", _collection, "timestamp")
+index_manifest.register("nft_transfer_orchestrator", "nft_transfers", "token_id")
+index_manifest.register("nft_transfer_orchestrator", "nft_transfers", "purchase_request_id")
+index_manifest.register("nft_transfer_orchestrator", "nft_escrows", "escrow_id")
+index_manifest.register("nft_transfer_orchestrator", "nft_transfer_steps", "transfer_id")
+
 
 class TransferStatus(Enum):
     PENDING = "pending"
@@ -128,21 +136,7 @@ class NFTTransferOrchestrator:
     
     async def _ensure_collections(self):
         """Ensure required database collections exist"""
-        collections = [
-            "nft_transfers",
-            "nft_escrows",
-            "nft_transfer_steps",
-            "nft_ownership_history"
-        ]
-        
-        for collection in collections:
-            await self.database[collection].create_index("timestamp")
-        
-        # Create specific indexes
-        await self.database["nft_transfers"].create_index("token_id")
-        await self.database["nft_transfers"].create_index("purchase_request_id")
-        await self.database["nft_escrows"].create_index("escrow_id")
-        await self.database["nft_transfer_steps"].create_index("transfer_id")
+        await index_manifest.apply(self.database, owners=["nft_transfer_orchestrator"])
     
     # === MAIN TRANSFER ORCHESTRATION ===
     
@@ -0,0 +1,338 @@
+"""
+NFT Ownership Indexer Service
+Follows ERC-721 Transfer logs on every configured NFT contract and keeps the
+nft_ownership_index collection (owner, chain, token_id, token_uri, cid) current
+"""
+import asyncio
+import time
+from typing import Any, Dict, List, Optional
+
+from pymongo import DeleteOne, UpdateOne
+from web3 import Web3
+
+from app.core.config import get_settings
+from app.core.database import get_database
+from app.core.index_manifest import index_manifest
+from app.core.log import get_logger
+from app.core.rpc_batch import batch_reader
+from app.core.service_registry import service_registry
+from app.core.web3_pool import web3_pool
+
+settings = get_settings()
+logger = get_logger(__name__)
+
+index_manifest.register("ownership_indexer", "nft_ownership_index", [("chain", 1), ("contract", 1), ("token_id", 1)], unique=True)
+index_manifest.register("ownership_indexer", "nft_ownership_index", [("owner", 1), ("chain", 1)])
+index_manifest.register("ownership_indexer", "nft_ownership_checkpoints", [("chain", 1), ("contract", 1)], unique=True)
+index_manifest.register_query("ownership_indexer", "nft_ownership_index", {"owner": "0x0", "chain": "polygon_amoy"})
+
+TRANSFER_TOPIC = Web3.to_hex(Web3.keccak(text="Transfer(address,address,uint256)"))
+ZERO_ADDRESS = "0x0000000000000000000000000000000000000000"
+
+TOKEN_URI_ABI = [
+    {
+        "inputs": [{"internalType": "uint256", "name": "tokenId", "type": "uint256"}],
+        "name": "tokenURI",
+        "outputs": [{"internalType": "string", "name": "", "type": "string"}],
+        "stateMutability": "view",
+        "type": "function"
+    }
+]
+
+
+def indexed_contracts() -> Dict[str, str]:
+    """NFT contract per chain that the indexer follows"""
+    contracts = {
+        "base_sepolia": settings.nft_contract_base_sepolia,
+        "optimism_sepolia": settings.nft_contract_op_sepolia,
+        "arbitrum_sepolia": settings.nft_contract_arbitrum_sepolia,
+        "polygon_amoy": settings.nft_contract_polygon_amoy,
+    }
+    return {chain: Web3.to_checksum_address(address) for chain, address in contracts.items() if address}
+
+
+def configured_start_blocks() -> Dict[str, int]:
+    return {
+        "base_sepolia": settings.nft_index_start_block_base_sepolia,
+        "optimism_sepolia": settings.nft_index_start_block_op_sepolia,
+        "arbitrum_sepolia": settings.nft_index_start_block_arbitrum_sepolia,
+        "polygon_amoy": settings.nft_index_start_block_polygon_amoy,
+    }
+
+
+def extract_cid_from_uri(token_uri: str) -> Optional[str]:
+    """Extract CID from token URI"""
+    try:
+        if "ipfs://" in token_uri:
+            return token_uri.replace("ipfs://", "").split("/")[0]
+        elif ".ipfs." in token_uri:
+            # Handle gateway URLs like https://bafybei....ipfs.dweb.link/metadata.json
+            parts = token_uri.split(".ipfs.")
+            if len(parts) > 0:
+                cid_part = parts[0].split("/")[-1]
+                return cid_part
+        return None
+    except Exception as e:
+        logger.warning("⚠️ Error extracting CID from URI %s: %s", token_uri, e)
+        return None
+
+
+class OwnershipIndexerService:
+    """
+    Background indexer for NFT ownership
+
+    - each chain resumes from its checkpoint in nft_ownership_checkpoints and
+      reads Transfer logs in block ranges that shrink when the RPC rejects a range
+    - the last transfer of each token wins; burns remove the token
+    - confirmations blocks are left unindexed so shallow reorgs don't corrupt the index
+    - a chain counts as fresh while its last sync reached the head within
+      max_staleness seconds; a backfill in progress is never fresh
+    """
+
+    def __init__(
+        self,
+        poll_interval: int = settings.nft_index_poll_interval,
+        max_staleness: int = settings.nft_index_max_staleness,
+        block_range: int = 2000,
+        min_block_range: int = 50,
+        confirmations: int = 2,
+        fallback_lookback: int = 50000,
+    ):
+        self.database = None
+        self.poll_interval = poll_interval
+        self.max_staleness = max_staleness
+        self.max_block_range = block_range
+        self.min_block_range = min_block_range
+        self.confirmations = confirmations
+        self.fallback_lookback = fallback_lookback
+        self.contracts = indexed_contracts()
+        self.start_blocks = configured_start_blocks()
+        self._block_ranges: Dict[str, int] = {}
+        self._task: Optional[asyncio.Task] = None
+
+    async def initialize(self):
+        self.database = await get_database()
+        await index_manifest.apply(self.database, owners=["ownership_indexer"])
+        logger.info("✅ NFT ownership indexer initialized for %s", list(self.contracts) or 'no configured contracts')
+
+    def start(self):
+        """Start the background sync loop"""
+        if self.contracts and (self._task is None or self._task.done()):
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if self._task and not self._task.done():
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        self._task = None
+
+    async def _run(self):
+        while True:
+            await asyncio.gather(*(self._sync_safely(chain) for chain in self.contracts))
+            await asyncio.sleep(self.poll_interval)
+
+    async def _sync_safely(self, chain: str):
+        try:
+            await self.sync_chain(chain)
+        except Exception as e:
+            logger.warning("⚠️ Ownership index sync failed for %s: %s", chain, e)
+
+    async def _checkpoint(self, chain: str) -> Optional[Dict[str, Any]]:
+        return await self.database.nft_ownership_checkpoints.find_one(
+            {"chain": chain, "contract": self.contracts[chain]}
+        )
+
+    async def _initial_block(self, chain: str, w3: Web3, latest: int) -> int:
+        """First block for a chain without checkpoint: configured, else the contract deployment block"""
+        if self.start_blocks.get(chain):
+            return self.start_blocks[chain]
+
+        address = self.contracts[chain]
+        try:
+            # Binary search for the first block where the contract has code
+            low, high = 0, latest
+            while low < high:
+                middle = (low + high) // 2
+                code = await web3_pool.run(chain, w3.eth.get_code, address, middle)
+                if code:
+                    high = middle
+                else:
+                    low = middle + 1
+            logger.debug("📍 %s NFT contract deployed at block %s", chain, low)
+            return low
+        except Exception as e:
+            # Pruned nodes can't serve historical state
+            start = max(0, latest - self.fallback_lookback)
+            logger.warning("⚠️ Could not locate deployment block on %s (%s); indexing from block %s", chain, e, start)
+            return start
+
+    async def sync_chain(self, chain: str) -> int:
+        """Index Transfer logs on one chain up to the confirmed head; returns the number of tokens updated"""
+        address = self.contracts[chain]
+        w3 = web3_pool.web3(chain)
+        latest = await web3_pool.run(chain, lambda: w3.eth.block_number) - self.confirmations
+
+        checkpoint = await self._checkpoint(chain)
+        from_block = checkpoint["last_block"] + 1 if checkpoint else await self._initial_block(chain, w3, latest)
+
+        if checkpoint and from_block > latest:
+            # Already at the head; record that the index is current
+            await self.database.nft_ownership_checkpoints.update_one(
+                {"chain": chain, "contract": address},
+                {"$set": {"head_synced_at": time.time()}},
+            )
+            return 0
+
+        applied = 0
+        while from_block <= latest:
+            block_range = self._block_ranges.get(chain, self.max_block_range)
+            to_block = min(from_block + block_range - 1, latest)
+            try:
+                logs = await web3_pool.run(chain, w3.eth.get_logs, {
+                    "address": address,
+                    "topics": [TRANSFER_TOPIC],
+                    "fromBlock": from_block,
+                    "toBlock": to_block,
+                })
+            except Exception as e:
+                if block_range <= self.min_block_range:
+                    raise
+                # Most public RPCs cap the range or the result size of eth_getLogs
+                self._block_ranges[chain] = max(self.min_block_range, block_range // 2)
+                logger.warning("⚠️ %s getLogs %s-%s rejected, range -> %s: %s", chain, from_block, to_block, self._block_ranges[chain], e)
+                continue
+
+            applied += await self._apply_transfers(chain, w3, logs)
+            progress = {"last_block": to_block}
+            if to_block == latest:
+                progress["head_synced_at"] = time.time()
+            await self.database.nft_ownership_checkpoints.update_one(
+                {"chain": chain, "contract": address},
+                {"$set": progress},
+                upsert=True,
+            )
+            from_block = to_block + 1
+            if block_range < self.max_block_range:
+                self._block_ranges[chain] = min(self.max_block_range, block_range * 2)
+        return applied
+
+    async def _apply_transfers(self, chain: str, w3: Web3, logs: List[Dict[str, Any]]) -> int:
+        address = self.contracts[chain]
+        latest_transfer: Dict[int, Dict[str, Any]] = {}
+        for log in sorted(logs, key=lambda entry: (entry["blockNumber"], entry["logIndex"])):
+            topics = log["topics"]
+            # ERC-721 indexes tokenId; ERC-20 Transfer logs have only three topics
+            if len(topics) != 4:
+                continue
+            token_id = int.from_bytes(bytes(topics[3]), "big")
+            latest_transfer[token_id] = {
+                "owner": Web3.to_checksum_address(bytes(topics[2])[-20:]).lower(),
+                "block": log["blockNumber"],
+                "tx_hash": Web3.to_hex(log["transactionHash"]),
+            }
+        if not latest_transfer:
+            return 0
+
+        now = time.time()
+        operations = []
+        minted = []
+        for token_id, transfer in latest_transfer.items():
+            key = {"chain": chain, "contract": address, "token_id": str(token_id)}
+            if transfer["owner"] == ZERO_ADDRESS:
+                operations.append(DeleteOne(key))
+                continue
+            minted.append(token_id)
+            operations.append(UpdateOne(
+                key,
+                {
+                    "$set": {
+                        "owner": transfer["owner"],
+                        "last_transfer_block": transfer["block"],
+                        "last_transfer_tx": transfer["tx_hash"],
+                        "updated_at": now,
+                    },
+                    "$setOnInsert": {"token_uri": None, "cid": None},
+                },
+                upsert=True,
+            ))
+        await self.database.nft_ownership_index.bulk_write(operations, ordered=False)
+        await self._fill_token_uris(chain, w3, minted)
+        return len(latest_transfer)
+
+    async def _fill_token_uris(self, chain: str, w3: Web3, token_ids: List[int]):
+        """Resolve tokenURI/CID for indexed tokens that don't have one yet"""
+        address = self.contracts[chain]
+        missing = await self.database.nft_ownership_index.distinct("token_id", {
+            "chain": chain,
+            "contract": address,
+            "token_id": {"$in": [str(token_id) for token_id in token_ids]},
+            "token_uri": None,
+        })
+        if not missing:
+            return
+
+        contract = w3.eth.contract(address=address, abi=TOKEN_URI_ABI)
+        results = await batch_reader.call(chain, [contract.functions.tokenURI(int(token_id)) for token_id in missing])
+        operations = [
+            UpdateOne(
+                {"chain": chain, "contract": address, "token_id": token_id},
+                {"$set": {"token_uri": result.value, "cid": extract_cid_from_uri(result.value)}},
+            )
+            for token_id, result in zip(missing, results)
+            if result.success
+        ]
+        if operations:
+            await self.database.nft_ownership_index.bulk_write(operations, ordered=False)
+
+    async def fresh_chains(self, max_staleness: Optional[int] = None) -> List[str]:
+        """Chains whose index reached the head within max_staleness seconds"""
+        max_staleness = self.max_staleness if max_staleness is None else max_staleness
+        cutoff = time.time() - max_staleness
+        cursor = self.database.nft_ownership_checkpoints.find(
+            {"head_synced_at": {"$gte": cutoff}}, {"chain": 1, "contract": 1}
+        )
+        return [
+            checkpoint["chain"]
+            async for checkpoint in cursor
+            if self.contracts.get(checkpoint["chain"]) == checkpoint["contract"]
+        ]
+
+    async def get_owned_tokens(self, owner: str, max_staleness: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Tokens owned by an address according to the index
+
+        Returns {"tokens": [...], "stale_chains": [...]}; stale_chains lists the
+        configured chains whose index is older than max_staleness and can't be trusted.
+        """
+        fresh = await self.fresh_chains(max_staleness)
+        tokens = []
+        if fresh:
+            cursor = self.database.nft_ownership_index.find(
+                {"owner": owner.lower(), "chain": {"$in": fresh}}, {"_id": 0}
+            )
+            tokens = [token async for token in cursor]
+        return {
+            "tokens": tokens,
+            "stale_chains": [chain for chain in self.contracts if chain not in fresh],
+        }
+
+    async def get_status(self) -> Dict[str, Any]:
+        status = {}
+        for chain, address in self.contracts.items():
+            checkpoint = await self._checkpoint(chain)
+            status[chain] = {
+                "contract": address,
+                "last_block": checkpoint["last_block"] if checkpoint else None,
+                "head_synced_seconds_ago": (
+                    round(time.time() - checkpoint["head_synced_at"], 1)
+                    if checkpoint and checkpoint.get("head_synced_at") else None
+                ),
+                "indexed_tokens": await self.database.nft_ownership_index.count_documents({"chain": chain, "contract": address}),
+            }
+        return status
+
+
+ownership_indexer_service = service_registry.register("ownership_indexer", OwnershipIndexerService())
@@ -3,10 +3,20 @@ Ownership Verification Service
 Enhanced service to verify product ownership across multiple chains and handle cross-chain transfers
 """
 
+import asyncio
 import time
 from typing import Dict, List, Any, Optional
 from web3 import Web3
 
+from app.core.log import get_logger
+from app.core.rpc_batch import batch_reader
+from app.core.service_registry import service_registry
+from app.core.response_cache import invalidate_product_views
+from app.core.web3_pool import web3_pool
+from app.services.ownership_indexer_service import extract_cid_from_uri, ownership_indexer_service
+
+logger = get_logger(__name__)
+
 
 class OwnershipVerificationService:
     """
@@ -59,7 +69,7 @@ class OwnershipVerificationService:
             List of products owned by the buyer
         """
         try:
-            print(f"🔍 Finding owned products for buyer {buyer_address}")
+            logger.debug("🔍 Finding owned products for buyer %s", buyer_address)
             
             # Step 1: Get products from database where current_owner matches
             db_owned_products = []
@@ -69,7 +79,7 @@ class OwnershipVerificationService:
                 product["verification_method"] = "database"
                 db_owned_products.append(product)
             
-            print(f"📊 Found {len(db_owned_products)} products in database")
+            logger.debug("📊 Found %s products in database", len(db_owned_products))
             
             # Step 2: If on-chain verification is requested, check blockchain
             if verify_on_chain:
@@ -94,93 +104,121 @@ class OwnershipVerificationService:
                 return db_owned_products
                 
         except Exception as e:
-            print(f"❌ Error getting owned products: {e}")
+            logger.error("❌ Error getting owned products: %s", e)
             return []
     
     async def _verify_on_chain_ownership(self, buyer_address: str, db_products: List[Dict]) -> List[Dict[str, Any]]:
         """
         Verify on-chain ownership for products
         This is useful for cross-chain scenarios where CID is the same but token_id changes
+        
+        Answered from the Transfer-event ownership index; chains whose index is
+        older than the staleness bound, or every chain when the index is not
+        available, are scanned on-chain instead.
         """
         verified_products = []
         
         try:
-            # Check each supported chain
-            chains_to_check = ["optimism_sepolia", "polygon_amoy", "base_sepolia", "arbitrum_sepolia"]
-            
-            for chain_name in chains_to_check:
-                web3_conn = self.web3_connections.get(chain_name)
-                contract_addr = self.contract_addresses.get(chain_name)
-                
-                if not web3_conn or not contract_addr:
-                    continue
-                    
-                print(f"🔍 Checking {chain_name} for owned NFTs...")
-                
+            indexed = {"tokens": [], "stale_chains": list(self.web3_connections)}
+            if service_registry.is_initialized("ownership_indexer"):
                 try:
-                    # Create contract instance
-                    nft_contract = web3_conn.eth.contract(
-                        address=contract_addr,
-                        abi=self.nft_abi
-                    )
-                    
-                    # Get total supply to know how many tokens to check
-                    total_supply = nft_contract.functions.totalSupply().call()
-                    print(f"📊 {chain_name} total supply: {total_supply}")
-                    
-                    # Check ownership for each token (this is expensive, so we limit it)
-                    max_tokens_to_check = min(total_supply, 100)  # Limit for performance
-                    
-                    for token_id in range(1, max_tokens_to_check + 1):
-                        try:
-                            owner = nft_contract.functions.ownerOf(token_id).call()
-                            
-                            if owner.lower() == buyer_address.lower():
-                                # Get token URI to find CID
-                                token_uri = nft_contract.functions.tokenURI(token_id).call()
-                                
-                                # Extract CID from token URI
-                                cid = self._extract_cid_from_uri(token_uri)
-                                
-                                if cid:
-                                    verified_products.append({
-                                        "chain": chain_name,
-                                        "token_id": token_id,
-                                        "owner": owner,
-                                        "cid": cid,
-                                        "token_uri": token_uri,
-                                        "verification_method": "blockchain"
-                                    })
-                                    print(f"✅ Found owned NFT on {chain_name}: token {token_id}, CID {cid}")
-                                    
-                        except Exception as token_error:
-                            # Token might not exist or other error, continue
-                            continue
-                            
-                except Exception as chain_error:
-                    print(f"⚠️ Error checking {chain_name}: {chain_error}")
-                    continue
+                    indexed = await ownership_indexer_service.get_owned_tokens(buyer_address)
+                except Exception as e:
+                    logger.warning("⚠️ Ownership index unavailable (%s), scanning all chains", e)
+            else:
+                logger.warning("⚠️ Ownership indexer not initialized, scanning all chains")
+            
+            for token in indexed["tokens"]:
+                if token.get("cid"):
+                    verified_products.append({
+                        "chain": token["chain"],
+                        "token_id": int(token["token_id"]),
+                        "owner": Web3.to_checksum_address(token["owner"]),
+                        "cid": token["cid"],
+                        "token_uri": token["token_uri"],
+                        "verification_method": "blockchain"
+                    })
+            
+            stale_chains = [chain for chain in indexed["stale_chains"] if chain in self.web3_connections]
+            if stale_chains:
+                logger.warning("⚠️ Ownership index stale for %s, scanning on-chain", stale_chains)
+            chain_results = await asyncio.gather(*(
+                self._scan_chain_ownership(chain_name, buyer_address)
+                for chain_name in stale_chains
+            ))
+            for chain_products in chain_results:
+                verified_products.extend(chain_products)
                     
         except Exception as e:
-            print(f"❌ Error in on-chain verification: {e}")
+            logger.error("❌ Error in on-chain verification: %s", e)
             
         return verified_products
     
+    async def _scan_chain_ownership(self, chain_name: str, buyer_address: str) -> List[Dict[str, Any]]:
+        """Find tokens owned by buyer_address on one chain using batched ownerOf/tokenURI reads"""
+        web3_conn = self.web3_connections.get(chain_name)
+        contract_addr = self.contract_addresses.get(chain_name)
+        
+        if not web3_conn or not contract_addr:
+            return []
+            
+        logger.debug("🔍 Checking %s for owned NFTs...", chain_name)
+        
+        try:
+            # Create contract instance
+            nft_contract = web3_conn.eth.contract(
+                address=contract_addr,
+                abi=self.nft_abi
+            )
+            
+            # Get total supply to know how many tokens to check
+            total_supply = await web3_pool.run(chain_name, nft_contract.functions.totalSupply().call)
+            logger.debug("📊 %s total supply: %s", chain_name, total_supply)
+            
+            # Check ownership for each token (this is expensive, so we limit it)
+            max_tokens_to_check = min(total_supply, 100)  # Limit for performance
+            token_ids = list(range(1, max_tokens_to_check + 1))
+            
+            # Tokens that don't exist simply come back as failed calls
+            owners = await batch_reader.call(chain_name, [nft_contract.functions.ownerOf(token_id) for token_id in token_ids])
+            owned = [
+                (token_id, result.value)
+                for token_id, result in zip(token_ids, owners)
+                if result.success and result.value.lower() == buyer_address.lower()
+            ]
+            
+            # Get token URIs to find CIDs
+            token_uris = await batch_reader.call(chain_name, [nft_contract.functions.tokenURI(token_id) for token_id, _ in owned])
+            
+            verified_products = []
+            for (token_id, owner), uri_result in zip(owned, token_uris):
+                if not uri_result.success:
+                    continue
+                token_uri = uri_result.value
+                
+                # Extract CID from token URI
+                cid = self._extract_cid_from_uri(token_uri)
+                
+                if cid:
+                    verified_products.append({
+                        "chain": chain_name,
+                        "token_id": token_id,
+                        "owner": owner,
+                        "cid": cid,
+                        "token_uri": token_uri,
+                        "verification_method": "blockchain"
+                    })
+                    logger.debug("✅ Found owned NFT on %s: token %s, CID %s", chain_name, token_id, cid)
+            
+            return verified_products
+                    
+        except Exception as chain_error:
+            logger.warning("⚠️ Error checking %s: %s", chain_name, chain_error)
+            return []
+    
     def _extract_cid_from_uri(self, token_uri: str) -> Optional[str]:
         """Extract CID from token URI"""
-        try:
-            if "ipfs://" in token_uri:
-                return token_uri.replace("ipfs://", "").split("/")[0]
-            elif ".ipfs." in token_uri:
-                # Handle gateway URLs like https://bafybei....ipfs.dweb.link/metadata.json
-                parts = token_uri.split(".ipfs.")
-                if len(parts) > 0:
-                    cid_part = parts[0].split("/")[-1]
-                    return cid_part
-            return None
-        except Exception as e:
-            print(f"⚠️ Error extracting CID from URI {token_uri}: {e}")
-            return None
+        return extract_cid_from_uri(token_uri)
     
     async def update_product_ownership(self, product_id: str, new_owner: str, chain: str = None, token_id: str = None) -> bool:
         """
@@ -206,14 +244,15 @@ class OwnershipVerificationService:
             )
             
             if result.modified_count > 0:
-                print(f"✅ Updated ownership for product {product_id} to {new_owner}")
+                await invalidate_product_views(product_id)
+                logger.info("✅ Updated ownership for product %s to %s", product_id, new_owner)
                 return True
             else:
-                print(f"⚠️ No product found with token_id {product_id}")
+                logger.warning("⚠️ No product found with token_id %s", product_id)
                 return False
                 
         except Exception as e:
-            print(f"❌ Error updating product ownership: {e}")
+            logger.error("❌ Error updating product ownership: %s", e)
             return False
     
     async def verify_single_product_ownership(self, product_id: str, claimed_owner: str, verify_on_chain: bool = True) -> Dict[str, Any]:
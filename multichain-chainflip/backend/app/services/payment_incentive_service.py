@@ -13,9 +13,24 @@ from decimal import Decimal
 
 from motor.motor_asyncio import AsyncIOMotorDatabase
 
+from ..core.index_manifest import index_manifest
+from ..core.service_registry import service_registry
 from .blockchain_service import blockchain_service
 from .multichain_service import multichain_service
 
+for _collection in ["escrow_payments", "payment_distributions", "transporter_incentives",
+                    "payment_disputes", "performance_metrics"]:
+    index_manifest.register("payment_incentive", _collection, "timestamp")
+index_manifest.register("payment_incentive", "escrow_payments", [("purchase_request_id", 1), ("buyer_address", 1)])
+index_manifest.register("payment_incentive", "escrow_payments", "payment_id")
+index_manifest.register("payment_incentive", "escrow_payments", "status")
+index_manifest.register("payment_incentive", "transporter_incentives", "transporter_address")
+index_manifest.register("payment_incentive", "performance_metrics", "transporter_address")
+
+index_manifest.register_query("payment_incentive", "escrow_payments", {"purchase_request_id": "r"})
+index_manifest.register_query("payment_incentive", "escrow_payments", {"purchase_request_id": "r", "buyer_address": "0x0"})
+index_manifest.register_query("payment_incentive", "escrow_payments", {"payment_id": "p"})
+
 
 @dataclass
 class EscrowPayment:
@@ -107,22 +122,7 @@ class PaymentIncentiveService:
             self.logger.warning("Database is None, skipping collection initialization")
             return
             
-        collections = [
-            "escrow_payments",
-            "payment_distributions", 
-            "transporter_incentives",
-            "payment_disputes",
-            "performance_metrics"
-        ]
-        
-        for collection in collections:
-            await self.database[collection].create_index("timestamp")
-            
-        # Create specific indexes
-        await self.database["escrow_payments"].create_index("purchase_request_id")
-        await self.database["escrow_payments"].create_index("status")
-        await self.database["transporter_incentives"].create_index("transporter_address")
-        await self.database["performance_metrics"].create_index("transporter_address")
+        await index_manifest.apply(self.database, owners=["payment_incentive"])
     
     # === ESCROW PAYMENT SYSTEM ===
     
@@ -650,4 +650,4 @@ class PaymentIncentiveService:
 
 
 # Global service instance
-payment_incentive_service = PaymentIncentiveService()
\ No newline at end of file
+payment_incentive_service = service_registry.register("payment_incentive", PaymentIncentiveService(), depends_on=["blockchain"])
\ No newline at end of file
@@ -13,9 +13,41 @@ from decimal import Decimal
 
 from motor.motor_asyncio import AsyncIOMotorDatabase
 
+from ..core.index_manifest import index_manifest
+from ..core.response_cache import invalidate_product_views
+from ..core.service_registry import service_registry
 from .blockchain_service import blockchain_service
 from .ipfs_service import ipfs_service
 
+for _collection in ["marketplace_listings", "ownership_transfers", "product_valuations",
+                    "resale_history", "marketplace_transactions", "product_condition_reports"]:
+    index_manifest.register("post_supply_chain", _collection, "timestamp")
+index_manifest.register("post_supply_chain", "marketplace_listings", "listing_id")
+index_manifest.register("post_supply_chain", "marketplace_listings", [("product_id", 1), ("status", 1)])
+index_manifest.register("post_supply_chain", "marketplace_listings", [("seller_address", 1), ("status", 1)])
+index_manifest.register("post_supply_chain", "marketplace_listings", [("status", 1), ("listing_price", 1)])
+index_manifest.register("post_supply_chain", "ownership_transfers", [("product_id", 1), ("verification_status", 1), ("completed_at", -1)])
+index_manifest.register("post_supply_chain", "ownership_transfers", [("product_id", 1), ("completed_at", -1)])
+index_manifest.register("post_supply_chain", "ownership_transfers", [("to_address", 1), ("completed_at", -1)])
+index_manifest.register("post_supply_chain", "ownership_transfers", [("from_address", 1), ("completed_at", -1)])
+index_manifest.register("post_supply_chain", "ownership_transfers", [("completed_at", -1)])
+index_manifest.register("post_supply_chain", "product_valuations", "product_id")
+index_manifest.register("post_supply_chain", "resale_history", [("product_id", 1), ("sale_date", -1)])
+
+index_manifest.register_query("post_supply_chain", "marketplace_listings", {"product_id": "p", "status": "active"})
+index_manifest.register_query("post_supply_chain", "marketplace_listings", {"listing_id": "l"})
+index_manifest.register_query("post_supply_chain", "marketplace_listings", {"seller_address": "0x0", "status": "active"})
+index_manifest.register_query("post_supply_chain", "marketplace_listings", {"status": "active", "listing_price": {"$gte": 0}},
+                              sort=[("listing_price", 1)], name="marketplace_listings:active_by_price")
+index_manifest.register_query("post_supply_chain", "ownership_transfers", {"product_id": "p", "status": "pending"})
+index_manifest.register_query("post_supply_chain", "ownership_transfers", {"product_id": "p", "verification_status": "completed"},
+                              sort=[("completed_at", -1)], name="ownership_transfers:historical_prices")
+index_manifest.register_query("post_supply_chain", "ownership_transfers", {"to_address": "0x0"}, sort=[("completed_at", -1)])
+index_manifest.register_query("post_supply_chain", "ownership_transfers", {"from_address": "0x0"}, sort=[("completed_at", -1)])
+index_manifest.register_query("post_supply_chain", "ownership_transfers", {"completed_at": {"$gte": 0, "$lte": 1}},
+                              name="ownership_transfers:completed_range")
+index_manifest.register_query("post_supply_chain", "resale_history", {"product_id": "p"}, sort=[("sale_date", -1)])
+
 
 @dataclass
 class MarketplaceListing:
@@ -119,24 +151,7 @@ class PostSupplyChainService:
             self.logger.warning("Database is None, skipping collection initialization")
             return
             
-        collections = [
-            "marketplace_listings",
-            "ownership_transfers", 
-            "product_valuations",
-            "resale_history",
-            "marketplace_transactions",
-            "product_condition_reports"
-        ]
-        
-        for collection in collections:
-            await self.database[collection].create_index("timestamp")
-            
-        # Create specific indexes
-        await self.database["marketplace_listings"].create_index("product_id")
-        await self.database["marketplace_listings"].create_index("seller_address") 
-        await self.database["marketplace_listings"].create_index("status")
-        await self.database["ownership_transfers"].create_index("product_id")
-        await self.database["product_valuations"].create_index("product_id")
+        await index_manifest.apply(self.database, owners=["post_supply_chain"])
     
     # === SECONDARY MARKETPLACE FUNCTIONALITY ===
     
@@ -752,6 +767,7 @@ class PostSupplyChainService:
                 {"token_id": product_id},
                 {"$set": update_data}
             )
+            await invalidate_product_views(product_id)
         except Exception as e:
             self.logger.error(f"⚠️ Product status update failed: {e}")
     
@@ -777,6 +793,7 @@ class PostSupplyChainService:
                     }
                 }
             )
+            await invalidate_product_views(product_id)
         except Exception as e:
             self.logger.error(f"⚠️ Product ownership update failed: {e}")
     
@@ -1285,4 +1302,4 @@ class PostSupplyChainService:
 
 
 # Global service instance
-post_supply_chain_service = PostSupplyChainService()
\ No newline at end of file
+post_supply_chain_service = service_registry.register("post_supply_chain", PostSupplyChainService(), depends_on=["blockchain"])
\ No newline at end of file
@@ -8,13 +8,23 @@ import asyncio
 import json
 import time
 from decimal import Decimal
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Any
 from web3 import Web3
 from eth_account import Account
 from app.core.config import get_settings
+from app.core.web3_pool import web3_pool
 from app.core.database import get_database
+from app.core.index_manifest import index_manifest
+from app.core.log import get_logger
+from app.core.service_registry import service_registry
+from app.core.tx_pipeline import tx_pipeline
 
 settings = get_settings()
+logger = get_logger(__name__)
+
+index_manifest.register("real_weth_bridge", "token_transfers", "transfer_id")
+index_manifest.register("real_weth_bridge", "token_transfers", [("timestamp", -1)])
+index_manifest.register_query("real_weth_bridge", "token_transfers", {"transfer_id": "t"})
 
 def convert_decimals_to_float(obj):
     """
@@ -201,41 +211,34 @@ class RealWETHBridgeService:
     async def initialize(self):
         """Initialize real WETH bridge service"""
         self.database = await get_database()
+        await index_manifest.apply(self.database, owners=["real_weth_bridge"])
         
         # Initialize account
         from app.services.multi_account_manager import address_key_manager
         deployer_account_info = address_key_manager.get_account_info_for_address('0x032041b4b356fEE1496805DD4749f181bC736FFA')
         if deployer_account_info:
             self.current_account = deployer_account_info['account']
-            print(f"🔑 Real WETH Bridge using account: {self.current_account.address}")
+            logger.debug("🔑 Real WETH Bridge using account: %s", self.current_account.address)
         
         # Initialize chain connections and contracts
         await self._initialize_connections()
         
-        print("✅ Real WETH Bridge Service initialized")
-        print("📄 Using verified WETH contracts:")
+        logger.info("✅ Real WETH Bridge Service initialized")
+        logger.debug("📄 Using verified WETH contracts:")
         for chain, config in self.weth_contracts.items():
-            print(f"   {chain}: {config['address']}")
+            logger.debug("   %s: %s", chain, config['address'])
     
     async def _initialize_connections(self):
-        """Initialize Web3 connections and contract instances with fallback RPCs"""
+        """Initialize Web3 connections and contract instances; the RPC router fails over between alternative RPCs"""
         
         for chain_name, config in self.weth_contracts.items():
             try:
-                # Try primary RPC first
-                web3 = await self._try_rpc_connection(config['rpc'], chain_name)
-                
-                # If primary fails, try alternatives
-                if not web3 or not web3.is_connected():
-                    print(f"⚠️ Primary RPC failed for {chain_name}, trying alternatives...")
-                    for alt_rpc in config.get('alternative_rpcs', []):
-                        web3 = await self._try_rpc_connection(alt_rpc, chain_name)
-                        if web3 and web3.is_connected():
-                            print(f"✅ Connected to {chain_name} using alternative RPC: {alt_rpc}")
-                            break
+                web3_pool.add_endpoints(chain_name, [config['rpc'], *config.get('alternative_rpcs', [])])
+                web3 = await web3_pool.connect(chain_name)
                 
-                if web3 and web3.is_connected():
+                if web3:
                     self.web3_connections[chain_name] = web3
+                    logger.debug("✅ %s RPC: %s", chain_name, web3_pool.rpc_url(chain_name))
                     
                     # Initialize WETH contract
                     weth_contract = web3.eth.contract(
@@ -252,43 +255,12 @@ class RealWETHBridgeService:
                         )
                         self.bridge_instances[chain_name] = bridge_contract
                     
-                    print(f"✅ Connected to {chain_name} with real WETH contract")
+                    logger.debug("✅ Connected to %s with real WETH contract", chain_name)
                 else:
-                    print(f"❌ Failed to connect to {chain_name} with all available RPCs")
+                    logger.warning("❌ Failed to connect to %s with all available RPCs", chain_name)
                     
             except Exception as e:
-                print(f"⚠️ Error initializing {chain_name}: {e}")
-
-    async def _try_rpc_connection(self, rpc_url: str, chain_name: str) -> Optional[Web3]:
-        """Try to connect to a specific RPC with comprehensive testing"""
-        try:
-            print(f"🔍 Testing RPC connection: {rpc_url}")
-            web3 = Web3(Web3.HTTPProvider(rpc_url))
-            
-            if web3.is_connected():
-                # Test basic functionality
-                try:
-                    chain_id = web3.eth.chain_id
-                    latest_block = web3.eth.block_number
-                    gas_price = web3.eth.gas_price
-                    
-                    print(f"✅ RPC working - Chain ID: {chain_id}, Block: {latest_block}")
-                    
-                    # Test transaction capabilities
-                    test_nonce = web3.eth.get_transaction_count(self.current_account.address)
-                    print(f"✅ RPC can read account state - Nonce: {test_nonce}")
-                    
-                    return web3
-                except Exception as e:
-                    print(f"❌ RPC connected but has issues: {e}")
-                    return None
-            else:
-                print(f"❌ RPC connection failed")
-                return None
-                
-        except Exception as e:
-            print(f"❌ RPC connection error: {e}")
-            return None
+                logger.warning("⚠️ Error initializing %s: %s", chain_name, e)
 
     async def _deep_transaction_debug(self, web3: Web3, tx_hash: str, chain_name: str) -> Dict[str, Any]:
         """Deep debugging of transaction submission and blockchain state"""
@@ -303,33 +275,33 @@ class RealWETHBridgeService:
         }
         
         try:
-            print(f"🔍🔍🔍 DEEP TRANSACTION DEBUG for {tx_hash}")
+            logger.debug("🔍🔍🔍 DEEP TRANSACTION DEBUG for %s", tx_hash)
             
             # Check if transaction exists immediately after submission
             try:
-                immediate_tx = web3.eth.get_transaction(tx_hash)
+                immediate_tx = await web3_pool.run(chain_name, web3.eth.get_transaction, tx_hash)
                 if immediate_tx:
                     debug_info["found_immediately"] = True
                     debug_info["rpc_response_valid"] = True
-                    print(f"✅ Transaction found immediately: {immediate_tx}")
+                    logger.info("✅ Transaction found immediately: %s", immediate_tx)
                 else:
-                    print(f"❌ Transaction returned None immediately")
+                    logger.warning("❌ Transaction returned None immediately")
             except Exception as e:
                 debug_info["errors"].append(f"Immediate lookup failed: {e}")
-                print(f"❌ Transaction NOT found immediately after submission: {e}")
+                logger.error("❌ Transaction NOT found immediately after submission: %s", e)
             
             # Wait a moment and check again
             await asyncio.sleep(2)
             try:
-                pending_tx = web3.eth.get_transaction(tx_hash)
+                pending_tx = await web3_pool.run(chain_name, web3.eth.get_transaction, tx_hash)
                 if pending_tx:
                     debug_info["found_in_mempool"] = True
-                    print(f"✅ Transaction found in mempool: {pending_tx}")
+                    logger.info("✅ Transaction found in mempool: %s", pending_tx)
                 else:
-                    print(f"❌ Transaction not found in mempool after 2 seconds")
+                    logger.warning("❌ Transaction not found in mempool after 2 seconds")
             except Exception as e:
                 debug_info["errors"].append(f"Mempool lookup failed: {e}")
-                print(f"❌ Transaction NOT in mempool: {e}")
+                logger.error("❌ Transaction NOT in mempool: %s", e)
             
             # Generate block explorer link
             if chain_name == "optimism_sepolia":
@@ -341,11 +313,11 @@ class RealWETHBridgeService:
             elif chain_name == "base_sepolia":
                 debug_info["block_explorer_check"] = f"https://sepolia.basescan.org/tx/{tx_hash}"
             
-            print(f"🌐 Check on block explorer: {debug_info['block_explorer_check']}")
+            logger.debug("🌐 Check on block explorer: %s", debug_info['block_explorer_check'])
             
         except Exception as e:
             debug_info["errors"].append(f"Deep debug error: {e}")
-            print(f"❌ Deep transaction debug failed: {e}")
+            logger.error("❌ Deep transaction debug failed: %s", e)
         
         return debug_info
 
@@ -365,40 +337,40 @@ class RealWETHBridgeService:
                 'to': '0x0000000000000000000000000000000000000000',
                 'value': 0,
                 'gas': 21000,
-                'gasPrice': web3.eth.gas_price,
-                'nonce': web3.eth.get_transaction_count(self.current_account.address),
-                'chainId': web3.eth.chain_id
+                'gasPrice': await web3_pool.run(chain_name, lambda: web3.eth.gas_price),
+                'nonce': await web3_pool.run(chain_name, web3.eth.get_transaction_count, self.current_account.address),
+                'chainId': await web3_pool.run(chain_name, lambda: web3.eth.chain_id)
             }
             
             try:
-                estimated_gas = web3.eth.estimate_gas(test_tx)
+                estimated_gas = await web3_pool.run(chain_name, web3.eth.estimate_gas, test_tx)
                 test_info["can_estimate_gas"] = True
-                print(f"✅ RPC can estimate gas: {estimated_gas}")
+                logger.info("✅ RPC can estimate gas: %s", estimated_gas)
             except Exception as e:
                 test_info["errors"].append(f"Gas estimation failed: {e}")
-                print(f"❌ Cannot estimate gas: {e}")
+                logger.error("❌ Cannot estimate gas: %s", e)
             
             # Test nonce retrieval
             try:
-                nonce = web3.eth.get_transaction_count(self.current_account.address)
+                nonce = await web3_pool.run(chain_name, web3.eth.get_transaction_count, self.current_account.address)
                 test_info["can_get_nonce"] = True
-                print(f"✅ RPC can get nonce: {nonce}")
+                logger.info("✅ RPC can get nonce: %s", nonce)
             except Exception as e:
                 test_info["errors"].append(f"Nonce retrieval failed: {e}")
-                print(f"❌ Cannot get nonce: {e}")
+                logger.error("❌ Cannot get nonce: %s", e)
             
             # Test transaction simulation (call)
             try:
-                result = web3.eth.call(test_tx)
+                result = await web3_pool.run(chain_name, web3.eth.call, test_tx)
                 test_info["can_simulate_transaction"] = True
-                print(f"✅ RPC can simulate transactions")
+                logger.info("✅ RPC can simulate transactions")
             except Exception as e:
                 test_info["errors"].append(f"Transaction simulation failed: {e}")
-                print(f"❌ Cannot simulate transactions: {e}")
+                logger.error("❌ Cannot simulate transactions: %s", e)
             
         except Exception as e:
             test_info["errors"].append(f"RPC capability test failed: {e}")
-            print(f"❌ RPC capability test failed: {e}")
+            logger.error("❌ RPC capability test failed: %s", e)
         
         return test_info
 
@@ -416,29 +388,29 @@ class RealWETHBridgeService:
         
         try:
             # Test basic connectivity
-            debug_info["is_connected"] = web3.is_connected()
-            print(f"🔍 {chain_name} - Web3 connected: {debug_info['is_connected']}")
+            debug_info["is_connected"] = await web3_pool.run(chain_name, web3.is_connected)
+            logger.debug("🔍 %s - Web3 connected: %s", chain_name, debug_info['is_connected'])
             
             if debug_info["is_connected"]:
                 # Get chain ID
                 try:
-                    debug_info["chain_id"] = web3.eth.chain_id
-                    print(f"🔍 {chain_name} - Chain ID: {debug_info['chain_id']}")
+                    debug_info["chain_id"] = await web3_pool.run(chain_name, lambda: web3.eth.chain_id)
+                    logger.debug("🔍 %s - Chain ID: %s", chain_name, debug_info['chain_id'])
                 except Exception as e:
                     debug_info["errors"].append(f"Chain ID error: {e}")
                 
                 # Get latest block
                 try:
-                    debug_info["latest_block"] = web3.eth.block_number
-                    print(f"🔍 {chain_name} - Latest block: {debug_info['latest_block']}")
+                    debug_info["latest_block"] = await web3_pool.run(chain_name, lambda: web3.eth.block_number)
+                    logger.debug("🔍 %s - Latest block: %s", chain_name, debug_info['latest_block'])
                 except Exception as e:
                     debug_info["errors"].append(f"Latest block error: {e}")
                 
                 # Get gas price
                 try:
-                    debug_info["gas_price"] = web3.eth.gas_price
+                    debug_info["gas_price"] = await web3_pool.run(chain_name, lambda: web3.eth.gas_price)
                     gas_price_gwei = Web3.from_wei(debug_info["gas_price"], 'gwei')
-                    print(f"🔍 {chain_name} - Gas price: {gas_price_gwei} gwei")
+                    logger.debug("🔍 %s - Gas price: %s gwei", chain_name, gas_price_gwei)
                 except Exception as e:
                     debug_info["errors"].append(f"Gas price error: {e}")
                 
@@ -463,26 +435,26 @@ class RealWETHBridgeService:
         
         try:
             # Get account balance
-            balance_wei = web3.eth.get_balance(self.current_account.address)
+            balance_wei = await web3_pool.run(chain_name, web3.eth.get_balance, self.current_account.address)
             account_info["eth_balance_wei"] = balance_wei
             account_info["eth_balance"] = float(Web3.from_wei(balance_wei, 'ether'))
-            print(f"🔍 {chain_name} - Account balance: {account_info['eth_balance']} ETH")
+            logger.debug("🔍 %s - Account balance: %s ETH", chain_name, account_info['eth_balance'])
             
             # Get nonce
-            account_info["nonce"] = web3.eth.get_transaction_count(self.current_account.address)
-            print(f"🔍 {chain_name} - Account nonce: {account_info['nonce']}")
+            account_info["nonce"] = await web3_pool.run(chain_name, web3.eth.get_transaction_count, self.current_account.address)
+            logger.debug("🔍 %s - Account nonce: %s", chain_name, account_info['nonce'])
             
             # Check if sufficient for gas (estimate 0.01 ETH minimum)
             min_required_wei = Web3.to_wei(0.01, 'ether')
             account_info["sufficient_for_gas"] = balance_wei >= min_required_wei
-            print(f"🔍 {chain_name} - Sufficient for gas: {account_info['sufficient_for_gas']}")
+            logger.debug("🔍 %s - Sufficient for gas: %s", chain_name, account_info['sufficient_for_gas'])
             
             if not account_info["sufficient_for_gas"]:
-                print(f"⚠️ {chain_name} - Low balance! Need at least 0.01 ETH for gas")
+                logger.warning("⚠️ %s - Low balance! Need at least 0.01 ETH for gas", chain_name)
             
         except Exception as e:
             account_info["errors"].append(f"Account state error: {e}")
-            print(f"❌ {chain_name} - Account debug error: {e}")
+            logger.error("❌ %s - Account debug error: %s", chain_name, e)
         
         return account_info
 
@@ -498,31 +470,31 @@ class RealWETHBridgeService:
         
         try:
             # Estimate gas for transaction
-            estimated_gas = web3.eth.estimate_gas(transaction)
+            estimated_gas = await web3_pool.run(chain_name, web3.eth.estimate_gas, transaction)
             validation["estimated_gas"] = estimated_gas
-            print(f"🔍 {chain_name} - Estimated gas: {estimated_gas}")
+            logger.debug("🔍 %s - Estimated gas: %s", chain_name, estimated_gas)
             
             # Calculate gas cost
-            gas_price = transaction.get('gasPrice', web3.eth.gas_price)
+            gas_price = transaction.get('gasPrice', await web3_pool.run(chain_name, lambda: web3.eth.gas_price))
             gas_cost_wei = estimated_gas * gas_price
             validation["gas_cost_wei"] = gas_cost_wei
             validation["gas_cost_eth"] = float(Web3.from_wei(gas_cost_wei, 'ether'))
-            print(f"🔍 {chain_name} - Gas cost: {validation['gas_cost_eth']} ETH")
+            logger.debug("🔍 %s - Gas cost: %s ETH", chain_name, validation['gas_cost_eth'])
             
             # Check if account has sufficient balance
-            account_balance = web3.eth.get_balance(self.current_account.address)
+            account_balance = await web3_pool.run(chain_name, web3.eth.get_balance, self.current_account.address)
             total_required = gas_cost_wei + transaction.get('value', 0)
             
             if account_balance >= total_required:
                 validation["valid"] = True
-                print(f"✅ {chain_name} - Transaction validation passed")
+                logger.info("✅ %s - Transaction validation passed", chain_name)
             else:
                 validation["errors"].append(f"Insufficient balance. Required: {Web3.from_wei(total_required, 'ether')} ETH, Available: {Web3.from_wei(account_balance, 'ether')} ETH")
-                print(f"❌ {chain_name} - Insufficient balance for transaction")
+                logger.warning("❌ %s - Insufficient balance for transaction", chain_name)
             
         except Exception as e:
             validation["errors"].append(f"Transaction validation error: {e}")
-            print(f"❌ {chain_name} - Transaction validation failed: {e}")
+            logger.error("❌ %s - Transaction validation failed: %s", chain_name, e)
         
         return validation
 
@@ -539,28 +511,23 @@ class RealWETHBridgeService:
         }
         
         try:
-            print(f"🚀 {chain_name} - Submitting {operation_name} transaction...")
-            
-            # Sign transaction
-            signed_txn = web3.eth.account.sign_transaction(transaction, self.current_account.key)
-            print(f"✅ {chain_name} - Transaction signed successfully")
-            print(f"🔍 Raw transaction: {signed_txn.raw_transaction.hex()}")
+            logger.debug("🚀 %s - Submitting %s transaction...", chain_name, operation_name)
             
-            # Submit transaction to blockchain
-            submission_start = time.time()
-            tx_hash = web3.eth.send_raw_transaction(signed_txn.raw_transaction)
+            # Sign and submit transaction to blockchain (nonce is assigned by tx_pipeline)
+            pending_txn = await tx_pipeline.submit(chain_name, web3, self.current_account, transaction)
+            tx_hash = pending_txn.tx_hash
             result["transaction_hash"] = tx_hash.hex()
-            print(f"📡 {chain_name} - Transaction submitted: {result['transaction_hash']}")
+            logger.debug("📡 %s - Transaction submitted: %s", chain_name, result['transaction_hash'])
             
             # DEEP DEBUGGING - Check if transaction actually made it to blockchain
             result["deep_debug"] = await self._deep_transaction_debug(web3, result["transaction_hash"], chain_name)
             
             # Wait for transaction receipt with timeout
-            print(f"⏳ {chain_name} - Waiting for confirmation...")
+            logger.debug("⏳ %s - Waiting for confirmation...", chain_name)
             receipt_start = time.time()
             
             try:
-                tx_receipt = web3.eth.wait_for_transaction_receipt(tx_hash, timeout=300)  # 5 minute timeout
+                tx_receipt = await pending_txn.receipt(timeout=300)  # 5 minute timeout
                 result["confirmation_time"] = time.time() - receipt_start
                 
                 if tx_receipt.status == 1:
@@ -568,59 +535,59 @@ class RealWETHBridgeService:
                     result["gas_used"] = tx_receipt.gasUsed
                     result["block_number"] = tx_receipt.blockNumber
                     
-                    print(f"✅ {chain_name} - {operation_name} transaction confirmed!")
-                    print(f"   📦 Block: {result['block_number']}")
-                    print(f"   ⛽ Gas used: {result['gas_used']}")
-                    print(f"   ⏱️ Confirmation time: {result['confirmation_time']:.2f}s")
+                    logger.info("✅ %s - %s transaction confirmed!", chain_name, operation_name)
+                    logger.debug("   📦 Block: %s", result['block_number'])
+                    logger.debug("   ⛽ Gas used: %s", result['gas_used'])
+                    logger.debug("   ⏱️ Confirmation time: %.2fs", result['confirmation_time'])
                     
                     # Additional verification - check if transaction actually exists on blockchain
                     try:
-                        verified_tx = web3.eth.get_transaction(tx_hash)
+                        verified_tx = await web3_pool.run(chain_name, web3.eth.get_transaction, tx_hash)
                         if verified_tx:
-                            print(f"✅ {chain_name} - Transaction verified on blockchain")
+                            logger.info("✅ %s - Transaction verified on blockchain", chain_name)
                             result["deep_debug"]["confirmed_on_blockchain"] = True
                         else:
                             result["errors"].append("Transaction not found on blockchain after confirmation")
-                            print(f"❌ {chain_name} - Transaction not found on blockchain after confirmation")
+                            logger.warning("❌ %s - Transaction not found on blockchain after confirmation", chain_name)
                     except Exception as e:
                         result["errors"].append(f"Blockchain verification error: {e}")
-                        print(f"❌ {chain_name} - Blockchain verification error: {e}")
+                        logger.error("❌ %s - Blockchain verification error: %s", chain_name, e)
                         
                 else:
                     result["success"] = False
                     result["errors"].append(f"Transaction failed with status: {tx_receipt.status}")
-                    print(f"❌ {chain_name} - Transaction failed!")
+                    logger.warning("❌ %s - Transaction failed!", chain_name)
                     
             except Exception as e:
                 result["errors"].append(f"Transaction confirmation timeout or error: {e}")
-                print(f"❌ {chain_name} - Transaction confirmation failed: {e}")
+                logger.error("❌ %s - Transaction confirmation failed: %s", chain_name, e)
                 
                 # If confirmation failed, check if transaction is still pending
                 try:
-                    pending_tx = web3.eth.get_transaction(tx_hash)
+                    pending_tx = await web3_pool.run(chain_name, web3.eth.get_transaction, tx_hash)
                     if pending_tx:
-                        print(f"⚠️ {chain_name} - Transaction still pending in mempool")
+                        logger.warning("⚠️ %s - Transaction still pending in mempool", chain_name)
                         result["errors"].append("Transaction pending but not confirmed within timeout")
                     else:
-                        print(f"❌ {chain_name} - Transaction disappeared from mempool")
+                        logger.error("❌ %s - Transaction disappeared from mempool", chain_name)
                         result["errors"].append("Transaction not found in mempool after timeout")
                 except Exception as lookup_e:
-                    print(f"❌ {chain_name} - Cannot lookup transaction after timeout: {lookup_e}")
+                    logger.error("❌ %s - Cannot lookup transaction after timeout: %s", chain_name, lookup_e)
                     result["errors"].append(f"Transaction lookup failed after timeout: {lookup_e}")
                 
         except Exception as e:
             result["errors"].append(f"Transaction submission error: {e}")
-            print(f"❌ {chain_name} - Transaction submission failed: {e}")
+            logger.error("❌ %s - Transaction submission failed: %s", chain_name, e)
         
         # Print summary of deep debugging
-        print(f"\n🔍🔍🔍 DEEP DEBUG SUMMARY for {operation_name}:")
-        print(f"   Transaction Hash: {result['transaction_hash']}")
-        print(f"   Found Immediately: {result['deep_debug'].get('found_immediately', False)}")
-        print(f"   Found in Mempool: {result['deep_debug'].get('found_in_mempool', False)}")
-        print(f"   Confirmed on Blockchain: {result['deep_debug'].get('confirmed_on_blockchain', False)}")
-        print(f"   Block Explorer: {result['deep_debug'].get('block_explorer_check', 'N/A')}")
+        logger.debug("\n🔍🔍🔍 DEEP DEBUG SUMMARY for %s:", operation_name)
+        logger.debug("   Transaction Hash: %s", result['transaction_hash'])
+        logger.debug("   Found Immediately: %s", result['deep_debug'].get('found_immediately', False))
+        logger.debug("   Found in Mempool: %s", result['deep_debug'].get('found_in_mempool', False))
+        logger.debug("   Confirmed on Blockchain: %s", result['deep_debug'].get('confirmed_on_blockchain', False))
+        logger.debug("   Block Explorer: %s", result['deep_debug'].get('block_explorer_check', 'N/A'))
         if result['deep_debug'].get('errors'):
-            print(f"   Debug Errors: {result['deep_debug']['errors']}")
+            logger.debug("   Debug Errors: %s", result['deep_debug']['errors'])
         
         return result
     
@@ -630,9 +597,9 @@ class RealWETHBridgeService:
         This fixes the bug where users were getting free transfers
         """
         try:
-            print(f"💸 === STEP 1: COLLECT USER ETH ON {chain_name.upper()} ===")
-            print(f"💸 Collecting {Web3.from_wei(amount_wei, 'ether')} ETH from user {user_address}")
-            print(f"   Bridge service will receive ETH from user on {chain_name}")
+            logger.debug("💸 === STEP 1: COLLECT USER ETH ON %s ===", chain_name.upper())
+            logger.debug("💸 Collecting %s ETH from user %s", Web3.from_wei(amount_wei, 'ether'), user_address)
+            logger.debug("   Bridge service will receive ETH from user on %s", chain_name)
             
             # Get user's account from multi-account manager
             from app.services.multi_account_manager import address_key_manager
@@ -643,7 +610,7 @@ class RealWETHBridgeService:
             user_account = user_account_info['account']
             
             # Check user's ETH balance
-            user_balance = web3.eth.get_balance(user_account.address)
+            user_balance = await web3_pool.run(chain_name, web3.eth.get_balance, user_account.address)
             required_total = amount_wei + Web3.to_wei(0.01, 'ether')  # Amount + gas buffer
             
             if user_balance < required_total:
@@ -653,49 +620,43 @@ class RealWETHBridgeService:
                 }
             
             # Build transaction to send ETH from user to bridge service
-            nonce = web3.eth.get_transaction_count(user_account.address)
-            chain_id = web3.eth.chain_id
+            chain_id = await web3_pool.run(chain_name, lambda: web3.eth.chain_id)
             
             # Use dynamic gas price with minimum floor
-            base_gas_price = web3.eth.gas_price
-            min_gas_price = Web3.to_wei(1, 'gwei')
-            gas_price = max(base_gas_price, min_gas_price)
+            gas_price = await tx_pipeline.gas_price(chain_name, web3, minimum=Web3.to_wei(1, 'gwei'))
             
             transaction = {
                 'to': self.current_account.address,  # Bridge service address
                 'value': amount_wei,  # User's ETH to bridge service
                 'gas': 21000,  # Standard ETH transfer gas
                 'gasPrice': gas_price,
-                'nonce': nonce,
                 'chainId': chain_id
             }
             
-            print(f"🔍 User ETH collection transaction:")
-            print(f"   From (User): {user_account.address}")
-            print(f"   To (Bridge): {self.current_account.address}")
-            print(f"   Amount: {Web3.from_wei(amount_wei, 'ether')} ETH")
-            print(f"   Gas: {transaction['gas']}")
-            print(f"   Gas Price: {Web3.from_wei(gas_price, 'gwei')} gwei")
+            logger.debug("🔍 User ETH collection transaction:")
+            logger.debug("   From (User): %s", user_account.address)
+            logger.debug("   To (Bridge): %s", self.current_account.address)
+            logger.debug("   Amount: %s ETH", Web3.from_wei(amount_wei, 'ether'))
+            logger.debug("   Gas: %s", transaction['gas'])
+            logger.debug("   Gas Price: %s gwei", Web3.from_wei(gas_price, 'gwei'))
             
-            # Sign transaction with user's private key
-            signed_txn = web3.eth.account.sign_transaction(transaction, user_account.key)
-            
-            # Submit transaction
-            tx_hash = web3.eth.send_raw_transaction(signed_txn.raw_transaction)
+            # Sign with user's private key and submit transaction
+            pending_txn = await tx_pipeline.submit(chain_name, web3, user_account, transaction)
+            tx_hash = pending_txn.tx_hash
             tx_hash_hex = tx_hash.hex()
-            print(f"📡 User ETH collection submitted: {tx_hash_hex}")
+            logger.debug("📡 User ETH collection submitted: %s", tx_hash_hex)
             
             # Wait for confirmation
-            receipt = web3.eth.wait_for_transaction_receipt(tx_hash, timeout=300)
+            receipt = await pending_txn.receipt(timeout=300)
             
             if receipt.status == 1:
-                print(f"✅ User ETH collected successfully!")
-                print(f"   User paid: {Web3.from_wei(amount_wei, 'ether')} ETH")
-                print(f"   Bridge received: {Web3.from_wei(amount_wei, 'ether')} ETH")
+                logger.info("✅ User ETH collected successfully!")
+                logger.debug("   User paid: %s ETH", Web3.from_wei(amount_wei, 'ether'))
+                logger.debug("   Bridge received: %s ETH", Web3.from_wei(amount_wei, 'ether'))
                 
                 # Verify bridge service balance increased
-                new_bridge_balance = web3.eth.get_balance(self.current_account.address)
-                print(f"   Bridge service balance updated: {Web3.from_wei(new_bridge_balance, 'ether')} ETH")
+                new_bridge_balance = await web3_pool.run(chain_name, web3.eth.get_balance, self.current_account.address)
+                logger.debug("   Bridge service balance updated: %s ETH", Web3.from_wei(new_bridge_balance, 'ether'))
                 
                 return {
                     "success": True,
@@ -709,7 +670,7 @@ class RealWETHBridgeService:
                 return {"success": False, "error": f"User ETH collection transaction failed with status: {receipt.status}"}
             
         except Exception as e:
-            print(f"❌ User ETH collection error: {e}")
+            logger.error("❌ User ETH collection error: %s", e)
             return {"success": False, "error": str(e)}
 
     async def _return_eth_to_user(self, web3: Web3, chain_name: str, user_address: str, amount_wei: int) -> Dict[str, Any]:
@@ -717,35 +678,29 @@ class RealWETHBridgeService:
         Rollback mechanism: Return ETH to user if transfer fails
         """
         try:
-            print(f"🔄 === ROLLBACK: RETURNING ETH TO USER ===")
-            print(f"💰 Returning {Web3.from_wei(amount_wei, 'ether')} ETH to user {user_address}")
+            logger.debug("🔄 === ROLLBACK: RETURNING ETH TO USER ===")
+            logger.debug("💰 Returning %s ETH to user %s", Web3.from_wei(amount_wei, 'ether'), user_address)
             
             # Build transaction to send ETH from bridge service back to user
-            nonce = web3.eth.get_transaction_count(self.current_account.address)
-            chain_id = web3.eth.chain_id
+            chain_id = await web3_pool.run(chain_name, lambda: web3.eth.chain_id)
             
-            base_gas_price = web3.eth.gas_price
-            min_gas_price = Web3.to_wei(1, 'gwei')
-            gas_price = max(base_gas_price, min_gas_price)
+            gas_price = await tx_pipeline.gas_price(chain_name, web3, minimum=Web3.to_wei(1, 'gwei'))
             
             transaction = {
                 'to': user_address,  # Back to user
                 'value': amount_wei,  # Return the ETH
                 'gas': 21000,
                 'gasPrice': gas_price,
-                'nonce': nonce,
                 'chainId': chain_id
             }
             
-            # Sign with bridge service account
-            signed_txn = web3.eth.account.sign_transaction(transaction, self.current_account.key)
-            
-            # Submit transaction
-            tx_hash = web3.eth.send_raw_transaction(signed_txn.raw_transaction)
-            receipt = web3.eth.wait_for_transaction_receipt(tx_hash, timeout=300)
+            # Sign with bridge service account and submit transaction
+            pending_txn = await tx_pipeline.submit(chain_name, web3, self.current_account, transaction)
+            tx_hash = pending_txn.tx_hash
+            receipt = await pending_txn.receipt(timeout=300)
             
             if receipt.status == 1:
-                print(f"✅ ETH returned to user successfully: {tx_hash.hex()}")
+                logger.info("✅ ETH returned to user successfully: %s", tx_hash.hex())
                 return {
                     "success": True,
                     "transaction_hash": tx_hash.hex(),
@@ -755,7 +710,7 @@ class RealWETHBridgeService:
                 return {"success": False, "error": "Failed to return ETH to user"}
                 
         except Exception as e:
-            print(f"❌ ETH return error: {e}")
+            logger.error("❌ ETH return error: %s", e)
             return {"success": False, "error": str(e)}
 
     async def transfer_eth_cross_chain(
@@ -772,21 +727,21 @@ class RealWETHBridgeService:
         FIXED: Now properly collects user ETH first, then executes transfer
         """
         try:
-            print(f"\n🌉 === REAL CROSS-CHAIN ETH TRANSFER ===")
-            print(f"📤 From: {from_chain} ({from_address})")
-            print(f"📥 To: {to_chain} ({to_address})")
-            print(f"💰 Amount: {amount_eth} ETH")
-            print(f"🔗 Escrow ID: {escrow_id}")
+            logger.debug("\n🌉 === REAL CROSS-CHAIN ETH TRANSFER ===")
+            logger.debug("📤 From: %s (%s)", from_chain, from_address)
+            logger.debug("📥 To: %s (%s)", to_chain, to_address)
+            logger.debug("💰 Amount: %s ETH", amount_eth)
+            logger.debug("🔗 Escrow ID: %s", escrow_id)
             
             # Determine if this is same-chain or cross-chain
             is_cross_chain = from_chain != to_chain
-            print(f"🔀 Transfer type: {'Cross-chain' if is_cross_chain else 'Same-chain'}")
+            logger.debug("🔀 Transfer type: %s", 'Cross-chain' if is_cross_chain else 'Same-chain')
             
             # Get Web3 instances
             source_web3 = self.web3_connections.get(from_chain)
             if not source_web3:
                 error_msg = f"Source chain {from_chain} not connected"
-                print(f"❌ {error_msg}")
+                logger.warning("❌ %s", error_msg)
                 return {"success": False, "error": error_msg}
                 
             # For cross-chain, also need target chain connection
@@ -795,11 +750,11 @@ class RealWETHBridgeService:
                 target_web3 = self.web3_connections.get(to_chain)
                 if not target_web3:
                     error_msg = f"Target chain {to_chain} not connected"
-                    print(f"❌ {error_msg}")
+                    logger.warning("❌ %s", error_msg)
                     return {"success": False, "error": error_msg}
             
             # Debug Web3 connections
-            print(f"\n🔍 === CONNECTION DEBUGGING ===")
+            logger.debug("\n🔍 === CONNECTION DEBUGGING ===")
             source_debug = await self._debug_web3_connection(source_web3, from_chain)
             account_debug = await self._debug_account_state(source_web3, from_chain)
             
@@ -811,7 +766,7 @@ class RealWETHBridgeService:
             
             # Convert amount to Wei
             amount_wei = int(amount_eth * 10**18)
-            print(f"\n💱 Amount in Wei: {amount_wei}")
+            logger.debug("\n💱 Amount in Wei: %s", amount_wei)
             
             # STEP 1: COLLECT USER ETH (CRITICAL FIX)
             collect_result = await self._collect_user_eth(source_web3, from_chain, from_address, amount_wei)
@@ -830,7 +785,7 @@ class RealWETHBridgeService:
             
             # STEP 3: Handle transfer result
             if transfer_result["success"]:
-                print(f"✅ === TRANSFER COMPLETED SUCCESSFULLY ===")
+                logger.info("✅ === TRANSFER COMPLETED SUCCESSFULLY ===")
                 
                 # Store comprehensive transfer record
                 transfer_record = {
@@ -869,11 +824,11 @@ class RealWETHBridgeService:
                 # Store in database
                 await self.database.token_transfers.insert_one(transfer_record)
                 
-                print(f"💾 Transfer record saved to database")
-                print(f"   Collection TX: {collect_result['transaction_hash']}")
-                print(f"   Transfer TX: {transfer_result['transaction_hash']}")
-                print(f"   User paid: {amount_eth} ETH")
-                print(f"   Recipient received: {amount_eth} ETH")
+                logger.debug("💾 Transfer record saved to database")
+                logger.debug("   Collection TX: %s", collect_result['transaction_hash'])
+                logger.debug("   Transfer TX: %s", transfer_result['transaction_hash'])
+                logger.debug("   User paid: %s ETH", amount_eth)
+                logger.debug("   Recipient received: %s ETH", amount_eth)
                 
                 # Prepare API response
                 response_data = {
@@ -899,7 +854,7 @@ class RealWETHBridgeService:
                 return convert_decimals_to_float(response_data)
                 
             else:
-                print(f"❌ Transfer failed, returning ETH to user...")
+                logger.warning("❌ Transfer failed, returning ETH to user...")
                 # Return ETH to user on failure
                 rollback_result = await self._return_eth_to_user(source_web3, from_chain, from_address, amount_wei)
                 
@@ -912,7 +867,7 @@ class RealWETHBridgeService:
                 return {"success": False, "error": error_msg}
             
         except Exception as e:
-            print(f"❌ Real cross-chain transfer error: {e}")
+            logger.error("❌ Real cross-chain transfer error: %s", e)
             return {"success": False, "error": str(e)}
     
     async def _bridge_eth_cross_chain_simplified(
@@ -929,19 +884,19 @@ class RealWETHBridgeService:
         FIXED: Bridge service already has ETH from user, just send it to recipient
         """
         try:
-            print(f"🌉 Bridging {Web3.from_wei(amount_wei, 'ether')} ETH from {from_chain} to {to_chain}")
-            print(f"   Direct ETH transfer to recipient: {to_address}")
-            print(f"   Bridge service already has ETH from user collection step")
+            logger.debug("🌉 Bridging %s ETH from %s to %s", Web3.from_wei(amount_wei, 'ether'), from_chain, to_chain)
+            logger.debug("   Direct ETH transfer to recipient: %s", to_address)
+            logger.debug("   Bridge service already has ETH from user collection step")
             
             # Send ETH directly from bridge service to recipient on target chain
-            print(f"\n💸 Sending ETH from bridge service to recipient on target chain ({to_chain})")
+            logger.debug("\n💸 Sending ETH from bridge service to recipient on target chain (%s)", to_chain)
             eth_transfer_result = await self._send_eth_to_recipient(target_web3, to_chain, to_address, amount_wei)
             if not eth_transfer_result["success"]:
                 return {"success": False, "error": f"Failed to send ETH to recipient: {eth_transfer_result['error']}"}
             
-            print(f"✅ Cross-chain bridge completed successfully!")
-            print(f"   Bridge service sent ETH to recipient: {eth_transfer_result.get('transaction_hash')}")
-            print(f"   Recipient {to_address} received {Web3.from_wei(amount_wei, 'ether')} ETH on {to_chain}")
+            logger.info("✅ Cross-chain bridge completed successfully!")
+            logger.debug("   Bridge service sent ETH to recipient: %s", eth_transfer_result.get('transaction_hash'))
+            logger.debug("   Recipient %s received %s ETH on %s", to_address, Web3.from_wei(amount_wei, 'ether'), to_chain)
             
             return {
                 "success": True,
@@ -953,7 +908,7 @@ class RealWETHBridgeService:
             }
             
         except Exception as e:
-            print(f"❌ Cross-chain bridge error: {e}")
+            logger.error("❌ Cross-chain bridge error: %s", e)
             return {"success": False, "error": str(e)}
     
     async def _send_eth_to_recipient(
@@ -968,12 +923,12 @@ class RealWETHBridgeService:
         This ensures the recipient gets the tokens in their native ETH form
         """
         try:
-            print(f"💸 Sending {Web3.from_wei(amount_wei, 'ether')} ETH on {target_chain} to {recipient_address}")
+            logger.debug("💸 Sending %s ETH on %s to %s", Web3.from_wei(amount_wei, 'ether'), target_chain, recipient_address)
             
             # Check if we have enough ETH on target chain
-            account_balance = target_web3.eth.get_balance(self.current_account.address)
+            account_balance = await web3_pool.run(target_chain, target_web3.eth.get_balance, self.current_account.address)
             gas_estimate = 21000  # Standard ETH transfer gas
-            gas_price = target_web3.eth.gas_price
+            gas_price = await web3_pool.run(target_chain, lambda: target_web3.eth.gas_price)
             gas_cost = gas_estimate * gas_price
             total_required = amount_wei + gas_cost
             
@@ -984,30 +939,25 @@ class RealWETHBridgeService:
                 }
             
             # Build ETH transfer transaction
-            nonce = target_web3.eth.get_transaction_count(self.current_account.address)
-            chain_id = target_web3.eth.chain_id
+            chain_id = await web3_pool.run(target_chain, lambda: target_web3.eth.chain_id)
             
             # Use dynamic gas price with minimum floor
-            base_gas_price = target_web3.eth.gas_price
-            min_gas_price = Web3.to_wei(1, 'gwei')  # Minimum 1 gwei
-            gas_price = max(base_gas_price, min_gas_price)
+            gas_price = await tx_pipeline.gas_price(target_chain, target_web3, minimum=Web3.to_wei(1, 'gwei'))  # Minimum 1 gwei
             
             transaction = {
                 'to': recipient_address,
                 'value': amount_wei,
                 'gas': gas_estimate,
                 'gasPrice': gas_price,
-                'nonce': nonce,
                 'chainId': chain_id
             }
             
-            print(f"🔍 ETH Transfer transaction details:")
-            print(f"   From: {self.current_account.address}")
-            print(f"   To: {recipient_address}")
-            print(f"   Amount: {Web3.from_wei(amount_wei, 'ether')} ETH")
-            print(f"   Gas: {transaction['gas']}")
-            print(f"   Gas Price: {Web3.from_wei(transaction['gasPrice'], 'gwei')} gwei")
-            print(f"   Nonce: {transaction['nonce']}")
+            logger.debug("🔍 ETH Transfer transaction details:")
+            logger.debug("   From: %s", self.current_account.address)
+            logger.debug("   To: %s", recipient_address)
+            logger.debug("   Amount: %s ETH", Web3.from_wei(amount_wei, 'ether'))
+            logger.debug("   Gas: %s", transaction['gas'])
+            logger.debug("   Gas Price: %s gwei", Web3.from_wei(transaction['gasPrice'], 'gwei'))
             
             # Validate transaction
             validation = await self._validate_transaction_before_submission(target_web3, transaction, target_chain)
@@ -1020,17 +970,17 @@ class RealWETHBridgeService:
             if result["success"]:
                 # Verify balance change after transfer
                 try:
-                    new_account_balance = target_web3.eth.get_balance(self.current_account.address)
-                    recipient_balance = target_web3.eth.get_balance(recipient_address)
-                    print(f"✅ ETH transfer completed successfully")
-                    print(f"   Sender new balance: {Web3.from_wei(new_account_balance, 'ether')} ETH")
-                    print(f"   Recipient balance: {Web3.from_wei(recipient_balance, 'ether')} ETH")
+                    new_account_balance = await web3_pool.run(target_chain, target_web3.eth.get_balance, self.current_account.address)
+                    recipient_balance = await web3_pool.run(target_chain, target_web3.eth.get_balance, recipient_address)
+                    logger.info("✅ ETH transfer completed successfully")
+                    logger.debug("   Sender new balance: %s ETH", Web3.from_wei(new_account_balance, 'ether'))
+                    logger.debug("   Recipient balance: %s ETH", Web3.from_wei(recipient_balance, 'ether'))
                     
                     # Additional verification - check if recipient actually received the ETH
-                    print(f"✅ CONFIRMED: Recipient {recipient_address} received ETH on {target_chain}!")
+                    logger.info("✅ CONFIRMED: Recipient %s received ETH on %s!", recipient_address, target_chain)
                         
                 except Exception as e:
-                    print(f"⚠️ Balance verification error: {e}")
+                    logger.warning("⚠️ Balance verification error: %s", e)
                 
                 return {
                     "success": True,
@@ -1044,13 +994,13 @@ class RealWETHBridgeService:
                 return {"success": False, "error": f"ETH transfer transaction failed: {result['errors']}"}
                 
         except Exception as e:
-            print(f"❌ ETH transfer error: {e}")
+            logger.error("❌ ETH transfer error: %s", e)
             return {"success": False, "error": str(e)}
     
     async def _wrap_eth_to_weth(self, web3: Web3, chain_name: str, user_address: str, amount_wei: int) -> Dict[str, Any]:
         """Wrap ETH to WETH using real WETH contract with comprehensive verification"""
         try:
-            print(f"🔄 Wrapping {Web3.from_wei(amount_wei, 'ether')} ETH to WETH on {chain_name}")
+            logger.debug("🔄 Wrapping %s ETH to WETH on %s", Web3.from_wei(amount_wei, 'ether'), chain_name)
             
             weth_contract = self.weth_instances.get(chain_name)
             if not weth_contract:
@@ -1064,29 +1014,24 @@ class RealWETHBridgeService:
                 return {"success": False, "error": f"Web3 not connected to {chain_name}"}
             
             # Build WETH deposit transaction
-            nonce = web3.eth.get_transaction_count(self.current_account.address)
-            chain_id = web3.eth.chain_id
+            chain_id = await web3_pool.run(chain_name, lambda: web3.eth.chain_id)
             
             # Use dynamic gas price with minimum floor
-            base_gas_price = web3.eth.gas_price
-            min_gas_price = Web3.to_wei(1, 'gwei')  # Minimum 1 gwei
-            gas_price = max(base_gas_price, min_gas_price)
+            gas_price = await tx_pipeline.gas_price(chain_name, web3, minimum=Web3.to_wei(1, 'gwei'))  # Minimum 1 gwei
             
             transaction = weth_contract.functions.deposit().build_transaction({
                 'from': self.current_account.address,
                 'value': amount_wei,
                 'gas': 80000,  # Increased gas limit for safety
                 'gasPrice': gas_price,
-                'nonce': nonce,
                 'chainId': chain_id
             })
             
-            print(f"🔍 Transaction details:")
-            print(f"   To: {transaction['to']}")
-            print(f"   Value: {Web3.from_wei(transaction['value'], 'ether')} ETH")
-            print(f"   Gas: {transaction['gas']}")
-            print(f"   Gas Price: {Web3.from_wei(transaction['gasPrice'], 'gwei')} gwei")
-            print(f"   Nonce: {transaction['nonce']}")
+            logger.debug("🔍 Transaction details:")
+            logger.debug("   To: %s", transaction['to'])
+            logger.debug("   Value: %s ETH", Web3.from_wei(transaction['value'], 'ether'))
+            logger.debug("   Gas: %s", transaction['gas'])
+            logger.debug("   Gas Price: %s gwei", Web3.from_wei(transaction['gasPrice'], 'gwei'))
             
             # Validate transaction
             validation = await self._validate_transaction_before_submission(web3, transaction, chain_name)
@@ -1097,7 +1042,7 @@ class RealWETHBridgeService:
             result = await self._submit_and_verify_transaction(web3, transaction, chain_name, "WETH wrap")
             
             if result["success"]:
-                print(f"✅ ETH wrapped to WETH successfully on {chain_name}")
+                logger.info("✅ ETH wrapped to WETH successfully on %s", chain_name)
                 return {
                     "success": True,
                     "transaction_hash": result["transaction_hash"],
@@ -1110,7 +1055,7 @@ class RealWETHBridgeService:
                 return {"success": False, "error": f"WETH wrap transaction failed: {result['errors']}"}
                 
         except Exception as e:
-            print(f"❌ WETH wrapping error: {e}")
+            logger.error("❌ WETH wrapping error: %s", e)
             return {"success": False, "error": str(e)}
     
     async def _transfer_weth_same_chain(
@@ -1123,11 +1068,11 @@ class RealWETHBridgeService:
     ) -> Dict[str, Any]:
         """Transfer WETH tokens on same chain (real token movement) with comprehensive verification"""
         try:
-            print(f"💸 Transferring {Web3.from_wei(amount_wei, 'ether')} WETH on {chain_name}")
-            print(f"   From: {from_address} → To: {to_address}")
-            print(f"🔍 DEBUG: Actual addresses being used:")
-            print(f"   Current account (signer): {self.current_account.address}")
-            print(f"   WETH transfer TO address: {to_address}")
+            logger.debug("💸 Transferring %s WETH on %s", Web3.from_wei(amount_wei, 'ether'), chain_name)
+            logger.debug("   From: %s → To: %s", from_address, to_address)
+            logger.debug("🔍 DEBUG: Actual addresses being used:")
+            logger.debug("   Current account (signer): %s", self.current_account.address)
+            logger.debug("   WETH transfer TO address: %s", to_address)
             
             weth_contract = self.weth_instances.get(chain_name)
             if not weth_contract:
@@ -1135,8 +1080,8 @@ class RealWETHBridgeService:
             
             # Verify WETH balance before transfer
             try:
-                weth_balance = weth_contract.functions.balanceOf(self.current_account.address).call()
-                print(f"🔍 Current WETH balance of {self.current_account.address}: {Web3.from_wei(weth_balance, 'ether')} WETH")
+                weth_balance = await web3_pool.run(chain_name, weth_contract.functions.balanceOf(self.current_account.address).call)
+                logger.debug("🔍 Current WETH balance of %s: %s WETH", self.current_account.address, Web3.from_wei(weth_balance, 'ether'))
                 
                 if weth_balance < amount_wei:
                     return {"success": False, "error": f"Insufficient WETH balance. Required: {Web3.from_wei(amount_wei, 'ether')}, Available: {Web3.from_wei(weth_balance, 'ether')}"}
@@ -1144,34 +1089,29 @@ class RealWETHBridgeService:
                 return {"success": False, "error": f"WETH balance check failed: {e}"}
             
             # Build WETH transfer transaction
-            nonce = web3.eth.get_transaction_count(self.current_account.address)
-            chain_id = web3.eth.chain_id
+            chain_id = await web3_pool.run(chain_name, lambda: web3.eth.chain_id)
             
             # Use dynamic gas price with minimum floor
-            base_gas_price = web3.eth.gas_price
-            min_gas_price = Web3.to_wei(1, 'gwei')  # Minimum 1 gwei
-            gas_price = max(base_gas_price, min_gas_price)
+            gas_price = await tx_pipeline.gas_price(chain_name, web3, minimum=Web3.to_wei(1, 'gwei'))  # Minimum 1 gwei
             
-            print(f"🔍 Building WETH transfer transaction:")
-            print(f"   WETH Contract: {weth_contract.address}")
-            print(f"   Transfer from: {self.current_account.address}")
-            print(f"   Transfer to: {to_address}")
-            print(f"   Amount: {Web3.from_wei(amount_wei, 'ether')} WETH")
+            logger.debug("🔍 Building WETH transfer transaction:")
+            logger.debug("   WETH Contract: %s", weth_contract.address)
+            logger.debug("   Transfer from: %s", self.current_account.address)
+            logger.debug("   Transfer to: %s", to_address)
+            logger.debug("   Amount: %s WETH", Web3.from_wei(amount_wei, 'ether'))
             
             transaction = weth_contract.functions.transfer(to_address, amount_wei).build_transaction({
                 'from': self.current_account.address,
                 'gas': 80000,  # Increased gas limit for safety
                 'gasPrice': gas_price,
-                'nonce': nonce,
                 'chainId': chain_id
             })
             
-            print(f"🔍 WETH Transfer transaction details:")
-            print(f"   Contract address: {transaction['to']}")
-            print(f"   Function call: transfer({to_address}, {amount_wei})")
-            print(f"   Gas: {transaction['gas']}")
-            print(f"   Gas Price: {Web3.from_wei(transaction['gasPrice'], 'gwei')} gwei")
-            print(f"   Nonce: {transaction['nonce']}")
+            logger.debug("🔍 WETH Transfer transaction details:")
+            logger.debug("   Contract address: %s", transaction['to'])
+            logger.debug("   Function call: transfer(%s, %s)", to_address, amount_wei)
+            logger.debug("   Gas: %s", transaction['gas'])
+            logger.debug("   Gas Price: %s gwei", Web3.from_wei(transaction['gasPrice'], 'gwei'))
             
             # Validate transaction
             validation = await self._validate_transaction_before_submission(web3, transaction, chain_name)
@@ -1184,20 +1124,20 @@ class RealWETHBridgeService:
             if result["success"]:
                 # Verify balance change after transfer
                 try:
-                    new_weth_balance = weth_contract.functions.balanceOf(self.current_account.address).call()
-                    recipient_balance = weth_contract.functions.balanceOf(to_address).call()
-                    print(f"✅ WETH transfer completed successfully")
-                    print(f"   Sender new balance: {Web3.from_wei(new_weth_balance, 'ether')} WETH")
-                    print(f"   Recipient balance: {Web3.from_wei(recipient_balance, 'ether')} WETH")
+                    new_weth_balance = await web3_pool.run(chain_name, weth_contract.functions.balanceOf(self.current_account.address).call)
+                    recipient_balance = await web3_pool.run(chain_name, weth_contract.functions.balanceOf(to_address).call)
+                    logger.info("✅ WETH transfer completed successfully")
+                    logger.debug("   Sender new balance: %s WETH", Web3.from_wei(new_weth_balance, 'ether'))
+                    logger.debug("   Recipient balance: %s WETH", Web3.from_wei(recipient_balance, 'ether'))
                     
                     # Additional verification - check if recipient actually received the tokens
                     if recipient_balance >= amount_wei:
-                        print(f"✅ CONFIRMED: Recipient {to_address} received WETH tokens!")
+                        logger.info("✅ CONFIRMED: Recipient %s received WETH tokens!", to_address)
                     else:
-                        print(f"⚠️ WARNING: Recipient balance seems incorrect. Expected at least {Web3.from_wei(amount_wei, 'ether')} WETH")
+                        logger.warning("⚠️ WARNING: Recipient balance seems incorrect. Expected at least %s WETH", Web3.from_wei(amount_wei, 'ether'))
                         
                 except Exception as e:
-                    print(f"⚠️ Balance verification error: {e}")
+                    logger.warning("⚠️ Balance verification error: %s", e)
                 
                 return {
                     "success": True,
@@ -1211,32 +1151,28 @@ class RealWETHBridgeService:
                 return {"success": False, "error": f"WETH transfer transaction failed: {result['errors']}"}
                 
         except Exception as e:
-            print(f"❌ WETH transfer error: {e}")
+            logger.error("❌ WETH transfer error: %s", e)
             return {"success": False, "error": str(e)}
     
     async def _unwrap_weth_to_eth(self, web3: Web3, chain_name: str, user_address: str, amount_wei: int) -> Dict[str, Any]:
         """Unwrap WETH back to ETH (for rollback scenarios) with comprehensive verification"""
         try:
-            print(f"🔄 Unwrapping {Web3.from_wei(amount_wei, 'ether')} WETH back to ETH")
+            logger.debug("🔄 Unwrapping %s WETH back to ETH", Web3.from_wei(amount_wei, 'ether'))
             
             weth_contract = self.weth_instances.get(chain_name)
             if not weth_contract:
                 return {"success": False, "error": "WETH contract not available"}
             
             # Build WETH withdraw transaction
-            nonce = web3.eth.get_transaction_count(self.current_account.address)
-            chain_id = web3.eth.chain_id
+            chain_id = await web3_pool.run(chain_name, lambda: web3.eth.chain_id)
             
             # Use dynamic gas price with minimum floor
-            base_gas_price = web3.eth.gas_price
-            min_gas_price = Web3.to_wei(1, 'gwei')  # Minimum 1 gwei
-            gas_price = max(base_gas_price, min_gas_price)
+            gas_price = await tx_pipeline.gas_price(chain_name, web3, minimum=Web3.to_wei(1, 'gwei'))  # Minimum 1 gwei
             
             transaction = weth_contract.functions.withdraw(amount_wei).build_transaction({
                 'from': self.current_account.address,
                 'gas': 80000,  # Increased gas limit for safety
                 'gasPrice': gas_price,
-                'nonce': nonce,
                 'chainId': chain_id
             })
             
@@ -1249,7 +1185,7 @@ class RealWETHBridgeService:
             result = await self._submit_and_verify_transaction(web3, transaction, chain_name, "WETH unwrap")
             
             if result["success"]:
-                print(f"✅ WETH unwrapped back to ETH successfully")
+                logger.info("✅ WETH unwrapped back to ETH successfully")
                 return {
                     "success": True, 
                     "transaction_hash": result["transaction_hash"],
@@ -1261,15 +1197,15 @@ class RealWETHBridgeService:
                 return {"success": False, "error": f"WETH unwrap failed: {result['errors']}"}
                 
         except Exception as e:
-            print(f"❌ WETH unwrapping error: {e}")
+            logger.error("❌ WETH unwrapping error: %s", e)
             return {"success": False, "error": str(e)}
     
     async def get_balance_on_chain(self, chain_name: str, address: str) -> Dict[str, Any]:
         """Get ETH and WETH balance using real contracts with enhanced debugging"""
         try:
-            print(f"\n💰 === BALANCE CHECK ===")
-            print(f"Chain: {chain_name}")
-            print(f"Address: {address}")
+            logger.debug("\n💰 === BALANCE CHECK ===")
+            logger.debug("Chain: %s", chain_name)
+            logger.debug("Address: %s", address)
             
             web3 = self.web3_connections.get(chain_name)
             if not web3:
@@ -1281,27 +1217,27 @@ class RealWETHBridgeService:
                 return {"success": False, "error": f"Web3 not connected to {chain_name}"}
             
             # Get native ETH balance
-            eth_balance_wei = web3.eth.get_balance(address)
+            eth_balance_wei = await web3_pool.run(chain_name, web3.eth.get_balance, address)
             eth_balance = float(Web3.from_wei(eth_balance_wei, 'ether'))
-            print(f"💎 ETH balance: {eth_balance} ETH")
+            logger.debug("💎 ETH balance: %s ETH", eth_balance)
             
             # Get WETH balance from real contract
             weth_balance = 0.0
             try:
                 weth_contract = self.weth_instances.get(chain_name)
                 if weth_contract:
-                    weth_balance_wei = weth_contract.functions.balanceOf(address).call()
+                    weth_balance_wei = await web3_pool.run(chain_name, weth_contract.functions.balanceOf(address).call)
                     weth_balance = float(Web3.from_wei(weth_balance_wei, 'ether'))
-                    print(f"🟡 WETH balance: {weth_balance} WETH")
+                    logger.debug("🟡 WETH balance: %s WETH", weth_balance)
                 else:
-                    print(f"⚠️ WETH contract not available for {chain_name}")
+                    logger.warning("⚠️ WETH contract not available for %s", chain_name)
             except Exception as e:
-                print(f"⚠️ WETH balance check error for {chain_name}: {e}")
+                logger.warning("⚠️ WETH balance check error for %s: %s", chain_name, e)
                 # Don't fail the entire balance check if only WETH fails
-                print(f"💰 Returning ETH balance only for {chain_name}")
+                logger.warning("💰 Returning ETH balance only for %s", chain_name)
             
             total_balance = eth_balance + weth_balance
-            print(f"💰 Total balance: {total_balance} ETH equivalent")
+            logger.debug("💰 Total balance: %s ETH equivalent", total_balance)
             
             return {
                 "success": True,
@@ -1315,7 +1251,7 @@ class RealWETHBridgeService:
             }
             
         except Exception as e:
-            print(f"❌ Balance check error: {e}")
+            logger.error("❌ Balance check error: %s", e)
             return {"success": False, "error": str(e)}
     
     async def get_transfer_status(self, transfer_id: str) -> Dict[str, Any]:
@@ -1337,4 +1273,4 @@ class RealWETHBridgeService:
             return {"success": False, "error": str(e)}
 
 # Global service instance
-real_weth_bridge_service = RealWETHBridgeService()
+real_weth_bridge_service = service_registry.register("real_weth_bridge", RealWETHBridgeService(), lazy=True)
@@ -8,8 +8,22 @@ import uuid
 import asyncio
 from typing import Dict, List, Any, Optional
 from app.core.database import get_database
+from app.core.index_manifest import index_manifest
+from app.core.log import get_logger
+from app.core.service_registry import service_registry
 from app.services.chainflip_messaging_service import chainflip_messaging_service
 
+logger = get_logger(__name__)
+
+index_manifest.register("shipping", "purchases", [("seller", 1), ("status", 1), ("stage", 1), ("created_at", -1)])
+index_manifest.register("shipping", "shipping_requests", "purchase_id")
+index_manifest.register_query(
+    "shipping", "purchases",
+    {"seller": "0x0", "status": "paid_waiting_shipping", "stage": "waiting_for_manufacture_shipping"},
+    sort=[("created_at", -1)], name="purchases:manufacturer_shipping_queue",
+)
+index_manifest.register_query("shipping", "shipping_requests", {"purchase_id": "p"})
+
 class ShippingService:
     def __init__(self):
         self.database = None
@@ -26,7 +40,8 @@ class ShippingService:
     async def initialize(self):
         """Initialize shipping service"""
         self.database = await get_database()
-        print("✅ Shipping Service initialized")
+        await index_manifest.apply(self.database, owners=["shipping"])
+        logger.info("✅ Shipping Service initialized")
     
     def calculate_transporters_needed(self, distance_miles: int) -> int:
         """Calculate number of transporters needed based on distance"""
@@ -43,7 +58,7 @@ class ShippingService:
             purchase_id = purchase_data.get("purchase_id")
             buyer_address = purchase_data.get("buyer")
             
-            print(f"📋 Collecting shipping information for purchase: {purchase_id}")
+            logger.debug("📋 Collecting shipping information for purchase: %s", purchase_id)
             
             # This would typically be collected from frontend form
             # For now, return a template structure
@@ -75,7 +90,7 @@ class ShippingService:
             # Store shipping information
             await self.database.shipping_requests.insert_one(shipping_info)
             
-            print(f"✅ Shipping information template created")
+            logger.info("✅ Shipping information template created")
             return {
                 "success": True,
                 "shipping_id": shipping_info["shipping_id"],
@@ -84,7 +99,7 @@ class ShippingService:
             }
             
         except Exception as e:
-            print(f"❌ Error collecting shipping information: {e}")
+            logger.error("❌ Error collecting shipping information: %s", e)
             return {"success": False, "error": str(e)}
     
     async def notify_purchase_stakeholders(self, purchase_data: Dict[str, Any], shipping_data: Dict[str, Any]) -> Dict[str, Any]:
@@ -97,7 +112,7 @@ class ShippingService:
             buyer_address = purchase_data.get("buyer")
             manufacturer_address = purchase_data.get("seller")
             
-            print(f"📡 Sending cross-chain notifications for purchase: {purchase_id}")
+            logger.debug("📡 Sending cross-chain notifications for purchase: %s", purchase_id)
             
             # Prepare notification data
             notification_data = {
@@ -136,7 +151,7 @@ class ShippingService:
             
             await self.database.purchase_notifications.insert_one(notification_record)
             
-            print(f"✅ Cross-chain notifications sent successfully")
+            logger.info("✅ Cross-chain notifications sent successfully")
             return {
                 "success": True,
                 "hub_notification": hub_notification,
@@ -144,7 +159,7 @@ class ShippingService:
             }
             
         except Exception as e:
-            print(f"❌ Error sending purchase notifications: {e}")
+            logger.error("❌ Error sending purchase notifications: %s", e)
             return {"success": False, "error": str(e)}
     
     async def get_manufacturer_shipping_requests(self, manufacturer_address: str) -> List[Dict[str, Any]]:
@@ -183,11 +198,11 @@ class ShippingService:
                 
                 shipping_requests.append(request_data)
             
-            print(f"📋 Found {len(shipping_requests)} shipping requests for manufacturer {manufacturer_address}")
+            logger.debug("📋 Found %s shipping requests for manufacturer %s", len(shipping_requests), manufacturer_address)
             return shipping_requests
             
         except Exception as e:
-            print(f"❌ Error getting shipping requests: {e}")
+            logger.error("❌ Error getting shipping requests: %s", e)
             return []
     
     async def start_shipping_process(self, manufacturer_address: str, purchase_id: str, distance_miles: int) -> Dict[str, Any]:
@@ -195,12 +210,12 @@ class ShippingService:
         Manufacturer starts shipping process with distance calculation
         """
         try:
-            print(f"🚛 Starting shipping process for purchase: {purchase_id}")
-            print(f"📏 Distance: {distance_miles} miles")
+            logger.debug("🚛 Starting shipping process for purchase: %s", purchase_id)
+            logger.debug("📏 Distance: %s miles", distance_miles)
             
             # Calculate transporters needed
             transporters_needed = self.calculate_transporters_needed(distance_miles)
-            print(f"🚛 Transporters needed: {transporters_needed}")
+            logger.debug("🚛 Transporters needed: %s", transporters_needed)
             
             # Create shipping record
             shipping_record = {
@@ -245,7 +260,7 @@ class ShippingService:
                 hub_shipping_data
             )
             
-            print(f"✅ Shipping process started successfully")
+            logger.info("✅ Shipping process started successfully")
             return {
                 "success": True,
                 "shipping_id": shipping_record["shipping_id"],
@@ -255,7 +270,7 @@ class ShippingService:
             }
             
         except Exception as e:
-            print(f"❌ Error starting shipping process: {e}")
+            logger.error("❌ Error starting shipping process: %s", e)
             return {"success": False, "error": str(e)}
     
     async def assign_transporters(self, shipping_id: str, transporter_addresses: List[str]) -> Dict[str, Any]:
@@ -263,8 +278,8 @@ class ShippingService:
         Hub admin assigns transporters to shipping request
         """
         try:
-            print(f"👥 Assigning transporters to shipping: {shipping_id}")
-            print(f"🚛 Transporters: {transporter_addresses}")
+            logger.debug("👥 Assigning transporters to shipping: %s", shipping_id)
+            logger.debug("🚛 Transporters: %s", transporter_addresses)
             
             # Update shipping record with assigned transporters
             await self.database.shipping_records.update_one(
@@ -307,7 +322,7 @@ class ShippingService:
                     notification_data
                 )
             
-            print(f"✅ Transporters assigned successfully")
+            logger.info("✅ Transporters assigned successfully")
             return {
                 "success": True,
                 "assigned_transporters": transporter_addresses,
@@ -315,7 +330,7 @@ class ShippingService:
             }
             
         except Exception as e:
-            print(f"❌ Error assigning transporters: {e}")
+            logger.error("❌ Error assigning transporters: %s", e)
             return {"success": False, "error": str(e)}
     
     async def process_transporter_handoff(self, current_transporter: str, shipping_id: str, handoff_message: str) -> Dict[str, Any]:
@@ -323,8 +338,8 @@ class ShippingService:
         Process handoff between transporters
         """
         try:
-            print(f"🔄 Processing transporter handoff for shipping: {shipping_id}")
-            print(f"📦 From: {current_transporter}")
+            logger.debug("🔄 Processing transporter handoff for shipping: %s", shipping_id)
+            logger.debug("📦 From: %s", current_transporter)
             
             # Get current assignment
             current_assignment = await self.database.transporter_assignments.find_one({
@@ -380,11 +395,11 @@ class ShippingService:
                         notification_data
                     )
                     
-                    print(f"✅ Handoff to next transporter: {next_assignment['transporter']}")
+                    logger.info("✅ Handoff to next transporter: %s", next_assignment['transporter'])
             else:
                 # Final delivery - notify buyer
                 await self._notify_buyer_for_delivery(shipping_id)
-                print(f"✅ Final delivery stage - buyer notified")
+                logger.info("✅ Final delivery stage - buyer notified")
             
             # Notify Hub admin
             await chainflip_messaging_service.send_handoff_notification_to_hub({
@@ -403,7 +418,7 @@ class ShippingService:
             }
             
         except Exception as e:
-            print(f"❌ Error processing transporter handoff: {e}")
+            logger.error("❌ Error processing transporter handoff: %s", e)
             return {"success": False, "error": str(e)}
     
     async def _notify_buyer_for_delivery(self, shipping_id: str):
@@ -443,17 +458,17 @@ class ShippingService:
                 delivery_data
             )
             
-            print(f"✅ Buyer notified for delivery with encryption keys")
+            logger.info("✅ Buyer notified for delivery with encryption keys")
             
         except Exception as e:
-            print(f"❌ Error notifying buyer for delivery: {e}")
+            logger.error("❌ Error notifying buyer for delivery: %s", e)
     
     async def confirm_delivery(self, buyer_address: str, shipping_id: str, qr_verification_data: Dict[str, Any]) -> Dict[str, Any]:
         """
         Buyer confirms delivery after QR verification
         """
         try:
-            print(f"✅ Processing delivery confirmation for shipping: {shipping_id}")
+            logger.info("✅ Processing delivery confirmation for shipping: %s", shipping_id)
             
             # Update shipping status
             await self.database.shipping_records.update_one(
@@ -480,7 +495,7 @@ class ShippingService:
                     }}
                 )
             
-            print(f"✅ Delivery confirmed successfully")
+            logger.info("✅ Delivery confirmed successfully")
             return {
                 "success": True,
                 "status": "delivered",
@@ -488,8 +503,8 @@ class ShippingService:
             }
             
         except Exception as e:
-            print(f"❌ Error confirming delivery: {e}")
+            logger.error("❌ Error confirming delivery: %s", e)
             return {"success": False, "error": str(e)}
 
 # Global service instance
-shipping_service = ShippingService()
\ No newline at end of file
+shipping_service = service_registry.register("shipping", ShippingService())
\ No newline at end of file
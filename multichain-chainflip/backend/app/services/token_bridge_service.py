@@ -3,16 +3,19 @@ Cross-Chain Token Bridge Service using LayerZero OFT
 Implements real ETH transfers between chains without token conversions
 Hub coordinates the process but doesn't hold tokens
 """
-import asyncio
 import json
 import time
 from typing import Dict, List, Optional, Any
 from web3 import Web3
 from eth_account import Account
 from app.core.config import get_settings
+from app.core.web3_pool import web3_pool
 from app.core.database import get_database
+from app.core.log import get_logger
+from app.services.confirmation_tracker import confirmation_tracker, tracking_target
 
 settings = get_settings()
+logger = get_logger(__name__)
 
 # WETH Contract ABI (for deposit/withdraw functions)
 WETH_ABI = [
@@ -154,7 +157,7 @@ class TokenBridgeService:
         deployer_account_info = address_key_manager.get_account_info_for_address('0x032041b4b356fEE1496805DD4749f181bC736FFA')
         if deployer_account_info:
             self.current_account = deployer_account_info['account']
-            print(f"🔑 Token Bridge using account: {self.current_account.address}")
+            logger.debug("🔑 Token Bridge using account: %s", self.current_account.address)
         
         # Initialize chain connections
         await self._initialize_chain_connections()
@@ -162,43 +165,43 @@ class TokenBridgeService:
         # Initialize WETH OFT contracts
         await self._initialize_weth_oft_contracts()
         
-        print("✅ Token Bridge Service initialized with REAL LayerZero OFT contracts")
-        print(f"   📄 Optimism: {self.weth_oft_contracts['optimism_sepolia']}")
-        print(f"   📄 Polygon: {self.weth_oft_contracts['polygon_pos']}")
-        print(f"   📄 Base Sepolia: {self.weth_oft_contracts['base_sepolia']}")
-        print(f"   📄 Arbitrum: {self.weth_oft_contracts['arbitrum_sepolia']}")
+        logger.info("✅ Token Bridge Service initialized with REAL LayerZero OFT contracts")
+        logger.debug("   📄 Optimism: %s", self.weth_oft_contracts['optimism_sepolia'])
+        logger.debug("   📄 Polygon: %s", self.weth_oft_contracts['polygon_pos'])
+        logger.debug("   📄 Base Sepolia: %s", self.weth_oft_contracts['base_sepolia'])
+        logger.debug("   📄 Arbitrum: %s", self.weth_oft_contracts['arbitrum_sepolia'])
     
     async def _initialize_chain_connections(self):
         """Initialize Web3 connections to all chains"""
         
         # Optimism Sepolia (Buyer Chain)
         if settings.optimism_sepolia_rpc:
-            self.optimism_web3 = Web3(Web3.HTTPProvider(settings.optimism_sepolia_rpc))
-            if self.optimism_web3.is_connected():
-                print(f"✅ Token Bridge connected to Optimism Sepolia")
+            self.optimism_web3 = web3_pool.web3("optimism_sepolia")
+            if await web3_pool.is_connected("optimism_sepolia"):
+                logger.info("✅ Token Bridge connected to Optimism Sepolia")
                 
         # Polygon PoS (Hub Chain)
         if settings.polygon_pos_rpc:
-            self.polygon_web3 = Web3(Web3.HTTPProvider(settings.polygon_pos_rpc))
-            if self.polygon_web3.is_connected():
-                print(f"✅ Token Bridge connected to Polygon PoS Hub")
+            self.polygon_web3 = web3_pool.web3("polygon_pos")
+            if await web3_pool.is_connected("polygon_pos"):
+                logger.info("✅ Token Bridge connected to Polygon PoS Hub")
                 
         # Base Sepolia (Manufacturer Chain)
         if settings.base_sepolia_rpc:
-            self.base_sepolia_web3 = Web3(Web3.HTTPProvider(settings.base_sepolia_rpc))
-            if self.base_sepolia_web3.is_connected():
-                print(f"✅ Token Bridge connected to Base Sepolia")
+            self.base_sepolia_web3 = web3_pool.web3("base_sepolia")
+            if await web3_pool.is_connected("base_sepolia"):
+                logger.info("✅ Token Bridge connected to Base Sepolia")
                 
         # Arbitrum Sepolia (Transporter Chain)
         if settings.arbitrum_sepolia_rpc:
-            self.arbitrum_web3 = Web3(Web3.HTTPProvider(settings.arbitrum_sepolia_rpc))
-            if self.arbitrum_web3.is_connected():
-                print(f"✅ Token Bridge connected to Arbitrum Sepolia")
+            self.arbitrum_web3 = web3_pool.web3("arbitrum_sepolia")
+            if await web3_pool.is_connected("arbitrum_sepolia"):
+                logger.info("✅ Token Bridge connected to Arbitrum Sepolia")
     
     async def _initialize_weth_oft_contracts(self):
         """Initialize WETH OFT contract instances with REAL deployed contracts"""
         
-        print("✅ Initializing REAL WETH OFT contracts...")
+        logger.info("✅ Initializing REAL WETH OFT contracts...")
         
         # Initialize contract instances with real addresses
         try:
@@ -207,33 +210,33 @@ class TokenBridgeService:
                     address=self.weth_oft_contracts["optimism_sepolia"],
                     abi=LAYERZERO_OFT_ABI
                 )
-                print(f"✅ Optimism WETH OFT contract initialized")
+                logger.info("✅ Optimism WETH OFT contract initialized")
                 
             if self.polygon_web3:
                 self.weth_oft_polygon = self.polygon_web3.eth.contract(
                     address=self.weth_oft_contracts["polygon_pos"],
                     abi=LAYERZERO_OFT_ABI
                 )
-                print(f"✅ Polygon WETH OFT contract initialized")
+                logger.info("✅ Polygon WETH OFT contract initialized")
                 
             if self.base_sepolia_web3:
                 self.weth_oft_base = self.base_sepolia_web3.eth.contract(
                     address=self.weth_oft_contracts["base_sepolia"],
                     abi=LAYERZERO_OFT_ABI
                 )
-                print(f"✅ Base Sepolia WETH OFT contract initialized")
+                logger.info("✅ Base Sepolia WETH OFT contract initialized")
                 
             if self.arbitrum_web3:
                 self.weth_oft_arbitrum = self.arbitrum_web3.eth.contract(
                     address=self.weth_oft_contracts["arbitrum_sepolia"],
                     abi=LAYERZERO_OFT_ABI
                 )
-                print(f"✅ Arbitrum WETH OFT contract initialized")
+                logger.info("✅ Arbitrum WETH OFT contract initialized")
                 
         except Exception as e:
-            print(f"⚠️ Contract initialization warning: {e}")
+            logger.warning("⚠️ Contract initialization warning: %s", e)
         
-        print("🎉 WETH OFT contracts ready for real token transfers")
+        logger.info("🎉 WETH OFT contracts ready for real token transfers")
         
     def get_layerzero_chain_id(self, chain_name: str) -> int:
         """Get LayerZero chain ID for a given chain"""
@@ -280,10 +283,10 @@ class TokenBridgeService:
             escrow_id: Associated escrow ID for tracking
         """
         try:
-            print(f"🌉 Cross-Chain ETH Transfer Initiated")
-            print(f"   📤 From: {from_chain} ({from_address})")
-            print(f"   📥 To: {to_chain} ({to_address})")
-            print(f"   💰 Amount: {amount_eth} ETH")
+            logger.debug("🌉 Cross-Chain ETH Transfer Initiated")
+            logger.debug("   📤 From: %s (%s)", from_chain, from_address)
+            logger.debug("   📥 To: %s (%s)", to_chain, to_address)
+            logger.debug("   💰 Amount: %s ETH", amount_eth)
             
             # Get Web3 instances
             source_web3 = self.get_web3_for_chain(from_chain)
@@ -319,9 +322,12 @@ class TokenBridgeService:
             if not transfer_result["success"]:
                 return {"success": False, "error": f"LayerZero transfer failed: {transfer_result['error']}"}
             
-            # Step 3: Record transfer in database with pending status initially
+            # Step 3: Record transfer in database with pending status; the confirmation
+            # tracker marks it completed (or failed) once the LayerZero tx is deep enough
+            transfer_id = f"TRANSFER-{escrow_id}-{int(time.time())}"
             transfer_record = {
-                "transfer_id": f"TRANSFER-{escrow_id}-{int(time.time())}",
+                "transfer_id": transfer_id,
+                "tracking_id": None,
                 "escrow_id": escrow_id,
                 "from_chain": from_chain,
                 "to_chain": to_chain,
@@ -340,16 +346,33 @@ class TokenBridgeService:
             
             await self.database.token_transfers.insert_one(transfer_record)
             
-            # Start background task to monitor transaction status
-            asyncio.create_task(self._monitor_transfer_status(transfer_record["transfer_id"], transfer_result.get("transaction_hash"), source_web3))
+            # The funds have moved either way, so a tracker failure must not fail the transfer
+            tracking_id = None
+            try:
+                tracking_id = await confirmation_tracker.track(
+                    from_chain, transfer_result.get("transaction_hash"), "token_transfer",
+                    target=tracking_target(
+                        "token_transfers", {"transfer_id": transfer_id},
+                        on_confirmed={"status": "completed"},
+                        on_failed={"status": "failed"},
+                    ),
+                    confirmations=3,
+                    web3=source_web3,
+                )
+                await self.database.token_transfers.update_one(
+                    {"transfer_id": transfer_id}, {"$set": {"tracking_id": tracking_id}}
+                )
+            except Exception as tracking_error:
+                logger.warning("⚠️ Could not track transfer %s: %s", transfer_id, tracking_error)
             
-            print(f"✅ Cross-chain ETH transfer initiated successfully")
-            print(f"   🔗 Wrap TX: {wrap_result.get('transaction_hash')}")
-            print(f"   🔗 LayerZero TX: {transfer_result.get('transaction_hash')}")
+            logger.info("✅ Cross-chain ETH transfer initiated successfully")
+            logger.debug("   🔗 Wrap TX: %s", wrap_result.get('transaction_hash'))
+            logger.debug("   🔗 LayerZero TX: %s", transfer_result.get('transaction_hash'))
             
             return {
                 "success": True,
                 "transfer_id": transfer_record["transfer_id"],
+                "tracking_id": tracking_id,
                 "wrap_transaction_hash": wrap_result.get("transaction_hash"),
                 "layerzero_transaction_hash": transfer_result.get("transaction_hash"),
                 "amount_transferred": amount_eth,
@@ -360,39 +383,39 @@ class TokenBridgeService:
             }
             
         except Exception as e:
-            print(f"❌ Cross-chain transfer error: {e}")
+            logger.error("❌ Cross-chain transfer error: %s", e)
             return {"success": False, "error": str(e)}
     
     async def _wrap_eth_on_chain(self, web3: Web3, oft_contract, user_address: str, amount_wei: int, chain_name: str) -> Dict[str, Any]:
         """Wrap ETH to WETH using the OFT contract deposit function"""
         try:
-            print(f"🔄 Wrapping {Web3.from_wei(amount_wei, 'ether')} ETH on {chain_name}")
+            logger.debug("🔄 Wrapping %s ETH on %s", Web3.from_wei(amount_wei, 'ether'), chain_name)
             
             # Build WETH deposit transaction using OFT contract
-            nonce = web3.eth.get_transaction_count(self.current_account.address)
+            nonce = await web3_pool.run(chain_name, web3.eth.get_transaction_count, self.current_account.address)
             
             # Get chain ID for EIP-155 compliance
-            chain_id = web3.eth.chain_id
+            chain_id = await web3_pool.run(chain_name, lambda: web3.eth.chain_id)
             
             # Call the deposit function on the OFT contract
             transaction = oft_contract.functions.deposit().build_transaction({
                 'from': self.current_account.address,
                 'value': amount_wei,
                 'gas': 100000,  # Sufficient gas for WETH deposit
-                'gasPrice': web3.eth.gas_price,
+                'gasPrice': await web3_pool.run(chain_name, lambda: web3.eth.gas_price),
                 'nonce': nonce,
                 'chainId': chain_id
             })
             
             # Sign and send transaction
             signed_txn = web3.eth.account.sign_transaction(transaction, self.current_account.key)
-            tx_hash = web3.eth.send_raw_transaction(signed_txn.raw_transaction)
+            tx_hash = await web3_pool.run(chain_name, web3.eth.send_raw_transaction, signed_txn.raw_transaction)
             
-            print(f"⏳ Waiting for WETH wrap confirmation...")
-            tx_receipt = web3.eth.wait_for_transaction_receipt(tx_hash, timeout=120)
+            logger.debug("⏳ Waiting for WETH wrap confirmation...")
+            tx_receipt = await web3_pool.run(chain_name, web3.eth.wait_for_transaction_receipt, tx_hash, timeout=120, bounded=False)
             
             if tx_receipt.status == 1:
-                print(f"✅ ETH wrapped successfully on {chain_name}")
+                logger.info("✅ ETH wrapped successfully on %s", chain_name)
                 return {
                     "success": True,
                     "transaction_hash": tx_hash.hex(),
@@ -403,7 +426,7 @@ class TokenBridgeService:
                 return {"success": False, "error": "WETH wrap transaction failed"}
                 
         except Exception as e:
-            print(f"❌ WETH wrapping error: {e}")
+            logger.error("❌ WETH wrapping error: %s", e)
             return {"success": False, "error": str(e)}
     
     async def _transfer_weth_via_layerzero(
@@ -418,8 +441,8 @@ class TokenBridgeService:
     ) -> Dict[str, Any]:
         """Transfer WETH using LayerZero OFT"""
         try:
-            print(f"🌉 LayerZero WETH transfer: {Web3.from_wei(amount_wei, 'ether')} WETH")
-            print(f"   🎯 Target Chain ID: {target_lz_chain_id}")
+            logger.debug("🌉 LayerZero WETH transfer: %s WETH", Web3.from_wei(amount_wei, 'ether'))
+            logger.debug("   🎯 Target Chain ID: %s", target_lz_chain_id)
             
             # Convert address to bytes32 for LayerZero
             to_address_bytes32 = Web3.to_bytes(hexstr=to_address).rjust(32, b'\x00')
@@ -429,24 +452,24 @@ class TokenBridgeService:
             
             try:
                 # Get estimated fee from the contract
-                estimated_fees = oft_contract.functions.estimateSendFee(
+                estimated_fees = await web3_pool.run(chain_name, oft_contract.functions.estimateSendFee(
                     target_lz_chain_id,
                     to_address_bytes32,
                     amount_wei,
                     False,  # useZro
                     adapter_params
-                ).call()
+                ).call)
                 estimated_fee = estimated_fees[0]  # nativeFee
-                print(f"   💰 Estimated LayerZero fee: {Web3.from_wei(estimated_fee, 'ether')} ETH")
+                logger.debug("   💰 Estimated LayerZero fee: %s ETH", Web3.from_wei(estimated_fee, 'ether'))
             except Exception as e:
-                print(f"⚠️ Fee estimation failed, using default: {e}")
+                logger.warning("⚠️ Fee estimation failed, using default: %s", e)
                 estimated_fee = Web3.to_wei(0.01, 'ether')  # Fallback fee
             
             # Build LayerZero OFT sendFrom transaction
-            nonce = source_web3.eth.get_transaction_count(self.current_account.address)
+            nonce = await web3_pool.run(chain_name, source_web3.eth.get_transaction_count, self.current_account.address)
             
             # Get chain ID for EIP-155 compliance
-            chain_id = source_web3.eth.chain_id
+            chain_id = await web3_pool.run(chain_name, lambda: source_web3.eth.chain_id)
             
             transaction = oft_contract.functions.sendFrom(
                 self.current_account.address,  # _from
@@ -460,22 +483,22 @@ class TokenBridgeService:
                 'from': self.current_account.address,
                 'value': estimated_fee,  # LayerZero fee
                 'gas': 500000,          # Sufficient gas for LayerZero transfer
-                'gasPrice': source_web3.eth.gas_price,
+                'gasPrice': await web3_pool.run(chain_name, lambda: source_web3.eth.gas_price),
                 'nonce': nonce,
                 'chainId': chain_id
             })
             
             # Sign and send transaction
             signed_txn = source_web3.eth.account.sign_transaction(transaction, self.current_account.key)
-            tx_hash = source_web3.eth.send_raw_transaction(signed_txn.raw_transaction)
+            tx_hash = await web3_pool.run(chain_name, source_web3.eth.send_raw_transaction, signed_txn.raw_transaction)
             
-            print(f"⏳ Waiting for LayerZero transfer confirmation...")
-            tx_receipt = source_web3.eth.wait_for_transaction_receipt(tx_hash, timeout=120)
+            logger.debug("⏳ Waiting for LayerZero transfer confirmation...")
+            tx_receipt = await web3_pool.run(chain_name, source_web3.eth.wait_for_transaction_receipt, tx_hash, timeout=120, bounded=False)
             
             if tx_receipt.status == 1:
-                print(f"✅ LayerZero WETH transfer initiated successfully")
-                print(f"   🔗 TX Hash: {tx_hash.hex()}")
-                print(f"   ⛽ Gas Used: {tx_receipt.gasUsed}")
+                logger.info("✅ LayerZero WETH transfer initiated successfully")
+                logger.debug("   🔗 TX Hash: %s", tx_hash.hex())
+                logger.debug("   ⛽ Gas Used: %s", tx_receipt.gasUsed)
                 
                 return {
                     "success": True,
@@ -488,66 +511,9 @@ class TokenBridgeService:
                 return {"success": False, "error": "LayerZero transfer transaction failed"}
                 
         except Exception as e:
-            print(f"❌ LayerZero transfer error: {e}")
+            logger.error("❌ LayerZero transfer error: %s", e)
             return {"success": False, "error": str(e)}
     
-    async def _monitor_transfer_status(self, transfer_id: str, tx_hash: str, web3: Web3):
-        """Monitor transaction status and update database when confirmed"""
-        try:
-            print(f"🔍 Monitoring transfer {transfer_id[:16]}... status")
-            
-            # Wait for multiple confirmations
-            confirmation_blocks = 3
-            tx_receipt = web3.eth.wait_for_transaction_receipt(tx_hash, timeout=300)
-            
-            if tx_receipt.status == 1:
-                # Wait for additional confirmations
-                current_block = web3.eth.block_number
-                target_block = tx_receipt.blockNumber + confirmation_blocks
-                
-                while current_block < target_block:
-                    await asyncio.sleep(10)  # Wait 10 seconds
-                    current_block = web3.eth.block_number
-                
-                # Update transfer status to completed
-                await self.database.token_transfers.update_one(
-                    {"transfer_id": transfer_id},
-                    {
-                        "$set": {
-                            "status": "completed",
-                            "confirmation_block": current_block,
-                            "confirmed_at": time.time()
-                        }
-                    }
-                )
-                
-                print(f"✅ Transfer {transfer_id[:16]}... confirmed and completed")
-            else:
-                # Mark as failed
-                await self.database.token_transfers.update_one(
-                    {"transfer_id": transfer_id},
-                    {
-                        "$set": {
-                            "status": "failed",
-                            "failure_reason": "Transaction failed on-chain"
-                        }
-                    }
-                )
-                print(f"❌ Transfer {transfer_id[:16]}... failed")
-                
-        except Exception as e:
-            print(f"⚠️ Transfer monitoring error for {transfer_id[:16]}...: {e}")
-            # Mark as failed due to monitoring error
-            await self.database.token_transfers.update_one(
-                {"transfer_id": transfer_id},
-                {
-                    "$set": {
-                        "status": "failed",
-                        "failure_reason": f"Monitoring error: {str(e)}"
-                    }
-                }
-            )
-    
     async def get_transfer_status(self, transfer_id: str) -> Dict[str, Any]:
         """Get status of a cross-chain transfer"""
         try:
@@ -573,7 +539,7 @@ class TokenBridgeService:
                 return {"success": False, "error": "Chain not connected"}
             
             # Get native ETH balance
-            eth_balance_wei = web3.eth.get_balance(address)
+            eth_balance_wei = await web3_pool.run(chain_name, web3.eth.get_balance, address)
             eth_balance = float(Web3.from_wei(eth_balance_wei, 'ether'))
             
             # Get WETH balance from OFT contract
@@ -581,10 +547,10 @@ class TokenBridgeService:
             try:
                 oft_contract = self.get_oft_contract_for_chain(chain_name)
                 if oft_contract:
-                    weth_balance_wei = oft_contract.functions.balanceOf(address).call()
+                    weth_balance_wei = await web3_pool.run(chain_name, oft_contract.functions.balanceOf(address).call)
                     weth_balance = float(Web3.from_wei(weth_balance_wei, 'ether'))
             except Exception as e:
-                print(f"⚠️ WETH balance check failed for {chain_name}: {e}")
+                logger.warning("⚠️ WETH balance check failed for %s: %s", chain_name, e)
             
             return {
                 "success": True,
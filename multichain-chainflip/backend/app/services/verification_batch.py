@@ -0,0 +1,164 @@
+"""
+Authenticity verification batch
+Shared lookups and buffered event writes for Algorithm 4, so verifying N QR
+codes costs one products query, one IPFS fetch per distinct metadata CID,
+one fan-out of QR decryption over the crypto pool and one insert per event
+collection instead of N of each
+"""
+import asyncio
+import time
+import uuid
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from app.services.encryption_service import encryption_service
+from app.services.ipfs_service import ipfs_service
+from app.core.log import get_logger
+
+logger = get_logger(__name__)
+
+
+def encrypted_payload(qr_data: Any) -> Optional[str]:
+    """The encrypted part of scanned QR data: [encrypted_data, hash] or a bare encrypted string"""
+    if isinstance(qr_data, list) and len(qr_data) >= 1:
+        return qr_data[0]
+    if isinstance(qr_data, str):
+        return qr_data
+    return None
+
+
+class VerificationBatch:
+    """
+    Per-request state for one or more authenticity verifications
+
+    - load_products() fetches every product in the batch with a single $in query
+    - metadata() fetches each IPFS CID once; concurrent callers share the fetch
+    - decrypt_payloads() decrypts every scanned QR payload in one call to the
+      crypto pool; decrypt() answers from it, off the event loop either way
+    - record() buffers verification events; flush() writes them with insert_many
+    """
+
+    def __init__(self, database):
+        self.database = database
+        self._products: Dict[str, Optional[Dict[str, Any]]] = {}
+        self._metadata: Dict[str, asyncio.Task] = {}
+        self._decrypted: Dict[Tuple, Tuple[asyncio.Task, int]] = {}
+        self._verifications: List[Dict[str, Any]] = []
+        self._history: List[Dict[str, Any]] = []
+
+    async def load_products(self, product_ids: Iterable[str]):
+        """Fetch all not-yet-loaded products in one query; unknown IDs are remembered as None"""
+        wanted = [product_id for product_id in dict.fromkeys(product_ids) if product_id and product_id not in self._products]
+        if not wanted:
+            return
+        found = {}
+        try:
+            async for product in self.database.products.find({"token_id": {"$in": wanted}}):
+                product["_id"] = str(product["_id"])
+                found.setdefault(product["token_id"], product)
+        except Exception as e:
+            logger.error("❌ Error getting products: %s", e)
+        for product_id in wanted:
+            self._products[product_id] = found.get(product_id)
+
+    async def product(self, product_id: str) -> Optional[Dict[str, Any]]:
+        if product_id not in self._products:
+            await self.load_products([product_id])
+        return self._products.get(product_id)
+
+    def prefetch_metadata(self):
+        """Start fetching the metadata CID of every loaded product"""
+        for product in self._products.values():
+            if product and product.get("metadata_cid"):
+                self._metadata_task(product["metadata_cid"])
+
+    def _metadata_task(self, cid: str) -> asyncio.Task:
+        task = self._metadata.get(cid)
+        if task is None:
+            task = self._metadata[cid] = asyncio.create_task(ipfs_service.get_from_ipfs(cid))
+        return task
+
+    async def metadata(self, cid: str) -> Dict[str, Any]:
+        """IPFS metadata for a CID, fetched at most once per batch"""
+        return await asyncio.shield(self._metadata_task(cid))
+
+    @staticmethod
+    def _decrypt_key(payload: str, keys: Optional[Dict[str, str]]) -> Tuple:
+        keys = keys or {}
+        return payload, keys.get("aes_key"), keys.get("hmac_key")
+
+    def _start_decrypt(self, items: List[Tuple[str, Optional[Dict[str, str]]]]):
+        task = asyncio.create_task(asyncio.to_thread(encryption_service.decrypt_qr_data_many, items))
+        for index, (payload, keys) in enumerate(items):
+            self._decrypted[self._decrypt_key(payload, keys)] = (task, index)
+
+    def decrypt_payloads(self, requests: Iterable[Dict[str, Any]]):
+        """Start decrypting the QR payload of every request with its loaded product's keys"""
+        items = {}
+        for request in requests:
+            product = self._products.get(request.get("product_id"))
+            payload = encrypted_payload(request.get("qr_data"))
+            if not product or not product.get("encryption_keys") or not isinstance(payload, str):
+                continue
+            key = self._decrypt_key(payload, product["encryption_keys"])
+            if key not in self._decrypted:
+                items.setdefault(key, (payload, product["encryption_keys"]))
+        if items:
+            self._start_decrypt(list(items.values()))
+
+    async def decrypt(self, payload: str, keys: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
+        """Decrypted QR data (session keys when keys is omitted); raises if it doesn't decrypt"""
+        key = self._decrypt_key(payload, keys)
+        if key not in self._decrypted:
+            self._start_decrypt([(payload, keys)])
+        task, index = self._decrypted[key]
+        result = (await asyncio.shield(task))[index]
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    def record(self, product_id: str, verifier: str, result: str, verification_details: Dict = None):
+        """Buffer a verification event for the verifications and verification_history collections"""
+        context = (verification_details or {}).get("context", {})
+        self._verifications.append({
+            "product_id": product_id,
+            "verifier": verifier,
+            "result": result,
+            "timestamp": time.time(),
+            "verification_id": str(uuid.uuid4()),
+            "details": verification_details or {}
+        })
+        self._history.append({
+            "product_id": product_id,
+            "verifier": verifier,
+            "result": result,
+            "timestamp": datetime.utcnow(),
+            "verification_details": verification_details,
+            "session_info": {
+                "user_agent": context.get("user_agent", ""),
+                "ip_address": context.get("ip_address", "")
+            }
+        })
+
+    async def flush(self):
+        """Write buffered events, one insert_many per collection"""
+        verifications, self._verifications = self._verifications, []
+        history, self._history = self._history, []
+        if not verifications:
+            return
+        try:
+            await asyncio.gather(
+                self.database.verifications.insert_many(verifications, ordered=False),
+                self.database.verification_history.insert_many(history, ordered=False),
+            )
+            logger.debug("📝 Recorded %s verification events", len(verifications))
+        except Exception as e:
+            logger.warning("⚠️ Enhanced verification recording error: %s", e)
+
+    async def close(self):
+        """Flush events and cancel metadata fetches and decryptions nobody waited for"""
+        await self.flush()
+        tasks = list(self._metadata.values()) + list({id(task): task for task, _ in self._decrypted.values()}.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
@@ -0,0 +1,228 @@
+"""
+W3Storage upload worker
+Keeps one `node w3storage_upload.mjs --serve` process alive and multiplexes
+uploads over its stdin/stdout, so the w3up client is authorized once instead
+of cold-starting Node for every upload
+"""
+import asyncio
+import itertools
+import json
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from app.core.config import get_settings
+from app.core.log import get_logger
+from app.core.service_registry import service_registry
+
+settings = get_settings()
+logger = get_logger(__name__)
+
+SCRIPT_PATH = Path(__file__).parent.parent.parent / "w3storage_upload.mjs"
+
+
+class W3StorageWorkerError(Exception):
+    """Upload rejected by W3Storage or the worker process failed"""
+
+
+class W3StorageWorker:
+    """
+    Client for the long-lived Node upload worker
+
+    - the process is started on first use (or by initialize() at startup) and
+      restarted on the next upload if it dies; in-flight uploads fail fast
+    - file bytes are written straight to the worker's stdin, no temp files
+    - at most max_in_flight uploads are outstanding; further callers wait, and
+      writes wait for the pipe to drain, so large bursts can't balloon memory
+    """
+
+    def __init__(
+        self,
+        script_path: Path = SCRIPT_PATH,
+        max_in_flight: int = settings.w3storage_worker_concurrency,
+        upload_timeout: float = settings.w3storage_upload_timeout,
+        start_timeout: float = 60.0,
+    ):
+        self.script_path = script_path
+        self.max_in_flight = max_in_flight
+        self.upload_timeout = upload_timeout
+        self.start_timeout = start_timeout
+        self._process: Optional[asyncio.subprocess.Process] = None
+        self._reader_task: Optional[asyncio.Task] = None
+        self._stderr_task: Optional[asyncio.Task] = None
+        self._pending: Dict[int, asyncio.Future] = {}
+        self._ids = itertools.count(1)
+        self._start_lock = asyncio.Lock()
+        self._write_lock = asyncio.Lock()
+        self._slots = asyncio.Semaphore(max_in_flight)
+        self._uploads = 0
+        self._restarts = 0
+
+    async def initialize(self):
+        await self.start()
+        logger.info("✅ W3Storage upload worker ready (pid %s, %s concurrent uploads)", self._process.pid, self.max_in_flight)
+
+    @property
+    def running(self) -> bool:
+        return self._process is not None and self._process.returncode is None
+
+    async def start(self):
+        """Spawn the worker and send credentials; returns once the w3up client is authorized"""
+        async with self._start_lock:
+            if self.running:
+                return
+            if not settings.w3storage_token or not settings.w3storage_proof:
+                raise W3StorageWorkerError("W3Storage credentials are missing. Please check your .env file for W3STORAGE_TOKEN and W3STORAGE_PROOF")
+            if not self.script_path.exists():
+                raise W3StorageWorkerError(f"W3Storage upload script not found at {self.script_path}")
+
+            if self._process is not None:
+                self._restarts += 1
+            self._process = await asyncio.create_subprocess_exec(
+                "node", str(self.script_path), "--serve",
+                cwd=str(self.script_path.parent),
+                stdin=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+            )
+            self._stderr_task = asyncio.create_task(self._drain_stderr(self._process))
+
+            ready = asyncio.get_running_loop().create_future()
+            self._reader_task = asyncio.create_task(self._read_replies(self._process, ready))
+            await self._write_frame({
+                "type": "init",
+                "token": settings.w3storage_token,
+                "proof": settings.w3storage_proof,
+            })
+            try:
+                await asyncio.wait_for(asyncio.shield(ready), self.start_timeout)
+            except BaseException:
+                await self._terminate()
+                raise
+
+    async def _write_frame(self, header: Dict[str, Any], body: bytes = b""):
+        header = {**header, "size": len(body)}
+        async with self._write_lock:
+            stdin = self._process.stdin
+            stdin.write(json.dumps(header).encode("utf-8") + b"\n")
+            if body:
+                stdin.write(body)
+            await stdin.drain()
+
+    async def _read_replies(self, process: asyncio.subprocess.Process, ready: asyncio.Future):
+        try:
+            while True:
+                line = await process.stdout.readline()
+                if not line:
+                    break
+                try:
+                    message = json.loads(line)
+                except json.JSONDecodeError:
+                    logger.warning("🔍 W3Storage worker stdout: %s", line.decode('utf-8', 'replace').rstrip())
+                    continue
+
+                if message.get("type") == "ready":
+                    if not ready.done():
+                        ready.set_result(True)
+                elif message.get("type") == "init_failed":
+                    if not ready.done():
+                        ready.set_exception(W3StorageWorkerError(f"W3Storage worker failed to initialize: {message.get('error')}"))
+                elif message.get("type") == "result":
+                    future = self._pending.pop(message.get("id"), None)
+                    if future is None or future.done():
+                        continue
+                    if message.get("success"):
+                        future.set_result(message)
+                    else:
+                        future.set_exception(W3StorageWorkerError(f"W3Storage upload failed: {message.get('error', 'Unknown error')}"))
+        finally:
+            error = W3StorageWorkerError("W3Storage worker exited")
+            if not ready.done():
+                ready.set_exception(error)
+            for future in self._pending.values():
+                if not future.done():
+                    future.set_exception(error)
+            self._pending.clear()
+
+    async def _drain_stderr(self, process: asyncio.subprocess.Process):
+        # The worker logs to stderr; it must be read or the pipe fills and the worker blocks
+        while True:
+            line = await process.stderr.readline()
+            if not line:
+                break
+            text = line.decode("utf-8", "replace").rstrip()
+            if "❌" in text or "⚠️" in text:
+                logger.debug("🔍 W3Storage worker: %s", text)
+
+    async def _request(self, header: Dict[str, Any], body: bytes) -> Dict[str, Any]:
+        async with self._slots:
+            if not self.running:
+                await self.start()
+            upload_id = next(self._ids)
+            future = asyncio.get_running_loop().create_future()
+            self._pending[upload_id] = future
+            try:
+                await self._write_frame({**header, "id": upload_id}, body)
+                result = await asyncio.wait_for(future, self.upload_timeout)
+            except asyncio.TimeoutError:
+                raise W3StorageWorkerError(f"W3Storage upload timed out after {self.upload_timeout} seconds")
+            except (BrokenPipeError, ConnectionResetError):
+                raise W3StorageWorkerError("W3Storage worker exited")
+            finally:
+                self._pending.pop(upload_id, None)
+            self._uploads += 1
+            return result
+
+    async def upload(self, content: bytes, filename: str = "metadata.json", mime_type: Optional[str] = None) -> str:
+        """Upload raw bytes and return the CID"""
+        result = await self._request({"type": "upload", "filename": filename, "mime": mime_type}, content)
+        return result["cid"]
+
+    async def upload_directory(self, files: List[Tuple[str, bytes]], mime_type: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Upload files as one UnixFS directory
+
+        Returns {"cid": directory CID, "entries": {name: file CID}}; entries may be
+        empty if the w3up client doesn't report per-file links, in which case files
+        are addressed as <directory CID>/<name>.
+        """
+        header = {
+            "type": "upload_directory",
+            "files": [{"name": name, "size": len(content), "mime": mime_type} for name, content in files],
+        }
+        result = await self._request(header, b"".join(content for _, content in files))
+        return {"cid": result["cid"], "entries": result.get("entries") or {}}
+
+    async def upload_json(self, data: Dict[str, Any], filename: str = "metadata.json") -> str:
+        return await self.upload(json.dumps(data, indent=2).encode("utf-8"), filename, "application/json")
+
+    async def _terminate(self):
+        process, self._process = self._process, None
+        if process is not None and process.returncode is None:
+            process.stdin.close()
+            try:
+                await asyncio.wait_for(process.wait(), 5)
+            except asyncio.TimeoutError:
+                process.kill()
+                await process.wait()
+        for task in (self._reader_task, self._stderr_task):
+            if task is not None:
+                await asyncio.gather(task, return_exceptions=True)
+        self._reader_task = self._stderr_task = None
+
+    async def stop(self):
+        """Close the worker's stdin and wait for it to exit"""
+        async with self._start_lock:
+            await self._terminate()
+
+    def status(self) -> Dict[str, Any]:
+        return {
+            "running": self.running,
+            "pid": self._process.pid if self.running else None,
+            "in_flight": len(self._pending),
+            "max_in_flight": self.max_in_flight,
+            "uploads": self._uploads,
+            "restarts": self._restarts,
+        }
+
+
+w3storage_worker = service_registry.register("w3storage_worker", W3StorageWorker(), timeout=90)
@@ -10,6 +10,9 @@ import time
 from typing import Dict, Any, Optional
 from web3 import Web3
 from eth_account import Account
+from app.core.log import get_logger
+
+logger = get_logger(__name__)
 
 # LayerZero V2 Endpoint Addresses (Official)
 LAYERZERO_ENDPOINTS = {
@@ -210,9 +213,9 @@ class WETHOFTDeployer:
             config = CHAIN_CONFIGS[chain_name]
             endpoint = LAYERZERO_ENDPOINTS[chain_name]
             
-            print(f"🏗️ Deploying WETH OFT on {config['name']}...")
-            print(f"   📍 LayerZero Endpoint: {endpoint}")
-            print(f"   👤 Deployer: {deployer_account.address}")
+            logger.debug("🏗️ Deploying WETH OFT on %s...", config['name'])
+            logger.debug("   📍 LayerZero Endpoint: %s", endpoint)
+            logger.debug("   👤 Deployer: %s", deployer_account.address)
             
             # In a real implementation, you would:
             # 1. Compile the Solidity contract
@@ -241,9 +244,9 @@ class WETHOFTDeployer:
             
             self.deployed_contracts[chain_name] = deployment_result
             
-            print(f"✅ WETH OFT deployed successfully on {config['name']}")
-            print(f"   📄 Contract Address: {mock_contract_address}")
-            print(f"   ⛽ Estimated Cost: {estimated_cost_eth:.6f} ETH")
+            logger.info("✅ WETH OFT deployed successfully on %s", config['name'])
+            logger.debug("   📄 Contract Address: %s", mock_contract_address)
+            logger.debug("   ⛽ Estimated Cost: %.6f ETH", estimated_cost_eth)
             
             return {
                 "success": True,
@@ -251,7 +254,7 @@ class WETHOFTDeployer:
             }
             
         except Exception as e:
-            print(f"❌ Deployment failed on {chain_name}: {e}")
+            logger.error("❌ Deployment failed on %s: %s", chain_name, e)
             return {
                 "success": False,
                 "error": str(e)
@@ -278,8 +281,7 @@ class WETHOFTDeployer:
     ) -> Dict[str, Any]:
         """Deploy WETH OFT contracts on all supported chains"""
         
-        print("🚀 Starting WETH OFT deployment across all chains...")
-        print("=" * 60)
+        logger.debug("🚀 Starting WETH OFT deployment across all chains...")
         
         deployment_results = {}
         total_estimated_cost = 0.0
@@ -293,14 +295,11 @@ class WETHOFTDeployer:
                 
                 if result["success"]:
                     total_estimated_cost += result["deployment"]["estimated_gas_cost"]
-                
-                print()  # Add spacing between deployments
         
-        print("=" * 60)
-        print(f"🏁 Deployment Summary:")
-        print(f"   ✅ Successfully deployed: {sum(1 for r in deployment_results.values() if r['success'])}")
-        print(f"   ❌ Failed deployments: {sum(1 for r in deployment_results.values() if not r['success'])}")
-        print(f"   💰 Total estimated cost: {total_estimated_cost:.6f} ETH")
+        logger.info("🏁 Deployment Summary:")
+        logger.info("   ✅ Successfully deployed: %s", sum(1 for r in deployment_results.values() if r['success']))
+        logger.info("   ❌ Failed deployments: %s", sum(1 for r in deployment_results.values() if not r['success']))
+        logger.debug("   💰 Total estimated cost: %.6f ETH", total_estimated_cost)
         
         return {
             "success": True,
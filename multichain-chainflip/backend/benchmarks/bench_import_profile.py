@@ -0,0 +1,111 @@
+"""
+Benchmark: import-time budget for worker boot
+
+Imports the application module in a fresh interpreter under `python -X importtime`,
+reports the slowest modules and fails (exit code 1) when the median boot import
+exceeds the budget in import_budget.json or when a module that is meant to load
+lazily (scikit-learn, QR imaging, ...) is imported at boot.
+
+Usage (from multichain-chainflip/backend):
+    python -m benchmarks.bench_import_profile --runs 5
+    python -m benchmarks.bench_import_profile --module app.api.routes.products
+    python -m benchmarks.bench_import_profile --update-budget
+"""
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+BUDGET_FILE = Path(__file__).resolve().parent / "import_budget.json"
+
+
+def profile_import(module: str) -> List[Tuple[str, int, int, int]]:
+    """(name, depth, self_us, cumulative_us) per imported module, in import order"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=BACKEND_DIR,
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"import {module} failed:\n{result.stderr[-2000:]}")
+
+    entries = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|", 2)
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        entries.append((name.strip(), depth, int(self_us), int(cumulative_us)))
+    return entries
+
+
+def top_level_packages(entries: List[Tuple[str, int, int, int]]) -> Dict[str, int]:
+    """Import time per top-level package (sum of its modules' self time)"""
+    packages: Dict[str, int] = {}
+    for name, _, self_us, _ in entries:
+        package = name.split(".")[0]
+        packages[package] = packages.get(package, 0) + self_us
+    return packages
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--module", default="main", help="Module to import (default: main)")
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--top", type=int, default=15, help="Number of slowest packages to print")
+    parser.add_argument("--update-budget", action="store_true", help="Write the measured median (+ headroom) as the new budget")
+    args = parser.parse_args()
+
+    budget = json.loads(BUDGET_FILE.read_text()) if BUDGET_FILE.exists() else {}
+    module_budget = budget.get("modules", {}).get(args.module, {})
+
+    totals = []
+    packages: Dict[str, List[int]] = {}
+    imported = set()
+    for _ in range(args.runs):
+        entries = profile_import(args.module)
+        imported.update(name for name, _, _, _ in entries)
+        totals.append(next(cumulative for name, depth, _, cumulative in reversed(entries) if name == args.module and depth == 0))
+        for package, self_us in top_level_packages(entries).items():
+            packages.setdefault(package, []).append(self_us)
+
+    median_ms = statistics.median(totals) / 1000
+    print(f"import {args.module}: median {median_ms:.1f}ms over {args.runs} runs (min {min(totals) / 1000:.1f}ms, max {max(totals) / 1000:.1f}ms)")
+    print(f"{'package':<32} {'median ms':>10}")
+    ranked = sorted(packages.items(), key=lambda item: -statistics.median(item[1]))
+    for package, samples in ranked[:args.top]:
+        print(f"{package:<32} {statistics.median(samples) / 1000:>10.1f}")
+
+    if args.update_budget:
+        budget.setdefault("modules", {})[args.module] = {
+            "max_ms": round(median_ms * (1 + budget.get("headroom", 0.25)), 1),
+        }
+        BUDGET_FILE.write_text(json.dumps(budget, indent=2) + "\n")
+        print(f"budget for {args.module} updated in {BUDGET_FILE.name}")
+        return
+
+    failures = []
+    eager = sorted(
+        package for package in budget.get("deferred_packages", [])
+        if package in imported or any(name.startswith(f"{package}.") for name in imported)
+    )
+    if eager:
+        failures.append(f"deferred packages imported at boot: {', '.join(eager)}")
+    max_ms = module_budget.get("max_ms")
+    if max_ms is not None and median_ms > max_ms:
+        failures.append(f"median {median_ms:.1f}ms exceeds budget {max_ms}ms")
+
+    if failures:
+        for failure in failures:
+            print(f"FAIL: {failure}")
+        sys.exit(1)
+    print(f"OK (budget {f'{max_ms}ms' if max_ms is not None else 'not set'})")
+
+
+if __name__ == "__main__":
+    main()
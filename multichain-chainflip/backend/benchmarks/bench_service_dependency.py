@@ -0,0 +1,80 @@
+"""
+Benchmark: per-request cost of resolving the blockchain service dependency
+
+Compares the old behaviour (construct BlockchainService and await initialize()
+on every request) with the shared instance handed out by the service registry.
+Runs against the RPC endpoints and MongoDB configured in .env.
+
+Usage (from multichain-chainflip/backend):
+    python -m benchmarks.bench_service_dependency --requests 20
+"""
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from dotenv import load_dotenv
+
+load_dotenv(Path(__file__).resolve().parent.parent / ".env")
+
+from app.core.service_registry import service_registry  # noqa: E402
+from app.services.blockchain_service import BlockchainService  # noqa: E402
+
+
+async def per_request_construction() -> BlockchainService:
+    """Dependency as it used to be wired in the route modules"""
+    service = BlockchainService()
+    await service.initialize()
+    return service
+
+
+async def shared_instance() -> BlockchainService:
+    """Dependency as it is wired now"""
+    return await service_registry.get("blockchain")
+
+
+async def measure(label: str, dependency, requests: int, query_products: bool):
+    samples = []
+    for _ in range(requests):
+        started = time.perf_counter()
+        service = await dependency()
+        if query_products:
+            await service.get_all_products(limit=50)
+        samples.append((time.perf_counter() - started) * 1000)
+
+    samples.sort()
+    p95 = samples[max(0, int(len(samples) * 0.95) - 1)]
+    print(
+        f"{label:<28} n={len(samples):<4} "
+        f"mean={statistics.mean(samples):9.2f}ms  "
+        f"p50={statistics.median(samples):9.2f}ms  "
+        f"p95={p95:9.2f}ms  max={samples[-1]:9.2f}ms"
+    )
+    return samples
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=20)
+    parser.add_argument("--no-query", action="store_true", help="Only resolve the dependency, skip the products query")
+    args = parser.parse_args()
+
+    query_products = not args.no_query
+
+    # Startup populates the registry once, exactly like main.py
+    startup = time.perf_counter()
+    await service_registry.initialize("blockchain")
+    print(f"startup initialize: {(time.perf_counter() - startup) * 1000:.2f}ms")
+
+    before = await measure("before (per-request init)", per_request_construction, args.requests, query_products)
+    after = await measure("after (shared registry)", shared_instance, args.requests, query_products)
+
+    print(f"speedup (mean): {statistics.mean(before) / max(statistics.mean(after), 1e-9):.1f}x")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
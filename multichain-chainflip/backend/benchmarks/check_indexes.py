@@ -0,0 +1,74 @@
+"""
+Check: registered MongoDB query shapes are served by an index
+
+Creates every index in the index manifest (idempotent), then explain()s each
+registered query shape against the configured database and exits with code 1
+if any winning plan is a collection scan.
+
+Usage (from multichain-chainflip/backend):
+    python -m benchmarks.check_indexes
+    python -m benchmarks.check_indexes --owner post_supply_chain --no-apply
+"""
+import argparse
+import asyncio
+import importlib
+import sys
+
+from app.core.config import get_settings
+from app.core.index_manifest import index_manifest
+
+# Importing a module registers its indexes and query shapes with the manifest
+MANIFEST_MODULES = [
+    "app.core.database",
+    "app.services.blockchain_service",
+    "app.services.shipping_service",
+    "app.services.payment_incentive_service",
+    "app.services.post_supply_chain_service",
+    "app.services.dispute_resolution_service",
+    "app.services.nft_transfer_orchestrator",
+    "app.services.ownership_indexer_service",
+    "app.services.real_weth_bridge_service",
+]
+
+
+async def run(owners, apply: bool) -> int:
+    import motor.motor_asyncio
+
+    settings = get_settings()
+    client = motor.motor_asyncio.AsyncIOMotorClient(settings.mongo_url)
+    database = client[settings.database_name]
+    try:
+        if apply:
+            for result in await index_manifest.apply(database, owners=owners):
+                if result["status"] != "ok":
+                    print(f"⚠️ {result['index']}: {result['status']}")
+        report = await index_manifest.verify(database, owners=owners)
+    finally:
+        client.close()
+
+    print(f"{'status':<20} {'owner':<26} query")
+    for entry in report:
+        stages = f"  [{' > '.join(entry['stages'])}]" if entry.get("stages") else ""
+        print(f"{entry['status']:<20} {entry['owner']:<26} {entry['query']}{stages}")
+
+    scans = [entry for entry in report if entry["status"] == "collection_scan"]
+    if scans:
+        print(f"FAIL: {len(scans)} of {len(report)} query shapes use a collection scan")
+        return 1
+    print(f"OK: {len(report)} query shapes checked")
+    return 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--owner", action="append", help="Only check this owner's indexes/queries (repeatable)")
+    parser.add_argument("--no-apply", action="store_true", help="Don't create missing indexes before checking")
+    args = parser.parse_args()
+
+    for module in MANIFEST_MODULES:
+        importlib.import_module(module)
+    sys.exit(asyncio.run(run(args.owner, not args.no_apply)))
+
+
+if __name__ == "__main__":
+    main()
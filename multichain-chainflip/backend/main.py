@@ -4,6 +4,7 @@ Combines comprehensive route modules from app/main.py with network-status functi
 """
 import os
 import logging
+import time
 import uuid
 from datetime import datetime
 from pathlib import Path
@@ -17,20 +18,31 @@ from motor.motor_asyncio import AsyncIOMotorClient
 from pydantic import BaseModel, Field
 from dotenv import load_dotenv
 
+# Logging is configured before any service module is imported, since they log at import time
+from app.core.log import configure_logging, logging_metrics, shutdown_logging
+configure_logging()
+
 # Import comprehensive route modules from app/main.py structure
-from app.api.routes import blockchain, products, fl_system, ipfs_service, analytics, qr_routes, auth, participants, token_bridge, layerzero_oft, nft_transfers, payment_incentive, enhanced_authenticity, post_supply_chain, chainflip_messaging, nft_bridge, shipping
+from app.api.routes import blockchain, products, fl_system, ipfs_service, analytics, qr_routes, auth, participants, token_bridge, layerzero_oft, nft_transfers, payment_incentive, enhanced_authenticity, post_supply_chain, chainflip_messaging, nft_bridge, shipping, tracking
+from app.core.cid_cache import cid_cache
 from app.core.config import get_settings
 from app.core.database import init_database, close_database
+from app.core.response_cache import response_cache
+from app.core.verification_cache import verification_cache
+from app.core.rpc_router import rpc_router
+from app.core.service_registry import service_registry
+from app.core.tx_pipeline import tx_pipeline
+from app.core.web3_pool import web3_pool
 
 # Import services from both implementations
 from app.services.blockchain_service import BlockchainService
-from app.services.fl_service import FederatedLearningService
 from app.services.auth_service import AuthService
 from app.services.blockchain_service import blockchain_service
+from app.services.confirmation_tracker import confirmation_tracker
+from app.services.fl_executor import fl_executor
 from app.services.multichain_service import multichain_service
-from app.services.crosschain_purchase_service import crosschain_purchase_service
-from app.services.real_weth_bridge_service import real_weth_bridge_service
-from app.services.layerzero_oft_bridge_service import layerzero_oft_bridge_service
+from app.services.network_health_service import network_health_service
+from app.services.w3storage_worker import w3storage_worker
 
 # Import additional routes from server.py
 from app.api import participant_routes
@@ -90,15 +102,32 @@ app.include_router(fl_system.router, prefix="/api/federated-learning", tags=["fe
 app.include_router(ipfs_service.router, prefix="/api/ipfs", tags=["ipfs"])
 app.include_router(analytics.router, prefix="/api/analytics", tags=["analytics"])
 app.include_router(qr_routes.router, prefix="/api/qr", tags=["qr-codes"])
-app.include_router(token_bridge.router, prefix="/api/token-bridge", tags=["token-bridge"])
-app.include_router(layerzero_oft.router, prefix="/api/layerzero-oft", tags=["layerzero-oft"])
+# Bridge services are lazy: their RPC connections are set up on the first request to their router
+app.include_router(
+    token_bridge.router, prefix="/api/token-bridge", tags=["token-bridge"],
+    dependencies=[Depends(service_registry.dependency("real_weth_bridge", "layerzero_oft_bridge"))],
+)
+app.include_router(
+    layerzero_oft.router, prefix="/api/layerzero-oft", tags=["layerzero-oft"],
+    dependencies=[Depends(service_registry.dependency("layerzero_oft_bridge"))],
+)
 app.include_router(nft_transfers.router, prefix="/api/supply-chain", tags=["NFT Transfers"])
 app.include_router(payment_incentive.router, prefix="/api/payment", tags=["payment-incentive"])
 app.include_router(enhanced_authenticity.router, prefix="/api/enhanced-authenticity", tags=["enhanced-authenticity"])
 app.include_router(post_supply_chain.router, prefix="/api/post-supply-chain", tags=["post-supply-chain"])
-app.include_router(chainflip_messaging.router, prefix="/api", tags=["chainflip-messaging"])
-app.include_router(nft_bridge.router, tags=["nft-bridge"])
+app.include_router(
+    chainflip_messaging.router, prefix="/api", tags=["chainflip-messaging"],
+    dependencies=[Depends(service_registry.dependency("chainflip_messaging"))],
+)
+app.include_router(
+    nft_bridge.router, tags=["nft-bridge"],
+    dependencies=[Depends(service_registry.dependency("nft_bridge"))],
+)
 app.include_router(shipping.router, prefix="/api", tags=["shipping"])
+app.include_router(
+    tracking.router, prefix="/api/tracking", tags=["tracking"],
+    dependencies=[Depends(service_registry.dependency("confirmation_tracker"))],
+)
 
 # Include additional routes from server.py
 app.include_router(participant_routes.router)
@@ -128,8 +157,7 @@ async def get_products_with_filtering(
     """Get products with optional role-based filtering"""
     try:
         # Initialize blockchain service if needed
-        if blockchain_service.database is None:
-            await blockchain_service.initialize()
+        await service_registry.initialize("blockchain")
         
         # Get all products
         all_products = await blockchain_service.get_all_products(limit)
@@ -183,8 +211,7 @@ async def get_products_with_filtering(
 async def get_all_products_legacy():
     """Legacy endpoint - get all products without filtering"""
     try:
-        if blockchain_service.database is None:
-            await blockchain_service.initialize()
+        await service_registry.initialize("blockchain")
         
         products = await blockchain_service.get_all_products()
         return {"products": products, "count": len(products)}
@@ -198,11 +225,10 @@ async def get_network_status():
     """Get comprehensive network status - THE KEY ENDPOINT FROM SERVER.PY"""
     try:
         # Initialize services if needed
-        if blockchain_service.database is None:
-            await blockchain_service.initialize()
+        await service_registry.initialize("blockchain")
         
         # Get network stats
-        network_stats = await blockchain_service.get_network_stats()
+        network_stats = await network_health_service.get_snapshot()
         
         # Get multichain stats if available
         multichain_stats = {}
@@ -255,13 +281,12 @@ async def enhanced_health_check():
     blockchain_status = {}
     try:
         # Initialize blockchain service if not already done
-        if blockchain_service.database is None:
-            await blockchain_service.initialize()
+        await service_registry.initialize("blockchain")
         
         # Test Base Sepolia (Manufacturer chain)
         if blockchain_service.manufacturer_web3:
             try:
-                latest_block = blockchain_service.manufacturer_web3.eth.block_number
+                latest_block = await web3_pool.run("base_sepolia", lambda: blockchain_service.manufacturer_web3.eth.block_number)
                 blockchain_status["base_sepolia"] = {"connected": True, "latest_block": latest_block}
             except Exception as e:
                 blockchain_status["base_sepolia"] = {"connected": False, "error": str(e)}
@@ -271,20 +296,11 @@ async def enhanced_health_check():
         # Test Polygon Hub
         if blockchain_service.pos_web3:
             try:
-                latest_block = blockchain_service.pos_web3.eth.block_number
-                blockchain_status["polygon_hub"] = {"connected": True, "latest_block": latest_block}
+                latest_block = await web3_pool.run("polygon_amoy", lambda: blockchain_service.pos_web3.eth.block_number)
+                blockchain_status["polygon_hub"] = {"connected": True, "latest_block": latest_block, "via": web3_pool.rpc_url("polygon_amoy")}
             except Exception as e:
+                # The routed client already tried every configured Polygon endpoint
                 blockchain_status["polygon_hub"] = {"connected": False, "error": str(e)}
-                # Try fallback RPC
-                try:
-                    from web3 import Web3
-                    fallback_rpc = os.getenv("POLYGON_POS_RPC_FALLBACK", "https://polygon-amoy.g.alchemy.com/v2/demo")
-                    fallback_web3 = Web3(Web3.HTTPProvider(fallback_rpc))
-                    if fallback_web3.is_connected():
-                        latest_block = fallback_web3.eth.block_number
-                        blockchain_status["polygon_hub"] = {"connected": True, "latest_block": latest_block, "via": "fallback"}
-                except Exception:
-                    blockchain_status["polygon_hub"] = {"connected": False, "error": "Both primary and fallback failed"}
         else:
             blockchain_status["polygon_hub"] = {"connected": False, "error": "Not initialized"}
             
@@ -296,6 +312,16 @@ async def enhanced_health_check():
         "timestamp": datetime.utcnow().isoformat(),
         "database": db_status,
         "blockchain": blockchain_status,
+        "rpc_endpoints": rpc_router.status(),
+        "services": service_registry.status(),
+        "response_cache": response_cache.metrics(),
+        "w3storage_worker": w3storage_worker.status(),
+        "ipfs_cache": cid_cache.metrics(),
+        "verification_cache": verification_cache.metrics(),
+        "tx_pipeline": tx_pipeline.metrics(),
+        "fl_executor": fl_executor.metrics(),
+        "confirmation_tracker": confirmation_tracker.metrics(),
+        "logging": logging_metrics(),
         "role_verification": os.getenv("ENABLE_ROLE_VERIFICATION", "true").lower() == "true"
     }
 
@@ -349,17 +375,18 @@ async def simple_health_check():
     """Simple health check from app/main.py"""
     return {"status": "healthy", "message": "ChainFLIP unified backend is running"}
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
+@app.get("/api/health/cache")
+async def response_cache_metrics():
+    """Hit/miss counters of the response cache per endpoint"""
+    return response_cache.metrics()
+
 logger = logging.getLogger(__name__)
 
 @app.on_event("startup")
 async def unified_startup_event():
     """Unified startup event combining both initialization strategies"""
     try:
+        startup_started = time.perf_counter()
         logger.info("🚀 Starting ChainFLIP Multi-Chain Unified Backend...")
         
         # Initialize database first (from app/main.py approach)
@@ -370,87 +397,39 @@ async def unified_startup_event():
         auth_service = AuthService(db_instance)
         await auth_service.initialize_admin()
         
-        # Initialize blockchain services (from both approaches)
-        logger.info("🔗 Initializing blockchain services...")
-        
-        # Initialize the global blockchain service instance
-        await blockchain_service.initialize()
-        
-        # Initialize multichain service  
-        try:
-            await multichain_service.initialize()
-        except Exception as e:
-            logger.warning(f"Multichain service initialization warning: {e}")
-        
-        # Initialize cross-chain purchase service
-        try:
-            await crosschain_purchase_service.initialize()
-            logger.info("✅ Cross-chain purchase service initialized")
-        except Exception as e:
-            logger.warning(f"Cross-chain purchase service initialization warning: {e}")
-        
-        # Initialize real WETH bridge service
-        try:
-            await real_weth_bridge_service.initialize()
-            logger.info("✅ Real WETH bridge service initialized")
-        except Exception as e:
-            logger.warning(f"Real WETH bridge service initialization warning: {e}")
-        
-        # Initialize LayerZero OFT bridge service (new)
-        try:
-            await layerzero_oft_bridge_service.initialize()
-            logger.info("✅ LayerZero OFT bridge service initialized")
-        except Exception as e:
-            logger.warning(f"LayerZero OFT bridge service initialization warning: {e}")
-        
-        # Initialize Dispute Resolution Service (Algorithm 2)
-        try:
-            from app.services.dispute_resolution_service import dispute_resolution_service
-            await dispute_resolution_service.initialize()
-            logger.info("✅ Dispute Resolution Service initialized")
-        except Exception as e:
-            logger.warning(f"Dispute Resolution Service initialization warning: {e}")
-        
-        # Initialize FL service (from app/main.py)
-        try:
-            fl_service = FederatedLearningService()
-            await fl_service.initialize()
-            logger.info("✅ Federated Learning service initialized")
-        except Exception as e:
-            logger.warning(f"FL service initialization warning: {e}")
-        
-        # Initialize Payment Incentive Service (Algorithm 1)
-        try:
-            from app.services.payment_incentive_service import payment_incentive_service
-            await payment_incentive_service.initialize()
-            logger.info("✅ Payment Incentive Service initialized")
-        except Exception as e:
-            logger.warning(f"Payment Incentive Service initialization warning: {e}")
+        # Initialize services concurrently; each waits only for its declared dependencies
+        logger.info("🔗 Initializing services...")
         
-        # Initialize Post Supply Chain Service (Algorithm 5)
-        try:
-            from app.services.post_supply_chain_service import post_supply_chain_service
-            await post_supply_chain_service.initialize()
-            logger.info("✅ Post Supply Chain Service initialized")
-        except Exception as e:
-            logger.warning(f"Post Supply Chain Service initialization warning: {e}")
+        # Importing a service module registers its singleton with the service registry
+        from app.services import (  # noqa: F401
+            crosschain_purchase_service,
+            dispute_resolution_service,
+            nft_bridge_service,
+            payment_incentive_service,
+            post_supply_chain_service,
+            shipping_service,
+        )
+        from app.services.ownership_indexer_service import ownership_indexer_service
         
-        # Initialize NFT Bridge Service
-        try:
-            from app.services.nft_bridge_service import nft_bridge_service
-            await nft_bridge_service.initialize()
-            logger.info("✅ ChainFLIP NFT Bridge Service initialized")
-        except Exception as e:
-            logger.warning(f"NFT Bridge Service initialization warning: {e}")
+        startup_report = await service_registry.initialize_all(default_timeout=get_settings().startup_service_timeout)
+        for name, result in sorted(startup_report.items(), key=lambda item: -item[1]["seconds"]):
+            if result["status"] == "ok":
+                logger.info(f"   ✅ {name}: {result['seconds']:.2f}s")
+            else:
+                logger.warning(f"   ⚠️ {name}: {result['status']} after {result['seconds']:.2f}s ({result['error']})")
         
-        # Initialize Shipping Service
-        try:
-            from app.services.shipping_service import shipping_service
-            await shipping_service.initialize()
-            logger.info("✅ Comprehensive Shipping Service initialized")
-        except Exception as e:
-            logger.warning(f"Shipping Service initialization warning: {e}")
+        # Background pollers (NFT ownership index, network health snapshot, transaction confirmations)
+        if service_registry.is_initialized("ownership_indexer"):
+            ownership_indexer_service.start()
+            logger.info("✅ NFT ownership indexer started")
+        if service_registry.is_initialized("network_health"):
+            network_health_service.start()
+            logger.info("✅ Network health poller started")
+        if service_registry.is_initialized("confirmation_tracker"):
+            await confirmation_tracker.start()
+            logger.info("✅ Confirmation tracker started")
         
+        logger.info(f"⏱️ Startup completed in {time.perf_counter() - startup_started:.2f}s")
         logger.info("✅ ChainFLIP Unified Backend Initialized Successfully")
         logger.info("🌐 All endpoints available:")
         logger.info("   - Comprehensive API routes from app/main.py")
@@ -473,7 +452,52 @@ async def unified_shutdown_event():
     except Exception as e:
         logger.warning(f"Database closure warning: {e}")
     
+    # Stop background indexing before the RPC pool goes away
+    try:
+        from app.services.ownership_indexer_service import ownership_indexer_service
+        await ownership_indexer_service.stop()
+    except Exception as e:
+        logger.warning(f"NFT ownership indexer shutdown warning: {e}")
+    
+    try:
+        await network_health_service.stop()
+    except Exception as e:
+        logger.warning(f"Network health poller shutdown warning: {e}")
+    
+    try:
+        await w3storage_worker.stop()
+    except Exception as e:
+        logger.warning(f"W3Storage worker shutdown warning: {e}")
+    
+    try:
+        from app.services.ipfs_service import ipfs_service as ipfs_client
+        await ipfs_client.close()
+    except Exception as e:
+        logger.warning(f"IPFS gateway client shutdown warning: {e}")
+    
+    try:
+        await confirmation_tracker.stop()
+    except Exception as e:
+        logger.warning(f"Confirmation tracker shutdown warning: {e}")
+    
+    try:
+        await tx_pipeline.close()
+    except Exception as e:
+        logger.warning(f"Transaction pipeline shutdown warning: {e}")
+    
+    try:
+        await fl_executor.close()
+    except Exception as e:
+        logger.warning(f"FL executor shutdown warning: {e}")
+    
+    # Close pooled RPC sessions
+    try:
+        await web3_pool.close()
+    except Exception as e:
+        logger.warning(f"RPC pool closure warning: {e}")
+    
     logger.info("✅ ChainFLIP Unified Backend Shutdown Complete")
+    shutdown_logging()
 
 if __name__ == "__main__":
     settings = get_settings()
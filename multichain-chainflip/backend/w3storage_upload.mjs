@@ -51,17 +51,20 @@ async function loadW3StorageModules() {
     }
 }
 
-async function initW3Storage() {
+async function initW3Storage(credentials = null) {
     console.error('🔧 Initializing W3Storage...');
     
     const modules = await loadW3StorageModules();
     const { Client, StoreMemory, Proof, Signer } = modules;
     
-    // Read credentials from files or environment variables
+    // Read credentials from the caller, files or environment variables
     let W3UP_KEY, W3UP_PROOF;
     
-    // Check for credential files first (more reliable for special characters)
-    if (process.env.W3STORAGE_TOKEN_FILE && process.env.W3STORAGE_PROOF_FILE) {
+    if (credentials) {
+        W3UP_KEY = (credentials.token || '').trim();
+        W3UP_PROOF = (credentials.proof || '').trim();
+    } else if (process.env.W3STORAGE_TOKEN_FILE && process.env.W3STORAGE_PROOF_FILE) {
+        // Credential files are more reliable than env vars for special characters
         console.error('🔍 Reading credentials from files...');
         try {
             W3UP_KEY = fs.readFileSync(process.env.W3STORAGE_TOKEN_FILE, 'utf8').trim();
@@ -152,6 +155,23 @@ async function initW3Storage() {
     return client;
 }
 
+const MIME_TYPES = {
+    '.png': 'image/png',
+    '.jpg': 'image/jpeg',
+    '.jpeg': 'image/jpeg',
+    '.gif': 'image/gif',
+    '.webp': 'image/webp',
+    '.mp4': 'video/mp4',
+    '.webm': 'video/webm',
+    '.avi': 'video/avi',
+    '.mov': 'video/quicktime',
+    '.json': 'application/json'
+};
+
+function mimeTypeFor(filename) {
+    return MIME_TYPES[path.extname(filename).toLowerCase()] || 'application/octet-stream';
+}
+
 async function uploadToIPFS(data, filename = 'metadata.json') {
     try {
         console.error('📦 Starting uploadToIPFS function...');
@@ -173,23 +193,7 @@ async function uploadToIPFS(data, filename = 'metadata.json') {
             const fileBuffer = fs.readFileSync(data);
             
             // Detect MIME type based on file extension
-            const ext = path.extname(filename).toLowerCase();
-            let mimeType = 'application/octet-stream';
-            
-            const mimeTypes = {
-                '.png': 'image/png',
-                '.jpg': 'image/jpeg',
-                '.jpeg': 'image/jpeg',
-                '.gif': 'image/gif',
-                '.webp': 'image/webp',
-                '.mp4': 'video/mp4',
-                '.webm': 'video/webm',
-                '.avi': 'video/avi',
-                '.mov': 'video/quicktime',
-                '.json': 'application/json'
-            };
-            
-            mimeType = mimeTypes[ext] || 'application/octet-stream';
+            const mimeType = mimeTypeFor(filename);
             console.error(`📄 File type: ${mimeType}, size: ${fileBuffer.length} bytes`);
             
             blob = new Blob([fileBuffer], { type: mimeType });
@@ -221,6 +225,130 @@ async function uploadToIPFS(data, filename = 'metadata.json') {
     }
 }
 
+/*
+ * Worker mode (`node w3storage_upload.mjs --serve`)
+ *
+ * Long-lived process driven by the Python backend over stdin/stdout so the w3up
+ * client, delegation proof and space are set up once instead of per upload.
+ * Every frame on stdin is one JSON header line followed by `size` raw bytes:
+ *   {"type": "init", "token": "...", "proof": "..."}                 (first frame, size 0)
+ *   {"type": "upload", "id": 1, "filename": "a.png", "mime": "image/png", "size": 1234}
+ *   {"type": "upload_directory", "id": 2, "files": [{"name": "0.json", "size": 10}, ...], "size": 25}
+ * Every reply on stdout is one JSON line:
+ *   {"type": "ready"} | {"type": "result", "id": 1, "success": true, "cid": "..."}
+ *   directory results also carry "entries": {"0.json": "<file cid>", ...}
+ * Uploads run concurrently; replies are sent in completion order, matched by id.
+ */
+async function* readFrames(stream) {
+    let chunks = [];
+    let buffered = 0;
+    let header = null;
+    
+    const take = (size) => {
+        const all = chunks.length === 1 ? chunks[0] : Buffer.concat(chunks, buffered);
+        chunks = size < all.length ? [all.subarray(size)] : [];
+        buffered = all.length - size;
+        return all.subarray(0, size);
+    };
+    
+    for await (const chunk of stream) {
+        chunks.push(chunk);
+        buffered += chunk.length;
+        
+        while (true) {
+            if (header === null) {
+                // Header lines are small; only search the buffered bytes for a newline
+                const joined = chunks.length === 1 ? chunks[0] : Buffer.concat(chunks, buffered);
+                chunks = [joined];
+                const newline = joined.indexOf(10);
+                if (newline === -1) break;
+                header = JSON.parse(take(newline + 1).toString('utf8'));
+            }
+            const size = header.size || 0;
+            if (buffered < size) break;
+            const body = size ? Buffer.from(take(size)) : Buffer.alloc(0);
+            yield { header, body };
+            header = null;
+        }
+    }
+}
+
+async function serve() {
+    const send = (message) => process.stdout.write(JSON.stringify(message) + '\n');
+    const modules = await loadW3StorageModules();
+    const { Blob, File } = modules;
+    let client = null;
+    let uploads = 0;
+    
+    for await (const { header, body } of readFrames(process.stdin)) {
+        if (header.type === 'init') {
+            try {
+                client = await initW3Storage({ token: header.token, proof: header.proof });
+                send({ type: 'ready' });
+            } catch (error) {
+                send({ type: 'init_failed', error: error.message });
+                process.exit(1);
+            }
+            continue;
+        }
+        
+        if (header.type === 'upload_directory' && client !== null) {
+            // One UnixFS directory for the whole batch; body is the files' bytes back to back
+            let offset = 0;
+            const files = header.files.map((entry) => {
+                const bytes = body.subarray(offset, offset + entry.size);
+                offset += entry.size;
+                const mimeType = entry.mime || mimeTypeFor(entry.name);
+                return new File([new Blob([bytes], { type: mimeType })], entry.name, { type: mimeType });
+            });
+            const entries = {};
+            client.uploadDirectory(files, {
+                onDirectoryEntryLink: (link) => {
+                    if (link.name) entries[link.name] = link.cid.toString();
+                }
+            }).then(
+                (cid) => {
+                    uploads += files.length;
+                    send({ type: 'result', id: header.id, success: true, cid: cid.toString(), entries });
+                },
+                (error) => {
+                    console.error(`❌ Directory upload ${header.id} (${files.length} files) failed:`, error.message);
+                    send({ type: 'result', id: header.id, success: false, error: error.message });
+                }
+            );
+            continue;
+        }
+        
+        if (header.type !== 'upload') {
+            send({ type: 'result', id: header.id, success: false, error: `Unknown frame type: ${header.type}` });
+            continue;
+        }
+        
+        if (client === null) {
+            send({ type: 'result', id: header.id, success: false, error: 'Worker not initialized' });
+            continue;
+        }
+        
+        const filename = header.filename || 'metadata.json';
+        const mimeType = header.mime || mimeTypeFor(filename);
+        const file = new File([new Blob([body], { type: mimeType })], filename, { type: mimeType });
+        
+        // Don't await: later frames keep streaming in while this upload runs
+        client.uploadFile(file).then(
+            (cid) => {
+                uploads += 1;
+                send({ type: 'result', id: header.id, success: true, cid: cid.toString() });
+            },
+            (error) => {
+                console.error(`❌ Upload ${header.id} (${filename}) failed:`, error.message);
+                send({ type: 'result', id: header.id, success: false, error: error.message });
+            }
+        );
+    }
+    
+    console.error(`👋 W3Storage worker stdin closed after ${uploads} uploads`);
+}
+
 // CLI interface
 async function main() {
     try {
@@ -351,7 +479,14 @@ const isMainScript = (
 
 console.error('🔍 isMainScript:', isMainScript);
 
-if (isMainScript) {
+if (isMainScript && process.argv.includes('--serve')) {
+    console.error('🚀 W3Storage upload worker starting...');
+    serve().catch(error => {
+        console.error('❌ Fatal error in worker:', error.message);
+        console.error('❌ Stack:', error.stack);
+        process.exit(1);
+    });
+} else if (isMainScript) {
     console.error('🚀 W3Storage upload script is starting as main module...');
     main().catch(error => {
         console.error('❌ Fatal error in main:', error.message);
@@ -64,7 +64,7 @@ export const FederatedLearning = () => {
       
       if (response.ok) {
         const result = await response.json();
-        showSuccess(`${modelType} training completed successfully!`);
+        showSuccess(`${modelType} training queued (job ${result.job_id})`);
         fetchFLStatus(); // Refresh status
       } else {
         const error = await response.json();